@@ -10,7 +10,7 @@ import logging
 
 import init_api_client
 import swagger_client
-from sdk_utilities import get_referenced_entity_name
+from sdk_utilities import get_referenced_entity_name, get_referenced_entity_names
 import utilities
 
 
@@ -52,10 +52,8 @@ def main():
             src_vm_name = get_referenced_entity_name(referenced_entity=internet_flow.source_vm)
 
             # Get Source security groups
-            sec_group_names = []
-            for src_sec_group in internet_flow.source_security_groups:
-                name = get_referenced_entity_name(referenced_entity=src_sec_group)
-                if name: sec_group_names.append(name)
+            sec_group_names = [name for name in get_referenced_entity_names(internet_flow.source_security_groups or [])
+                               if name]
 
             # Write it to csv file
             flow_fields = dict(src_ip=internet_flow.source_ip.ip_address,
@@ -14,12 +14,12 @@ def get_api_client(args):
     user_creds = swagger_client.UserCredential(username=args.username, password=args.password,
                                                domain=dict(domain_type=args.domain_type))
 
-    auth_api = swagger_client.AuthenticationApi(api_client=api_client)
+    # the token is renewed before it expires and after a 401
+    token_manager = swagger_client.TokenManager.for_credentials(api_client, user_creds)
+    # authenticate now, so that wrong credentials fail here
+    token_manager.get_token()
+    api_client.token_manager = token_manager.start()
 
-    auth_token = auth_api.create(user_creds)
-
-    config.api_key['Authorization'] = auth_token.token
-    config.api_key_prefix['Authorization'] = 'NetworkInsight'
     config.api_client = api_client
     return api_client
 
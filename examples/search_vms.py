@@ -1,9 +1,7 @@
 # Python SDK Examples
 
 # Script will fetch VMs through a call to search API. Search API returns uuids for all VMs.
-# Script will then fetch every single VM's complete information.
-
-import time
+# Script will then bulk fetch every VM's complete information.
 
 import init_api_client
 import swagger_client
@@ -28,19 +26,13 @@ def main():
     # Create payload from search parameters required for calling the search API
     search_payload = swagger_client.SearchRequest(**public_api_search_request_params)
 
-    while True:
-        # Call the search API
-        api_response = search_api.search_entities(body=search_payload)
-        logger.info("Response attributes: Total Count: {} "
-              "Time: {}".format(api_response.total_count,
-                                time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(api_response.end_time))))
-        for result in api_response.results:
-            entities_api = swagger_client.EntitiesApi(api_client=api_client)
-            logger.info("VM Name: {}".format(entities_api.get_vm(id=result.entity_id).name))
-            # print result
-        if not api_response.cursor:
-            break
-        search_payload.cursor = api_response.cursor
+    # Pages are prefetched in the background while the current one is processed
+    search_results = swagger_client.iter_results(search_api.search_entities, body=search_payload)
+
+    # Fetch complete VM information in concurrent batches instead of one get_vm call per VM
+    entities_api = swagger_client.EntitiesApi(api_client=api_client)
+    for vm in swagger_client.hydrate(search_results, entities_api, batch_size=100):
+        logger.info("VM Name: {}".format(vm.entity.name))
 
 
 if __name__ == '__main__':
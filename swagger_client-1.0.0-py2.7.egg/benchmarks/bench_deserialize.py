@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Deserialization throughput on synthetic bulk fetch responses.
+
+    Usage: python benchmarks/bench_deserialize.py [--count 10000] [--repeat 3] [--compact]
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import swagger_client  # noqa: E402
+from synthetic import bulk_fetch_json  # noqa: E402
+
+
+class Response(object):
+    """
+    Minimal stand-in for RESTResponse.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+
+def count_objects(value):
+    """
+    Counts the model objects in a deserialized value.
+    """
+    if isinstance(value, list):
+        return sum(count_objects(v) for v in value)
+    if hasattr(value, 'swagger_types'):
+        return 1 + sum(count_objects(getattr(value, attr)) for attr in value.swagger_types)
+    return 0
+
+
+def memory(api_client, response):
+    """
+    Returns the bytes allocated by a deserialized response, or None before python 3.4.
+    """
+    if tracemalloc is None:
+        return None
+    data = json.loads(response.data)
+    api_client.deserializer('BulkFetchResponse')
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = api_client.deserializer('BulkFetchResponse')(data)
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        del result
+        tracemalloc.stop()
+
+
+def run(count, repeat, entity_type, compact=False):
+    api_client = swagger_client.ApiClient(host='http://localhost', compact_models=compact)
+    response = Response(json.dumps(bulk_fetch_json(count, entity_type)))
+
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.time()
+        result = api_client.deserialize(response, 'BulkFetchResponse')
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    objects = count_objects(result)
+    model_bytes = memory(api_client, response)
+    return {
+        'entity_type': entity_type,
+        'compact': compact,
+        'model_bytes': model_bytes,
+        'entities': count,
+        'objects': objects,
+        'seconds': round(best, 4),
+        'entities_per_sec': int(count / best),
+        'objects_per_sec': int(objects / best),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ApiClient.deserialize')
+    parser.add_argument('--count', type=int, default=10000, help='entities per response')
+    parser.add_argument('--repeat', type=int, default=3, help='runs, the best one is reported')
+    parser.add_argument('--entity-type', action='append', dest='entity_types',
+                        help='entity types to benchmark (default Flow, VirtualMachine)')
+    parser.add_argument('--compact', action='store_true', help='deserialize into compact models')
+    args = parser.parse_args()
+    for entity_type in args.entity_types or ['Flow', 'VirtualMachine']:
+        print(json.dumps(run(args.count, args.repeat, entity_type, args.compact), sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Import time of the package, each sample in a fresh interpreter.
+
+    Usage: python benchmarks/bench_import.py [--repeat 20] [--output results.json]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+# Statements timed in the child interpreter, after its own startup.
+SCENARIOS = [
+    ('import', 'import swagger_client'),
+    ('info_api', 'import swagger_client\n'
+                 'swagger_client.InfoApi(swagger_client.ApiClient(host="http://localhost/api/ni"))'),
+    ('get_vm', 'import swagger_client\n'
+               'swagger_client.EntitiesApi(swagger_client.ApiClient(host="http://localhost/api/ni"))\n'
+               'swagger_client.VirtualMachine()'),
+    # what every script paid when the package imported all its modules
+    ('everything', 'import swagger_client\n'
+                   'for name in swagger_client.__all__:\n'
+                   '    getattr(swagger_client, name)'),
+]
+
+_CHILD = '''
+import sys, time
+from timeit import default_timer
+start = default_timer()
+exec(compile(sys.argv[1], "<scenario>", "exec"))
+elapsed = default_timer() - start
+print("%r %d" % (elapsed, len(sys.modules)))
+'''
+
+
+def sample(statement):
+    """
+    Runs `statement` in a new interpreter, returns (seconds, modules
+    loaded).
+    """
+    output = subprocess.check_output([sys.executable, '-c', _CHILD, statement], cwd=ROOT)
+    elapsed, modules = output.decode('utf8').split()
+    return float(elapsed), int(modules)
+
+
+def run(repeat=20):
+    results = {}
+    for name, statement in SCENARIOS:
+        samples = [sample(statement) for _ in range(repeat)]
+        times = sorted(elapsed for elapsed, _ in samples)
+        results[name] = {'best_ms': round(times[0] * 1000, 2),
+                         'median_ms': round(times[len(times) // 2] * 1000, 2),
+                         'modules': samples[-1][1]}
+        print(json.dumps(dict(results[name], scenario=name), sort_keys=True))
+        sys.stdout.flush()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import time of swagger_client')
+    parser.add_argument('--repeat', type=int, default=20, help='fresh interpreters per scenario')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'implementation': platform.python_implementation(),
+                       'timestamp': int(time.time()),
+                       'results': results}, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
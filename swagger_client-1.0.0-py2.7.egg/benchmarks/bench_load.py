@@ -0,0 +1,183 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    End to end throughput of the client against the fake vRNI server.
+
+    Usage: python benchmarks/bench_load.py [--scenarios get_vm,search,bulk_fetch,metrics]
+                                           [--requests 2000] [--concurrency 8] [--latency 0.005]
+                                           [--url http://host:port/api/ni]
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import swagger_client  # noqa: E402
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+FAKE_VRNI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_vrni.py')
+
+
+def start_server(args):
+    """
+    Runs the fake server in a child process, so its CPU time is not
+    counted as the client's. Returns (process, url).
+    """
+    command = [sys.executable, FAKE_VRNI, '--entities', str(args.entities), '--latency', str(args.latency),
+               '--throttle-rate', str(args.throttle_rate)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    url = process.stdout.readline().decode('utf8').strip()
+    return process, url
+
+
+def peak_rss():
+    """
+    Returns the peak resident set size of the process in bytes, or None.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class Recorder(object):
+    """
+    Collects the latency of calls made from many threads.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def timed(self, fn):
+        def call(*args, **kwargs):
+            start = time.time()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.time() - start
+                with self._lock:
+                    self.latencies.append(elapsed)
+        return call
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def scenario_get_vm(api_client, recorder, args):
+    get_vm = recorder.timed(swagger_client.EntitiesApi(api_client).get_vm)
+    ids = ['vm-%d' % i for i in range(args.requests)]
+    return sum(1 for _ in api_client.map_calls(get_vm, ids, ordered=False))
+
+
+def scenario_search(api_client, recorder, args):
+    search_api = swagger_client.SearchApi(api_client)
+    search_api.search_entities = recorder.timed(search_api.search_entities)
+    request = swagger_client.SearchRequest(entity_type='Flow', size=args.page_size)
+    return sum(1 for _ in swagger_client.iter_results(search_api.search_entities, body=request))
+
+
+def scenario_bulk_fetch(api_client, recorder, args):
+    entities_api = swagger_client.EntitiesApi(api_client)
+    entities_api.entities_fetch_post = recorder.timed(entities_api.entities_fetch_post)
+    ids = [swagger_client.EntityIdWithTime(entity_id='flow-%d' % i, entity_type='Flow', time=0)
+           for i in range(args.entities)]
+    hydrator = swagger_client.EntityHydrator(entities_api, batch_size=args.page_size,
+                                             max_workers=args.concurrency)
+    return sum(1 for _ in hydrator.hydrate(ids))
+
+
+def scenario_metrics(api_client, recorder, args):
+    metrics_api = swagger_client.MetricsApi(api_client)
+    metrics_api.get_metrics = recorder.timed(metrics_api.get_metrics)
+    fetcher = swagger_client.MetricsFetcher(metrics_api)
+    pairs = fetcher.pairs(['vm-%d' % i for i in range(args.requests // 4)], ['metric.cpu.usage.rate.average.percent'])
+    start = 1528000000
+    return sum(len(series) for series in fetcher.iter_series(pairs, 300, start, start + 300 * 1200))
+
+
+SCENARIOS = {
+    'get_vm': scenario_get_vm,
+    'search': scenario_search,
+    'bulk_fetch': scenario_bulk_fetch,
+    'metrics': scenario_metrics,
+}
+
+
+def run(name, url, args):
+    """
+    Runs a scenario on a fresh client and returns its measurements.
+    """
+    configuration = swagger_client.Configuration()
+    configuration.executor_max_workers = args.concurrency
+    configuration.connection_pool_maxsize = args.concurrency
+    api_client = swagger_client.ApiClient(host=url)
+    recorder = Recorder()
+    cpu = os.times()
+    start = time.time()
+    entities = SCENARIOS[name](api_client, recorder, args)
+    elapsed = time.time() - start
+    cpu_seconds = sum(os.times()[:2]) - sum(cpu[:2])
+    api_client.shutdown()
+    latencies = recorder.latencies
+    return {
+        'scenario': name,
+        'requests': len(latencies),
+        'entities': entities,
+        'seconds': round(elapsed, 3),
+        'requests_per_sec': round(len(latencies) / elapsed, 1),
+        'entities_per_sec': round(entities / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 2) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        'cpu_us_per_entity': round(cpu_seconds * 1e6 / entities, 1) if entities else None,
+        'peak_rss_bytes': peak_rss(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the client against a fake vRNI server')
+    parser.add_argument('--scenarios', default=','.join(sorted(SCENARIOS)), help='comma separated scenarios')
+    parser.add_argument('--requests', type=int, default=2000, help='calls of the get_vm and metrics scenarios')
+    parser.add_argument('--entities', type=int, default=5000, help='results of the search and bulk fetch scenarios')
+    parser.add_argument('--page-size', type=int, default=100, help='search page and bulk fetch batch size')
+    parser.add_argument('--concurrency', type=int, default=8, help='client threads and connections')
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds added by the server per response')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of requests answered 429')
+    parser.add_argument('--url', help='base URL of a running server, e.g. http://127.0.0.1:8080/api/ni')
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server(args)
+    try:
+        for name in args.scenarios.split(','):
+            print(json.dumps(run(name, url, args), sort_keys=True))
+            sys.stdout.flush()
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
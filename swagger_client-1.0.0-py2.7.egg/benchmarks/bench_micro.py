@@ -0,0 +1,228 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Micro-benchmarks of the serialization hot paths, offline.
+
+    Usage: python benchmarks/bench_micro.py [--output results.json] [--compare baseline.json]
+                                            [--filter deserialize] [--min-time 0.2] [--repeat 5]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from timeit import default_timer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import swagger_client  # noqa: E402
+from synthetic import bulk_fetch_json, metric_json, model_json  # noqa: E402
+
+RESULTS_VERSION = 1
+
+
+class Response(object):
+    """
+    Minimal stand-in for RESTResponse.
+    """
+
+    def __init__(self, data):
+        self.status = 200
+        self.reason = 'OK'
+        self.data = data
+        self.raw_data = data.encode('utf8')
+
+    def getheaders(self):
+        return {'Content-Type': 'application/json'}
+
+
+class NoopRESTClient(object):
+    """
+    Transport answering every request with the same response.
+    """
+
+    def __init__(self, response):
+        self.response = response
+
+    GET = HEAD = OPTIONS = DELETE = POST = PUT = PATCH = lambda self, url, **kwargs: self.response
+
+
+def _client():
+    return swagger_client.ApiClient(host='http://localhost/api/ni')
+
+
+def _model(api_client, type_name, data):
+    return api_client.deserialize(Response(json.dumps(data)), type_name)
+
+
+def case_sanitize(type_name):
+    def setup():
+        api_client = _client()
+        model = _model(api_client, type_name, model_json(type_name))
+        return lambda: api_client.sanitize_for_serialization(model), 1
+    return setup
+
+
+def case_deserialize(type_name, data_fn, items=1):
+    def setup():
+        api_client = _client()
+        response = Response(json.dumps(data_fn()))
+        api_client.deserialize(response, type_name)
+        return lambda: api_client.deserialize(response, type_name), items
+    return setup
+
+
+def case_to_dict(type_name, data_fn, items=1):
+    def setup():
+        model = _model(_client(), type_name, data_fn())
+        return model.to_dict, items
+    return setup
+
+
+def case_parameters_to_tuples():
+    api_client = _client()
+    params = [('entity_id', 'vm-1'), ('metric', 'metric.cpu.usage.rate.average.percent'), ('interval', 300),
+              ('start', 1528000000), ('end', 1528090000), ('ids', ['id-%d' % i for i in range(20)])]
+    formats = {'ids': 'csv'}
+    return lambda: api_client.parameters_to_tuples(params, formats), 1
+
+
+def case_call(api_class, method_name, response_data, response_mode, make_args, instrumented=False):
+    def setup():
+        api_client = _client()
+        api_client.rest_client = NoopRESTClient(Response(json.dumps(response_data)))
+        if instrumented:
+            api_client.instrumentation = swagger_client.Instrumentation()
+        method = getattr(api_class(api_client), method_name)
+        args, kwargs = make_args()
+        kwargs['_response_mode'] = response_mode
+        return lambda: method(*args, **kwargs), 1
+    return setup
+
+
+def _search_args():
+    request = swagger_client.SearchRequest(entity_type='Flow', filter="name = 'x'", size=100,
+                                           time_range=swagger_client.TimeRange(1528000000, 1528090000))
+    return (), {'body': request}
+
+
+CASES = [
+    ('sanitize.Flow', case_sanitize('Flow')),
+    ('sanitize.VirtualMachine', case_sanitize('VirtualMachine')),
+    ('sanitize.SearchRequest', case_sanitize('SearchRequest')),
+    ('deserialize.Flow', case_deserialize('Flow', lambda: model_json('Flow'))),
+    ('deserialize.VirtualMachine', case_deserialize('VirtualMachine', lambda: model_json('VirtualMachine'))),
+    ('deserialize.NSXSecurityGroup', case_deserialize('NSXSecurityGroup', lambda: model_json('NSXSecurityGroup'))),
+    ('deserialize.BulkFetchResponse.100', case_deserialize('BulkFetchResponse', lambda: bulk_fetch_json(100), 100)),
+    ('deserialize.MetricResponse.10k', case_deserialize('MetricResponse', lambda: metric_json(10000), 10000)),
+    ('parameters_to_tuples', case_parameters_to_tuples),
+    ('to_dict.Flow', case_to_dict('Flow', lambda: model_json('Flow'))),
+    ('to_dict.BulkFetchResponse.100', case_to_dict('BulkFetchResponse', lambda: bulk_fetch_json(100), 100)),
+    ('call.get_vm.raw_bytes', case_call(swagger_client.EntitiesApi, 'get_vm_with_http_info',
+                                        model_json('VirtualMachine'), 'raw_bytes', lambda: (('vm-1',), {}))),
+    ('call.get_vm.model', case_call(swagger_client.EntitiesApi, 'get_vm_with_http_info',
+                                    model_json('VirtualMachine'), 'model', lambda: (('vm-1',), {}))),
+    ('call.get_vm.raw_bytes.instrumented', case_call(swagger_client.EntitiesApi, 'get_vm_with_http_info',
+                                                     model_json('VirtualMachine'), 'raw_bytes',
+                                                     lambda: (('vm-1',), {}), instrumented=True)),
+    ('call.search_entities.raw_bytes', case_call(swagger_client.SearchApi, 'search_entities_with_http_info',
+                                                 {'results': []}, 'raw_bytes', _search_args)),
+]
+
+
+def measure(fn, min_time, repeat):
+    """
+    Times `fn`: the number of calls per run is chosen so a run lasts at
+    least `min_time` seconds, the fastest of `repeat` runs is kept.
+
+    :return: (seconds per call of the best run, of the median run).
+    """
+    number = 1
+    while True:
+        start = default_timer()
+        for _ in range(number):
+            fn()
+        elapsed = default_timer() - start
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9) * 1.1))
+    runs = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = default_timer()
+        for _ in range(number):
+            fn()
+        runs.append((default_timer() - start) / number)
+    runs.sort()
+    return runs[0], runs[len(runs) // 2]
+
+
+def run(name_filter=None, min_time=0.2, repeat=5):
+    results = {}
+    for name, setup in CASES:
+        if name_filter and name_filter not in name:
+            continue
+        fn, items = setup()
+        best, median = measure(fn, min_time, repeat)
+        results[name] = {'us_per_call': round(best * 1e6, 3),
+                         'median_us_per_call': round(median * 1e6, 3),
+                         'calls_per_sec': round(1 / best, 1),
+                         'items_per_sec': round(items / best, 1)}
+        print(json.dumps(dict(results[name], case=name), sort_keys=True))
+        sys.stdout.flush()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the ratio to a baseline per case, returns the regressed cases.
+    """
+    regressions = []
+    for name in sorted(results):
+        if name not in baseline:
+            continue
+        ratio = results[name]['us_per_call'] / baseline[name]['us_per_call']
+        flag = ''
+        if ratio > threshold:
+            flag = ' REGRESSION'
+            regressions.append(name)
+        print("{0:<36} {1:>12.3f} us {2:>7.2f}x{3}".format(name, results[name]['us_per_call'], ratio, flag))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of serialization and request preparation')
+    parser.add_argument('--filter', help='run the cases whose name contains this string')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per run')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per case, the fastest is reported')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.10,
+                        help='slowdown ratio reported as a regression, exit status 1')
+    args = parser.parse_args()
+
+    results = run(args.filter, args.min_time, args.repeat)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'version': RESULTS_VERSION,
+                       'python': platform.python_version(),
+                       'implementation': platform.python_implementation(),
+                       'machine': platform.machine(),
+                       'timestamp': int(time.time()),
+                       'results': results}, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
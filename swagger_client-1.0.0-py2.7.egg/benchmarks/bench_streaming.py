@@ -0,0 +1,93 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Peak memory of a large bulk fetch, preloaded versus streamed.
+
+    Usage: python benchmarks/bench_streaming.py [--count 20000]
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+from six.moves import BaseHTTPServer, socketserver
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import swagger_client  # noqa: E402
+from synthetic import bulk_fetch_json  # noqa: E402
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def serve(body):
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers['Content-Length']))
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def measure(name, fn):
+    tracemalloc.start()
+    start = time.time()
+    try:
+        count = fn()
+        elapsed = time.time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'mode': name, 'entities': count, 'seconds': round(elapsed, 3), 'peak_bytes': peak}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark streamed bulk fetch')
+    parser.add_argument('--count', type=int, default=20000, help='entities in the response')
+    args = parser.parse_args()
+
+    body = json.dumps(bulk_fetch_json(args.count)).encode('utf8')
+    server = serve(body)
+    api_client = swagger_client.ApiClient(host='http://127.0.0.1:%d' % server.server_address[1])
+    entities_api = swagger_client.EntitiesApi(api_client)
+    request = swagger_client.FetchRequest(entity_ids=[])
+    print(json.dumps({'response_bytes': len(body)}))
+
+    def preloaded():
+        return sum(1 for _ in entities_api.entities_fetch_post(body=request).results)
+
+    def streamed():
+        return sum(1 for _ in swagger_client.stream_results(entities_api.entities_fetch_post, body=request,
+                                                            item_type='EntityWithTime'))
+
+    for name, fn in (('preloaded', preloaded), ('streamed', streamed)):
+        print(json.dumps(measure(name, fn), sort_keys=True))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
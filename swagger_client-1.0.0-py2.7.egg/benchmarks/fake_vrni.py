@@ -0,0 +1,324 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Local stand-in for a vRNI platform, serving synthetic data.
+
+    Usage: python benchmarks/fake_vrni.py [--port 8080] [--entities 10000] [--latency 0.01]
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import inspect
+import itertools
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+from six.moves import BaseHTTPServer, socketserver
+from six.moves.urllib.parse import parse_qsl, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from swagger_client import apis, models  # noqa: E402
+from synthetic import CONCRETE_TYPES, model_json  # noqa: E402
+
+BASE_PATH = '/api/ni'
+# API classes whose routes are served.
+API_CLASSES = [apis.AuthenticationApi, apis.EntitiesApi, apis.SearchApi, apis.MetricsApi,
+               apis.ApplicationsApi, apis.DataSourcesApi]
+START_TIME = 1528000000
+
+_CALL_API = re.compile(r"call_api\('([^']+)', '([A-Z]+)',.*?response_type=([^,\n]+),", re.S)
+
+
+class Route(object):
+    """
+    A resource path template with its method and response type.
+    """
+
+    def __init__(self, template, method, response_type):
+        self.template = template
+        self.method = method
+        self.response_type = None if response_type == 'None' else response_type.strip("'")
+        self.params = re.findall(r'{([^}]+)}', template)
+        self.pattern = re.compile('^' + re.sub(r'{[^}]+}', '([^/]+)', template) + '$')
+
+    def match(self, method, path):
+        if method != self.method:
+            return None
+        match = self.pattern.match(path)
+        return dict(zip(self.params, match.groups())) if match else None
+
+
+def load_routes(api_classes=API_CLASSES):
+    """
+    Returns the routes called by the generated API classes, literal paths
+    before templated ones.
+    """
+    routes = []
+    for api_class in api_classes:
+        source = inspect.getsource(inspect.getmodule(api_class))
+        routes.extend(Route(*match) for match in _CALL_API.findall(source))
+    return sorted(routes, key=lambda r: len(r.params))
+
+
+class FakeVRNI(object):
+    """
+    Threaded HTTP server answering the routes of the API classes with
+    synthetic data.
+
+    Cursor based routes page through `entities` results, bulk fetch returns
+    one entity per requested id and metrics return one point per interval
+    of the requested range. Other routes return a generated instance of
+    their response type.
+
+    >>> server = FakeVRNI(entities=10000, latency=0.005).start()
+    >>> api_client = swagger_client.ApiClient(host=server.url)
+
+    :param entities: number of results of cursor based routes.
+    :param list_size: number of items of generated list attributes.
+    :param latency: seconds added to every response.
+    :param throttle_rate: fraction of requests answered with 429.
+    :param retry_after: `Retry-After` seconds of the 429 answers.
+    :param require_auth: answer 401 to requests without a valid token.
+    :param token_ttl: seconds a token issued by /auth/token is valid.
+    :param port: port to listen on, 0 picks a free one.
+    """
+
+    def __init__(self, entities=1000, list_size=3, latency=0.0, throttle_rate=0.0, retry_after=0,
+                 require_auth=False, token_ttl=1800, port=0, seed=0):
+        self.entities = entities
+        self.list_size = list_size
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.require_auth = require_auth
+        self.token_ttl = token_ttl
+        self.port = port
+        self.routes = load_routes()
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.throttled = 0
+        self.tokens = {}
+        self._templates = {}
+        self._token_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d%s' % (self._server.server_address[1], BASE_PATH)
+
+    def start(self):
+        """
+        Starts serving on a background thread.
+        """
+        self._server = _Server(('127.0.0.1', self.port), _handler(self))
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def template(self, type_name):
+        """
+        Returns the serialized synthetic instance of a type, generated once.
+        """
+        if type_name not in self._templates:
+            self._templates[type_name] = json.dumps(model_json(CONCRETE_TYPES.get(type_name, type_name),
+                                                               self.list_size))
+        return self._templates[type_name]
+
+    def entity_template(self, entity_type):
+        if entity_type and hasattr(models, entity_type) and getattr(models, entity_type).swagger_types:
+            return self.template(entity_type)
+        return self.template('Flow')
+
+    # route handlers, returning (status, body)
+
+    def issue_token(self):
+        token = 'token-%d' % next(self._token_ids)
+        expiry = time.time() + self.token_ttl
+        with self._lock:
+            self.tokens[token] = expiry
+        return 200, json.dumps({'token': token, 'expiry': int(expiry * 1000)})
+
+    def is_authorized(self, header):
+        if not self.require_auth:
+            return True
+        token = (header or '').split(' ')[-1]
+        expiry = self.tokens.get(token)
+        return expiry is not None and expiry > time.time()
+
+    def page(self, offset, size, entity_type, item_type='EntityIdWithTime'):
+        end = min(offset + size, self.entities)
+        if item_type in ('EntityIdWithTime', 'EntityId'):
+            results = ','.join('{"entity_id":"%s-%d","entity_type":"%s","time":%d}'
+                               % (entity_type, i, entity_type, START_TIME + i) for i in range(offset, end))
+        else:
+            results = ','.join([self.template(item_type)] * (end - offset))
+        cursor = json.dumps(str(end)) if end < self.entities else 'null'
+        return 200, '{"results":[%s],"cursor":%s,"total_count":%d,"start_time":%d,"end_time":%d}' % (
+            results, cursor, self.entities, START_TIME, START_TIME + self.entities)
+
+    def search(self, body):
+        return self.page(int(body.get('cursor') or 0), int(body.get('size') or 10),
+                         body.get('entity_type') or 'Flow')
+
+    def bulk_fetch(self, body):
+        results = ','.join('{"entity_id":%s,"entity_type":%s,"time":%d,"entity":%s}'
+                           % (json.dumps(e.get('entity_id')), json.dumps(e.get('entity_type')),
+                              e.get('time') or START_TIME, self.entity_template(e.get('entity_type')))
+                           for e in body.get('entity_ids') or [])
+        return 200, '{"results":[%s]}' % results
+
+    def names(self, body):
+        return 200, json.dumps({'entities': [{'entity_id': e.get('entity_id'), 'name': 'name-%s' % e.get('entity_id')}
+                                             for e in body.get('entities') or []]})
+
+    def metrics(self, query):
+        interval = int(query.get('interval') or 300)
+        start = int(query.get('start') or START_TIME)
+        end = int(query.get('end') or start + interval * 300)
+        points = ','.join('[%d,%.2f]' % (t, (t // interval) % 100) for t in range(start - start % interval, end, interval))
+        return 200, ('{"metric":%s,"display_name":"metric","interval":%d,"unit":"%%","pointlist":[%s],'
+                     '"start":%d,"end":%d}') % (json.dumps(query.get('metric')), interval, points, start, end)
+
+    def respond(self, method, path, query, body):
+        """
+        Returns the (status, body) answer to a request.
+        """
+        if path == '/auth/token' and method == 'POST':
+            return self.issue_token()
+        if path == '/search' and method == 'POST':
+            return self.search(body)
+        if path == '/entities/fetch' and method == 'POST':
+            return self.bulk_fetch(body)
+        if path == '/entities/names' and method == 'POST':
+            return self.names(body)
+        if path == '/metrics' and method == 'GET':
+            return self.metrics(query)
+        for route in self.routes:
+            params = route.match(method, path)
+            if params is None:
+                continue
+            if route.response_type is None:
+                return 204, ''
+            klass = getattr(models, route.response_type, None)
+            if klass is not None and 'results' in klass.swagger_types and 'cursor' in klass.swagger_types:
+                item_type = klass.swagger_types['results'][5:-1]
+                return self.page(int(query.get('cursor') or 0), int(query.get('size') or 10),
+                                 'Entity', item_type)
+            data = self.template(route.response_type)
+            if 'id' in params and data.startswith('{"') and '"entity_id"' in data:
+                entity = json.loads(data)
+                entity['entity_id'] = params['id']
+                data = json.dumps(entity)
+            return 200, data
+        return 404, json.dumps({'code': 404, 'message': 'No route for %s %s' % (method, path)})
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def _handler(fake):
+
+    class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # send headers and body in one segment, avoids delayed ACK stalls
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def handle_request(self, method):
+            length = int(self.headers.get('Content-Length') or 0)
+            raw_body = self.rfile.read(length) if length else b''
+            with fake._lock:
+                fake.requests += 1
+                throttled = fake.throttle_rate and fake.random.random() < fake.throttle_rate
+                if throttled:
+                    fake.throttled += 1
+            if fake.latency:
+                time.sleep(fake.latency)
+            url = urlsplit(self.path)
+            path = url.path[len(BASE_PATH):] if url.path.startswith(BASE_PATH) else url.path
+            headers = {'Content-Type': 'application/json'}
+            if throttled:
+                status, body = 429, '{"code":429,"message":"Too many requests"}'
+                headers['Retry-After'] = str(fake.retry_after)
+            elif not path.startswith('/auth/') and not fake.is_authorized(self.headers.get('Authorization')):
+                status, body = 401, '{"code":401,"message":"Unauthorized"}'
+            else:
+                try:
+                    body = json.loads(raw_body.decode('utf8')) if raw_body else {}
+                except ValueError:
+                    body = {}
+                status, body = fake.respond(method, path, dict(parse_qsl(url.query)), body)
+            data = body.encode('utf8')
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            self.handle_request('GET')
+
+        def do_POST(self):
+            self.handle_request('POST')
+
+        def do_PUT(self):
+            self.handle_request('PUT')
+
+        def do_PATCH(self):
+            self.handle_request('PATCH')
+
+        def do_DELETE(self):
+            self.handle_request('DELETE')
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a fake vRNI API')
+    parser.add_argument('--port', type=int, default=0, help='port to listen on, 0 picks a free one')
+    parser.add_argument('--entities', type=int, default=10000, help='results of cursor based routes')
+    parser.add_argument('--list-size', type=int, default=3, help='items of generated list attributes')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction of requests answered 429')
+    parser.add_argument('--retry-after', type=int, default=0, help='Retry-After seconds of 429 answers')
+    parser.add_argument('--require-auth', action='store_true', help='answer 401 without a valid token')
+    parser.add_argument('--token-ttl', type=int, default=1800, help='seconds issued tokens are valid')
+    args = parser.parse_args()
+
+    fake = FakeVRNI(entities=args.entities, list_size=args.list_size, latency=args.latency,
+                    throttle_rate=args.throttle_rate, retry_after=args.retry_after,
+                    require_auth=args.require_auth, token_ttl=args.token_ttl, port=args.port).start()
+    # the first line tells a parent process where to connect
+    print(fake.url)
+    sys.stdout.flush()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == '__main__':
+    main()
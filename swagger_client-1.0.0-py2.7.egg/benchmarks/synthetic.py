@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Synthetic JSON payloads generated from the model definitions.
+"""
+
+from __future__ import absolute_import
+
+import ast
+import inspect
+import itertools
+import re
+
+from six import iteritems
+
+from swagger_client import models
+
+# Concrete entity type used for each polymorphic base type.
+CONCRETE_TYPES = {
+    'BaseVirtualMachine': 'VirtualMachine',
+    'BaseNSXManager': 'NSXVManager',
+    'BaseL2Network': 'VxlanLayer2Network',
+    'BaseFirewallRule': 'NSXFirewallRule',
+    'BaseSecurityGroup': 'NSXSecurityGroup',
+    'BaseIPSet': 'NSXIPSet',
+    'BaseVnic': 'Vnic',
+    'BaseService': 'NSXService',
+    'BaseServiceGroup': 'NSXServiceGroup',
+    'BaseFirewallManager': 'NSXVManager',
+    'BaseEntity': 'Flow',
+}
+
+_counter = itertools.count()
+_allowed_values = {}
+
+
+def allowed_values(klass, attr):
+    """
+    Returns the enum values accepted by a model attribute setter, or None.
+    """
+    key = (klass, attr)
+    if key not in _allowed_values:
+        source = inspect.getsource(getattr(klass, attr).fset)
+        match = re.search(r'allowed_values = (\[.*\])', source)
+        _allowed_values[key] = ast.literal_eval(match.group(1)) if match else None
+    return _allowed_values[key]
+
+
+def json_for_type(type_name, list_size=3, depth=0, max_depth=4):
+    """
+    Returns JSON data matching a swagger type string.
+
+    :param type_name: swagger type, e.g. 'Flow' or 'list[Reference]'.
+    :param list_size: number of items generated for list types.
+    :param max_depth: nesting depth after which models are left out.
+    """
+    if type_name.startswith('list['):
+        sub_type = type_name[5:-1]
+        return [json_for_type(sub_type, list_size, depth + 1, max_depth) for _ in range(list_size)]
+    if type_name.startswith('dict('):
+        sub_type = re.match(r'dict\(([^,]*), (.*)\)', type_name).group(2)
+        return dict(('key%d' % i, json_for_type(sub_type, list_size, depth + 1, max_depth))
+                    for i in range(list_size))
+    if type_name == 'str':
+        return 'value-%d' % next(_counter)
+    if type_name in ('int', 'long'):
+        return next(_counter)
+    if type_name == 'float':
+        return next(_counter) * 0.5
+    if type_name == 'bool':
+        return True
+    if type_name == 'object':
+        return {}
+    if type_name == 'date':
+        return '2018-06-01'
+    if type_name == 'datetime':
+        return '2018-06-01T12:00:00Z'
+    return model_json(CONCRETE_TYPES.get(type_name, type_name), list_size, depth, max_depth)
+
+
+def model_json(model_name, list_size=3, depth=0, max_depth=4):
+    """
+    Returns a JSON dict for a model, with every attribute filled in.
+    """
+    klass = getattr(models, model_name)
+    if not klass.swagger_types:
+        # enums, use the first allowed value
+        values = [v for k, v in sorted(vars(klass).items()) if k.isupper()]
+        return values[0] if values else 'value'
+    if depth > max_depth:
+        return None
+    data = {}
+    for attr, attr_type in iteritems(klass.swagger_types):
+        values = allowed_values(klass, attr)
+        if values:
+            data[klass.attribute_map[attr]] = values[0]
+        else:
+            data[klass.attribute_map[attr]] = json_for_type(attr_type, list_size, depth + 1, max_depth)
+    if 'entity_type' in klass.swagger_types:
+        data['entity_type'] = model_name
+    return data
+
+
+def bulk_fetch_json(count, entity_type='Flow'):
+    """
+    Returns a `BulkFetchResponse` JSON dict of `count` entities.
+    """
+    entity = model_json(entity_type)
+    return {'results': [{'entity_id': 'id-%d' % i,
+                         'entity_type': entity_type,
+                         'time': 1528000000,
+                         'entity': entity} for i in range(count)]}
+
+
+def metric_json(points, entity_id='vm-1', metric='metric.cpu.usage.rate.average.percent'):
+    """
+    Returns a `MetricResponse` JSON dict with `points` points.
+    """
+    return {'metric': metric,
+            'display_name': 'CPU Usage',
+            'interval': 300,
+            'unit': '%',
+            'pointlist': [[1528000000 + i * 300, i * 0.25] for i in range(points)],
+            'start': 1528000000,
+            'end': 1528000000 + points * 300}
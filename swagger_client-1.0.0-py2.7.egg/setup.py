@@ -23,7 +23,8 @@ VERSION = "1.0.0"
 # prerequisite: setuptools
 # http://pypi.python.org/pypi/setuptools
 
-REQUIRES = ["urllib3 >= 1.15", "six >= 1.10", "certifi", "python-dateutil"]
+REQUIRES = ["urllib3 >= 1.15", "six >= 1.10", "certifi", "python-dateutil",
+            "futures; python_version < '3'"]
 
 setup(
     name=NAME,
@@ -33,6 +34,17 @@ setup(
     url="",
     keywords=["Swagger", "vRealize Network Insight API Reference"],
     install_requires=REQUIRES,
+    extras_require={
+        # asyncio client, swagger_client.aio
+        'async': ['aiohttp >= 3.0; python_version >= "3.5"'],
+        # columnar metrics, swagger_client.metrics
+        'numpy': ['numpy'],
+        # Parquet export, swagger_client.export
+        'parquet': ['pyarrow'],
+    },
+    entry_points={
+        'console_scripts': ['vrni-export = swagger_client.export:main'],
+    },
     packages=find_packages(),
     include_package_data=True,
     long_description="""\
@@ -13,244 +13,283 @@
 
 from __future__ import absolute_import
 
-# import models into sdk package
-from .models.aggregation import Aggregation
-from .models.aggregation_request import AggregationRequest
-from .models.aggregation_response import AggregationResponse
-from .models.aggregation_with_value import AggregationWithValue
-from .models.all_entity_type import AllEntityType
-from .models.api_error import ApiError
-from .models.application_flow_summary import ApplicationFlowSummary
-from .models.application_member import ApplicationMember
-from .models.application_request import ApplicationRequest
-from .models.application_vm_members import ApplicationVMMembers
-from .models.applied_to import AppliedTo
-from .models.audit_list_response import AuditListResponse
-from .models.audit_request import AuditRequest
-from .models.audit_response import AuditResponse
-from .models.base_data_source import BaseDataSource
-from .models.base_data_source_request import BaseDataSourceRequest
-from .models.base_entity import BaseEntity
-from .models.bulk_fetch_response import BulkFetchResponse
-from .models.cisco_switch_type import CiscoSwitchType
-from .models.data_source_entity_id import DataSourceEntityId
-from .models.data_source_list_response import DataSourceListResponse
-from .models.data_source_type import DataSourceType
-from .models.datasource_health import DatasourceHealth
-from .models.dell_switch_type import DellSwitchType
-from .models.domain import Domain
-from .models.ec2_firewall_direction import EC2FirewallDirection
-from .models.entity_id import EntityId
-from .models.entity_id_with_time import EntityIdWithTime
-from .models.entity_metrics_schema import EntityMetricsSchema
-from .models.entity_type import EntityType
-from .models.entity_with_time import EntityWithTime
-from .models.error_detail import ErrorDetail
-from .models.fetch_request import FetchRequest
-from .models.fetch_request_entity_ids import FetchRequestEntityIds
-from .models.firewall_action import FirewallAction
-from .models.firewall_direction import FirewallDirection
-from .models.firewall_rule_set import FirewallRuleSet
-from .models.flow_summary import FlowSummary
-from .models.flow_tag import FlowTag
-from .models.flow_traffic_type import FlowTrafficType
-from .models.group_entry import GroupEntry
-from .models.group_membership_criteria import GroupMembershipCriteria
-from .models.ip_address_membership_criteria import IpAddressMembershipCriteria
-from .models.ip_address_range import IpAddressRange
-from .models.ip_numeric_range import IpNumericRange
-from .models.ip_tag import IpTag
-from .models.ip_tag_id_list import IpTagIdList
-from .models.ip_v4_address import IpV4Address
-from .models.k8_s_credentials import K8SCredentials
-from .models.kubernetes_source_request import KubernetesSourceRequest
-from .models.manager import Manager
-from .models.meta_entity_type import MetaEntityType
-from .models.metric_response import MetricResponse
-from .models.metric_schema import MetricSchema
-from .models.micro_sec_group import MicroSecGroup
-from .models.nsx_controller_data_collection import NSXControllerDataCollection
-from .models.name_request_param import NameRequestParam
-from .models.names_request import NamesRequest
-from .models.names_response import NamesResponse
-from .models.node import Node
-from .models.node_id import NodeId
-from .models.node_list_result import NodeListResult
-from .models.node_type import NodeType
-from .models.pks_source_request import PKSSourceRequest
-from .models.paged_application_list_response import PagedApplicationListResponse
-from .models.paged_list_response import PagedListResponse
-from .models.paged_list_response_with_time import PagedListResponseWithTime
-from .models.paged_user_group_list_response import PagedUserGroupListResponse
-from .models.paged_user_list_response import PagedUserListResponse
-from .models.password_credentials import PasswordCredentials
-from .models.path_firewall_rules import PathFirewallRules
-from .models.path_firewall_rules_request import PathFirewallRulesRequest
-from .models.port_range import PortRange
-from .models.protocol import Protocol
-from .models.recommended_rule import RecommendedRule
-from .models.recommended_rules import RecommendedRules
-from .models.recommended_rules_request import RecommendedRulesRequest
-from .models.reference import Reference
-from .models.role import Role
-from .models.rule_set import RuleSet
-from .models.snmp2c_config import SNMP2cConfig
-from .models.snmp3_config import SNMP3Config
-from .models.snmp_config import SNMPConfig
-from .models.scope_enum import ScopeEnum
-from .models.search_membership_criteria import SearchMembershipCriteria
-from .models.search_request import SearchRequest
-from .models.service_now_source_request import ServiceNowSourceRequest
-from .models.simple_list_response import SimpleListResponse
-from .models.simple_port_range import SimplePortRange
-from .models.sort_by_clause import SortByClause
-from .models.subnet_mapping_list import SubnetMappingList
-from .models.subnet_mapping_request import SubnetMappingRequest
-from .models.tier_list_response import TierListResponse
-from .models.tier_request import TierRequest
-from .models.time_range import TimeRange
-from .models.token import Token
-from .models.user_credential import UserCredential
-from .models.user_group_response import UserGroupResponse
-from .models.user_group_type import UserGroupType
-from .models.user_response import UserResponse
-from .models.user_type import UserType
-from .models.vendor_id import VendorId
-from .models.vendor_info import VendorInfo
-from .models.version_response import VersionResponse
-from .models.vidm_config_response import VidmConfigResponse
-from .models.vidm_configuration import VidmConfiguration
-from .models.vidm_oauth_client_response import VidmOauthClientResponse
-from .models.vidm_token import VidmToken
-from .models.vidm_user_group_request import VidmUserGroupRequest
-from .models.vidm_user_request import VidmUserRequest
-from .models.vlan import Vlan
-from .models.application import Application
-from .models.base_event import BaseEvent
-from .models.base_firewall import BaseFirewall
-from .models.base_firewall_rule import BaseFirewallRule
-from .models.base_ip_set import BaseIPSet
-from .models.base_l2_network import BaseL2Network
-from .models.base_manager import BaseManager
-from .models.base_service import BaseService
-from .models.base_virtual_machine import BaseVirtualMachine
-from .models.base_vnic import BaseVnic
-from .models.cluster import Cluster
-from .models.container_base_data_source import ContainerBaseDataSource
-from .models.datastore import Datastore
-from .models.distributed_virtual_portgroup import DistributedVirtualPortgroup
-from .models.distributed_virtual_switch import DistributedVirtualSwitch
-from .models.entity_name import EntityName
-from .models.flow import Flow
-from .models.folder import Folder
-from .models.group import Group
-from .models.host import Host
-from .models.infoblox_manager_data_source_request import InfobloxManagerDataSourceRequest
-from .models.kubernetes_data_source_request import KubernetesDataSourceRequest
-from .models.nsxt_manager_data_source_request import NSXTManagerDataSourceRequest
-from .models.nsxv_manager_data_source import NSXVManagerDataSource
-from .models.nsxv_manager_data_source_request import NSXVManagerDataSourceRequest
-from .models.pks_data_source import PKSDataSource
-from .models.pks_data_source_request import PKSDataSourceRequest
-from .models.policy_manager_data_source import PolicyManagerDataSource
-from .models.policy_manager_data_source_request import PolicyManagerDataSourceRequest
-from .models.resource_pool import ResourcePool
-from .models.security_tag import SecurityTag
-from .models.service_now_data_source_request import ServiceNowDataSourceRequest
-from .models.subnet_mapping import SubnetMapping
-from .models.switch_data_source import SwitchDataSource
-from .models.switch_data_source_request import SwitchDataSourceRequest
-from .models.tier import Tier
-from .models.vc_datacenter import VCDatacenter
-from .models.v_center_data_source import VCenterDataSource
-from .models.v_center_data_source_request import VCenterDataSourceRequest
-from .models.vpc import VPC
-from .models.vmknic import Vmknic
-from .models.arista_switch_data_source import AristaSwitchDataSource
-from .models.arista_switch_data_source_request import AristaSwitchDataSourceRequest
-from .models.base_firewall_manager import BaseFirewallManager
-from .models.base_generic_firewall import BaseGenericFirewall
-from .models.base_generic_firewall_rule import BaseGenericFirewallRule
-from .models.base_nsx_manager import BaseNSXManager
-from .models.base_security_group import BaseSecurityGroup
-from .models.base_service_group import BaseServiceGroup
-from .models.brocade_switch_data_source import BrocadeSwitchDataSource
-from .models.brocade_switch_data_source_request import BrocadeSwitchDataSourceRequest
-from .models.checkpoint_firewall_data_source import CheckpointFirewallDataSource
-from .models.checkpoint_firewall_data_source_request import CheckpointFirewallDataSourceRequest
-from .models.cisco_aci_data_source import CiscoACIDataSource
-from .models.cisco_aci_data_source_request import CiscoACIDataSourceRequest
-from .models.cisco_switch_data_source import CiscoSwitchDataSource
-from .models.cisco_switch_data_source_request import CiscoSwitchDataSourceRequest
-from .models.dell_switch_data_source import DellSwitchDataSource
-from .models.dell_switch_data_source_request import DellSwitchDataSourceRequest
-from .models.ec2_firewall import EC2Firewall
-from .models.ec2_ip_set import EC2IPSet
-from .models.ec2_instance import EC2Instance
-from .models.ec2_network_interface import EC2NetworkInterface
-from .models.ec2_sg_firewall_rule import EC2SGFirewallRule
-from .models.ec2_service import EC2Service
-from .models.gd_data_source import GDDataSource
-from .models.gd_data_source_request import GDDataSourceRequest
-from .models.hp_one_view_manager_data_source import HPOneViewManagerDataSource
-from .models.hp_one_view_manager_data_source_request import HPOneViewManagerDataSourceRequest
-from .models.hpvc_manager_data_source import HPVCManagerDataSource
-from .models.hpvc_manager_data_source_request import HPVCManagerDataSourceRequest
-from .models.infoblox_manager_data_source import InfobloxManagerDataSource
-from .models.juniper_switch_data_source import JuniperSwitchDataSource
-from .models.juniper_switch_data_source_request import JuniperSwitchDataSourceRequest
-from .models.kubernetes_data_source import KubernetesDataSource
-from .models.ns_service import NSService
-from .models.nsx_distributed_firewall import NSXDistributedFirewall
-from .models.nsx_firewall_rule import NSXFirewallRule
-from .models.nsxip_set import NSXIPSet
-from .models.nsx_redirect_rule import NSXRedirectRule
-from .models.nsx_service import NSXService
-from .models.nsxt_firewall import NSXTFirewall
-from .models.nsxtip_set import NSXTIPSet
-from .models.nsxt_manager_data_source import NSXTManagerDataSource
-from .models.pan_firewall_data_source import PanFirewallDataSource
-from .models.pan_firewall_data_source_request import PanFirewallDataSourceRequest
-from .models.problem_event import ProblemEvent
-from .models.service_now_data_source import ServiceNowDataSource
-from .models.ucs_manager_data_source import UCSManagerDataSource
-from .models.ucs_manager_data_source_request import UCSManagerDataSourceRequest
-from .models.v_center_manager import VCenterManager
-from .models.virtual_machine import VirtualMachine
-from .models.vlan_l2_network import VlanL2Network
-from .models.vnic import Vnic
-from .models.vxlan_layer2_network import VxlanLayer2Network
-from .models.checkpoint_firewall import CheckpointFirewall
-from .models.checkpoint_firewall_rule import CheckpointFirewallRule
-from .models.checkpoint_mds_manager import CheckpointMDSManager
-from .models.checkpoint_manager import CheckpointManager
-from .models.ec2_security_group import EC2SecurityGroup
-from .models.ns_group import NSGroup
-from .models.ns_service_group import NSServiceGroup
-from .models.nsx_security_group import NSXSecurityGroup
-from .models.nsx_service_group import NSXServiceGroup
-from .models.nsxt_firewall_rule import NSXTFirewallRule
-from .models.nsxt_manager import NSXTManager
-from .models.nsxv_manager import NSXVManager
-
-# import apis into sdk package
-from .apis.applications_api import ApplicationsApi
-from .apis.authentication_api import AuthenticationApi
-from .apis.data_sources_api import DataSourcesApi
-from .apis.entities_api import EntitiesApi
-from .apis.info_api import InfoApi
-from .apis.infrastructure_api import InfrastructureApi
-from .apis.logs_api import LogsApi
-from .apis.metrics_api import MetricsApi
-from .apis.microsegmentation_api import MicrosegmentationApi
-from .apis.path_api import PathApi
-from .apis.schema_api import SchemaApi
-from .apis.search_api import SearchApi
-from .apis.settings_api import SettingsApi
+from . import lazy
+from .configuration import Configuration
 
-# import ApiClient
-from .api_client import ApiClient
+# package attributes, imported on first access so that a script pays
+# only for the models and apis it uses
+_ATTRIBUTES = {
+    # models
+    'Aggregation': '.models.aggregation',
+    'AggregationRequest': '.models.aggregation_request',
+    'AggregationResponse': '.models.aggregation_response',
+    'AggregationWithValue': '.models.aggregation_with_value',
+    'AllEntityType': '.models.all_entity_type',
+    'ApiError': '.models.api_error',
+    'ApplicationFlowSummary': '.models.application_flow_summary',
+    'ApplicationMember': '.models.application_member',
+    'ApplicationRequest': '.models.application_request',
+    'ApplicationVMMembers': '.models.application_vm_members',
+    'AppliedTo': '.models.applied_to',
+    'AuditListResponse': '.models.audit_list_response',
+    'AuditRequest': '.models.audit_request',
+    'AuditResponse': '.models.audit_response',
+    'BaseDataSource': '.models.base_data_source',
+    'BaseDataSourceRequest': '.models.base_data_source_request',
+    'BaseEntity': '.models.base_entity',
+    'BulkFetchResponse': '.models.bulk_fetch_response',
+    'CiscoSwitchType': '.models.cisco_switch_type',
+    'DataSourceEntityId': '.models.data_source_entity_id',
+    'DataSourceListResponse': '.models.data_source_list_response',
+    'DataSourceType': '.models.data_source_type',
+    'DatasourceHealth': '.models.datasource_health',
+    'DellSwitchType': '.models.dell_switch_type',
+    'Domain': '.models.domain',
+    'EC2FirewallDirection': '.models.ec2_firewall_direction',
+    'EntityId': '.models.entity_id',
+    'EntityIdWithTime': '.models.entity_id_with_time',
+    'EntityMetricsSchema': '.models.entity_metrics_schema',
+    'EntityType': '.models.entity_type',
+    'EntityWithTime': '.models.entity_with_time',
+    'ErrorDetail': '.models.error_detail',
+    'FetchRequest': '.models.fetch_request',
+    'FetchRequestEntityIds': '.models.fetch_request_entity_ids',
+    'FirewallAction': '.models.firewall_action',
+    'FirewallDirection': '.models.firewall_direction',
+    'FirewallRuleSet': '.models.firewall_rule_set',
+    'FlowSummary': '.models.flow_summary',
+    'FlowTag': '.models.flow_tag',
+    'FlowTrafficType': '.models.flow_traffic_type',
+    'GroupEntry': '.models.group_entry',
+    'GroupMembershipCriteria': '.models.group_membership_criteria',
+    'IpAddressMembershipCriteria': '.models.ip_address_membership_criteria',
+    'IpAddressRange': '.models.ip_address_range',
+    'IpNumericRange': '.models.ip_numeric_range',
+    'IpTag': '.models.ip_tag',
+    'IpTagIdList': '.models.ip_tag_id_list',
+    'IpV4Address': '.models.ip_v4_address',
+    'K8SCredentials': '.models.k8_s_credentials',
+    'KubernetesSourceRequest': '.models.kubernetes_source_request',
+    'Manager': '.models.manager',
+    'MetaEntityType': '.models.meta_entity_type',
+    'MetricResponse': '.models.metric_response',
+    'MetricSchema': '.models.metric_schema',
+    'MicroSecGroup': '.models.micro_sec_group',
+    'NSXControllerDataCollection': '.models.nsx_controller_data_collection',
+    'NameRequestParam': '.models.name_request_param',
+    'NamesRequest': '.models.names_request',
+    'NamesResponse': '.models.names_response',
+    'Node': '.models.node',
+    'NodeId': '.models.node_id',
+    'NodeListResult': '.models.node_list_result',
+    'NodeType': '.models.node_type',
+    'PKSSourceRequest': '.models.pks_source_request',
+    'PagedApplicationListResponse': '.models.paged_application_list_response',
+    'PagedListResponse': '.models.paged_list_response',
+    'PagedListResponseWithTime': '.models.paged_list_response_with_time',
+    'PagedUserGroupListResponse': '.models.paged_user_group_list_response',
+    'PagedUserListResponse': '.models.paged_user_list_response',
+    'PasswordCredentials': '.models.password_credentials',
+    'PathFirewallRules': '.models.path_firewall_rules',
+    'PathFirewallRulesRequest': '.models.path_firewall_rules_request',
+    'PortRange': '.models.port_range',
+    'Protocol': '.models.protocol',
+    'RecommendedRule': '.models.recommended_rule',
+    'RecommendedRules': '.models.recommended_rules',
+    'RecommendedRulesRequest': '.models.recommended_rules_request',
+    'Reference': '.models.reference',
+    'Role': '.models.role',
+    'RuleSet': '.models.rule_set',
+    'SNMP2cConfig': '.models.snmp2c_config',
+    'SNMP3Config': '.models.snmp3_config',
+    'SNMPConfig': '.models.snmp_config',
+    'ScopeEnum': '.models.scope_enum',
+    'SearchMembershipCriteria': '.models.search_membership_criteria',
+    'SearchRequest': '.models.search_request',
+    'ServiceNowSourceRequest': '.models.service_now_source_request',
+    'SimpleListResponse': '.models.simple_list_response',
+    'SimplePortRange': '.models.simple_port_range',
+    'SortByClause': '.models.sort_by_clause',
+    'SubnetMappingList': '.models.subnet_mapping_list',
+    'SubnetMappingRequest': '.models.subnet_mapping_request',
+    'TierListResponse': '.models.tier_list_response',
+    'TierRequest': '.models.tier_request',
+    'TimeRange': '.models.time_range',
+    'Token': '.models.token',
+    'UserCredential': '.models.user_credential',
+    'UserGroupResponse': '.models.user_group_response',
+    'UserGroupType': '.models.user_group_type',
+    'UserResponse': '.models.user_response',
+    'UserType': '.models.user_type',
+    'VendorId': '.models.vendor_id',
+    'VendorInfo': '.models.vendor_info',
+    'VersionResponse': '.models.version_response',
+    'VidmConfigResponse': '.models.vidm_config_response',
+    'VidmConfiguration': '.models.vidm_configuration',
+    'VidmOauthClientResponse': '.models.vidm_oauth_client_response',
+    'VidmToken': '.models.vidm_token',
+    'VidmUserGroupRequest': '.models.vidm_user_group_request',
+    'VidmUserRequest': '.models.vidm_user_request',
+    'Vlan': '.models.vlan',
+    'Application': '.models.application',
+    'BaseEvent': '.models.base_event',
+    'BaseFirewall': '.models.base_firewall',
+    'BaseFirewallRule': '.models.base_firewall_rule',
+    'BaseIPSet': '.models.base_ip_set',
+    'BaseL2Network': '.models.base_l2_network',
+    'BaseManager': '.models.base_manager',
+    'BaseService': '.models.base_service',
+    'BaseVirtualMachine': '.models.base_virtual_machine',
+    'BaseVnic': '.models.base_vnic',
+    'Cluster': '.models.cluster',
+    'ContainerBaseDataSource': '.models.container_base_data_source',
+    'Datastore': '.models.datastore',
+    'DistributedVirtualPortgroup': '.models.distributed_virtual_portgroup',
+    'DistributedVirtualSwitch': '.models.distributed_virtual_switch',
+    'EntityName': '.models.entity_name',
+    'Flow': '.models.flow',
+    'Folder': '.models.folder',
+    'Group': '.models.group',
+    'Host': '.models.host',
+    'InfobloxManagerDataSourceRequest': '.models.infoblox_manager_data_source_request',
+    'KubernetesDataSourceRequest': '.models.kubernetes_data_source_request',
+    'NSXTManagerDataSourceRequest': '.models.nsxt_manager_data_source_request',
+    'NSXVManagerDataSource': '.models.nsxv_manager_data_source',
+    'NSXVManagerDataSourceRequest': '.models.nsxv_manager_data_source_request',
+    'PKSDataSource': '.models.pks_data_source',
+    'PKSDataSourceRequest': '.models.pks_data_source_request',
+    'PolicyManagerDataSource': '.models.policy_manager_data_source',
+    'PolicyManagerDataSourceRequest': '.models.policy_manager_data_source_request',
+    'ResourcePool': '.models.resource_pool',
+    'SecurityTag': '.models.security_tag',
+    'ServiceNowDataSourceRequest': '.models.service_now_data_source_request',
+    'SubnetMapping': '.models.subnet_mapping',
+    'SwitchDataSource': '.models.switch_data_source',
+    'SwitchDataSourceRequest': '.models.switch_data_source_request',
+    'Tier': '.models.tier',
+    'VCDatacenter': '.models.vc_datacenter',
+    'VCenterDataSource': '.models.v_center_data_source',
+    'VCenterDataSourceRequest': '.models.v_center_data_source_request',
+    'VPC': '.models.vpc',
+    'Vmknic': '.models.vmknic',
+    'AristaSwitchDataSource': '.models.arista_switch_data_source',
+    'AristaSwitchDataSourceRequest': '.models.arista_switch_data_source_request',
+    'BaseFirewallManager': '.models.base_firewall_manager',
+    'BaseGenericFirewall': '.models.base_generic_firewall',
+    'BaseGenericFirewallRule': '.models.base_generic_firewall_rule',
+    'BaseNSXManager': '.models.base_nsx_manager',
+    'BaseSecurityGroup': '.models.base_security_group',
+    'BaseServiceGroup': '.models.base_service_group',
+    'BrocadeSwitchDataSource': '.models.brocade_switch_data_source',
+    'BrocadeSwitchDataSourceRequest': '.models.brocade_switch_data_source_request',
+    'CheckpointFirewallDataSource': '.models.checkpoint_firewall_data_source',
+    'CheckpointFirewallDataSourceRequest': '.models.checkpoint_firewall_data_source_request',
+    'CiscoACIDataSource': '.models.cisco_aci_data_source',
+    'CiscoACIDataSourceRequest': '.models.cisco_aci_data_source_request',
+    'CiscoSwitchDataSource': '.models.cisco_switch_data_source',
+    'CiscoSwitchDataSourceRequest': '.models.cisco_switch_data_source_request',
+    'DellSwitchDataSource': '.models.dell_switch_data_source',
+    'DellSwitchDataSourceRequest': '.models.dell_switch_data_source_request',
+    'EC2Firewall': '.models.ec2_firewall',
+    'EC2IPSet': '.models.ec2_ip_set',
+    'EC2Instance': '.models.ec2_instance',
+    'EC2NetworkInterface': '.models.ec2_network_interface',
+    'EC2SGFirewallRule': '.models.ec2_sg_firewall_rule',
+    'EC2Service': '.models.ec2_service',
+    'GDDataSource': '.models.gd_data_source',
+    'GDDataSourceRequest': '.models.gd_data_source_request',
+    'HPOneViewManagerDataSource': '.models.hp_one_view_manager_data_source',
+    'HPOneViewManagerDataSourceRequest': '.models.hp_one_view_manager_data_source_request',
+    'HPVCManagerDataSource': '.models.hpvc_manager_data_source',
+    'HPVCManagerDataSourceRequest': '.models.hpvc_manager_data_source_request',
+    'InfobloxManagerDataSource': '.models.infoblox_manager_data_source',
+    'JuniperSwitchDataSource': '.models.juniper_switch_data_source',
+    'JuniperSwitchDataSourceRequest': '.models.juniper_switch_data_source_request',
+    'KubernetesDataSource': '.models.kubernetes_data_source',
+    'NSService': '.models.ns_service',
+    'NSXDistributedFirewall': '.models.nsx_distributed_firewall',
+    'NSXFirewallRule': '.models.nsx_firewall_rule',
+    'NSXIPSet': '.models.nsxip_set',
+    'NSXRedirectRule': '.models.nsx_redirect_rule',
+    'NSXService': '.models.nsx_service',
+    'NSXTFirewall': '.models.nsxt_firewall',
+    'NSXTIPSet': '.models.nsxtip_set',
+    'NSXTManagerDataSource': '.models.nsxt_manager_data_source',
+    'PanFirewallDataSource': '.models.pan_firewall_data_source',
+    'PanFirewallDataSourceRequest': '.models.pan_firewall_data_source_request',
+    'ProblemEvent': '.models.problem_event',
+    'ServiceNowDataSource': '.models.service_now_data_source',
+    'UCSManagerDataSource': '.models.ucs_manager_data_source',
+    'UCSManagerDataSourceRequest': '.models.ucs_manager_data_source_request',
+    'VCenterManager': '.models.v_center_manager',
+    'VirtualMachine': '.models.virtual_machine',
+    'VlanL2Network': '.models.vlan_l2_network',
+    'Vnic': '.models.vnic',
+    'VxlanLayer2Network': '.models.vxlan_layer2_network',
+    'CheckpointFirewall': '.models.checkpoint_firewall',
+    'CheckpointFirewallRule': '.models.checkpoint_firewall_rule',
+    'CheckpointMDSManager': '.models.checkpoint_mds_manager',
+    'CheckpointManager': '.models.checkpoint_manager',
+    'EC2SecurityGroup': '.models.ec2_security_group',
+    'NSGroup': '.models.ns_group',
+    'NSServiceGroup': '.models.ns_service_group',
+    'NSXSecurityGroup': '.models.nsx_security_group',
+    'NSXServiceGroup': '.models.nsx_service_group',
+    'NSXTFirewallRule': '.models.nsxt_firewall_rule',
+    'NSXTManager': '.models.nsxt_manager',
+    'NSXVManager': '.models.nsxv_manager',
+    # apis
+    'ApplicationsApi': '.apis.applications_api',
+    'AuthenticationApi': '.apis.authentication_api',
+    'DataSourcesApi': '.apis.data_sources_api',
+    'EntitiesApi': '.apis.entities_api',
+    'InfoApi': '.apis.info_api',
+    'InfrastructureApi': '.apis.infrastructure_api',
+    'LogsApi': '.apis.logs_api',
+    'MetricsApi': '.apis.metrics_api',
+    'MicrosegmentationApi': '.apis.microsegmentation_api',
+    'PathApi': '.apis.path_api',
+    'SchemaApi': '.apis.schema_api',
+    'SearchApi': '.apis.search_api',
+    'SettingsApi': '.apis.settings_api',
+    # ApiClient and helpers
+    'ApiClient': '.api_client',
+    'PageIterator': '.pagination',
+    'iter_pages': '.pagination',
+    'iter_results': '.pagination',
+    'EntityHydrator': '.hydration',
+    'hydrate': '.hydration',
+    'ReferenceResolver': '.resolver',
+    'ResultStream': '.streaming',
+    'stream_results': '.streaming',
+    'MetricSeries': '.metrics',
+    'MetricsFetcher': '.metrics',
+    'MetricSchemaIndex': '.schema_index',
+    'Throttle': '.throttle',
+    'RetryPolicy': '.retry',
+    'CheckpointedWalk': '.checkpoint',
+    'ShardedSearch': '.sharding',
+    'split_time_range': '.sharding',
+    'CsvSink': '.export',
+    'ExportPipeline': '.export',
+    'JsonLinesSink': '.export',
+    'ParquetSink': '.export',
+    'AggregationPlanner': '.aggregation',
+    'time_buckets': '.aggregation',
+    'Instrumentation': '.instrumentation',
+    'StatsdExporter': '.instrumentation',
+    'TokenCache': '.auth',
+    'TokenManager': '.auth',
+}
 
-from .configuration import Configuration
+# submodules reachable as `swagger_client.<name>` without importing them
+# first; `configuration` stays the Configuration instance
+_SUBMODULES = [
+    'aggregation', 'aio', 'api_client', 'apis', 'auth', 'cache', 'checkpoint', 'compact', 'conditional', 'export',
+    'hydration', 'instrumentation', 'metrics', 'models', 'pagination', 'resolver', 'response_cache', 'rest',
+    'retry', 'schema_index', 'sharding', 'streaming', 'throttle',
+]
 
 configuration = Configuration()
+
+lazy.install(__name__, _ATTRIBUTES, _SUBMODULES)
@@ -0,0 +1,258 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Planning and caching of `SearchApi.aggregate_search_results` queries.
+"""
+
+from __future__ import absolute_import
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+from collections import namedtuple
+
+from .apis.search_api import SearchApi
+from .configuration import Configuration
+from .metrics import time_chunks
+from .models.aggregation import Aggregation
+from .models.aggregation_request import AggregationRequest
+from .models.time_range import TimeRange
+
+DAY = 86400
+
+# One aggregation request: the aggregations are (field, aggregation_type) tuples.
+AggregationQuery = namedtuple('AggregationQuery', ['entity_type', 'filter', 'start_time', 'end_time',
+                                                   'aggregations'])
+
+
+def time_buckets(start, end, size=DAY):
+    """
+    Splits a time range into buckets aligned to multiples of `size`
+    seconds since the epoch, e.g. UTC days.
+
+    :return: list of (start, end) tuples covering the range.
+    """
+    return list(time_chunks(start, end, size, max_points=1))
+
+
+def _aggregation_spec(aggregation):
+    if isinstance(aggregation, Aggregation):
+        return aggregation.field, aggregation.aggregation_type
+    field, aggregation_type = aggregation
+    return field, aggregation_type
+
+
+def _bucket(bucket):
+    if isinstance(bucket, TimeRange):
+        return bucket.start_time, bucket.end_time
+    start, end = bucket
+    return start, end
+
+
+class AggregationPlanner(object):
+    """
+    Runs a matrix of aggregation queries: filters x time buckets x
+    aggregations.
+
+    All aggregations of a (filter, bucket) cell are sent in one request,
+    identical cells are requested once and the requests run concurrently
+    on the thread pool of the api client. Results of closed buckets, ended
+    more than `settle` seconds ago, cannot change any more and are cached,
+    in memory and, when a cache directory is configured, in a JSON file
+    keyed by platform and user, so a daily report only queries the newest bucket.
+
+    >>> planner = AggregationPlanner(search_api)
+    >>> table = planner.run('Flow', ["destination_l2_network.name = 'vlan-1014'"],
+    >>>                     time_buckets(start, end, DAY),
+    >>>                     [('flow.totalBytes.delta.summation.bytes', 'SUM')])
+
+    :param search_api: SearchApi used for the aggregation calls.
+    :param cache_dir: directory of the on-disk cache, defaults to
+        `Configuration.cache_dir`; None keeps results in memory only.
+    :param settle: seconds after its end a bucket is considered closed.
+    :param max_in_flight: number of requests queued or running, defaults
+        to twice the thread pool size of the api client.
+    :param clock: function returning the current time in seconds.
+    """
+
+    def __init__(self, search_api=None, cache_dir=None, settle=3600, max_in_flight=None, clock=time.time):
+        self.search_api = search_api or SearchApi()
+        self.cache_dir = cache_dir if cache_dir is not None else Configuration().cache_dir
+        self.settle = settle
+        self.max_in_flight = max_in_flight
+        self.clock = clock
+        # counters of the last run
+        self.requests = 0
+        self.cache_hits = 0
+        self._cache = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def cache_file(self):
+        """
+        Gets the path of the on-disk cache, or None.
+        """
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, 'aggregations.json')
+
+    def plan(self, entity_type, filters, buckets, aggregations):
+        """
+        Returns the distinct queries needed for a matrix, in matrix order.
+
+        :param entity_type: entity type, e.g. 'Flow'.
+        :param filters: filter expressions, None for no filter.
+        :param buckets: (start, end) tuples or `TimeRange` objects.
+        :param aggregations: `Aggregation` objects or (field,
+            aggregation_type) tuples.
+        :return: list of AggregationQuery.
+        """
+        specs = []
+        for aggregation in aggregations:
+            spec = _aggregation_spec(aggregation)
+            if spec not in specs:
+                specs.append(spec)
+        queries = []
+        seen = set()
+        for query_filter in filters:
+            for bucket in buckets:
+                start, end = _bucket(bucket)
+                query = AggregationQuery(entity_type, query_filter, start, end, tuple(specs))
+                if query not in seen:
+                    seen.add(query)
+                    queries.append(query)
+        return queries
+
+    def is_closed(self, query):
+        """
+        Returns True if the results of a query can no longer change.
+        """
+        return query.end_time is not None and query.end_time + self.settle <= self.clock()
+
+    def fetch(self, query):
+        """
+        Runs a single query.
+
+        :return: dict of (field, aggregation_type) to value.
+        """
+        request = AggregationRequest(entity_type=query.entity_type, filter=query.filter,
+                                     aggregations=[Aggregation(field=field, aggregation_type=aggregation_type)
+                                                   for field, aggregation_type in query.aggregations],
+                                     time_range=TimeRange(start_time=query.start_time, end_time=query.end_time))
+        response = self.search_api.aggregate_search_results(body=request, _response_mode='dict') or {}
+        with self._lock:
+            self.requests += 1
+        return dict(((a.get('field'), a.get('aggregation_type')), a.get('value'))
+                    for a in response.get('aggregations') or [])
+
+    def _fetch_task(self, query):
+        return query, self.fetch(query)
+
+    def _identity(self):
+        # who the aggregation calls are sent as, results may depend on the user's permissions
+        api_client = self.search_api.api_client
+        headers = dict(api_client.default_headers)
+        if api_client.token_manager is None:
+            api_client.update_params_for_auth(headers, [], ['ApiKeyAuth'])
+        return api_client._auth_identity(headers)
+
+    def _key(self, query, identity):
+        # the cache file may be shared by clients of several platforms and users
+        return json.dumps([self.search_api.api_client.host, identity, query.entity_type, query.filter,
+                           query.start_time, query.end_time, [list(spec) for spec in query.aggregations]])
+
+    def _load(self):
+        if self._cache is not None:
+            return self._cache
+        self._cache = {}
+        path = self.cache_file
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self._cache = json.load(f)
+            except ValueError:
+                # a corrupt cache is rebuilt
+                pass
+        return self._cache
+
+    def _save(self):
+        path = self.cache_file
+        if not path or not self._dirty:
+            return
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self._cache, f)
+        getattr(os, 'replace', os.rename)(tmp, path)
+        self._dirty = False
+
+    def execute(self, queries):
+        """
+        Runs queries, from the cache where possible.
+
+        :return: dict of AggregationQuery to a dict of (field,
+            aggregation_type) to value.
+        """
+        self.requests = 0
+        self.cache_hits = 0
+        cache = self._load()
+        identity = self._identity()
+        results = {}
+        missing = []
+        for query in queries:
+            cached = cache.get(self._key(query, identity))
+            if cached is not None:
+                self.cache_hits += 1
+                results[query] = dict(((field, aggregation_type), value)
+                                      for field, aggregation_type, value in cached)
+            else:
+                missing.append(query)
+        api_client = self.search_api.api_client
+        for query, values in api_client.map_calls(self._fetch_task, missing, ordered=False,
+                                                  max_in_flight=self.max_in_flight):
+            results[query] = values
+            if self.is_closed(query):
+                cache[self._key(query, identity)] = [[field, aggregation_type, values.get((field, aggregation_type))]
+                                           for field, aggregation_type in query.aggregations]
+                self._dirty = True
+        self._save()
+        return results
+
+    def run(self, entity_type, filters, buckets, aggregations):
+        """
+        Runs a matrix of queries, see `plan`.
+
+        :return: dict of columns 'filter', 'start_time', 'end_time',
+            'field', 'aggregation_type' and 'value', one row per filter,
+            bucket and aggregation.
+        """
+        queries = self.plan(entity_type, filters, buckets, aggregations)
+        results = self.execute(queries)
+        table = dict((column, []) for column in
+                     ('filter', 'start_time', 'end_time', 'field', 'aggregation_type', 'value'))
+        for query in queries:
+            values = results[query]
+            for field, aggregation_type in query.aggregations:
+                table['filter'].append(query.filter)
+                table['start_time'].append(query.start_time)
+                table['end_time'].append(query.end_time)
+                table['field'].append(field)
+                table['aggregation_type'].append(aggregation_type)
+                table['value'].append(values.get((field, aggregation_type)))
+        return table
+
+    def invalidate(self):
+        """
+        Drops the cached results, in memory and on disk.
+        """
+        self._cache = {}
+        self._dirty = False
+        if self.cache_file and os.path.exists(self.cache_file):
+            os.remove(self.cache_file)
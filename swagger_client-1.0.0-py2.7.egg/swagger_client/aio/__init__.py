@@ -0,0 +1,28 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    asyncio client, requires Python 3.5+ and aiohttp.
+"""
+
+from __future__ import absolute_import
+
+from .api_client import AsyncApiClient
+from .rest import AsyncRESTClientObject, AsyncRESTResponse
+from .apis import (
+    AsyncApplicationsApi,
+    AsyncAuthenticationApi,
+    AsyncDataSourcesApi,
+    AsyncEntitiesApi,
+    AsyncInfoApi,
+    AsyncInfrastructureApi,
+    AsyncLogsApi,
+    AsyncMetricsApi,
+    AsyncMicrosegmentationApi,
+    AsyncPathApi,
+    AsyncSchemaApi,
+    AsyncSearchApi,
+    AsyncSettingsApi,
+    default_api_client,
+)
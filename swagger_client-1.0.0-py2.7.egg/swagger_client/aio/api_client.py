@@ -0,0 +1,235 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    asyncio variant of ApiClient.
+"""
+
+import asyncio
+import logging
+
+from timeit import default_timer
+
+from ..api_client import ApiClient
+from ..cache import MISSING
+from ..instrumentation import CallRecord
+from ..rest import ApiException
+from .rest import AsyncRESTClientObject
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncApiClient(ApiClient):
+    """
+    ApiClient whose `call_api` is a coroutine.
+
+    The generated API classes return whatever `call_api` returns, so any API
+    class constructed with an AsyncApiClient has coroutine methods:
+
+    >>> async with AsyncApiClient(host) as api_client:
+    >>>     entities_api = EntitiesApi(api_client=api_client)
+    >>>     vms = await asyncio.gather(*[entities_api.get_vm(id) for id in ids])
+
+    Serialization, authentication and deserialization are shared with
+    ApiClient, only the transport differs. The throttle rate limit, retry
+    policy, response and conditional caches, instrumentation and token
+    manager of the client apply as well, without blocking the event loop:
+    token renewals and response cache reads and writes run on the default
+    executor. The adaptive concurrency limit of the throttle is not
+    supported, `max_concurrency` bounds the requests in flight, and
+    instrumentation records no phase timings. The token manager logs in
+    with a synchronous ApiClient, see `TokenManager.for_credentials`.
+
+    :param host: The base path for the server to call.
+    :param header_name: a header to pass when making calls to the API.
+    :param header_value: a header value to pass when making calls to the API.
+    :param max_concurrency: number of requests in flight, defaults to
+        `Configuration.connection_pool_maxsize`.
+    :param compact_models: deserialize responses into the compact, slots
+        based models of `swagger_client.compact`.
+    :param response_mode: 'model', 'dict' or 'raw_bytes', see ApiClient.
+    """
+
+    def __init__(self, host=None, header_name=None, header_value=None, cookie=None,
+                 max_concurrency=None, compact_models=False, response_mode='model'):
+        self._max_concurrency = max_concurrency
+        super(AsyncApiClient, self).__init__(host, header_name, header_value, cookie,
+                                             compact_models, response_mode)
+        self._warned = False
+
+    def _new_rest_client(self):
+        return AsyncRESTClientObject(max_concurrency=self._max_concurrency)
+
+    def _managed_auth_headers(self):
+        # `call_api` renews the token off the event loop beforehand
+        return self.token_manager.headers(self.token_manager.token)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying HTTP session.
+        """
+        await self.rest_client.close()
+
+    @staticmethod
+    def _run_in_executor(fn, *args):
+        """
+        Runs a blocking function on the default executor.
+        """
+        return asyncio.get_event_loop().run_in_executor(None, fn, *args)
+
+    async def call_api(self, resource_path, method,
+                       path_params=None, query_params=None, header_params=None,
+                       body=None, post_params=None, files=None,
+                       response_type=None, auth_settings=None, callback=None,
+                       _return_http_data_only=None, collection_formats=None, _preload_content=True,
+                       _request_timeout=None, _response_mode=None):
+        """
+        Makes the HTTP request and returns the deserialized data.
+
+        Takes the same parameters as `ApiClient.call_api`. When `callback`
+        is given it is invoked with the result, which is returned as well.
+        """
+        args = (resource_path, method, path_params, query_params, header_params, body, post_params, files,
+                response_type, auth_settings, _return_http_data_only, collection_formats, _preload_content,
+                _request_timeout, _response_mode)
+        if self.instrumentation is None:
+            result = await self.__call_api(None, *args)
+        else:
+            record = CallRecord(method, resource_path)
+            start = default_timer()
+            try:
+                result = await self.__call_api(record, *args)
+            except Exception as e:
+                record.error = type(e).__name__
+                record.status = getattr(e, 'status', None) or record.status
+                raise
+            finally:
+                record.duration = default_timer() - start
+                self.instrumentation.record(record)
+        if callback:
+            callback(result)
+        return result
+
+    async def __call_api(self, record, resource_path, method, path_params, query_params, header_params,
+                         body, post_params, files, response_type, auth_settings, _return_http_data_only,
+                         collection_formats, _preload_content, _request_timeout, _response_mode):
+        authenticated = self.token_manager is not None and auth_settings and 'ApiKeyAuth' in auth_settings
+        if authenticated:
+            await self._run_in_executor(self.token_manager.get_token)
+
+        url, query_params, header_params, post_params, body = \
+            self._prepare_request(resource_path, path_params, query_params, header_params,
+                                  body, post_params, files, auth_settings, collection_formats)
+
+        cache_key = response_data = None
+        if self.response_cache is not None:
+            cache_key, response_data = await self._run_in_executor(
+                self._cache_lookup, method, resource_path, url, query_params, header_params, body, post_params,
+                _preload_content)
+        conditional_key = self._conditional_key(cache_key, method, url, query_params, header_params,
+                                                response_type, _preload_content, _response_mode)
+
+        # perform request and return response, unless it is cached
+        return_data = MISSING
+        if response_data is None:
+            kwargs = dict(query_params=query_params, headers=header_params, post_params=post_params, body=body,
+                          _preload_content=_preload_content, _request_timeout=_request_timeout)
+            try:
+                response_data = await self.__retried_request(record, authenticated, method, resource_path,
+                                                             url, kwargs)
+            except ApiException as e:
+                return_data = self._not_modified_data(conditional_key, e)
+                if return_data is MISSING:
+                    raise
+                response_data = e.http_resp
+            if cache_key is not None:
+                await self._run_in_executor(self.response_cache.set, cache_key, response_data)
+
+        self.last_response = response_data
+
+        if return_data is MISSING:
+            return_data = self._call_data(conditional_key, response_data, response_type, _preload_content,
+                                          _response_mode)
+
+        if _return_http_data_only:
+            return return_data
+        return (return_data, response_data.status, response_data.getheaders())
+
+    async def __retried_request(self, record, authenticated, method, resource_path, url, kwargs):
+        """
+        Makes the HTTP request, retried according to `self.retry_policy`.
+        """
+        policy = self.retry_policy
+        if policy is None or not policy.begin(method, resource_path):
+            return await self.__authenticated_request(record, authenticated, method, url, kwargs)
+        attempt = 1
+        while True:
+            try:
+                return await self.__authenticated_request(record, authenticated, method, url, kwargs)
+            except Exception as e:
+                delay = policy.retry_delay(method, resource_path, e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def __authenticated_request(self, record, authenticated, method, url, kwargs):
+        """
+        Makes the HTTP request, once more with a new token if the server
+        rejects the token of `self.token_manager`.
+        """
+        try:
+            return await self.__throttled_request(record, method, url, kwargs)
+        except ApiException as e:
+            if e.status != 401 or not authenticated:
+                raise
+            headers = kwargs['headers']
+            await self._run_in_executor(self.token_manager.refresh, headers.get(self.token_manager.header))
+            headers.update(self._managed_auth_headers())
+            return await self.__throttled_request(record, method, url, kwargs)
+
+    async def __throttled_request(self, record, method, url, kwargs):
+        """
+        Makes the HTTP request within the rate limit of `self.throttle`.
+        """
+        throttle = self.throttle
+        if throttle is not None:
+            if throttle.concurrency is not None and not self._warned:
+                self._warned = True
+                logger.warning("AsyncApiClient ignores the adaptive concurrency limit of its throttle, "
+                               "requests in flight are bounded by max_concurrency")
+            if throttle.bucket is not None:
+                delay = throttle.bucket.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        if record is None:
+            return await self.request(method, url, **kwargs)
+        record.attempts += 1
+        try:
+            response = await self.request(method, url, **kwargs)
+        except ApiException as e:
+            record.status = e.status
+            raise
+        record.status = response.status
+        record.response_bytes += len(getattr(response, 'raw_data', None) or b'')
+        return response
+
+    def request(self, method, url, query_params=None, headers=None,
+                post_params=None, body=None, _preload_content=True, _request_timeout=None):
+        """
+        Makes the HTTP request using AsyncRESTClientObject, returns a coroutine.
+        """
+        return self.rest_client.request(method, url,
+                                        query_params=query_params,
+                                        headers=headers,
+                                        post_params=post_params,
+                                        body=body,
+                                        _preload_content=_preload_content,
+                                        _request_timeout=_request_timeout)
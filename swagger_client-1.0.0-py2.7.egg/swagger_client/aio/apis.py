@@ -0,0 +1,60 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    asyncio counterparts of the generated API classes.
+"""
+
+from .. import apis
+from .api_client import AsyncApiClient
+
+_default_api_client = None
+
+
+def default_api_client():
+    """
+    Returns the AsyncApiClient shared by API objects created without one.
+    """
+    global _default_api_client
+    if _default_api_client is None:
+        _default_api_client = AsyncApiClient()
+    return _default_api_client
+
+
+def _async_api(api_class):
+    """
+    Derives an asyncio API class from a generated API class.
+
+    The generated methods return the result of `api_client.call_api`
+    unchanged, so binding them to an AsyncApiClient is all it takes for
+    every method to return a coroutine.
+    """
+    def __init__(self, api_client=None):
+        if api_client is None:
+            api_client = default_api_client()
+        if not isinstance(api_client, AsyncApiClient):
+            raise TypeError("{0} requires an AsyncApiClient".format(name))
+        self.api_client = api_client
+
+    name = 'Async' + api_class.__name__
+    return type(name, (api_class,), {
+        '__init__': __init__,
+        '__doc__': "asyncio variant of {0}, every API method returns a coroutine.".format(api_class.__name__),
+        '__module__': __name__,
+    })
+
+
+AsyncApplicationsApi = _async_api(apis.ApplicationsApi)
+AsyncAuthenticationApi = _async_api(apis.AuthenticationApi)
+AsyncDataSourcesApi = _async_api(apis.DataSourcesApi)
+AsyncEntitiesApi = _async_api(apis.EntitiesApi)
+AsyncInfoApi = _async_api(apis.InfoApi)
+AsyncInfrastructureApi = _async_api(apis.InfrastructureApi)
+AsyncLogsApi = _async_api(apis.LogsApi)
+AsyncMetricsApi = _async_api(apis.MetricsApi)
+AsyncMicrosegmentationApi = _async_api(apis.MicrosegmentationApi)
+AsyncPathApi = _async_api(apis.PathApi)
+AsyncSchemaApi = _async_api(apis.SchemaApi)
+AsyncSearchApi = _async_api(apis.SearchApi)
+AsyncSettingsApi = _async_api(apis.SettingsApi)
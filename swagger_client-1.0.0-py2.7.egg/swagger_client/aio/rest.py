@@ -0,0 +1,235 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    asyncio HTTP transport built on aiohttp.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import ssl
+
+import certifi
+
+from six.moves.urllib.parse import urlencode
+
+from ..configuration import Configuration
+from ..rest import ApiException
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError('The asyncio client requires aiohttp.')
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(object):
+    """
+    Response of an asyncio request, with the same interface as RESTResponse.
+    """
+
+    def __init__(self, resp, raw_data):
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.raw_data = raw_data
+        self._data = None
+
+    @property
+    def data(self):
+        """
+        Gets the response body, decoded to a string.
+        """
+        if self._data is None:
+            self._data = self.raw_data.decode('utf8')
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    def getheaders(self):
+        """
+        Returns a dictionary of the response headers.
+        """
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """
+        Returns a given response header.
+        """
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+    """
+    asyncio counterpart of RESTClientObject.
+
+    All requests share one `aiohttp.ClientSession`, limited to
+    `Configuration.connection_pool_maxsize` connections per host. The number
+    of requests in flight, including those waiting for a connection, is
+    bounded by `max_concurrency`.
+
+    :param maxsize: number of connections per host.
+    :param max_concurrency: number of requests in flight.
+    """
+
+    def __init__(self, maxsize=None, max_concurrency=None):
+        config = Configuration()
+        if maxsize is None:
+            maxsize = config.connection_pool_maxsize
+        if max_concurrency is None:
+            max_concurrency = maxsize
+        self.maxsize = maxsize
+        self.max_concurrency = max_concurrency
+        self.proxy = config.proxy
+
+        # ssl context
+        if config.verify_ssl:
+            self.ssl_context = ssl.create_default_context(cafile=config.ssl_ca_cert or certifi.where())
+        else:
+            self.ssl_context = ssl.create_default_context()
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        if config.cert_file:
+            self.ssl_context.load_cert_chain(config.cert_file, keyfile=config.key_file)
+
+        self._session = None
+        self._semaphore = None
+
+    @property
+    def session(self):
+        """
+        The aiohttp session, created on first use inside the event loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.maxsize, ssl=self.ssl_context)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    @property
+    def semaphore(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self):
+        """
+        Closes the session and its pooled connections.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True, _request_timeout=None):
+        """
+        :param method: http request method
+        :param url: http request url
+        :param query_params: query parameters in the url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _preload_content: if False, the aiohttp.ClientResponse object will be returned without
+                                 reading the response data. The caller must release it. Default is True.
+        :param _request_timeout: timeout setting for this request. If one number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of (connection, read) timeouts.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = aiohttp.ClientTimeout(sock_connect=_request_timeout[0],
+                                                sock_read=_request_timeout[1])
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        args = {
+            'headers': headers,
+            'proxy': self.proxy,
+        }
+        if timeout is not None:
+            args['timeout'] = timeout
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if query_params:
+                url += '?' + urlencode(query_params)
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                if body is not None:
+                    args['data'] = json.dumps(body)
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
+                args['data'] = aiohttp.FormData(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # aiohttp generates the Content-Type with the multipart boundary
+                del headers['Content-Type']
+                data = aiohttp.FormData()
+                for k, v in post_params:
+                    if isinstance(v, tuple):
+                        filename, filedata, mimetype = v
+                        data.add_field(k, filedata, filename=filename, content_type=mimetype)
+                    else:
+                        data.add_field(k, v)
+                args['data'] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is provided
+            # in serialized form
+            elif isinstance(body, str):
+                args['data'] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided arguments.
+                         Please check that your arguments match declared content type."""
+                raise ApiException(status=0, reason=msg)
+        # For `GET`, `HEAD`
+        elif query_params:
+            url += '?' + urlencode(query_params)
+
+        async with self.semaphore:
+            try:
+                r = await self.session.request(method, url, **args)
+            except aiohttp.ClientSSLError as e:
+                msg = "{0}\n{1}".format(type(e).__name__, str(e))
+                raise ApiException(status=0, reason=msg)
+
+            if not _preload_content:
+                if not 200 <= r.status <= 299:
+                    data = await r.read()
+                    raise ApiException(http_resp=AsyncRESTResponse(r, data))
+                return r
+
+            try:
+                data = await r.read()
+            finally:
+                r.release()
+
+        r = AsyncRESTResponse(r, data)
+
+        # log response body
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
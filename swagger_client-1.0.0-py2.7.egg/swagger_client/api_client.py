@@ -14,19 +14,33 @@ from __future__ import absolute_import
 import os
 import re
 import json
+import hashlib
 import mimetypes
 import tempfile
 import threading
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import as_completed as _as_completed
 from datetime import date, datetime
+from functools import partial
+from timeit import default_timer
 
 # python 2 and python 3 compatibility library
 from six import PY3, integer_types, iteritems, text_type
+from six.moves import zip
 from six.moves.urllib.parse import quote
 
 from . import models
+from .compact import compact_model
+from .conditional import ConditionalCache
 from .configuration import Configuration
+from .cache import MISSING
+from .instrumentation import Instrumentation, current_record
 from .rest import ApiException, RESTClientObject
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
+from .throttle import Throttle
 
 
 class ApiClient(object):
@@ -45,6 +59,11 @@ class ApiClient(object):
     :param host: The base path for the server to call.
     :param header_name: a header to pass when making calls to the API.
     :param header_value: a header value to pass when making calls to the API.
+    :param compact_models: deserialize responses into the compact, slots
+        based models of `swagger_client.compact`.
+    :param response_mode: what API calls return, one of `RESPONSE_MODES`:
+        'model' (default) for models, 'dict' for the parsed JSON and
+        'raw_bytes' for the undecoded response body.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, text_type) + integer_types
@@ -58,12 +77,20 @@ class ApiClient(object):
         'datetime': datetime,
         'object': object,
     }
-
-    def __init__(self, host=None, header_name=None, header_value=None, cookie=None):
+    RESPONSE_MODES = ('model', 'dict', 'raw_bytes')
+    # Base types deserialized as the model named by `entity_type`
+    POLYMORPHIC_TYPES = frozenset([
+        'BaseVirtualMachine', 'BaseNSXManager', 'BaseL2Network', 'BaseFirewallRule',
+        'BaseSecurityGroup', 'BaseIPSet', 'BaseVnic', 'BaseService', 'BaseServiceGroup',
+        'BaseFirewallManager', 'BaseEntity',
+    ])
+
+    def __init__(self, host=None, header_name=None, header_value=None, cookie=None,
+                 compact_models=False, response_mode='model'):
         """
         Constructor of the class.
         """
-        self.rest_client = RESTClientObject()
+        self.rest_client = self._new_rest_client()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -74,6 +101,35 @@ class ApiClient(object):
         self.cookie = cookie
         # Set default User-Agent.
         self.user_agent = 'Swagger-Codegen/1.0.0/python'
+        # Thread pool for asynchronous requests, created on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        # Compiled deserializers by type
+        self._deserializers = {}
+        self._compiling = {}
+        self._deserializers_lock = threading.RLock()
+        self._compact_models = compact_models
+        self.response_mode = response_mode
+        # Rate and concurrency limits shared by every API object using this
+        # client, see `swagger_client.throttle`
+        self.throttle = Throttle.from_configuration()
+        # Retries of transient failures, see `swagger_client.retry`
+        self.retry_policy = RetryPolicy.from_configuration()
+        # Persistent cache of historical queries, see `swagger_client.response_cache`
+        self.response_cache = ResponseCache.from_configuration()
+        # Conditional GETs of unchanged resources, see `swagger_client.conditional`
+        self.conditional_cache = ConditionalCache.from_configuration()
+        # Per operation timings and sizes, see `swagger_client.instrumentation`
+        self.instrumentation = Instrumentation.from_configuration()
+        # Auth token renewal, see `swagger_client.auth`. None uses the token
+        # of `Configuration.api_key`
+        self.token_manager = None
+
+    def _new_rest_client(self):
+        """
+        Returns the transport of the client.
+        """
+        return RESTClientObject()
 
     @property
     def user_agent(self):
@@ -89,16 +145,235 @@ class ApiClient(object):
         """
         self.default_headers['User-Agent'] = value
 
+    @property
+    def compact_models(self):
+        """
+        Gets whether responses are deserialized into compact models.
+        """
+        return self._compact_models
+
+    @compact_models.setter
+    def compact_models(self, value):
+        """
+        Sets whether responses are deserialized into compact models.
+
+        :param value: True for compact models, False for the generated ones.
+        :type: bool
+        """
+        with self._deserializers_lock:
+            self._compact_models = value
+            self._deserializers = {}
+
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    @property
+    def executor(self):
+        """
+        Gets the thread pool running asynchronous requests.
+
+        The pool is shared by every API object using this client and holds
+        `Configuration.executor_max_workers` threads, by default as many as
+        there are pooled connections.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.executor_max_workers)
+            return self._executor
+
+    @property
+    def executor_max_workers(self):
+        """
+        Gets the number of threads of the thread pool.
+        """
+        config = Configuration()
+        return config.executor_max_workers or config.connection_pool_maxsize
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the thread pool, a new one is created on next use.
+
+        :param wait: wait for requests already submitted to finish.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Runs an API method on the client thread pool.
+
+        >>> future = api_client.submit(entities_api.get_vm, vm_id)
+        >>> vm = future.result()
+
+        :param fn: API method, or any callable.
+        :return: concurrent.futures.Future of the method result.
+        """
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def map_calls(self, fn, *iterables, **kwargs):
+        """
+        Calls an API method for every item of the iterables on the client
+        thread pool and yields the results.
+
+        Input is consumed lazily and at most `max_in_flight` calls are
+        queued at any time, so it is safe to fan out over millions of ids.
+
+        >>> for vm in api_client.map_calls(entities_api.get_vm, vm_ids):
+        >>>     pprint(vm)
+
+        :param fn: API method, or any callable.
+        :param ordered: yield results in input order (default) instead of
+            as they complete.
+        :param max_in_flight: number of calls queued or running, defaults
+            to twice the pool size.
+        :return: generator of results, the first failed call raises.
+        """
+        ordered = kwargs.pop('ordered', True)
+        max_in_flight = kwargs.pop('max_in_flight', None) or 2 * self.executor_max_workers
+        if kwargs:
+            raise TypeError("Got an unexpected keyword argument '%s' to method map_calls" % next(iter(kwargs)))
+
+        pending = deque()
+        try:
+            for args in zip(*iterables):
+                pending.append(self.submit(fn, *args))
+                while len(pending) >= max_in_flight:
+                    for result in self.__collect(pending, ordered):
+                        yield result
+            while pending:
+                for result in self.__collect(pending, ordered):
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def __collect(self, pending, ordered):
+        """
+        Removes finished futures from `pending` and returns their results.
+        """
+        if ordered:
+            return [pending.popleft().result()]
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+        return [future.result() for future in done]
+
+    @staticmethod
+    def as_completed(futures, timeout=None):
+        """
+        Yields futures returned by `submit` as they complete.
+
+        :param futures: iterable of futures.
+        :param timeout: seconds to wait for all futures.
+        """
+        return _as_completed(futures, timeout=timeout)
+
     def __call_api(self, resource_path, method,
                    path_params=None, query_params=None, header_params=None,
                    body=None, post_params=None, files=None,
                    response_type=None, auth_settings=None, callback=None,
                    _return_http_data_only=None, collection_formats=None, _preload_content=True,
-                   _request_timeout=None):
+                   _request_timeout=None, _response_mode=None):
+
+        url, query_params, header_params, post_params, body = \
+            self._prepare_request(resource_path, path_params, query_params, header_params,
+                                  body, post_params, files, auth_settings, collection_formats)
+
+        cache_key = response_data = None
+        if self.response_cache is not None:
+            cache_key, response_data = self._cache_lookup(method, resource_path, url, query_params, header_params,
+                                                          body, post_params, _preload_content)
+        conditional_key = self._conditional_key(cache_key, method, url, query_params, header_params,
+                                                response_type, _preload_content, _response_mode)
+
+        # perform request and return response, unless it is cached
+        return_data = MISSING
+        if response_data is None:
+            send = self.request if self.throttle is None else self.__throttled_request
+            if self.token_manager is not None and auth_settings and 'ApiKeyAuth' in auth_settings:
+                send = partial(self.__authenticated_request, send)
+            try:
+                if self.retry_policy is None:
+                    response_data = send(method, url,
+                                         query_params=query_params,
+                                         headers=header_params,
+                                         post_params=post_params, body=body,
+                                         _preload_content=_preload_content,
+                                         _request_timeout=_request_timeout)
+                else:
+                    response_data = self.retry_policy.call(method, resource_path, send, method, url,
+                                                           query_params=query_params,
+                                                           headers=header_params,
+                                                           post_params=post_params, body=body,
+                                                           _preload_content=_preload_content,
+                                                           _request_timeout=_request_timeout)
+            except ApiException as e:
+                return_data = self._not_modified_data(conditional_key, e)
+                if return_data is MISSING:
+                    raise
+                response_data = e.http_resp
+            if cache_key is not None:
+                self.response_cache.set(cache_key, response_data)
+
+        self.last_response = response_data
+
+        if return_data is MISSING:
+            return_data = self._call_data(conditional_key, response_data, response_type, _preload_content,
+                                          _response_mode)
+
+        if callback:
+            if _return_http_data_only:
+                callback(return_data)
+            else:
+                callback((return_data, response_data.status, response_data.getheaders()))
+        elif _return_http_data_only:
+            return (return_data)
+        else:
+            return (return_data, response_data.status, response_data.getheaders())
+
+    def __instrumented_call_api(self, resource_path, method, *args):
+        """
+        Makes an API call recorded by `self.instrumentation`.
+        """
+        return self.instrumentation.call(method, resource_path, self.__call_api, resource_path, method, *args)
 
+    def __authenticated_request(self, send, method, url, **kwargs):
+        """
+        Makes the HTTP request with `send`, once more with a new token if
+        the server rejects the token of `self.token_manager`.
+        """
+        try:
+            return send(method, url, **kwargs)
+        except ApiException as e:
+            if e.status != 401:
+                raise
+            headers = kwargs['headers']
+            self.token_manager.refresh(rejected=headers.get(self.token_manager.header))
+            headers.update(self.token_manager.auth_headers())
+            return send(method, url, **kwargs)
+
+    def __throttled_request(self, *args, **kwargs):
+        """
+        Makes the HTTP request within the limits of `self.throttle`.
+        """
+        return self.throttle.call(self.request, *args, **kwargs)
+
+    def _prepare_request(self, resource_path, path_params=None, query_params=None,
+                         header_params=None, body=None, post_params=None, files=None,
+                         auth_settings=None, collection_formats=None):
+        """
+        Serializes the parameters of an API call.
+
+        :return: tuple of (url, query_params, header_params, post_params, body).
+        """
         config = Configuration()
 
         # header parameters
@@ -144,33 +419,90 @@ class ApiClient(object):
         # request url
         url = self.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(method, url,
-                                     query_params=query_params,
-                                     headers=header_params,
-                                     post_params=post_params, body=body,
-                                     _preload_content=_preload_content,
-                                     _request_timeout=_request_timeout)
+        return url, query_params, header_params, post_params, body
 
-        self.last_response = response_data
+    def _cache_lookup(self, method, resource_path, url, query_params, header_params, body, post_params,
+                      _preload_content):
+        """
+        Looks a call up in `self.response_cache`.
 
-        return_data = response_data
-        if _preload_content:
-            # deserialize response data
-            if response_type:
-                return_data = self.deserialize(response_data, response_type)
-            else:
-                return_data = None
+        :return: tuple of (cache key, cached response), the key is None if
+            the call is not cacheable and the response None on a miss.
+        """
+        if not _preload_content or post_params:
+            return None, None
+        return self.response_cache.lookup(method, resource_path, url, query_params, body,
+                                          self._auth_identity(header_params))
 
-        if callback:
-            if _return_http_data_only:
-                callback(return_data)
-            else:
-                callback((return_data, response_data.status, response_data.getheaders()))
-        elif _return_http_data_only:
-            return (return_data)
-        else:
-            return (return_data, response_data.status, response_data.getheaders())
+    def _conditional_key(self, cache_key, method, url, query_params, header_params, response_type,
+                         _preload_content, _response_mode):
+        """
+        Adds the validators of `self.conditional_cache` to the headers of a
+        GET call the response cache does not serve.
+
+        :return: key of the call in the conditional cache, or None.
+        """
+        if cache_key is not None or self.conditional_cache is None or method != 'GET' or not _preload_content:
+            return None
+        conditional_key = self.conditional_cache.key(url, query_params, response_type,
+                                                     _response_mode or self.response_mode)
+        header_params.update(self.conditional_cache.validators(conditional_key))
+        return conditional_key
+
+    def _not_modified_data(self, conditional_key, error):
+        """
+        Returns the data replayed for a 304 answer to a conditional call,
+        MISSING if the error is to be raised.
+        """
+        if error.status != 304 or conditional_key is None:
+            return MISSING
+        return self.conditional_cache.revalidated(conditional_key)
+
+    def _call_data(self, conditional_key, response_data, response_type, _preload_content, _response_mode):
+        """
+        Deserializes the response of a call, remembered by
+        `self.conditional_cache` for conditional calls.
+        """
+        if conditional_key is None:
+            return self._response_data(response_data, response_type, _preload_content, _response_mode)
+        return self.conditional_cache.result(
+            conditional_key, response_data,
+            lambda: self._response_data(response_data, response_type, _preload_content, _response_mode))
+
+    def _response_data(self, response_data, response_type, _preload_content=True, _response_mode=None):
+        """
+        Deserializes the response of an API call.
+
+        :param _response_mode: one of `RESPONSE_MODES`, defaults to
+            `self.response_mode`.
+        :return: deserialized data, or the response itself if its content
+            was not preloaded.
+        """
+        response_mode = _response_mode or self.response_mode
+        if response_mode not in self.RESPONSE_MODES:
+            raise ValueError(
+                "Invalid value for `response_mode` ({0}), must be one of {1}"
+                .format(response_mode, self.RESPONSE_MODES)
+            )
+        if not _preload_content:
+            return response_data
+        # deserialize response data
+        if not response_type:
+            return None
+        if response_type == "file" or response_mode == 'model':
+            return self.deserialize(response_data, response_type)
+        if response_mode == 'raw_bytes':
+            return response_data.raw_data
+        record = current_record() if self.instrumentation is not None else None
+        if record is not None:
+            start = default_timer()
+        try:
+            return json.loads(response_data.data)
+        except ValueError:
+            return response_data.data
+        finally:
+            if record is not None:
+                record.add('decode', default_timer() - start)
 
     def sanitize_for_serialization(self, obj):
         """
@@ -230,13 +562,24 @@ class ApiClient(object):
         if response_type == "file":
             return self.__deserialize_file(response)
 
+        record = current_record() if self.instrumentation is not None else None
+        if record is not None:
+            start = default_timer()
+
         # fetch data from response object
         try:
             data = json.loads(response.data)
         except ValueError:
             data = response.data
 
-        return self.__deserialize(data, response_type)
+        if record is None:
+            return self.__deserialize(data, response_type)
+        decoded = default_timer()
+        record.add('decode', decoded - start)
+        try:
+            return self.__deserialize(data, response_type)
+        finally:
+            record.add('build', default_timer() - decoded)
 
     def __deserialize(self, data, klass):
         """
@@ -250,44 +593,140 @@ class ApiClient(object):
         if data is None:
             return None
 
+        return self.deserializer(klass)(data)
+
+    def deserializer(self, klass):
+        """
+        Gets the deserializer for a type.
+
+        Type strings are parsed and models are inspected only once per
+        client, the resulting function is cached and reused for every
+        object of that type.
+
+        :param klass: class literal, or string of class name.
+        :return: function taking non-None data and returning the object.
+        """
+        try:
+            return self._deserializers[klass]
+        except KeyError:
+            pass
+
+        with self._deserializers_lock:
+            deserialize = self._deserializers.get(klass) or self._compiling.get(klass)
+            if deserialize is not None:
+                return deserialize
+            # models are registered before their attributes are compiled, so
+            # nothing is published to other threads until the outermost
+            # compilation is complete
+            if self._compiling:
+                return self.__compile_deserializer(klass)
+            try:
+                deserialize = self.__compile_deserializer(klass)
+                self._deserializers.update(self._compiling)
+                return deserialize
+            finally:
+                self._compiling.clear()
+
+    def __compile_deserializer(self, klass):
+        """
+        Builds the deserializer for a type and caches it.
+
+        :param klass: class literal, or string of class name.
+        :return: function taking non-None data and returning the object.
+        """
         if type(klass) == str:
             if klass.startswith('list['):
-                sub_kls = re.match('list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('dict('):
-                sub_kls = re.match('dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+                sub_deserializer = self.deserializer(re.match(r'list\[(.*)\]', klass).group(1))
+
+                def deserialize(data):
+                    return [None if sub_data is None else sub_deserializer(sub_data)
+                            for sub_data in data]
+
+            elif klass.startswith('dict('):
+                sub_deserializer = self.deserializer(re.match(r'dict\(([^,]*), (.*)\)', klass).group(2))
+
+                def deserialize(data):
+                    return {k: None if v is None else sub_deserializer(v)
+                            for k, v in iteritems(data)}
+
+            elif klass in self.NATIVE_TYPES_MAPPING:
+                deserialize = self.deserializer(self.NATIVE_TYPES_MAPPING[klass])
+            elif klass in self.POLYMORPHIC_TYPES:
+                # the concrete model is named by the `entity_type` of the data
+                deserializer = self.deserializer
+
+                def deserialize(data):
+                    return deserializer(data['entity_type'])(data)
+
             else:
-                if klass in ['BaseVirtualMachine', 'BaseNSXManager', 'BaseL2Network', 'BaseFirewallRule',
-                             'BaseSecurityGroup', 'BaseIPSet', 'BaseVnic', 'BaseService', 'BaseServiceGroup',
-                             'BaseFirewallManager', 'BaseEntity']:
-                    klass = data['entity_type']
-                klass = getattr(models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+                deserialize = self.deserializer(getattr(models, klass))
+        elif klass in self.PRIMITIVE_TYPES:
+            deserialize_primitive = self.__deserialize_primitive
+
+            def deserialize(data):
+                if type(data) is klass:
+                    return data
+                return deserialize_primitive(data, klass)
+
         elif klass == object:
-            return self.__deserialize_object(data)
+            deserialize = self.__deserialize_object
         elif klass == date:
-            return self.__deserialize_date(data)
+            deserialize = self.__deserialize_date
         elif klass == datetime:
-            return self.__deserialize_datatime(data)
+            deserialize = self.__deserialize_datatime
+        else:
+            return self.__compile_model_deserializer(klass)
+
+        self._compiling[klass] = deserialize
+        return deserialize
+
+    def __compile_model_deserializer(self, klass):
+        """
+        Builds the deserializer for a model class and caches it.
+
+        :param klass: model class.
+        :return: function taking non-None data and returning the model.
+        """
+        if not klass.swagger_types:
+            deserialize = self.__deserialize_object
+            self._compiling[klass] = deserialize
+            return deserialize
+
+        fields = []
+
+        if self._compact_models:
+            compact = compact_model(klass)
+            new = compact.__new__
+
+            def deserialize(data):
+                obj = new(compact)
+                get = data.get if isinstance(data, dict) else {}.get
+                for attr, key, attr_deserializer in fields:
+                    value = get(key)
+                    setattr(obj, attr, None if value is None else attr_deserializer(value))
+                return obj
         else:
-            return self.__deserialize_model(data, klass)
+            def deserialize(data):
+                kwargs = {}
+                if isinstance(data, (list, dict)):
+                    for attr, key, attr_deserializer in fields:
+                        if key in data:
+                            value = data[key]
+                            kwargs[attr] = None if value is None else attr_deserializer(value)
+                return klass(**kwargs)
+
+        # cache before compiling the attributes, models may refer to themselves
+        self._compiling[klass] = deserialize
+        fields.extend((attr, klass.attribute_map[attr], self.deserializer(attr_type))
+                      for attr, attr_type in iteritems(klass.swagger_types))
+        return deserialize
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
                  response_type=None, auth_settings=None, callback=None,
                  _return_http_data_only=None, collection_formats=None, _preload_content=True,
-                 _request_timeout=None):
+                 _request_timeout=None, _response_mode=None):
         """
         Makes the HTTP request (synchronous) and return the deserialized data.
         To make an async request, define a function for callback.
@@ -307,7 +746,7 @@ class ApiClient(object):
             for `multipart/form-data`.
         :param callback function: Callback function for asynchronous request.
             If provide this parameter,
-            the request will be called asynchronously.
+            the request will be called asynchronously on the client thread pool.
         :param _return_http_data_only: response data without head status code and headers
         :param collection_formats: dict of collection formats for path, query,
             header, and post parameters.
@@ -315,30 +754,32 @@ class ApiClient(object):
                                  reading/decoding response data. Default is True.
         :param _request_timeout: timeout setting for this request. If one number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of (connection, read) timeouts.
+        :param _response_mode: overrides `response_mode` for this call, 'model',
+                               'dict' or 'raw_bytes'.
         :return:
             If provide parameter callback,
             the request will be called asynchronously.
-            The method will return the request thread.
+            The method will return a concurrent.futures.Future of the request.
             If parameter callback is None,
             then the method will return the response directly.
         """
+        call = self.__call_api if self.instrumentation is None else self.__instrumented_call_api
         if callback is None:
-            return self.__call_api(resource_path, method,
-                                   path_params, query_params, header_params,
-                                   body, post_params, files,
-                                   response_type, auth_settings, callback,
-                                   _return_http_data_only, collection_formats, _preload_content, _request_timeout)
+            return call(resource_path, method,
+                        path_params, query_params, header_params,
+                        body, post_params, files,
+                        response_type, auth_settings, callback,
+                        _return_http_data_only, collection_formats, _preload_content, _request_timeout,
+                        _response_mode)
         else:
-            thread = threading.Thread(target=self.__call_api,
-                                      args=(resource_path, method,
-                                            path_params, query_params,
-                                            header_params, body,
-                                            post_params, files,
-                                            response_type, auth_settings,
-                                            callback, _return_http_data_only,
-                                            collection_formats, _preload_content, _request_timeout))
-        thread.start()
-        return thread
+            return self.submit(call, resource_path, method,
+                               path_params, query_params,
+                               header_params, body,
+                               post_params, files,
+                               response_type, auth_settings,
+                               callback, _return_http_data_only,
+                               collection_formats, _preload_content, _request_timeout,
+                               _response_mode)
 
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True, _request_timeout=None):
@@ -522,6 +963,29 @@ class ApiClient(object):
                             'Authentication token must be in `query` or `header`'
                     )
 
+        # a managed token takes precedence over `Configuration.api_key`
+        if self.token_manager is not None and 'ApiKeyAuth' in auth_settings:
+            headers.update(self._managed_auth_headers())
+
+    def _auth_identity(self, header_params):
+        """
+        Returns who a request is sent as: the identity of
+        `self.token_manager` (platform and user), else a hash of its auth
+        header, None for anonymous requests.
+        """
+        if self.token_manager is not None and self.token_manager.cache_key:
+            return self.token_manager.cache_key
+        value = header_params.get('Authorization') or header_params.get('csp-auth-token')
+        if not value:
+            return None
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    def _managed_auth_headers(self):
+        """
+        Returns the header of `self.token_manager`, renewing its token if needed.
+        """
+        return self.token_manager.auth_headers()
+
     def __deserialize_file(self, response):
         """
         Saves response body into a file in a temporary folder,
@@ -612,26 +1076,3 @@ class ApiClient(object):
                             .format(string)
                     )
             )
-
-    def __deserialize_model(self, data, klass):
-        """
-        Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-        if not klass.swagger_types:
-            return data
-
-        kwargs = {}
-        for attr, attr_type in iteritems(klass.swagger_types):
-            if data is not None \
-                    and klass.attribute_map[attr] in data \
-                    and isinstance(data, (list, dict)):
-                value = data[klass.attribute_map[attr]]
-                kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        return instance
@@ -1,16 +1,23 @@
 from __future__ import absolute_import
 
-# import apis into api package
-from .applications_api import ApplicationsApi
-from .authentication_api import AuthenticationApi
-from .data_sources_api import DataSourcesApi
-from .entities_api import EntitiesApi
-from .info_api import InfoApi
-from .infrastructure_api import InfrastructureApi
-from .logs_api import LogsApi
-from .metrics_api import MetricsApi
-from .microsegmentation_api import MicrosegmentationApi
-from .path_api import PathApi
-from .schema_api import SchemaApi
-from .search_api import SearchApi
-from .settings_api import SettingsApi
+from .. import lazy
+
+# apis are imported on first access
+_APIS = {
+    'ApplicationsApi': '.applications_api',
+    'AuthenticationApi': '.authentication_api',
+    'DataSourcesApi': '.data_sources_api',
+    'EntitiesApi': '.entities_api',
+    'InfoApi': '.info_api',
+    'InfrastructureApi': '.infrastructure_api',
+    'LogsApi': '.logs_api',
+    'MetricsApi': '.metrics_api',
+    'MicrosegmentationApi': '.microsegmentation_api',
+    'PathApi': '.path_api',
+    'SchemaApi': '.schema_api',
+    'SearchApi': '.search_api',
+    'SettingsApi': '.settings_api',
+}
+
+# the modules too, as `apis.entities_api`
+lazy.install(__name__, _APIS, [module[1:] for module in _APIS.values()])
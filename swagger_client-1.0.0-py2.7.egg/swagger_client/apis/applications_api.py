@@ -50,14 +50,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_application(body, callback=callback_function)
+        >>> future = api.add_application(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ApplicationRequest body: (required)
         :return: Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_application_with_http_info(body, callback=callback_function)
+        >>> future = api.add_application_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ApplicationRequest body: (required)
         :return: Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -91,6 +91,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -140,6 +141,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_tier(self, id, body, **kwargs):
@@ -152,7 +154,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_tier(id, body, callback=callback_function)
+        >>> future = api.add_tier(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -160,7 +162,7 @@ class ApplicationsApi(object):
         :param TierRequest body: (required)
         :return: Tier
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -179,7 +181,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_tier_with_http_info(id, body, callback=callback_function)
+        >>> future = api.add_tier_with_http_info(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -187,7 +189,7 @@ class ApplicationsApi(object):
         :param TierRequest body: (required)
         :return: Tier
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -195,6 +197,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -249,6 +252,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_application(self, id, **kwargs):
@@ -261,14 +265,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_application(id, callback=callback_function)
+        >>> future = api.delete_application(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -287,14 +291,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_application_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_application_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -302,6 +306,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -351,6 +356,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_tier(self, id, tier_id, **kwargs):
@@ -363,7 +369,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_tier(id, tier_id, callback=callback_function)
+        >>> future = api.delete_tier(id, tier_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -371,7 +377,7 @@ class ApplicationsApi(object):
         :param str tier_id: (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -390,7 +396,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_tier_with_http_info(id, tier_id, callback=callback_function)
+        >>> future = api.delete_tier_with_http_info(id, tier_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -398,7 +404,7 @@ class ApplicationsApi(object):
         :param str tier_id: (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'tier_id']
@@ -406,6 +412,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -460,6 +467,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_application(self, id, **kwargs):
@@ -472,14 +480,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application(id, callback=callback_function)
+        >>> future = api.get_application(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -498,14 +506,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_with_http_info(id, callback=callback_function)
+        >>> future = api.get_application_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: Application
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -513,6 +521,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -562,6 +571,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_application_flow_summary(self, id, **kwargs):
@@ -574,7 +584,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_flow_summary(id, callback=callback_function)
+        >>> future = api.get_application_flow_summary(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -583,7 +593,7 @@ class ApplicationsApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: ApplicationFlowSummary
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -602,7 +612,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_flow_summary_with_http_info(id, callback=callback_function)
+        >>> future = api.get_application_flow_summary_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -611,7 +621,7 @@ class ApplicationsApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: ApplicationFlowSummary
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'start_time', 'end_time']
@@ -619,6 +629,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -672,6 +683,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_application_members(self, id, **kwargs):
@@ -684,14 +696,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_members(id, callback=callback_function)
+        >>> future = api.get_application_members(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: ApplicationVMMembers
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -710,14 +722,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_members_with_http_info(id, callback=callback_function)
+        >>> future = api.get_application_members_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: ApplicationVMMembers
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -725,6 +737,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -774,6 +787,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_application_tier(self, id, tier_id, **kwargs):
@@ -786,7 +800,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_tier(id, tier_id, callback=callback_function)
+        >>> future = api.get_application_tier(id, tier_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -794,7 +808,7 @@ class ApplicationsApi(object):
         :param str tier_id: (required)
         :return: Tier
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -813,7 +827,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_application_tier_with_http_info(id, tier_id, callback=callback_function)
+        >>> future = api.get_application_tier_with_http_info(id, tier_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -821,7 +835,7 @@ class ApplicationsApi(object):
         :param str tier_id: (required)
         :return: Tier
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'tier_id']
@@ -829,6 +843,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -883,6 +898,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_tier(self, tier_id, authorization, **kwargs):
@@ -895,7 +911,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_tier(tier_id, authorization, callback=callback_function)
+        >>> future = api.get_tier(tier_id, authorization, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -903,7 +919,7 @@ class ApplicationsApi(object):
         :param str authorization: Authorization Header (required)
         :return: Tier
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -922,7 +938,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_tier_with_http_info(tier_id, authorization, callback=callback_function)
+        >>> future = api.get_tier_with_http_info(tier_id, authorization, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -930,7 +946,7 @@ class ApplicationsApi(object):
         :param str authorization: Authorization Header (required)
         :return: Tier
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['tier_id', 'authorization']
@@ -938,6 +954,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -992,6 +1009,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_application_tiers(self, id, **kwargs):
@@ -1004,14 +1022,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_application_tiers(id, callback=callback_function)
+        >>> future = api.list_application_tiers(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: TierListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1030,14 +1048,14 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_application_tiers_with_http_info(id, callback=callback_function)
+        >>> future = api.list_application_tiers_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: TierListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -1045,6 +1063,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1094,6 +1113,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_applications(self, **kwargs):
@@ -1106,7 +1126,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_applications(callback=callback_function)
+        >>> future = api.list_applications(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1116,7 +1136,7 @@ class ApplicationsApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1135,7 +1155,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_applications_with_http_info(callback=callback_function)
+        >>> future = api.list_applications_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1145,7 +1165,7 @@ class ApplicationsApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -1153,6 +1173,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1205,6 +1226,7 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_applications_details(self, **kwargs):
@@ -1217,7 +1239,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_applications_details(callback=callback_function)
+        >>> future = api.list_applications_details(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1225,7 +1247,7 @@ class ApplicationsApi(object):
         :param str cursor: cursor from previous response
         :return: PagedApplicationListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1244,7 +1266,7 @@ class ApplicationsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_applications_details_with_http_info(callback=callback_function)
+        >>> future = api.list_applications_details_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1252,7 +1274,7 @@ class ApplicationsApi(object):
         :param str cursor: cursor from previous response
         :return: PagedApplicationListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor']
@@ -1260,6 +1282,7 @@ class ApplicationsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1308,4 +1331,5 @@ class ApplicationsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
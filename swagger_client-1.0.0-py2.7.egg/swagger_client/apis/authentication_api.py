@@ -50,14 +50,14 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create(body, callback=callback_function)
+        >>> future = api.create(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param UserCredential body: User Credentials (required)
         :return: Token
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_with_http_info(body, callback=callback_function)
+        >>> future = api.create_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param UserCredential body: User Credentials (required)
         :return: Token
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -91,6 +91,7 @@ class AuthenticationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -140,6 +141,7 @@ class AuthenticationApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def create_vidm_user_token(self, body, **kwargs):
@@ -152,14 +154,14 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_vidm_user_token(body, callback=callback_function)
+        >>> future = api.create_vidm_user_token(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmToken body: User access token provided by VMware Identity Manager. (required)
         :return: Token
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -178,14 +180,14 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_vidm_user_token_with_http_info(body, callback=callback_function)
+        >>> future = api.create_vidm_user_token_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmToken body: User access token provided by VMware Identity Manager. (required)
         :return: Token
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -193,6 +195,7 @@ class AuthenticationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -242,6 +245,7 @@ class AuthenticationApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete(self, **kwargs):
@@ -254,13 +258,13 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete(callback=callback_function)
+        >>> future = api.delete(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -279,13 +283,13 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_with_http_info(callback=callback_function)
+        >>> future = api.delete_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -293,6 +297,7 @@ class AuthenticationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -336,6 +341,7 @@ class AuthenticationApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vidm_oauth_clien_id(self, **kwargs):
@@ -348,13 +354,13 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vidm_oauth_clien_id(callback=callback_function)
+        >>> future = api.get_vidm_oauth_clien_id(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: VidmOauthClientResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -373,13 +379,13 @@ class AuthenticationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vidm_oauth_clien_id_with_http_info(callback=callback_function)
+        >>> future = api.get_vidm_oauth_clien_id_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: VidmOauthClientResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -387,6 +393,7 @@ class AuthenticationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -430,4 +437,5 @@ class AuthenticationApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
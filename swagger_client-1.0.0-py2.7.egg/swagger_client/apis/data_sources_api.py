@@ -50,14 +50,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_arista_switch(callback=callback_function)
+        >>> future = api.add_arista_switch(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param AristaSwitchDataSourceRequest body: Add a cisco switch as datasource
         :return: AristaSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_arista_switch_with_http_info(callback=callback_function)
+        >>> future = api.add_arista_switch_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param AristaSwitchDataSourceRequest body: Add a cisco switch as datasource
         :return: AristaSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -91,6 +91,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -137,6 +138,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_brocade_switch(self, **kwargs):
@@ -149,14 +151,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_brocade_switch(callback=callback_function)
+        >>> future = api.add_brocade_switch(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BrocadeSwitchDataSourceRequest body:
         :return: BrocadeSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -175,14 +177,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_brocade_switch_with_http_info(callback=callback_function)
+        >>> future = api.add_brocade_switch_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param BrocadeSwitchDataSourceRequest body:
         :return: BrocadeSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -190,6 +192,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -236,6 +239,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_checkpoint_firewall(self, **kwargs):
@@ -248,14 +252,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_checkpoint_firewall(callback=callback_function)
+        >>> future = api.add_checkpoint_firewall(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param CheckpointFirewallDataSourceRequest body: Add a vSec Checkpoint firewall as data source
         :return: CheckpointFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -274,14 +278,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_checkpoint_firewall_with_http_info(callback=callback_function)
+        >>> future = api.add_checkpoint_firewall_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param CheckpointFirewallDataSourceRequest body: Add a vSec Checkpoint firewall as data source
         :return: CheckpointFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -289,6 +293,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -335,6 +340,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_cisco_aci(self, **kwargs):
@@ -347,14 +353,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_cisco_aci(callback=callback_function)
+        >>> future = api.add_cisco_aci(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param CiscoACIDataSourceRequest body:
         :return: CiscoACIDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -373,14 +379,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_cisco_aci_with_http_info(callback=callback_function)
+        >>> future = api.add_cisco_aci_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param CiscoACIDataSourceRequest body:
         :return: CiscoACIDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -388,6 +394,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -434,6 +441,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_cisco_switch(self, **kwargs):
@@ -446,14 +454,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_cisco_switch(callback=callback_function)
+        >>> future = api.add_cisco_switch(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param CiscoSwitchDataSourceRequest body: Add a cisco switch as datasource.
         :return: CiscoSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -472,14 +480,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_cisco_switch_with_http_info(callback=callback_function)
+        >>> future = api.add_cisco_switch_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param CiscoSwitchDataSourceRequest body: Add a cisco switch as datasource.
         :return: CiscoSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -487,6 +495,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -533,6 +542,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_dell_switch(self, **kwargs):
@@ -545,14 +555,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_dell_switch(callback=callback_function)
+        >>> future = api.add_dell_switch(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param DellSwitchDataSourceRequest body:
         :return: DellSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -571,14 +581,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_dell_switch_with_http_info(callback=callback_function)
+        >>> future = api.add_dell_switch_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param DellSwitchDataSourceRequest body:
         :return: DellSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -586,6 +596,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -632,6 +643,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_f5_bigip(self, **kwargs):
@@ -644,14 +656,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_f5_bigip(callback=callback_function)
+        >>> future = api.add_f5_bigip(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param GDDataSourceRequest body: Add a F5 BIG-IP as datasource
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -670,14 +682,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_f5_bigip_with_http_info(callback=callback_function)
+        >>> future = api.add_f5_bigip_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param GDDataSourceRequest body: Add a F5 BIG-IP as datasource
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -685,6 +697,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -731,6 +744,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_hpov_manager(self, **kwargs):
@@ -743,14 +757,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_hpov_manager(callback=callback_function)
+        >>> future = api.add_hpov_manager(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param HPOneViewManagerDataSourceRequest body:
         :return: HPOneViewManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -769,14 +783,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_hpov_manager_with_http_info(callback=callback_function)
+        >>> future = api.add_hpov_manager_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param HPOneViewManagerDataSourceRequest body:
         :return: HPOneViewManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -784,6 +798,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -830,6 +845,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_hpvc_manager(self, **kwargs):
@@ -842,14 +858,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_hpvc_manager(callback=callback_function)
+        >>> future = api.add_hpvc_manager(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param HPVCManagerDataSourceRequest body: Add a switch as datasource
         :return: HPVCManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -868,14 +884,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_hpvc_manager_with_http_info(callback=callback_function)
+        >>> future = api.add_hpvc_manager_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param HPVCManagerDataSourceRequest body: Add a switch as datasource
         :return: HPVCManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -883,6 +899,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -929,6 +946,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_huawei(self, **kwargs):
@@ -941,14 +959,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_huawei(callback=callback_function)
+        >>> future = api.add_huawei(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param GDDataSourceRequest body: Add a Huawei as datasource
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -967,14 +985,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_huawei_with_http_info(callback=callback_function)
+        >>> future = api.add_huawei_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param GDDataSourceRequest body: Add a Huawei as datasource
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -982,6 +1000,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1028,6 +1047,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_infoblox_manager_datasource(self, **kwargs):
@@ -1040,14 +1060,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_infoblox_manager_datasource(callback=callback_function)
+        >>> future = api.add_infoblox_manager_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param InfobloxManagerDataSourceRequest body:
         :return: InfobloxManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1066,14 +1086,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_infoblox_manager_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_infoblox_manager_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param InfobloxManagerDataSourceRequest body:
         :return: InfobloxManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1081,6 +1101,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1127,6 +1148,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_juniper_switch(self, **kwargs):
@@ -1139,14 +1161,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_juniper_switch(callback=callback_function)
+        >>> future = api.add_juniper_switch(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param JuniperSwitchDataSourceRequest body: Add a cisco switch as datasource
         :return: JuniperSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1165,14 +1187,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_juniper_switch_with_http_info(callback=callback_function)
+        >>> future = api.add_juniper_switch_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param JuniperSwitchDataSourceRequest body: Add a cisco switch as datasource
         :return: JuniperSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1180,6 +1202,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1226,6 +1249,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_kubernetes_datasource(self, **kwargs):
@@ -1238,14 +1262,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_kubernetes_datasource(callback=callback_function)
+        >>> future = api.add_kubernetes_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param KubernetesDataSourceRequest body:
         :return: KubernetesDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1264,14 +1288,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_kubernetes_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_kubernetes_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param KubernetesDataSourceRequest body:
         :return: KubernetesDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1279,6 +1303,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1325,6 +1350,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_nsxt_manager_datasource(self, **kwargs):
@@ -1337,14 +1363,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_nsxt_manager_datasource(callback=callback_function)
+        >>> future = api.add_nsxt_manager_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param NSXTManagerDataSourceRequest body:
         :return: NSXTManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1363,14 +1389,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_nsxt_manager_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_nsxt_manager_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param NSXTManagerDataSourceRequest body:
         :return: NSXTManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1378,6 +1404,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1424,6 +1451,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_nsxv_manager_datasource(self, **kwargs):
@@ -1436,14 +1464,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_nsxv_manager_datasource(callback=callback_function)
+        >>> future = api.add_nsxv_manager_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param NSXVManagerDataSourceRequest body:
         :return: NSXVManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1462,14 +1490,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_nsxv_manager_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_nsxv_manager_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param NSXVManagerDataSourceRequest body:
         :return: NSXVManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1477,6 +1505,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1523,6 +1552,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_panorama_firewall(self, **kwargs):
@@ -1535,14 +1565,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_panorama_firewall(callback=callback_function)
+        >>> future = api.add_panorama_firewall(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param PanFirewallDataSourceRequest body: Add a panorama firewall as datasource
         :return: PanFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1561,14 +1591,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_panorama_firewall_with_http_info(callback=callback_function)
+        >>> future = api.add_panorama_firewall_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param PanFirewallDataSourceRequest body: Add a panorama firewall as datasource
         :return: PanFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1576,6 +1606,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1622,6 +1653,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_pks_datasource(self, **kwargs):
@@ -1634,14 +1666,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_pks_datasource(callback=callback_function)
+        >>> future = api.add_pks_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param PKSDataSourceRequest body:
         :return: PKSDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1660,14 +1692,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_pks_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_pks_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param PKSDataSourceRequest body:
         :return: PKSDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1675,6 +1707,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1721,6 +1754,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_policy_manager_datasource(self, **kwargs):
@@ -1733,14 +1767,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_policy_manager_datasource(callback=callback_function)
+        >>> future = api.add_policy_manager_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param PolicyManagerDataSourceRequest body:
         :return: PolicyManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1759,14 +1793,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_policy_manager_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_policy_manager_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param PolicyManagerDataSourceRequest body:
         :return: PolicyManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1774,6 +1808,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1820,6 +1855,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_service_now_datasource(self, **kwargs):
@@ -1832,14 +1868,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_service_now_datasource(callback=callback_function)
+        >>> future = api.add_service_now_datasource(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ServiceNowDataSourceRequest body:
         :return: ServiceNowDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1858,14 +1894,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_service_now_datasource_with_http_info(callback=callback_function)
+        >>> future = api.add_service_now_datasource_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param ServiceNowDataSourceRequest body:
         :return: ServiceNowDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1873,6 +1909,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1919,6 +1956,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_uani(self, file, proxy_id, nickname, enabled, **kwargs):
@@ -1931,7 +1969,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_uani(file, proxy_id, nickname, enabled, callback=callback_function)
+        >>> future = api.add_uani(file, proxy_id, nickname, enabled, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1942,7 +1980,7 @@ class DataSourcesApi(object):
         :param str notes: Description of uani data source.
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1961,7 +1999,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_uani_with_http_info(file, proxy_id, nickname, enabled, callback=callback_function)
+        >>> future = api.add_uani_with_http_info(file, proxy_id, nickname, enabled, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1972,7 +2010,7 @@ class DataSourcesApi(object):
         :param str notes: Description of uani data source.
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['file', 'proxy_id', 'nickname', 'enabled', 'notes']
@@ -1980,6 +2018,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2050,6 +2089,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_ucs_manager(self, **kwargs):
@@ -2062,14 +2102,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_ucs_manager(callback=callback_function)
+        >>> future = api.add_ucs_manager(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param UCSManagerDataSourceRequest body:
         :return: UCSManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2088,14 +2128,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_ucs_manager_with_http_info(callback=callback_function)
+        >>> future = api.add_ucs_manager_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param UCSManagerDataSourceRequest body:
         :return: UCSManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -2103,6 +2143,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2149,6 +2190,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_vcenter_datasource(self, body, **kwargs):
@@ -2161,14 +2203,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_vcenter_datasource(body, callback=callback_function)
+        >>> future = api.add_vcenter_datasource(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VCenterDataSourceRequest body: VCenter Credentials (required)
         :return: VCenterDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2187,14 +2229,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_vcenter_datasource_with_http_info(body, callback=callback_function)
+        >>> future = api.add_vcenter_datasource_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VCenterDataSourceRequest body: VCenter Credentials (required)
         :return: VCenterDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -2202,6 +2244,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2251,6 +2294,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_arista_switch(self, id, **kwargs):
@@ -2263,14 +2307,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_arista_switch(id, callback=callback_function)
+        >>> future = api.delete_arista_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2289,14 +2333,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_arista_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_arista_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2304,6 +2348,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2353,6 +2398,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_brocade_switch(self, id, **kwargs):
@@ -2365,14 +2411,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_brocade_switch(id, callback=callback_function)
+        >>> future = api.delete_brocade_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2391,14 +2437,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_brocade_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_brocade_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2406,6 +2452,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2455,6 +2502,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_checkpoint_firewall(self, id, **kwargs):
@@ -2467,14 +2515,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_checkpoint_firewall(id, callback=callback_function)
+        >>> future = api.delete_checkpoint_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2493,14 +2541,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_checkpoint_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_checkpoint_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2508,6 +2556,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2557,6 +2606,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_cisco_aci(self, id, **kwargs):
@@ -2569,14 +2619,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_cisco_aci(id, callback=callback_function)
+        >>> future = api.delete_cisco_aci(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2595,14 +2645,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_cisco_aci_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_cisco_aci_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2610,6 +2660,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2659,6 +2710,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_cisco_switch(self, id, **kwargs):
@@ -2671,14 +2723,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_cisco_switch(id, callback=callback_function)
+        >>> future = api.delete_cisco_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2697,14 +2749,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_cisco_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_cisco_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2712,6 +2764,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2761,6 +2814,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_dell_switch(self, id, **kwargs):
@@ -2773,14 +2827,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_dell_switch(id, callback=callback_function)
+        >>> future = api.delete_dell_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2799,14 +2853,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_dell_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_dell_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2814,6 +2868,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2863,6 +2918,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_f5_bigip(self, id, **kwargs):
@@ -2875,14 +2931,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_f5_bigip(id, callback=callback_function)
+        >>> future = api.delete_f5_bigip(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2901,14 +2957,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_f5_bigip_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_f5_bigip_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -2916,6 +2972,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2965,6 +3022,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_hpov_manager(self, id, **kwargs):
@@ -2977,14 +3035,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_hpov_manager(id, callback=callback_function)
+        >>> future = api.delete_hpov_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3003,14 +3061,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_hpov_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_hpov_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3018,6 +3076,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3067,6 +3126,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_hpvc_manager(self, id, **kwargs):
@@ -3079,14 +3139,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_hpvc_manager(id, callback=callback_function)
+        >>> future = api.delete_hpvc_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3105,14 +3165,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_hpvc_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_hpvc_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3120,6 +3180,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3169,6 +3230,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_huawei(self, id, **kwargs):
@@ -3181,14 +3243,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_huawei(id, callback=callback_function)
+        >>> future = api.delete_huawei(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3207,14 +3269,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_huawei_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_huawei_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3222,6 +3284,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3271,6 +3334,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_infoblox_manager(self, id, **kwargs):
@@ -3283,14 +3347,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_infoblox_manager(id, callback=callback_function)
+        >>> future = api.delete_infoblox_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3309,14 +3373,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_infoblox_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_infoblox_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3324,6 +3388,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3373,6 +3438,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_juniper_switch(self, id, **kwargs):
@@ -3385,14 +3451,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_juniper_switch(id, callback=callback_function)
+        >>> future = api.delete_juniper_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3411,14 +3477,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_juniper_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_juniper_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3426,6 +3492,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3475,6 +3542,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_kubernetes_cluster(self, id, **kwargs):
@@ -3487,14 +3555,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_kubernetes_cluster(id, callback=callback_function)
+        >>> future = api.delete_kubernetes_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3513,14 +3581,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_kubernetes_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_kubernetes_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3528,6 +3596,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3577,6 +3646,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_nsxt_manager(self, id, **kwargs):
@@ -3589,14 +3659,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_nsxt_manager(id, callback=callback_function)
+        >>> future = api.delete_nsxt_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3615,14 +3685,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_nsxt_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_nsxt_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3630,6 +3700,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3679,6 +3750,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_nsxv_manager(self, id, **kwargs):
@@ -3691,14 +3763,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_nsxv_manager(id, callback=callback_function)
+        >>> future = api.delete_nsxv_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3717,14 +3789,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_nsxv_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_nsxv_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3732,6 +3804,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3781,6 +3854,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_panorama_firewall(self, id, **kwargs):
@@ -3793,14 +3867,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_panorama_firewall(id, callback=callback_function)
+        >>> future = api.delete_panorama_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3819,14 +3893,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_panorama_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_panorama_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3834,6 +3908,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3883,6 +3958,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_pks(self, id, **kwargs):
@@ -3895,14 +3971,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_pks(id, callback=callback_function)
+        >>> future = api.delete_pks(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3921,14 +3997,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_pks_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_pks_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -3936,6 +4012,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3985,6 +4062,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_policy_manager(self, id, **kwargs):
@@ -3997,14 +4075,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_policy_manager(id, callback=callback_function)
+        >>> future = api.delete_policy_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4023,14 +4101,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_policy_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_policy_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4038,6 +4116,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4087,6 +4166,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_service_now_instance(self, id, **kwargs):
@@ -4099,14 +4179,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_service_now_instance(id, callback=callback_function)
+        >>> future = api.delete_service_now_instance(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4125,14 +4205,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_service_now_instance_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_service_now_instance_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4140,6 +4220,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4189,6 +4270,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_uani(self, id, **kwargs):
@@ -4201,14 +4283,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_uani(id, callback=callback_function)
+        >>> future = api.delete_uani(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4227,14 +4309,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_uani_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_uani_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4242,6 +4324,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4291,6 +4374,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_ucs_manager(self, id, **kwargs):
@@ -4303,14 +4387,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_ucs_manager(id, callback=callback_function)
+        >>> future = api.delete_ucs_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4329,14 +4413,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_ucs_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_ucs_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4344,6 +4428,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4393,6 +4478,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_vcenter(self, id, **kwargs):
@@ -4405,14 +4491,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_vcenter(id, callback=callback_function)
+        >>> future = api.delete_vcenter(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4431,14 +4517,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_vcenter_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_vcenter_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4446,6 +4532,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4495,6 +4582,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_arista_switch(self, id, **kwargs):
@@ -4507,14 +4595,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_arista_switch(id, callback=callback_function)
+        >>> future = api.disable_arista_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4533,14 +4621,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_arista_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_arista_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4548,6 +4636,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4597,6 +4686,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_brocade_switch(self, id, **kwargs):
@@ -4608,14 +4698,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_brocade_switch(id, callback=callback_function)
+        >>> future = api.disable_brocade_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4633,14 +4723,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_brocade_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_brocade_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4648,6 +4738,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4697,6 +4788,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_checkpoint_firewall(self, id, **kwargs):
@@ -4709,14 +4801,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_checkpoint_firewall(id, callback=callback_function)
+        >>> future = api.disable_checkpoint_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4735,14 +4827,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_checkpoint_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_checkpoint_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4750,6 +4842,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4799,6 +4892,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_cisco_aci(self, id, **kwargs):
@@ -4811,14 +4905,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_cisco_aci(id, callback=callback_function)
+        >>> future = api.disable_cisco_aci(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4837,14 +4931,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_cisco_aci_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_cisco_aci_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4852,6 +4946,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4901,6 +4996,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_cisco_switch(self, id, **kwargs):
@@ -4913,14 +5009,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_cisco_switch(id, callback=callback_function)
+        >>> future = api.disable_cisco_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4939,14 +5035,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_cisco_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_cisco_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -4954,6 +5050,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5003,6 +5100,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_dell_switch(self, id, **kwargs):
@@ -5015,14 +5113,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_dell_switch(id, callback=callback_function)
+        >>> future = api.disable_dell_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5041,14 +5139,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_dell_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_dell_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5056,6 +5154,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5105,6 +5204,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_f5_bigip(self, id, **kwargs):
@@ -5117,14 +5217,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_f5_bigip(id, callback=callback_function)
+        >>> future = api.disable_f5_bigip(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5143,14 +5243,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_f5_bigip_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_f5_bigip_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5158,6 +5258,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5207,6 +5308,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_hpov_manager(self, id, **kwargs):
@@ -5219,14 +5321,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_hpov_manager(id, callback=callback_function)
+        >>> future = api.disable_hpov_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5245,14 +5347,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_hpov_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_hpov_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5260,6 +5362,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5309,6 +5412,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_hpvc_manager(self, id, **kwargs):
@@ -5321,14 +5425,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_hpvc_manager(id, callback=callback_function)
+        >>> future = api.disable_hpvc_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5347,14 +5451,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_hpvc_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_hpvc_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5362,6 +5466,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5411,6 +5516,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_huawei(self, id, **kwargs):
@@ -5423,14 +5529,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_huawei(id, callback=callback_function)
+        >>> future = api.disable_huawei(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5449,14 +5555,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_huawei_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_huawei_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5464,6 +5570,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5513,6 +5620,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_infoblox_manager(self, id, **kwargs):
@@ -5525,14 +5633,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_infoblox_manager(id, callback=callback_function)
+        >>> future = api.disable_infoblox_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5551,14 +5659,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_infoblox_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_infoblox_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5566,6 +5674,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5615,6 +5724,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_juniper_switch(self, id, **kwargs):
@@ -5627,14 +5737,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_juniper_switch(id, callback=callback_function)
+        >>> future = api.disable_juniper_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5653,14 +5763,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_juniper_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_juniper_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5668,6 +5778,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5717,6 +5828,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_kubernetes_cluster(self, id, **kwargs):
@@ -5729,14 +5841,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_kubernetes_cluster(id, callback=callback_function)
+        >>> future = api.disable_kubernetes_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5755,14 +5867,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_kubernetes_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_kubernetes_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5770,6 +5882,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5819,6 +5932,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_nsxt_manager(self, id, **kwargs):
@@ -5831,14 +5945,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_nsxt_manager(id, callback=callback_function)
+        >>> future = api.disable_nsxt_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5857,14 +5971,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_nsxt_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_nsxt_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5872,6 +5986,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5921,6 +6036,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_nsxv_manager(self, id, **kwargs):
@@ -5933,14 +6049,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_nsxv_manager(id, callback=callback_function)
+        >>> future = api.disable_nsxv_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5959,14 +6075,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_nsxv_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_nsxv_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -5974,6 +6090,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6023,6 +6140,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_panorama_firewall(self, id, **kwargs):
@@ -6035,14 +6153,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_panorama_firewall(id, callback=callback_function)
+        >>> future = api.disable_panorama_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6061,14 +6179,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_panorama_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_panorama_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6076,6 +6194,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6125,6 +6244,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_pks(self, id, **kwargs):
@@ -6137,14 +6257,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_pks(id, callback=callback_function)
+        >>> future = api.disable_pks(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6163,14 +6283,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_pks_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_pks_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6178,6 +6298,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6227,6 +6348,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_policy_manager(self, id, **kwargs):
@@ -6239,14 +6361,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_policy_manager(id, callback=callback_function)
+        >>> future = api.disable_policy_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6265,14 +6387,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_policy_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_policy_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6280,6 +6402,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6329,6 +6452,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_service_now_instance(self, id, **kwargs):
@@ -6341,14 +6465,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_service_now_instance(id, callback=callback_function)
+        >>> future = api.disable_service_now_instance(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6367,14 +6491,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_service_now_instance_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_service_now_instance_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6382,6 +6506,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6431,6 +6556,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_uani(self, id, **kwargs):
@@ -6443,14 +6569,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_uani(id, callback=callback_function)
+        >>> future = api.disable_uani(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6469,14 +6595,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_uani_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_uani_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6484,6 +6610,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6533,6 +6660,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_ucs_manager(self, id, **kwargs):
@@ -6545,14 +6673,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_ucs_manager(id, callback=callback_function)
+        >>> future = api.disable_ucs_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6571,14 +6699,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_ucs_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_ucs_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6586,6 +6714,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6635,6 +6764,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_vcenter(self, id, **kwargs):
@@ -6647,14 +6777,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_vcenter(id, callback=callback_function)
+        >>> future = api.disable_vcenter(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6673,14 +6803,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_vcenter_with_http_info(id, callback=callback_function)
+        >>> future = api.disable_vcenter_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6688,6 +6818,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6737,6 +6868,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_arista_switch(self, id, **kwargs):
@@ -6749,14 +6881,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_arista_switch(id, callback=callback_function)
+        >>> future = api.enable_arista_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6775,14 +6907,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_arista_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_arista_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6790,6 +6922,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6839,6 +6972,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_brocade_switch(self, id, **kwargs):
@@ -6850,14 +6984,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_brocade_switch(id, callback=callback_function)
+        >>> future = api.enable_brocade_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6875,14 +7009,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_brocade_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_brocade_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6890,6 +7024,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -6939,6 +7074,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_checkpoint_firewall(self, id, **kwargs):
@@ -6951,14 +7087,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_checkpoint_firewall(id, callback=callback_function)
+        >>> future = api.enable_checkpoint_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -6977,14 +7113,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_checkpoint_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_checkpoint_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -6992,6 +7128,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7041,6 +7178,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_cisco_aci(self, id, **kwargs):
@@ -7053,14 +7191,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_cisco_aci(id, callback=callback_function)
+        >>> future = api.enable_cisco_aci(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7079,14 +7217,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_cisco_aci_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_cisco_aci_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7094,6 +7232,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7143,6 +7282,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_cisco_switch(self, id, **kwargs):
@@ -7155,14 +7295,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_cisco_switch(id, callback=callback_function)
+        >>> future = api.enable_cisco_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7181,14 +7321,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_cisco_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_cisco_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7196,6 +7336,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7245,6 +7386,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_dell_switch(self, id, **kwargs):
@@ -7257,14 +7399,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_dell_switch(id, callback=callback_function)
+        >>> future = api.enable_dell_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7283,14 +7425,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_dell_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_dell_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7298,6 +7440,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7347,6 +7490,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_f5_bigip(self, id, **kwargs):
@@ -7359,14 +7503,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_f5_bigip(id, callback=callback_function)
+        >>> future = api.enable_f5_bigip(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7385,14 +7529,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_f5_bigip_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_f5_bigip_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7400,6 +7544,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7449,6 +7594,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_hpov_manager(self, id, **kwargs):
@@ -7461,14 +7607,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_hpov_manager(id, callback=callback_function)
+        >>> future = api.enable_hpov_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7487,14 +7633,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_hpov_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_hpov_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7502,6 +7648,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7551,6 +7698,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_hpvc_manager(self, id, **kwargs):
@@ -7563,14 +7711,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_hpvc_manager(id, callback=callback_function)
+        >>> future = api.enable_hpvc_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7589,14 +7737,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_hpvc_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_hpvc_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7604,6 +7752,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7653,6 +7802,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_huawei(self, id, **kwargs):
@@ -7665,14 +7815,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_huawei(id, callback=callback_function)
+        >>> future = api.enable_huawei(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7691,14 +7841,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_huawei_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_huawei_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7706,6 +7856,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7755,6 +7906,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_infoblox_manager(self, id, **kwargs):
@@ -7767,14 +7919,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_infoblox_manager(id, callback=callback_function)
+        >>> future = api.enable_infoblox_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7793,14 +7945,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_infoblox_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_infoblox_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7808,6 +7960,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7857,6 +8010,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_juniper_switch(self, id, **kwargs):
@@ -7869,14 +8023,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_juniper_switch(id, callback=callback_function)
+        >>> future = api.enable_juniper_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7895,14 +8049,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_juniper_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_juniper_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -7910,6 +8064,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -7959,6 +8114,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_kubernetes_cluster(self, id, **kwargs):
@@ -7971,14 +8127,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_kubernetes_cluster(id, callback=callback_function)
+        >>> future = api.enable_kubernetes_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -7997,14 +8153,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_kubernetes_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_kubernetes_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8012,6 +8168,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8061,6 +8218,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_nsxt_manager(self, id, **kwargs):
@@ -8073,14 +8231,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_nsxt_manager(id, callback=callback_function)
+        >>> future = api.enable_nsxt_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8099,14 +8257,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_nsxt_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_nsxt_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8114,6 +8272,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8163,6 +8322,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_nsxv_manager(self, id, **kwargs):
@@ -8175,14 +8335,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_nsxv_manager(id, callback=callback_function)
+        >>> future = api.enable_nsxv_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8201,14 +8361,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_nsxv_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_nsxv_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8216,6 +8376,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8265,6 +8426,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_panorama_firewall(self, id, **kwargs):
@@ -8277,14 +8439,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_panorama_firewall(id, callback=callback_function)
+        >>> future = api.enable_panorama_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8303,14 +8465,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_panorama_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_panorama_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8318,6 +8480,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8367,6 +8530,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_pks(self, id, **kwargs):
@@ -8379,14 +8543,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_pks(id, callback=callback_function)
+        >>> future = api.enable_pks(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8405,14 +8569,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_pks_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_pks_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8420,6 +8584,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8469,6 +8634,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_policy_manager(self, id, **kwargs):
@@ -8481,14 +8647,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_policy_manager(id, callback=callback_function)
+        >>> future = api.enable_policy_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8507,14 +8673,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_policy_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_policy_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8522,6 +8688,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8571,6 +8738,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_service_now_instance(self, id, **kwargs):
@@ -8583,14 +8751,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_service_now_instance(id, callback=callback_function)
+        >>> future = api.enable_service_now_instance(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8609,14 +8777,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_service_now_instance_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_service_now_instance_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8624,6 +8792,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8673,6 +8842,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_uani(self, id, **kwargs):
@@ -8685,14 +8855,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_uani(id, callback=callback_function)
+        >>> future = api.enable_uani(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8711,14 +8881,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_uani_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_uani_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8726,6 +8896,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8775,6 +8946,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_ucs_manager(self, id, **kwargs):
@@ -8787,14 +8959,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_ucs_manager(id, callback=callback_function)
+        >>> future = api.enable_ucs_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8813,14 +8985,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_ucs_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_ucs_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8828,6 +9000,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8877,6 +9050,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_vcenter(self, id, **kwargs):
@@ -8889,14 +9063,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_vcenter(id, callback=callback_function)
+        >>> future = api.enable_vcenter(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -8915,14 +9089,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_vcenter_with_http_info(id, callback=callback_function)
+        >>> future = api.enable_vcenter_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -8930,6 +9104,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -8979,6 +9154,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_arista_switch(self, id, **kwargs):
@@ -8991,14 +9167,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_arista_switch(id, callback=callback_function)
+        >>> future = api.get_arista_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: AristaSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9017,14 +9193,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_arista_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.get_arista_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: AristaSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9032,6 +9208,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9081,6 +9258,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_arista_switch_snmp_config(self, id, **kwargs):
@@ -9093,14 +9271,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_arista_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.get_arista_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9119,14 +9297,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_arista_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_arista_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9134,6 +9312,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9183,6 +9362,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_brocade_switch(self, id, **kwargs):
@@ -9195,14 +9375,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_brocade_switch(id, callback=callback_function)
+        >>> future = api.get_brocade_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: BrocadeSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9221,14 +9401,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_brocade_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.get_brocade_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: BrocadeSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9236,6 +9416,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9285,6 +9466,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_brocade_switch_snmp_config(self, id, **kwargs):
@@ -9297,14 +9479,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_brocade_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.get_brocade_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9323,14 +9505,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_brocade_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_brocade_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9338,6 +9520,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9387,6 +9570,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_checkpoint_firewall(self, id, **kwargs):
@@ -9399,14 +9583,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_checkpoint_firewall(id, callback=callback_function)
+        >>> future = api.get_checkpoint_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: CheckpointFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9425,14 +9609,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_checkpoint_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.get_checkpoint_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: CheckpointFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9440,6 +9624,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9489,6 +9674,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_cisco_aci(self, id, **kwargs):
@@ -9501,14 +9687,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_aci(id, callback=callback_function)
+        >>> future = api.get_cisco_aci(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: CiscoACIDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9527,14 +9713,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_aci_with_http_info(id, callback=callback_function)
+        >>> future = api.get_cisco_aci_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: CiscoACIDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9542,6 +9728,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9591,6 +9778,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_cisco_aci_snmp_config(self, id, **kwargs):
@@ -9603,14 +9791,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_aci_snmp_config(id, callback=callback_function)
+        >>> future = api.get_cisco_aci_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9629,14 +9817,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_aci_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_cisco_aci_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9644,6 +9832,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9693,6 +9882,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_cisco_switch(self, id, **kwargs):
@@ -9705,14 +9895,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_switch(id, callback=callback_function)
+        >>> future = api.get_cisco_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: CiscoSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9731,14 +9921,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.get_cisco_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: CiscoSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9746,6 +9936,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9795,6 +9986,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_cisco_switch_snmp_config(self, id, **kwargs):
@@ -9807,14 +9999,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.get_cisco_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9833,14 +10025,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cisco_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_cisco_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9848,6 +10040,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9897,6 +10090,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_dell_switch(self, id, **kwargs):
@@ -9909,14 +10103,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_dell_switch(id, callback=callback_function)
+        >>> future = api.get_dell_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: DellSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -9935,14 +10129,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_dell_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.get_dell_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: DellSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -9950,6 +10144,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -9999,6 +10194,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_dell_switch_snmp_config(self, id, **kwargs):
@@ -10011,14 +10207,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_dell_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.get_dell_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10037,14 +10233,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_dell_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_dell_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10052,6 +10248,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10101,6 +10298,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_f5_bigip(self, id, **kwargs):
@@ -10113,14 +10311,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_f5_bigip(id, callback=callback_function)
+        >>> future = api.get_f5_bigip(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10139,14 +10337,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_f5_bigip_with_http_info(id, callback=callback_function)
+        >>> future = api.get_f5_bigip_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10154,6 +10352,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10203,6 +10402,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_f5_bigip_snmp_config(self, id, **kwargs):
@@ -10215,14 +10415,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_f5_bigip_snmp_config(id, callback=callback_function)
+        >>> future = api.get_f5_bigip_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10241,14 +10441,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_f5_bigip_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_f5_bigip_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10256,6 +10456,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10305,6 +10506,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_hpov_manager(self, id, **kwargs):
@@ -10317,14 +10519,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_hpov_manager(id, callback=callback_function)
+        >>> future = api.get_hpov_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: HPOneViewManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10343,14 +10545,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_hpov_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_hpov_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: HPOneViewManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10358,6 +10560,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10407,6 +10610,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_hpvc_manager(self, id, **kwargs):
@@ -10419,14 +10623,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_hpvc_manager(id, callback=callback_function)
+        >>> future = api.get_hpvc_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: HPVCManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10445,14 +10649,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_hpvc_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_hpvc_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: HPVCManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10460,6 +10664,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10509,6 +10714,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_huawei(self, id, **kwargs):
@@ -10521,14 +10727,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_huawei(id, callback=callback_function)
+        >>> future = api.get_huawei(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10547,14 +10753,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_huawei_with_http_info(id, callback=callback_function)
+        >>> future = api.get_huawei_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10562,6 +10768,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10611,6 +10818,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_huawei_snmp_config(self, id, **kwargs):
@@ -10623,14 +10831,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_huawei_snmp_config(id, callback=callback_function)
+        >>> future = api.get_huawei_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10649,14 +10857,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_huawei_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_huawei_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10664,6 +10872,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10713,6 +10922,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_infoblox_manager(self, id, **kwargs):
@@ -10725,14 +10935,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_infoblox_manager(id, callback=callback_function)
+        >>> future = api.get_infoblox_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: InfobloxManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10751,14 +10961,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_infoblox_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_infoblox_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: InfobloxManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10766,6 +10976,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10815,6 +11026,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_juniper_switch(self, id, **kwargs):
@@ -10827,14 +11039,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_juniper_switch(id, callback=callback_function)
+        >>> future = api.get_juniper_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: JuniperSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10853,14 +11065,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_juniper_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.get_juniper_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: JuniperSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10868,6 +11080,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -10917,6 +11130,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_juniper_switch_snmp_config(self, id, **kwargs):
@@ -10929,14 +11143,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_juniper_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.get_juniper_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -10955,14 +11169,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_juniper_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_juniper_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -10970,6 +11184,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11019,6 +11234,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_kubernetes_cluster(self, id, **kwargs):
@@ -11031,14 +11247,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_kubernetes_cluster(id, callback=callback_function)
+        >>> future = api.get_kubernetes_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: KubernetesDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11057,14 +11273,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_kubernetes_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.get_kubernetes_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: KubernetesDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11072,6 +11288,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11121,6 +11338,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_nsxt_manager(self, id, **kwargs):
@@ -11133,14 +11351,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsxt_manager(id, callback=callback_function)
+        >>> future = api.get_nsxt_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: NSXTManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11159,14 +11377,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsxt_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_nsxt_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: NSXTManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11174,6 +11392,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11223,6 +11442,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_nsxv_controller_cluster(self, id, **kwargs):
@@ -11235,14 +11455,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsxv_controller_cluster(id, callback=callback_function)
+        >>> future = api.get_nsxv_controller_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: NSXControllerDataCollection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11261,14 +11481,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsxv_controller_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.get_nsxv_controller_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: NSXControllerDataCollection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11276,6 +11496,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11325,6 +11546,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_nsxv_manager(self, id, **kwargs):
@@ -11337,14 +11559,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsxv_manager(id, callback=callback_function)
+        >>> future = api.get_nsxv_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: NSXVManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11363,14 +11585,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsxv_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_nsxv_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: NSXVManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11378,6 +11600,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11427,6 +11650,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_panorama_firewall(self, id, **kwargs):
@@ -11439,14 +11663,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_panorama_firewall(id, callback=callback_function)
+        >>> future = api.get_panorama_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: PanFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11465,14 +11689,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_panorama_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.get_panorama_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: PanFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11480,6 +11704,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11529,6 +11754,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_pks(self, id, **kwargs):
@@ -11541,14 +11767,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_pks(id, callback=callback_function)
+        >>> future = api.get_pks(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: PKSDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11567,14 +11793,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_pks_with_http_info(id, callback=callback_function)
+        >>> future = api.get_pks_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: PKSDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11582,6 +11808,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11631,6 +11858,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_policy_manager(self, id, **kwargs):
@@ -11643,14 +11871,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_policy_manager(id, callback=callback_function)
+        >>> future = api.get_policy_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: PolicyManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11669,14 +11897,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_policy_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_policy_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: PolicyManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11684,6 +11912,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11733,6 +11962,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_service_now_instance(self, id, **kwargs):
@@ -11745,14 +11975,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_service_now_instance(id, callback=callback_function)
+        >>> future = api.get_service_now_instance(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: ServiceNowDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11771,14 +12001,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_service_now_instance_with_http_info(id, callback=callback_function)
+        >>> future = api.get_service_now_instance_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: ServiceNowDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11786,6 +12016,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11835,6 +12066,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_uani(self, id, **kwargs):
@@ -11847,14 +12079,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_uani(id, callback=callback_function)
+        >>> future = api.get_uani(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11873,14 +12105,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_uani_with_http_info(id, callback=callback_function)
+        >>> future = api.get_uani_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11888,6 +12120,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -11937,6 +12170,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_ucs_manager(self, id, **kwargs):
@@ -11949,14 +12183,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ucs_manager(id, callback=callback_function)
+        >>> future = api.get_ucs_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: UCSManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -11975,14 +12209,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ucs_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_ucs_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: UCSManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -11990,6 +12224,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12039,6 +12274,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_ucs_snmp_config(self, id, **kwargs):
@@ -12051,14 +12287,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ucs_snmp_config(id, callback=callback_function)
+        >>> future = api.get_ucs_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12077,14 +12313,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ucs_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.get_ucs_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -12092,6 +12328,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12141,6 +12378,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vcenter(self, id, **kwargs):
@@ -12153,14 +12391,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vcenter(id, callback=callback_function)
+        >>> future = api.get_vcenter(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: VCenterDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12179,14 +12417,14 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vcenter_with_http_info(id, callback=callback_function)
+        >>> future = api.get_vcenter_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: VCenterDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -12194,6 +12432,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12243,6 +12482,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_arista_switches(self, **kwargs):
@@ -12255,13 +12495,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_arista_switches(callback=callback_function)
+        >>> future = api.list_arista_switches(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12280,13 +12520,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_arista_switches_with_http_info(callback=callback_function)
+        >>> future = api.list_arista_switches_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12294,6 +12534,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12337,6 +12578,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_brocade_switches(self, **kwargs):
@@ -12349,13 +12591,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_brocade_switches(callback=callback_function)
+        >>> future = api.list_brocade_switches(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12374,13 +12616,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_brocade_switches_with_http_info(callback=callback_function)
+        >>> future = api.list_brocade_switches_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12388,6 +12630,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12431,6 +12674,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_checkpoint_firewalls(self, **kwargs):
@@ -12443,13 +12687,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_checkpoint_firewalls(callback=callback_function)
+        >>> future = api.list_checkpoint_firewalls(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12468,13 +12712,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_checkpoint_firewalls_with_http_info(callback=callback_function)
+        >>> future = api.list_checkpoint_firewalls_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12482,6 +12726,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12525,6 +12770,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_cisco_aci(self, **kwargs):
@@ -12537,13 +12783,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_cisco_aci(callback=callback_function)
+        >>> future = api.list_cisco_aci(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12562,13 +12808,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_cisco_aci_with_http_info(callback=callback_function)
+        >>> future = api.list_cisco_aci_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12576,6 +12822,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12619,6 +12866,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_cisco_switches(self, **kwargs):
@@ -12631,13 +12879,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_cisco_switches(callback=callback_function)
+        >>> future = api.list_cisco_switches(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12656,13 +12904,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_cisco_switches_with_http_info(callback=callback_function)
+        >>> future = api.list_cisco_switches_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12670,6 +12918,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12713,6 +12962,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_dell_switches(self, **kwargs):
@@ -12725,13 +12975,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_dell_switches(callback=callback_function)
+        >>> future = api.list_dell_switches(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12750,13 +13000,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_dell_switches_with_http_info(callback=callback_function)
+        >>> future = api.list_dell_switches_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12764,6 +13014,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12807,6 +13058,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_f5_bigip(self, **kwargs):
@@ -12819,13 +13071,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_f5_bigip(callback=callback_function)
+        >>> future = api.list_f5_bigip(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12844,13 +13096,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_f5_bigip_with_http_info(callback=callback_function)
+        >>> future = api.list_f5_bigip_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12858,6 +13110,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12901,6 +13154,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_hpov_managers(self, **kwargs):
@@ -12913,13 +13167,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_hpov_managers(callback=callback_function)
+        >>> future = api.list_hpov_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -12938,13 +13192,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_hpov_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_hpov_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -12952,6 +13206,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -12995,6 +13250,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_hpvc_managers(self, **kwargs):
@@ -13007,13 +13263,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_hpvc_managers(callback=callback_function)
+        >>> future = api.list_hpvc_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13032,13 +13288,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_hpvc_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_hpvc_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13046,6 +13302,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13089,6 +13346,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_huawei(self, **kwargs):
@@ -13101,13 +13359,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_huawei(callback=callback_function)
+        >>> future = api.list_huawei(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13126,13 +13384,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_huawei_with_http_info(callback=callback_function)
+        >>> future = api.list_huawei_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13140,6 +13398,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13183,6 +13442,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_infoblox_managers(self, **kwargs):
@@ -13195,13 +13455,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_infoblox_managers(callback=callback_function)
+        >>> future = api.list_infoblox_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13220,13 +13480,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_infoblox_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_infoblox_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13234,6 +13494,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13277,6 +13538,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_juniper_switches(self, **kwargs):
@@ -13289,13 +13551,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_juniper_switches(callback=callback_function)
+        >>> future = api.list_juniper_switches(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13314,13 +13576,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_juniper_switches_with_http_info(callback=callback_function)
+        >>> future = api.list_juniper_switches_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13328,6 +13590,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13371,6 +13634,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_kubernetes_clusters(self, **kwargs):
@@ -13383,13 +13647,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_kubernetes_clusters(callback=callback_function)
+        >>> future = api.list_kubernetes_clusters(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13408,13 +13672,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_kubernetes_clusters_with_http_info(callback=callback_function)
+        >>> future = api.list_kubernetes_clusters_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13422,6 +13686,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13465,6 +13730,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_nsxt_managers(self, **kwargs):
@@ -13477,13 +13743,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nsxt_managers(callback=callback_function)
+        >>> future = api.list_nsxt_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13502,13 +13768,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nsxt_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_nsxt_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13516,6 +13782,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13559,6 +13826,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_nsxv_managers(self, **kwargs):
@@ -13571,13 +13839,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nsxv_managers(callback=callback_function)
+        >>> future = api.list_nsxv_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13596,13 +13864,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nsxv_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_nsxv_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13610,6 +13878,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13653,6 +13922,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_panorama_firewalls(self, **kwargs):
@@ -13665,13 +13935,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_panorama_firewalls(callback=callback_function)
+        >>> future = api.list_panorama_firewalls(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13690,13 +13960,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_panorama_firewalls_with_http_info(callback=callback_function)
+        >>> future = api.list_panorama_firewalls_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13704,6 +13974,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13747,6 +14018,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_pks(self, **kwargs):
@@ -13759,13 +14031,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_pks(callback=callback_function)
+        >>> future = api.list_pks(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13784,13 +14056,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_pks_with_http_info(callback=callback_function)
+        >>> future = api.list_pks_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13798,6 +14070,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13841,6 +14114,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_policy_managers(self, **kwargs):
@@ -13853,13 +14127,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_policy_managers(callback=callback_function)
+        >>> future = api.list_policy_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13878,13 +14152,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_policy_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_policy_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13892,6 +14166,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -13935,6 +14210,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_service_now_instances(self, **kwargs):
@@ -13947,13 +14223,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_service_now_instances(callback=callback_function)
+        >>> future = api.list_service_now_instances(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -13972,13 +14248,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_service_now_instances_with_http_info(callback=callback_function)
+        >>> future = api.list_service_now_instances_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -13986,6 +14262,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14029,6 +14306,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_uani(self, **kwargs):
@@ -14041,13 +14319,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_uani(callback=callback_function)
+        >>> future = api.list_uani(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14066,13 +14344,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_uani_with_http_info(callback=callback_function)
+        >>> future = api.list_uani_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -14080,6 +14358,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14123,6 +14402,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_ucs_managers(self, **kwargs):
@@ -14135,13 +14415,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_ucs_managers(callback=callback_function)
+        >>> future = api.list_ucs_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14160,13 +14440,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_ucs_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_ucs_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -14174,6 +14454,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14217,6 +14498,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_vcenters(self, **kwargs):
@@ -14229,13 +14511,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vcenters(callback=callback_function)
+        >>> future = api.list_vcenters(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14254,13 +14536,13 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vcenters_with_http_info(callback=callback_function)
+        >>> future = api.list_vcenters_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: DataSourceListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -14268,6 +14550,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14311,6 +14594,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_arista_switch(self, id, **kwargs):
@@ -14323,7 +14607,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_arista_switch(id, callback=callback_function)
+        >>> future = api.update_arista_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14331,7 +14615,7 @@ class DataSourcesApi(object):
         :param AristaSwitchDataSource body:
         :return: AristaSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14350,7 +14634,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_arista_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.update_arista_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14358,7 +14642,7 @@ class DataSourcesApi(object):
         :param AristaSwitchDataSource body:
         :return: AristaSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -14366,6 +14650,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14417,6 +14702,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_arista_switch_snmp_config(self, id, **kwargs):
@@ -14429,7 +14715,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_arista_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.update_arista_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14437,7 +14723,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14456,7 +14742,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_arista_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_arista_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14464,7 +14750,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -14472,6 +14758,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14523,6 +14810,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_brocade_switch(self, id, **kwargs):
@@ -14535,7 +14823,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_brocade_switch(id, callback=callback_function)
+        >>> future = api.update_brocade_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14543,7 +14831,7 @@ class DataSourcesApi(object):
         :param BrocadeSwitchDataSource body:
         :return: BrocadeSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14562,7 +14850,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_brocade_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.update_brocade_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14570,7 +14858,7 @@ class DataSourcesApi(object):
         :param BrocadeSwitchDataSource body:
         :return: BrocadeSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -14578,6 +14866,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14629,6 +14918,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_brocade_switch_snmp_config(self, id, **kwargs):
@@ -14641,7 +14931,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_brocade_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.update_brocade_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14649,7 +14939,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14668,7 +14958,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_brocade_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_brocade_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14676,7 +14966,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -14684,6 +14974,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14735,6 +15026,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_checkpoint_firewall(self, id, **kwargs):
@@ -14747,7 +15039,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_checkpoint_firewall(id, callback=callback_function)
+        >>> future = api.update_checkpoint_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14755,7 +15047,7 @@ class DataSourcesApi(object):
         :param CheckpointFirewallDataSource body:
         :return: CheckpointFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14774,7 +15066,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_checkpoint_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.update_checkpoint_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14782,7 +15074,7 @@ class DataSourcesApi(object):
         :param CheckpointFirewallDataSource body:
         :return: CheckpointFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -14790,6 +15082,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14841,6 +15134,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_cisco_aci_manager(self, id, **kwargs):
@@ -14853,7 +15147,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_aci_manager(id, callback=callback_function)
+        >>> future = api.update_cisco_aci_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14861,7 +15155,7 @@ class DataSourcesApi(object):
         :param CiscoACIDataSource body:
         :return: CiscoACIDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14880,7 +15174,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_aci_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_cisco_aci_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14888,7 +15182,7 @@ class DataSourcesApi(object):
         :param CiscoACIDataSource body:
         :return: CiscoACIDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -14896,6 +15190,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -14947,6 +15242,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_cisco_aci_snmp_config(self, id, **kwargs):
@@ -14959,7 +15255,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_aci_snmp_config(id, callback=callback_function)
+        >>> future = api.update_cisco_aci_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14967,7 +15263,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -14986,7 +15282,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_aci_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_cisco_aci_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -14994,7 +15290,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15002,6 +15298,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15053,6 +15350,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_cisco_switch(self, id, **kwargs):
@@ -15065,7 +15363,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_switch(id, callback=callback_function)
+        >>> future = api.update_cisco_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15073,7 +15371,7 @@ class DataSourcesApi(object):
         :param CiscoSwitchDataSource body:
         :return: CiscoSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15092,7 +15390,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.update_cisco_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15100,7 +15398,7 @@ class DataSourcesApi(object):
         :param CiscoSwitchDataSource body:
         :return: CiscoSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15108,6 +15406,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15159,6 +15458,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_cisco_switch_snmp_config(self, id, **kwargs):
@@ -15171,7 +15471,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.update_cisco_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15179,7 +15479,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15198,7 +15498,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_cisco_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_cisco_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15206,7 +15506,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15214,6 +15514,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15265,6 +15566,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_dell_switch(self, id, **kwargs):
@@ -15277,7 +15579,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_dell_switch(id, callback=callback_function)
+        >>> future = api.update_dell_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15285,7 +15587,7 @@ class DataSourcesApi(object):
         :param DellSwitchDataSource body:
         :return: DellSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15304,7 +15606,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_dell_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.update_dell_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15312,7 +15614,7 @@ class DataSourcesApi(object):
         :param DellSwitchDataSource body:
         :return: DellSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15320,6 +15622,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15371,6 +15674,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_dell_switch_snmp_config(self, id, **kwargs):
@@ -15383,7 +15687,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_dell_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.update_dell_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15391,7 +15695,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15410,7 +15714,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_dell_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_dell_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15418,7 +15722,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15426,6 +15730,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15477,6 +15782,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_f5_bigip(self, id, **kwargs):
@@ -15489,7 +15795,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_f5_bigip(id, callback=callback_function)
+        >>> future = api.update_f5_bigip(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15497,7 +15803,7 @@ class DataSourcesApi(object):
         :param GDDataSource body:
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15516,7 +15822,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_f5_bigip_with_http_info(id, callback=callback_function)
+        >>> future = api.update_f5_bigip_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15524,7 +15830,7 @@ class DataSourcesApi(object):
         :param GDDataSource body:
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15532,6 +15838,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15583,6 +15890,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_f5_bigip_snmp_config(self, id, **kwargs):
@@ -15595,7 +15903,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_f5_bigip_snmp_config(id, callback=callback_function)
+        >>> future = api.update_f5_bigip_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15603,7 +15911,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15622,7 +15930,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_f5_bigip_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_f5_bigip_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15630,7 +15938,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15638,6 +15946,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15689,6 +15998,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_hpov_manager(self, id, **kwargs):
@@ -15701,7 +16011,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_hpov_manager(id, callback=callback_function)
+        >>> future = api.update_hpov_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15709,7 +16019,7 @@ class DataSourcesApi(object):
         :param HPOneViewManagerDataSource body:
         :return: HPOneViewManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15728,7 +16038,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_hpov_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_hpov_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15736,7 +16046,7 @@ class DataSourcesApi(object):
         :param HPOneViewManagerDataSource body:
         :return: HPOneViewManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15744,6 +16054,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15795,6 +16106,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_hpvc_manager(self, id, **kwargs):
@@ -15807,7 +16119,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_hpvc_manager(id, callback=callback_function)
+        >>> future = api.update_hpvc_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15815,7 +16127,7 @@ class DataSourcesApi(object):
         :param HPVCManagerDataSource body:
         :return: HPVCManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15834,7 +16146,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_hpvc_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_hpvc_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15842,7 +16154,7 @@ class DataSourcesApi(object):
         :param HPVCManagerDataSource body:
         :return: HPVCManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15850,6 +16162,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -15901,6 +16214,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_huawei(self, id, **kwargs):
@@ -15913,7 +16227,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_huawei(id, callback=callback_function)
+        >>> future = api.update_huawei(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15921,7 +16235,7 @@ class DataSourcesApi(object):
         :param GDDataSource body:
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -15940,7 +16254,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_huawei_with_http_info(id, callback=callback_function)
+        >>> future = api.update_huawei_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -15948,7 +16262,7 @@ class DataSourcesApi(object):
         :param GDDataSource body:
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -15956,6 +16270,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16007,6 +16322,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_huawei_snmp_config(self, id, **kwargs):
@@ -16019,7 +16335,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_huawei_snmp_config(id, callback=callback_function)
+        >>> future = api.update_huawei_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16027,7 +16343,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16046,7 +16362,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_huawei_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_huawei_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16054,7 +16370,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16062,6 +16378,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16113,6 +16430,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_infoblox_manager(self, id, **kwargs):
@@ -16125,7 +16443,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_infoblox_manager(id, callback=callback_function)
+        >>> future = api.update_infoblox_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16133,7 +16451,7 @@ class DataSourcesApi(object):
         :param InfobloxManagerDataSource body:
         :return: InfobloxManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16152,7 +16470,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_infoblox_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_infoblox_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16160,7 +16478,7 @@ class DataSourcesApi(object):
         :param InfobloxManagerDataSource body:
         :return: InfobloxManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16168,6 +16486,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16219,6 +16538,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_juniper_switch(self, id, **kwargs):
@@ -16231,7 +16551,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_juniper_switch(id, callback=callback_function)
+        >>> future = api.update_juniper_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16239,7 +16559,7 @@ class DataSourcesApi(object):
         :param JuniperSwitchDataSource body:
         :return: JuniperSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16258,7 +16578,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_juniper_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.update_juniper_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16266,7 +16586,7 @@ class DataSourcesApi(object):
         :param JuniperSwitchDataSource body:
         :return: JuniperSwitchDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16274,6 +16594,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16325,6 +16646,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_juniper_switch_snmp_config(self, id, **kwargs):
@@ -16337,7 +16659,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_juniper_switch_snmp_config(id, callback=callback_function)
+        >>> future = api.update_juniper_switch_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16345,7 +16667,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16364,7 +16686,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_juniper_switch_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_juniper_switch_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16372,7 +16694,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16380,6 +16702,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16431,6 +16754,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_kubernetes_cluster(self, id, **kwargs):
@@ -16443,7 +16767,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_kubernetes_cluster(id, callback=callback_function)
+        >>> future = api.update_kubernetes_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16451,7 +16775,7 @@ class DataSourcesApi(object):
         :param KubernetesDataSource body:
         :return: KubernetesDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16470,7 +16794,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_kubernetes_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.update_kubernetes_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16478,7 +16802,7 @@ class DataSourcesApi(object):
         :param KubernetesDataSource body:
         :return: KubernetesDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16486,6 +16810,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16537,6 +16862,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_nsxt_manager(self, id, **kwargs):
@@ -16549,7 +16875,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_nsxt_manager(id, callback=callback_function)
+        >>> future = api.update_nsxt_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16557,7 +16883,7 @@ class DataSourcesApi(object):
         :param NSXTManagerDataSource body:
         :return: NSXTManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16576,7 +16902,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_nsxt_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_nsxt_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16584,7 +16910,7 @@ class DataSourcesApi(object):
         :param NSXTManagerDataSource body:
         :return: NSXTManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16592,6 +16918,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16643,6 +16970,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_nsxv_controller_cluster(self, id, **kwargs):
@@ -16655,7 +16983,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_nsxv_controller_cluster(id, callback=callback_function)
+        >>> future = api.update_nsxv_controller_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16663,7 +16991,7 @@ class DataSourcesApi(object):
         :param NSXControllerDataCollection body:
         :return: NSXControllerDataCollection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16682,7 +17010,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_nsxv_controller_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.update_nsxv_controller_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16690,7 +17018,7 @@ class DataSourcesApi(object):
         :param NSXControllerDataCollection body:
         :return: NSXControllerDataCollection
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16698,6 +17026,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16749,6 +17078,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_nsxv_manager(self, id, **kwargs):
@@ -16761,7 +17091,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_nsxv_manager(id, callback=callback_function)
+        >>> future = api.update_nsxv_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16769,7 +17099,7 @@ class DataSourcesApi(object):
         :param NSXVManagerDataSource body:
         :return: NSXVManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16788,7 +17118,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_nsxv_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_nsxv_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16796,7 +17126,7 @@ class DataSourcesApi(object):
         :param NSXVManagerDataSource body:
         :return: NSXVManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16804,6 +17134,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16855,6 +17186,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_panorama_firewall(self, id, **kwargs):
@@ -16867,7 +17199,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_panorama_firewall(id, callback=callback_function)
+        >>> future = api.update_panorama_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16875,7 +17207,7 @@ class DataSourcesApi(object):
         :param PanFirewallDataSource body:
         :return: PanFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -16894,7 +17226,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_panorama_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.update_panorama_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16902,7 +17234,7 @@ class DataSourcesApi(object):
         :param PanFirewallDataSource body:
         :return: PanFirewallDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -16910,6 +17242,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16961,6 +17294,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_pks(self, id, **kwargs):
@@ -16973,7 +17307,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_pks(id, callback=callback_function)
+        >>> future = api.update_pks(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -16981,7 +17315,7 @@ class DataSourcesApi(object):
         :param PKSDataSource body:
         :return: PKSDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17000,7 +17334,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_pks_with_http_info(id, callback=callback_function)
+        >>> future = api.update_pks_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17008,7 +17342,7 @@ class DataSourcesApi(object):
         :param PKSDataSource body:
         :return: PKSDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -17016,6 +17350,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17067,6 +17402,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_policy_manager(self, id, **kwargs):
@@ -17079,7 +17415,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_policy_manager(id, callback=callback_function)
+        >>> future = api.update_policy_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17087,7 +17423,7 @@ class DataSourcesApi(object):
         :param PolicyManagerDataSource body:
         :return: PolicyManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17106,7 +17442,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_policy_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_policy_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17114,7 +17450,7 @@ class DataSourcesApi(object):
         :param PolicyManagerDataSource body:
         :return: PolicyManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -17122,6 +17458,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17173,6 +17510,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_service_now_instance(self, id, **kwargs):
@@ -17185,7 +17523,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_service_now_instance(id, callback=callback_function)
+        >>> future = api.update_service_now_instance(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17193,7 +17531,7 @@ class DataSourcesApi(object):
         :param ServiceNowDataSource body:
         :return: ServiceNowDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17212,7 +17550,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_service_now_instance_with_http_info(id, callback=callback_function)
+        >>> future = api.update_service_now_instance_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17220,7 +17558,7 @@ class DataSourcesApi(object):
         :param ServiceNowDataSource body:
         :return: ServiceNowDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -17228,6 +17566,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17279,6 +17618,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_uani(self, id, file, proxy_id, **kwargs):
@@ -17291,7 +17631,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_uani(id, file, proxy_id, callback=callback_function)
+        >>> future = api.update_uani(id, file, proxy_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17301,7 +17641,7 @@ class DataSourcesApi(object):
         :param str notes: Description of uani data source.
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17320,7 +17660,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_uani_with_http_info(id, file, proxy_id, callback=callback_function)
+        >>> future = api.update_uani_with_http_info(id, file, proxy_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17330,7 +17670,7 @@ class DataSourcesApi(object):
         :param str notes: Description of uani data source.
         :return: GDDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'file', 'proxy_id', 'notes']
@@ -17338,6 +17678,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17403,6 +17744,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_ucs_manager(self, id, **kwargs):
@@ -17415,7 +17757,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_ucs_manager(id, callback=callback_function)
+        >>> future = api.update_ucs_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17423,7 +17765,7 @@ class DataSourcesApi(object):
         :param UCSManagerDataSource body:
         :return: UCSManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17442,7 +17784,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_ucs_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.update_ucs_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17450,7 +17792,7 @@ class DataSourcesApi(object):
         :param UCSManagerDataSource body:
         :return: UCSManagerDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -17458,6 +17800,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17509,6 +17852,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_ucs_snmp_config(self, id, **kwargs):
@@ -17521,7 +17865,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_ucs_snmp_config(id, callback=callback_function)
+        >>> future = api.update_ucs_snmp_config(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17529,7 +17873,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17548,7 +17892,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_ucs_snmp_config_with_http_info(id, callback=callback_function)
+        >>> future = api.update_ucs_snmp_config_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17556,7 +17900,7 @@ class DataSourcesApi(object):
         :param SNMPConfig body:
         :return: SNMPConfig
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -17564,6 +17908,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17615,6 +17960,7 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_vcenter(self, id, **kwargs):
@@ -17627,7 +17973,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vcenter(id, callback=callback_function)
+        >>> future = api.update_vcenter(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17635,7 +17981,7 @@ class DataSourcesApi(object):
         :param VCenterDataSource body:
         :return: VCenterDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -17654,7 +18000,7 @@ class DataSourcesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vcenter_with_http_info(id, callback=callback_function)
+        >>> future = api.update_vcenter_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -17662,7 +18008,7 @@ class DataSourcesApi(object):
         :param VCenterDataSource body:
         :return: VCenterDataSource
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -17670,6 +18016,7 @@ class DataSourcesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17721,4 +18068,5 @@ class DataSourcesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
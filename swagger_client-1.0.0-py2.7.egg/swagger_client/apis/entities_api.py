@@ -50,14 +50,14 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.entities_fetch_post(callback=callback_function)
+        >>> future = api.entities_fetch_post(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param FetchRequest body:
         :return: BulkFetchResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.entities_fetch_post_with_http_info(callback=callback_function)
+        >>> future = api.entities_fetch_post_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param FetchRequest body:
         :return: BulkFetchResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -91,6 +91,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -137,6 +138,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_cluster(self, id, **kwargs):
@@ -149,7 +151,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cluster(id, callback=callback_function)
+        >>> future = api.get_cluster(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -157,7 +159,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Cluster
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -176,7 +178,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_cluster_with_http_info(id, callback=callback_function)
+        >>> future = api.get_cluster_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -184,7 +186,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Cluster
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -192,6 +194,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -243,6 +246,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_datacenter(self, id, **kwargs):
@@ -255,7 +259,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_datacenter(id, callback=callback_function)
+        >>> future = api.get_datacenter(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -263,7 +267,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: VCDatacenter
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -282,7 +286,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_datacenter_with_http_info(id, callback=callback_function)
+        >>> future = api.get_datacenter_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -290,7 +294,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: VCDatacenter
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -298,6 +302,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -349,6 +354,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_datastore(self, id, **kwargs):
@@ -361,7 +367,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_datastore(id, callback=callback_function)
+        >>> future = api.get_datastore(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -369,7 +375,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Datastore
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -388,7 +394,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_datastore_with_http_info(id, callback=callback_function)
+        >>> future = api.get_datastore_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -396,7 +402,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Datastore
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -404,6 +410,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -455,6 +462,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_distributed_virtual_portgroup(self, id, **kwargs):
@@ -467,7 +475,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_distributed_virtual_portgroup(id, callback=callback_function)
+        >>> future = api.get_distributed_virtual_portgroup(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -475,7 +483,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: DistributedVirtualPortgroup
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -494,7 +502,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_distributed_virtual_portgroup_with_http_info(id, callback=callback_function)
+        >>> future = api.get_distributed_virtual_portgroup_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -502,7 +510,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: DistributedVirtualPortgroup
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -510,6 +518,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -561,6 +570,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_distributed_virtual_switch(self, id, **kwargs):
@@ -573,7 +583,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_distributed_virtual_switch(id, callback=callback_function)
+        >>> future = api.get_distributed_virtual_switch(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -581,7 +591,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: DistributedVirtualSwitch
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -600,7 +610,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_distributed_virtual_switch_with_http_info(id, callback=callback_function)
+        >>> future = api.get_distributed_virtual_switch_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -608,7 +618,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: DistributedVirtualSwitch
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -616,6 +626,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -667,6 +678,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_firewall(self, id, **kwargs):
@@ -679,7 +691,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_firewall(id, callback=callback_function)
+        >>> future = api.get_firewall(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -687,7 +699,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseFirewallRule
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -706,7 +718,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_firewall_with_http_info(id, callback=callback_function)
+        >>> future = api.get_firewall_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -714,7 +726,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseFirewallRule
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -722,6 +734,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -773,6 +786,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_firewall_manager(self, id, **kwargs):
@@ -785,7 +799,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_firewall_manager(id, callback=callback_function)
+        >>> future = api.get_firewall_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -793,7 +807,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseFirewallManager
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -812,7 +826,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_firewall_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_firewall_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -820,7 +834,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseFirewallManager
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -828,6 +842,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -879,6 +894,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_firewall_rule(self, id, **kwargs):
@@ -891,7 +907,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_firewall_rule(id, callback=callback_function)
+        >>> future = api.get_firewall_rule(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -899,7 +915,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseFirewallRule
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -918,7 +934,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_firewall_rule_with_http_info(id, callback=callback_function)
+        >>> future = api.get_firewall_rule_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -926,7 +942,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseFirewallRule
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -934,6 +950,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -985,6 +1002,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_flow(self, id, **kwargs):
@@ -997,7 +1015,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_flow(id, callback=callback_function)
+        >>> future = api.get_flow(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1005,7 +1023,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Flow
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1024,7 +1042,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_flow_with_http_info(id, callback=callback_function)
+        >>> future = api.get_flow_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1032,7 +1050,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Flow
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1040,6 +1058,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1091,6 +1110,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_flows(self, **kwargs):
@@ -1103,7 +1123,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_flows(callback=callback_function)
+        >>> future = api.get_flows(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1113,7 +1133,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1132,7 +1152,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_flows_with_http_info(callback=callback_function)
+        >>> future = api.get_flows_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1142,7 +1162,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -1150,6 +1170,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1202,6 +1223,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_folder(self, id, **kwargs):
@@ -1214,7 +1236,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_folder(id, callback=callback_function)
+        >>> future = api.get_folder(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1222,7 +1244,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Folder
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1241,7 +1263,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_folder_with_http_info(id, callback=callback_function)
+        >>> future = api.get_folder_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1249,7 +1271,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Folder
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1257,6 +1279,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1308,6 +1331,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_host(self, id, **kwargs):
@@ -1320,7 +1344,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_host(id, callback=callback_function)
+        >>> future = api.get_host(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1328,7 +1352,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Host
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1347,7 +1371,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_host_with_http_info(id, callback=callback_function)
+        >>> future = api.get_host_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1355,7 +1379,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Host
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1363,6 +1387,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1414,6 +1439,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_ip_set(self, id, **kwargs):
@@ -1426,7 +1452,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ip_set(id, callback=callback_function)
+        >>> future = api.get_ip_set(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1434,7 +1460,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseIPSet
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1453,7 +1479,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ip_set_with_http_info(id, callback=callback_function)
+        >>> future = api.get_ip_set_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1461,7 +1487,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseIPSet
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1469,6 +1495,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1520,6 +1547,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_layer2_network(self, id, **kwargs):
@@ -1532,7 +1560,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_layer2_network(id, callback=callback_function)
+        >>> future = api.get_layer2_network(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1540,7 +1568,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseL2Network
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1559,7 +1587,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_layer2_network_with_http_info(id, callback=callback_function)
+        >>> future = api.get_layer2_network_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1567,7 +1595,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseL2Network
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1575,6 +1603,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1626,6 +1655,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_name(self, id, **kwargs):
@@ -1638,7 +1668,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_name(id, callback=callback_function)
+        >>> future = api.get_name(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1646,7 +1676,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: EntityName
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1665,7 +1695,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_name_with_http_info(id, callback=callback_function)
+        >>> future = api.get_name_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1673,7 +1703,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: EntityName
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1681,6 +1711,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1732,6 +1763,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_names(self, body, **kwargs):
@@ -1744,14 +1776,14 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_names(body, callback=callback_function)
+        >>> future = api.get_names(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param NamesRequest body: Names Request (required)
         :return: NamesResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1770,14 +1802,14 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_names_with_http_info(body, callback=callback_function)
+        >>> future = api.get_names_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param NamesRequest body: Names Request (required)
         :return: NamesResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -1785,6 +1817,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1834,6 +1867,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_nsx_manager(self, id, **kwargs):
@@ -1846,7 +1880,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsx_manager(id, callback=callback_function)
+        >>> future = api.get_nsx_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1854,7 +1888,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseNSXManager
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1873,7 +1907,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_nsx_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_nsx_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1881,7 +1915,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseNSXManager
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1889,6 +1923,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1940,6 +1975,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_problem_event(self, id, **kwargs):
@@ -1952,7 +1988,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_problem_event(id, callback=callback_function)
+        >>> future = api.get_problem_event(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1960,7 +1996,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: ProblemEvent
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1979,7 +2015,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_problem_event_with_http_info(id, callback=callback_function)
+        >>> future = api.get_problem_event_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1987,7 +2023,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: ProblemEvent
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -1995,6 +2031,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2046,6 +2083,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_security_group(self, id, **kwargs):
@@ -2058,7 +2096,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_security_group(id, callback=callback_function)
+        >>> future = api.get_security_group(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2066,7 +2104,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseSecurityGroup
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2085,7 +2123,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_security_group_with_http_info(id, callback=callback_function)
+        >>> future = api.get_security_group_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2093,7 +2131,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseSecurityGroup
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2101,6 +2139,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2152,6 +2191,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_security_tag(self, id, **kwargs):
@@ -2164,7 +2204,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_security_tag(id, callback=callback_function)
+        >>> future = api.get_security_tag(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2172,7 +2212,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: SecurityTag
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2191,7 +2231,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_security_tag_with_http_info(id, callback=callback_function)
+        >>> future = api.get_security_tag_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2199,7 +2239,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: SecurityTag
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2207,6 +2247,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2258,6 +2299,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_service(self, id, **kwargs):
@@ -2270,7 +2312,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_service(id, callback=callback_function)
+        >>> future = api.get_service(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2278,7 +2320,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseService
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2297,7 +2339,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_service_with_http_info(id, callback=callback_function)
+        >>> future = api.get_service_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2305,7 +2347,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseService
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2313,6 +2355,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2364,6 +2407,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_service_group(self, id, **kwargs):
@@ -2376,7 +2420,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_service_group(id, callback=callback_function)
+        >>> future = api.get_service_group(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2384,7 +2428,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseServiceGroup
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2403,7 +2447,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_service_group_with_http_info(id, callback=callback_function)
+        >>> future = api.get_service_group_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2411,7 +2455,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseServiceGroup
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2419,6 +2463,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2470,6 +2515,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vcenter_manager(self, id, **kwargs):
@@ -2482,7 +2528,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vcenter_manager(id, callback=callback_function)
+        >>> future = api.get_vcenter_manager(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2490,7 +2536,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: VCenterManager
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2509,7 +2555,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vcenter_manager_with_http_info(id, callback=callback_function)
+        >>> future = api.get_vcenter_manager_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2517,7 +2563,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: VCenterManager
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2525,6 +2571,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2576,6 +2623,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vm(self, id, **kwargs):
@@ -2588,7 +2636,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vm(id, callback=callback_function)
+        >>> future = api.get_vm(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2596,7 +2644,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseVirtualMachine
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2615,7 +2663,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vm_with_http_info(id, callback=callback_function)
+        >>> future = api.get_vm_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2623,7 +2671,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseVirtualMachine
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2631,6 +2679,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2682,6 +2731,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vmknic(self, id, **kwargs):
@@ -2694,7 +2744,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vmknic(id, callback=callback_function)
+        >>> future = api.get_vmknic(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2702,7 +2752,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Vmknic
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2721,7 +2771,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vmknic_with_http_info(id, callback=callback_function)
+        >>> future = api.get_vmknic_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2729,7 +2779,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: Vmknic
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2737,6 +2787,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2788,6 +2839,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vnic(self, id, **kwargs):
@@ -2800,7 +2852,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vnic(id, callback=callback_function)
+        >>> future = api.get_vnic(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2808,7 +2860,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseVnic
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2827,7 +2879,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vnic_with_http_info(id, callback=callback_function)
+        >>> future = api.get_vnic_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2835,7 +2887,7 @@ class EntitiesApi(object):
         :param int time: time in epoch seconds
         :return: BaseVnic
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'time']
@@ -2843,6 +2895,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2894,6 +2947,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_clusters(self, **kwargs):
@@ -2906,7 +2960,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_clusters(callback=callback_function)
+        >>> future = api.list_clusters(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2916,7 +2970,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2935,7 +2989,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_clusters_with_http_info(callback=callback_function)
+        >>> future = api.list_clusters_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2945,7 +2999,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -2953,6 +3007,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3005,6 +3060,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_datacenters(self, **kwargs):
@@ -3017,7 +3073,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_datacenters(callback=callback_function)
+        >>> future = api.list_datacenters(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3027,7 +3083,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3046,7 +3102,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_datacenters_with_http_info(callback=callback_function)
+        >>> future = api.list_datacenters_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3056,7 +3112,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3064,6 +3120,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3116,6 +3173,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_datastores(self, **kwargs):
@@ -3128,7 +3186,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_datastores(callback=callback_function)
+        >>> future = api.list_datastores(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3138,7 +3196,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3157,7 +3215,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_datastores_with_http_info(callback=callback_function)
+        >>> future = api.list_datastores_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3167,7 +3225,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3175,6 +3233,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3227,6 +3286,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_distributed_virtual_portgroups(self, **kwargs):
@@ -3239,7 +3299,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_distributed_virtual_portgroups(callback=callback_function)
+        >>> future = api.list_distributed_virtual_portgroups(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3249,7 +3309,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3268,7 +3328,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_distributed_virtual_portgroups_with_http_info(callback=callback_function)
+        >>> future = api.list_distributed_virtual_portgroups_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3278,7 +3338,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3286,6 +3346,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3338,6 +3399,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_distributed_virtual_switches(self, **kwargs):
@@ -3350,7 +3412,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_distributed_virtual_switches(callback=callback_function)
+        >>> future = api.list_distributed_virtual_switches(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3360,7 +3422,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3379,7 +3441,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_distributed_virtual_switches_with_http_info(callback=callback_function)
+        >>> future = api.list_distributed_virtual_switches_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3389,7 +3451,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3397,6 +3459,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3449,6 +3512,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_firewall_managers(self, **kwargs):
@@ -3461,7 +3525,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_firewall_managers(callback=callback_function)
+        >>> future = api.list_firewall_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3471,7 +3535,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3490,7 +3554,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_firewall_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_firewall_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3500,7 +3564,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3508,6 +3572,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3560,6 +3625,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_firewall_rules(self, **kwargs):
@@ -3572,7 +3638,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_firewall_rules(callback=callback_function)
+        >>> future = api.list_firewall_rules(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3582,7 +3648,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3601,7 +3667,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_firewall_rules_with_http_info(callback=callback_function)
+        >>> future = api.list_firewall_rules_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3611,7 +3677,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3619,6 +3685,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3671,6 +3738,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_firewalls(self, **kwargs):
@@ -3683,7 +3751,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_firewalls(callback=callback_function)
+        >>> future = api.list_firewalls(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3693,7 +3761,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3712,7 +3780,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_firewalls_with_http_info(callback=callback_function)
+        >>> future = api.list_firewalls_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3722,7 +3790,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3730,6 +3798,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3782,6 +3851,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_folders(self, **kwargs):
@@ -3794,7 +3864,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_folders(callback=callback_function)
+        >>> future = api.list_folders(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3804,7 +3874,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3823,7 +3893,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_folders_with_http_info(callback=callback_function)
+        >>> future = api.list_folders_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3833,7 +3903,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3841,6 +3911,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -3893,6 +3964,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_hosts(self, **kwargs):
@@ -3905,7 +3977,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_hosts(callback=callback_function)
+        >>> future = api.list_hosts(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3915,7 +3987,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -3934,7 +4006,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_hosts_with_http_info(callback=callback_function)
+        >>> future = api.list_hosts_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -3944,7 +4016,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -3952,6 +4024,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4004,6 +4077,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_ip_sets(self, **kwargs):
@@ -4016,7 +4090,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_ip_sets(callback=callback_function)
+        >>> future = api.list_ip_sets(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4026,7 +4100,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4045,7 +4119,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_ip_sets_with_http_info(callback=callback_function)
+        >>> future = api.list_ip_sets_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4055,7 +4129,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4063,6 +4137,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4115,6 +4190,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_layer2_networks(self, **kwargs):
@@ -4127,7 +4203,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_layer2_networks(callback=callback_function)
+        >>> future = api.list_layer2_networks(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4137,7 +4213,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4156,7 +4232,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_layer2_networks_with_http_info(callback=callback_function)
+        >>> future = api.list_layer2_networks_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4166,7 +4242,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4174,6 +4250,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4226,6 +4303,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_nsx_managers(self, **kwargs):
@@ -4238,7 +4316,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nsx_managers(callback=callback_function)
+        >>> future = api.list_nsx_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4248,7 +4326,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4267,7 +4345,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nsx_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_nsx_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4277,7 +4355,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4285,6 +4363,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4337,6 +4416,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_problem_events(self, **kwargs):
@@ -4349,7 +4429,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_problem_events(callback=callback_function)
+        >>> future = api.list_problem_events(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4359,7 +4439,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4378,7 +4458,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_problem_events_with_http_info(callback=callback_function)
+        >>> future = api.list_problem_events_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4388,7 +4468,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4396,6 +4476,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4448,6 +4529,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_security_groups(self, **kwargs):
@@ -4460,7 +4542,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_security_groups(callback=callback_function)
+        >>> future = api.list_security_groups(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4470,7 +4552,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4489,7 +4571,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_security_groups_with_http_info(callback=callback_function)
+        >>> future = api.list_security_groups_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4499,7 +4581,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4507,6 +4589,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4559,6 +4642,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_security_tags(self, **kwargs):
@@ -4571,7 +4655,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_security_tags(callback=callback_function)
+        >>> future = api.list_security_tags(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4581,7 +4665,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4600,7 +4684,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_security_tags_with_http_info(callback=callback_function)
+        >>> future = api.list_security_tags_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4610,7 +4694,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4618,6 +4702,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4670,6 +4755,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_service_groups(self, **kwargs):
@@ -4682,7 +4768,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_service_groups(callback=callback_function)
+        >>> future = api.list_service_groups(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4692,7 +4778,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4711,7 +4797,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_service_groups_with_http_info(callback=callback_function)
+        >>> future = api.list_service_groups_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4721,7 +4807,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4729,6 +4815,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4781,6 +4868,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_services(self, **kwargs):
@@ -4793,7 +4881,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_services(callback=callback_function)
+        >>> future = api.list_services(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4803,7 +4891,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4822,7 +4910,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_services_with_http_info(callback=callback_function)
+        >>> future = api.list_services_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4832,7 +4920,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4840,6 +4928,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -4892,6 +4981,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_vcenter_managers(self, **kwargs):
@@ -4904,7 +4994,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vcenter_managers(callback=callback_function)
+        >>> future = api.list_vcenter_managers(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4914,7 +5004,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -4933,7 +5023,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vcenter_managers_with_http_info(callback=callback_function)
+        >>> future = api.list_vcenter_managers_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -4943,7 +5033,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -4951,6 +5041,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5003,6 +5094,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_vmknics(self, **kwargs):
@@ -5015,7 +5107,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vmknics(callback=callback_function)
+        >>> future = api.list_vmknics(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -5025,7 +5117,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5044,7 +5136,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vmknics_with_http_info(callback=callback_function)
+        >>> future = api.list_vmknics_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -5054,7 +5146,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -5062,6 +5154,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5114,6 +5207,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_vms(self, **kwargs):
@@ -5126,7 +5220,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vms(callback=callback_function)
+        >>> future = api.list_vms(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -5136,7 +5230,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5155,7 +5249,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vms_with_http_info(callback=callback_function)
+        >>> future = api.list_vms_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -5165,7 +5259,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -5173,6 +5267,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5225,6 +5320,7 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_vnics(self, **kwargs):
@@ -5237,7 +5333,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vnics(callback=callback_function)
+        >>> future = api.list_vnics(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -5247,7 +5343,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -5266,7 +5362,7 @@ class EntitiesApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_vnics_with_http_info(callback=callback_function)
+        >>> future = api.list_vnics_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -5276,7 +5372,7 @@ class EntitiesApi(object):
         :param float end_time: end time for query in epoch seconds
         :return: PagedListResponseWithTime
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['size', 'cursor', 'start_time', 'end_time']
@@ -5284,6 +5380,7 @@ class EntitiesApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -5336,4 +5433,5 @@ class EntitiesApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
@@ -50,13 +50,13 @@ class InfoApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_version(callback=callback_function)
+        >>> future = api.get_version(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: VersionResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -75,13 +75,13 @@ class InfoApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_version_with_http_info(callback=callback_function)
+        >>> future = api.get_version_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: VersionResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -89,6 +89,7 @@ class InfoApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -132,4 +133,5 @@ class InfoApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
@@ -50,14 +50,14 @@ class InfrastructureApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_node(id, callback=callback_function)
+        >>> future = api.get_node(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: Node
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class InfrastructureApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_node_with_http_info(id, callback=callback_function)
+        >>> future = api.get_node_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: Node
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -91,6 +91,7 @@ class InfrastructureApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -140,6 +141,7 @@ class InfrastructureApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_nodes(self, **kwargs):
@@ -152,13 +154,13 @@ class InfrastructureApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nodes(callback=callback_function)
+        >>> future = api.list_nodes(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: NodeListResult
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -177,13 +179,13 @@ class InfrastructureApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_nodes_with_http_info(callback=callback_function)
+        >>> future = api.list_nodes_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: NodeListResult
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -191,6 +193,7 @@ class InfrastructureApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -234,4 +237,5 @@ class InfrastructureApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
@@ -50,7 +50,7 @@ class MetricsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_metrics(entity_id, metric, interval, start, end, callback=callback_function)
+        >>> future = api.get_metrics(entity_id, metric, interval, start, end, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -61,7 +61,7 @@ class MetricsApi(object):
         :param int end: end time for query in epoch seconds (required)
         :return: MetricResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -80,7 +80,7 @@ class MetricsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_metrics_with_http_info(entity_id, metric, interval, start, end, callback=callback_function)
+        >>> future = api.get_metrics_with_http_info(entity_id, metric, interval, start, end, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -91,7 +91,7 @@ class MetricsApi(object):
         :param int end: end time for query in epoch seconds (required)
         :return: MetricResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['entity_id', 'metric', 'interval', 'start', 'end']
@@ -99,6 +99,7 @@ class MetricsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -168,4 +169,5 @@ class MetricsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
@@ -50,14 +50,14 @@ class MicrosegmentationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.export_nsx_recommended_rules(callback=callback_function)
+        >>> future = api.export_nsx_recommended_rules(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param RecommendedRulesRequest body: NSX Recommended Rules Request
         :return: file
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class MicrosegmentationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.export_nsx_recommended_rules_with_http_info(callback=callback_function)
+        >>> future = api.export_nsx_recommended_rules_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param RecommendedRulesRequest body: NSX Recommended Rules Request
         :return: file
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -91,6 +91,7 @@ class MicrosegmentationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -137,6 +138,7 @@ class MicrosegmentationApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def list_recommended_rules(self, **kwargs):
@@ -149,14 +151,14 @@ class MicrosegmentationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_recommended_rules(callback=callback_function)
+        >>> future = api.list_recommended_rules(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param RecommendedRulesRequest body: Recommended Rules Request
         :return: RecommendedRules
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -175,14 +177,14 @@ class MicrosegmentationApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.list_recommended_rules_with_http_info(callback=callback_function)
+        >>> future = api.list_recommended_rules_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param RecommendedRulesRequest body: Recommended Rules Request
         :return: RecommendedRules
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -190,6 +192,7 @@ class MicrosegmentationApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -236,4 +239,5 @@ class MicrosegmentationApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
@@ -50,14 +50,14 @@ class SchemaApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_metrics_schema(entity_type, callback=callback_function)
+        >>> future = api.get_metrics_schema(entity_type, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str entity_type: entity type (required)
         :return: EntityMetricsSchema
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -76,14 +76,14 @@ class SchemaApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_metrics_schema_with_http_info(entity_type, callback=callback_function)
+        >>> future = api.get_metrics_schema_with_http_info(entity_type, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str entity_type: entity type (required)
         :return: EntityMetricsSchema
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['entity_type']
@@ -91,6 +91,7 @@ class SchemaApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -140,4 +141,5 @@ class SchemaApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
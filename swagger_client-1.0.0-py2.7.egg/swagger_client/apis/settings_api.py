@@ -50,7 +50,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_ip_tag(tag_id, body, callback=callback_function)
+        >>> future = api.add_ip_tag(tag_id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -58,7 +58,7 @@ class SettingsApi(object):
         :param IpTag body: Ip Tag (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -77,7 +77,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_ip_tag_with_http_info(tag_id, body, callback=callback_function)
+        >>> future = api.add_ip_tag_with_http_info(tag_id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -85,7 +85,7 @@ class SettingsApi(object):
         :param IpTag body: Ip Tag (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['tag_id', 'body']
@@ -93,6 +93,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -147,6 +148,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_vidm_user(self, body, **kwargs):
@@ -159,14 +161,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_vidm_user(body, callback=callback_function)
+        >>> future = api.add_vidm_user(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmUserRequest body: User details (required)
         :return: UserResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -185,14 +187,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_vidm_user_with_http_info(body, callback=callback_function)
+        >>> future = api.add_vidm_user_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmUserRequest body: User details (required)
         :return: UserResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -200,6 +202,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -249,6 +252,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def add_vidm_user_group(self, body, **kwargs):
@@ -261,14 +265,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_vidm_user_group(body, callback=callback_function)
+        >>> future = api.add_vidm_user_group(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmUserGroupRequest body: User-group details (required)
         :return: UserGroupResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -287,14 +291,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.add_vidm_user_group_with_http_info(body, callback=callback_function)
+        >>> future = api.add_vidm_user_group_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmUserGroupRequest body: User-group details (required)
         :return: UserGroupResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -302,6 +306,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -351,6 +356,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def create_subnet_mapping(self, body, **kwargs):
@@ -363,14 +369,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_subnet_mapping(body, callback=callback_function)
+        >>> future = api.create_subnet_mapping(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param SubnetMappingRequest body: (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -389,14 +395,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.create_subnet_mapping_with_http_info(body, callback=callback_function)
+        >>> future = api.create_subnet_mapping_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param SubnetMappingRequest body: (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -404,6 +410,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -453,6 +460,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_subnet_mapping(self, id, **kwargs):
@@ -465,14 +473,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_subnet_mapping(id, callback=callback_function)
+        >>> future = api.delete_subnet_mapping(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -491,14 +499,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_subnet_mapping_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_subnet_mapping_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -506,6 +514,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -555,6 +564,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_user(self, id, **kwargs):
@@ -567,14 +577,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_user(id, callback=callback_function)
+        >>> future = api.delete_user(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -593,14 +603,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_user_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_user_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -608,6 +618,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -657,6 +668,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_user_group(self, id, **kwargs):
@@ -669,14 +681,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_user_group(id, callback=callback_function)
+        >>> future = api.delete_user_group(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -695,14 +707,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_user_group_with_http_info(id, callback=callback_function)
+        >>> future = api.delete_user_group_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -710,6 +722,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -759,6 +772,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def delete_vidm_configuration(self, **kwargs):
@@ -771,13 +785,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_vidm_configuration(callback=callback_function)
+        >>> future = api.delete_vidm_configuration(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -796,13 +810,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.delete_vidm_configuration_with_http_info(callback=callback_function)
+        >>> future = api.delete_vidm_configuration_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -810,6 +824,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -853,6 +868,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def disable_vidm(self, **kwargs):
@@ -865,13 +881,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_vidm(callback=callback_function)
+        >>> future = api.disable_vidm(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -890,13 +906,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.disable_vidm_with_http_info(callback=callback_function)
+        >>> future = api.disable_vidm_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -904,6 +920,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -947,6 +964,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def enable_vidm(self, **kwargs):
@@ -959,13 +977,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_vidm(callback=callback_function)
+        >>> future = api.enable_vidm(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -984,13 +1002,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.enable_vidm_with_http_info(callback=callback_function)
+        >>> future = api.enable_vidm_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -998,6 +1016,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1041,6 +1060,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_ip_tag(self, tag_id, **kwargs):
@@ -1053,14 +1073,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ip_tag(tag_id, callback=callback_function)
+        >>> future = api.get_ip_tag(tag_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str tag_id: (required)
         :return: IpTag
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1079,14 +1099,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ip_tag_with_http_info(tag_id, callback=callback_function)
+        >>> future = api.get_ip_tag_with_http_info(tag_id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str tag_id: (required)
         :return: IpTag
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['tag_id']
@@ -1094,6 +1114,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1143,6 +1164,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_ip_tag_ids(self, **kwargs):
@@ -1155,13 +1177,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ip_tag_ids(callback=callback_function)
+        >>> future = api.get_ip_tag_ids(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: IpTagIdList
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1180,13 +1202,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_ip_tag_ids_with_http_info(callback=callback_function)
+        >>> future = api.get_ip_tag_ids_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: IpTagIdList
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -1194,6 +1216,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1237,6 +1260,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_subnet_mappings(self, **kwargs):
@@ -1249,13 +1273,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_subnet_mappings(callback=callback_function)
+        >>> future = api.get_subnet_mappings(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: SubnetMappingList
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1274,13 +1298,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_subnet_mappings_with_http_info(callback=callback_function)
+        >>> future = api.get_subnet_mappings_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: SubnetMappingList
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -1288,6 +1312,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1331,6 +1356,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_user(self, id, **kwargs):
@@ -1343,14 +1369,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_user(id, callback=callback_function)
+        >>> future = api.get_user(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: UserResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1369,14 +1395,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_user_with_http_info(id, callback=callback_function)
+        >>> future = api.get_user_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: UserResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -1384,6 +1410,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1433,6 +1460,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_user_group(self, id, **kwargs):
@@ -1445,14 +1473,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_user_group(id, callback=callback_function)
+        >>> future = api.get_user_group(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: UserGroupResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1471,14 +1499,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_user_group_with_http_info(id, callback=callback_function)
+        >>> future = api.get_user_group_with_http_info(id, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param str id: entity id (required)
         :return: UserGroupResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id']
@@ -1486,6 +1514,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1535,6 +1564,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_user_groups(self, type, **kwargs):
@@ -1547,7 +1577,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_user_groups(type, callback=callback_function)
+        >>> future = api.get_user_groups(type, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1556,7 +1586,7 @@ class SettingsApi(object):
         :param str cursor: cursor from previous response
         :return: PagedUserGroupListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1575,7 +1605,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_user_groups_with_http_info(type, callback=callback_function)
+        >>> future = api.get_user_groups_with_http_info(type, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1584,7 +1614,7 @@ class SettingsApi(object):
         :param str cursor: cursor from previous response
         :return: PagedUserGroupListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['type', 'size', 'cursor']
@@ -1592,6 +1622,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1645,6 +1676,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_users(self, type, **kwargs):
@@ -1657,7 +1689,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_users(type, callback=callback_function)
+        >>> future = api.get_users(type, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1666,7 +1698,7 @@ class SettingsApi(object):
         :param str cursor: cursor from previous response
         :return: PagedUserListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1685,7 +1717,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_users_with_http_info(type, callback=callback_function)
+        >>> future = api.get_users_with_http_info(type, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1694,7 +1726,7 @@ class SettingsApi(object):
         :param str cursor: cursor from previous response
         :return: PagedUserListResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['type', 'size', 'cursor']
@@ -1702,6 +1734,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1755,6 +1788,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def get_vidm_configuration(self, **kwargs):
@@ -1767,13 +1801,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vidm_configuration(callback=callback_function)
+        >>> future = api.get_vidm_configuration(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: VidmConfigResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1792,13 +1826,13 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.get_vidm_configuration_with_http_info(callback=callback_function)
+        >>> future = api.get_vidm_configuration_with_http_info(callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :return: VidmConfigResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = []
@@ -1806,6 +1840,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1849,6 +1884,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def remove_ip_tag(self, tag_id, body, **kwargs):
@@ -1861,7 +1897,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_ip_tag(tag_id, body, callback=callback_function)
+        >>> future = api.remove_ip_tag(tag_id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1869,7 +1905,7 @@ class SettingsApi(object):
         :param IpTag body: Ip Tag (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1888,7 +1924,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.remove_ip_tag_with_http_info(tag_id, body, callback=callback_function)
+        >>> future = api.remove_ip_tag_with_http_info(tag_id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -1896,7 +1932,7 @@ class SettingsApi(object):
         :param IpTag body: Ip Tag (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['tag_id', 'body']
@@ -1904,6 +1940,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -1958,6 +1995,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def save_vidm_configuration(self, body, **kwargs):
@@ -1970,14 +2008,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.save_vidm_configuration(body, callback=callback_function)
+        >>> future = api.save_vidm_configuration(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmConfiguration body: VMware Identity Manager configuration details (required)
         :return: VidmConfigResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -1996,14 +2034,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.save_vidm_configuration_with_http_info(body, callback=callback_function)
+        >>> future = api.save_vidm_configuration_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmConfiguration body: VMware Identity Manager configuration details (required)
         :return: VidmConfigResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -2011,6 +2049,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2060,6 +2099,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_subnet_mapping(self, id, body, **kwargs):
@@ -2072,7 +2112,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_subnet_mapping(id, body, callback=callback_function)
+        >>> future = api.update_subnet_mapping(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2080,7 +2120,7 @@ class SettingsApi(object):
         :param SubnetMappingRequest body: (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2099,7 +2139,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_subnet_mapping_with_http_info(id, body, callback=callback_function)
+        >>> future = api.update_subnet_mapping_with_http_info(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2107,7 +2147,7 @@ class SettingsApi(object):
         :param SubnetMappingRequest body: (required)
         :return: None
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -2115,6 +2155,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2169,6 +2210,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_vidm_configuration(self, body, **kwargs):
@@ -2181,14 +2223,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vidm_configuration(body, callback=callback_function)
+        >>> future = api.update_vidm_configuration(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmConfiguration body: VMware Identity Manager configuration details (required)
         :return: VidmConfigResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2207,14 +2249,14 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vidm_configuration_with_http_info(body, callback=callback_function)
+        >>> future = api.update_vidm_configuration_with_http_info(body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
         :param VidmConfiguration body: VMware Identity Manager configuration details (required)
         :return: VidmConfigResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['body']
@@ -2222,6 +2264,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2271,6 +2314,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_vidm_user_group_role(self, id, body, **kwargs):
@@ -2283,7 +2327,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vidm_user_group_role(id, body, callback=callback_function)
+        >>> future = api.update_vidm_user_group_role(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2291,7 +2335,7 @@ class SettingsApi(object):
         :param VidmUserGroupRequest body: User-group details (required)
         :return: UserGroupResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2310,7 +2354,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vidm_user_group_role_with_http_info(id, body, callback=callback_function)
+        >>> future = api.update_vidm_user_group_role_with_http_info(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2318,7 +2362,7 @@ class SettingsApi(object):
         :param VidmUserGroupRequest body: User-group details (required)
         :return: UserGroupResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -2326,6 +2370,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2380,6 +2425,7 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
 
     def update_vidm_user_role(self, id, body, **kwargs):
@@ -2392,7 +2438,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vidm_user_role(id, body, callback=callback_function)
+        >>> future = api.update_vidm_user_role(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2400,7 +2446,7 @@ class SettingsApi(object):
         :param VidmUserRequest body: User details (required)
         :return: UserResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
         kwargs['_return_http_data_only'] = True
         if kwargs.get('callback'):
@@ -2419,7 +2465,7 @@ class SettingsApi(object):
         >>> def callback_function(response):
         >>>     pprint(response)
         >>>
-        >>> thread = api.update_vidm_user_role_with_http_info(id, body, callback=callback_function)
+        >>> future = api.update_vidm_user_role_with_http_info(id, body, callback=callback_function)
 
         :param callback function: The callback function
             for asynchronous request. (optional)
@@ -2427,7 +2473,7 @@ class SettingsApi(object):
         :param VidmUserRequest body: User details (required)
         :return: UserResponse
                  If the method is called asynchronously,
-                 returns the request thread.
+                 returns a concurrent.futures.Future of the request.
         """
 
         all_params = ['id', 'body']
@@ -2435,6 +2481,7 @@ class SettingsApi(object):
         all_params.append('_return_http_data_only')
         all_params.append('_preload_content')
         all_params.append('_request_timeout')
+        all_params.append('_response_mode')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -2489,4 +2536,5 @@ class SettingsApi(object):
                                         _return_http_data_only=params.get('_return_http_data_only'),
                                         _preload_content=params.get('_preload_content', True),
                                         _request_timeout=params.get('_request_timeout'),
+                                        _response_mode=params.get('_response_mode'),
                                         collection_formats=collection_formats)
@@ -0,0 +1,301 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Auth token lifecycle: proactive refresh and an on-disk token cache.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from .apis.authentication_api import AuthenticationApi
+from .configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+# Name of the token cache in `Configuration.cache_dir`.
+TOKEN_CACHE_FILE = 'tokens.json'
+# Prefix of the `Authorization` header value, the SaaS `csp-auth-token`
+# header carries the bare token.
+AUTHORIZATION_PREFIX = 'NetworkInsight'
+
+
+def _token_fields(token):
+    """
+    Returns (token, expiry in seconds or None) of a `Token` model or dict,
+    whose `expiry` is in epoch milliseconds.
+    """
+    if isinstance(token, dict):
+        value, expiry = token.get('token'), token.get('expiry')
+    else:
+        value, expiry = token.token, token.expiry
+    return value, (expiry / 1000.0 if expiry else None)
+
+
+class TokenCache(object):
+    """
+    Valid tokens shared by the processes of a user, in a JSON file only
+    its owner can read. Entries are keyed by a hash of the identity
+    (platform and user) they authenticate.
+
+    :param path: path of the cache file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def _load(self):
+        try:
+            if os.name == 'posix':
+                stat = os.stat(self.path)
+                if stat.st_mode & 0o077 or stat.st_uid != os.getuid():
+                    logger.warning("Ignoring token cache %s readable by other users", self.path)
+                    return {}
+            with open(self.path) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            # missing or corrupt cache, authenticate again
+            return {}
+
+    def get(self, key, now):
+        """
+        Returns the entry of an identity, a dict with `token`, `expiry`
+        and `refresh_at` in seconds, or None if missing or expired.
+        """
+        entry = self._load().get(key)
+        if not entry or entry['expiry'] <= now:
+            return None
+        return entry
+
+    def set(self, key, entry, now):
+        """
+        Stores the entry of an identity, dropping expired entries.
+        """
+        entries = dict((k, v) for k, v in self._load().items() if v['expiry'] > now)
+        entries[key] = entry
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory, 0o700)
+        # mkstemp creates the file readable by its owner only; readers
+        # never see a partial file
+        fd, path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(entries, f, sort_keys=True)
+            getattr(os, 'replace', os.rename)(path, self.path)
+        except Exception:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+
+class TokenManager(object):
+    """
+    Keeps the auth token of an ApiClient valid.
+
+    The token is obtained on first use and renewed `refresh_margin`
+    seconds before its `expiry`, by a background thread once `start` is
+    called, else by the first request past that point. A request answered
+    401 is sent once more with a new token. Concurrent renewals are
+    serialized: threads holding the same stale token wait for a single
+    authentication.
+
+    With a `cache`, valid tokens are reused across processes, so a short
+    job skips authentication entirely.
+
+    >>> api_client.token_manager = TokenManager.for_credentials(api_client, credential)
+    >>> api_client.token_manager.start()
+
+    :param authenticate: function returning a new `Token`, or a dict with
+        `token` and `expiry` (epoch milliseconds).
+    :param header: header carrying the token, defaults to `csp-auth-token`
+        for the SaaS deployment type and `Authorization` otherwise.
+    :param prefix: prefix of the header value, defaults to
+        'NetworkInsight' for the `Authorization` header.
+    :param refresh_margin: seconds before expiry a token is renewed, at
+        most half its lifetime.
+    :param cache: `TokenCache` shared by processes, or None.
+    :param cache_key: identity of the token in the cache.
+    :param clock: function returning the current time in seconds.
+    """
+
+    def __init__(self, authenticate, header=None, prefix=None, refresh_margin=300, cache=None,
+                 cache_key=None, clock=time.time):
+        if header is None:
+            header = 'csp-auth-token' if Configuration().deployment_type == 'on_saas' else 'Authorization'
+        if prefix is None and header == 'Authorization':
+            prefix = AUTHORIZATION_PREFIX
+        self.authenticate = authenticate
+        self.header = header
+        self.prefix = prefix
+        self.refresh_margin = refresh_margin
+        self.cache = cache
+        self.cache_key = cache_key
+        self.clock = clock
+        self.token = None
+        self.expiry = None
+        self._refresh_at = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        # counters
+        self.authentications = 0
+        self.cache_hits = 0
+
+    @classmethod
+    def for_credentials(cls, api_client, credential, **kwargs):
+        """
+        Builds a manager authenticating with `AuthenticationApi.create`.
+
+        Tokens are cached in `Configuration.cache_dir` when
+        `Configuration.token_cache` is set, unless a `cache` is given.
+
+        The manager logs in with blocking calls, so `api_client` must be a
+        synchronous ApiClient; to authenticate an AsyncApiClient, build the
+        manager with an ApiClient of the same host and set it as the
+        `token_manager` of the AsyncApiClient, which renews tokens off the
+        event loop.
+
+        :param api_client: ApiClient used for the login calls.
+        :param credential: `UserCredential`.
+        :raise TypeError: if `api_client` is asynchronous.
+        """
+        if getattr(inspect, 'iscoroutinefunction', lambda fn: False)(api_client.call_api):
+            raise TypeError("TokenManager.for_credentials requires a synchronous ApiClient, "
+                            "set the manager as token_manager of the AsyncApiClient instead")
+        auth_api = AuthenticationApi(api_client)
+        config = Configuration()
+        if 'cache' not in kwargs and config.token_cache and config.cache_dir:
+            kwargs['cache'] = TokenCache(os.path.join(config.cache_dir, TOKEN_CACHE_FILE))
+        if 'cache_key' not in kwargs:
+            domain = credential.domain
+            identity = [api_client.host, credential.username,
+                        domain.get('domain_type') if isinstance(domain, dict) else getattr(domain, 'domain_type', None)]
+            kwargs['cache_key'] = hashlib.sha256(json.dumps(identity).encode('utf-8')).hexdigest()
+        return cls(lambda: auth_api.create(credential), **kwargs)
+
+    def _renew(self):
+        """
+        Replaces the token, by a newer one of the cache if any.
+        Called with the lock held.
+        """
+        now = self.clock()
+        if self.cache is not None:
+            entry = self.cache.get(self.cache_key, now)
+            if entry is not None and entry['token'] != self.token and now < entry['refresh_at']:
+                self.cache_hits += 1
+                self.token, self.expiry, self._refresh_at = entry['token'], entry['expiry'], entry['refresh_at']
+                return
+        self.token, self.expiry = _token_fields(self.authenticate())
+        self.authentications += 1
+        if self.expiry is None:
+            # lifetime unknown, renewed on 401 only
+            self._refresh_at = None
+            return
+        self._refresh_at = self.expiry - min(self.refresh_margin, max(self.expiry - now, 0) / 2.0)
+        if self.cache is not None:
+            self.cache.set(self.cache_key, {'token': self.token, 'expiry': self.expiry,
+                                            'refresh_at': self._refresh_at}, now)
+
+    def _needs_renewal(self, now):
+        if self.token is None:
+            return True
+        if self._refresh_at is None or now < self._refresh_at:
+            return False
+        # a running refresh thread renews it, unless it is about to expire
+        return not self.running or now >= self.expiry - 1
+
+    def get_token(self):
+        """
+        Returns a valid token, authenticating if needed.
+        """
+        if self._needs_renewal(self.clock()):
+            with self._lock:
+                if self._needs_renewal(self.clock()):
+                    self._renew()
+        return self.token
+
+    def auth_headers(self):
+        """
+        Returns the header carrying a valid token.
+        """
+        return self.headers(self.get_token())
+
+    def headers(self, token):
+        """
+        Returns the header carrying `token`, as is.
+        """
+        return {self.header: '%s %s' % (self.prefix, token) if self.prefix else token}
+
+    def refresh(self, rejected=None):
+        """
+        Renews the token after the server rejected it.
+
+        :param rejected: header value the server answered 401 to; when the
+            token changed since, the current one is kept.
+        :return: the valid token.
+        """
+        with self._lock:
+            current = self.headers(self.token)[self.header] if self.token is not None else None
+            if rejected is None or rejected == current:
+                self._renew()
+            return self.token
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Starts renewing the token in a background thread.
+        """
+        if self.running:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='vrni-token-refresh')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops the background thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _run(self):
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                with self._lock:
+                    if self.token is None or (self._refresh_at is not None and self.clock() >= self._refresh_at):
+                        self._renew()
+                failures = 0
+                delay = 3600 if self._refresh_at is None else self._refresh_at - self.clock()
+            except Exception:
+                failures += 1
+                delay = min(300, 2 ** failures)
+                logger.warning("Token refresh failed, retrying in %ds", delay, exc_info=True)
+            self._stop.wait(max(delay, 0.1))
+
+    def stats(self):
+        return {'authentications': self.authentications, 'cache_hits': self.cache_hits,
+                'expiry': self.expiry}
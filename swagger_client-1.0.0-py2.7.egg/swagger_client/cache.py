@@ -0,0 +1,95 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    In-memory caches shared by the client side helpers.
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+from collections import OrderedDict
+
+
+MISSING = object()
+
+
+class LRUCache(object):
+    """
+    Thread-safe, size bounded LRU cache with an optional TTL per entry.
+
+    >>> cache = LRUCache(maxsize=1000)
+    >>> cache.set('key', 'value', ttl=60)
+    >>> cache.get('key')
+
+    :param maxsize: maximum number of entries, least recently used entries
+        are evicted first.
+    :param ttl: default time to live in seconds, None keeps entries until
+        they are evicted.
+    :param clock: function returning the current time in seconds.
+    """
+
+    def __init__(self, maxsize=10000, ttl=None, clock=time.time):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=MISSING):
+        """
+        Returns the value cached for key, or default if absent or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > self.clock():
+                    # mark as most recently used
+                    del self._data[key]
+                    self._data[key] = entry
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl=MISSING):
+        """
+        Caches value for key.
+
+        :param ttl: time to live in seconds, defaults to the cache TTL.
+        """
+        if ttl is MISSING:
+            ttl = self.ttl
+        expires = None if ttl is None else self.clock() + ttl
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, expires)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Removes key from the cache and returns its value.
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key):
+        return self.get(key) is not MISSING
+
+    def __len__(self):
+        return len(self._data)
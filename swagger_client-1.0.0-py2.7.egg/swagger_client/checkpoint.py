@@ -0,0 +1,194 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Resumable cursor walks, checkpointed to a local state file.
+"""
+
+from __future__ import absolute_import
+
+import json
+import os
+import tempfile
+import time
+
+from .pagination import PageIterator, _page_field
+
+STATE_VERSION = 1
+
+
+class CheckpointFile(object):
+    """
+    JSON state file written atomically.
+
+    :param path: location of the state file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """
+        Returns the saved state, or None.
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, state):
+        """
+        Replaces the saved state. The state is flushed to disk before it
+        replaces the previous one, so a crash leaves either of them.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            getattr(os, 'replace', os.rename)(path, self.path)
+        except Exception:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+    def clear(self):
+        """
+        Removes the state file.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class CheckpointedWalk(object):
+    """
+    Cursor walk that can be resumed after a crash.
+
+    After each page has been processed, the request, the cursor of the
+    next page and the page and result counts are saved to the checkpoint
+    file. Running the same walk again continues after the last saved page.
+    A page counts as processed when the loop asks for the next one, so a
+    crash while processing a page replays that page on resume.
+
+    For exactly-once output, pass the file the results are written to as
+    `sink`: its position is saved with each checkpoint and the file is
+    truncated back to it on resume, dropping the output of a replayed page.
+
+    >>> walk = CheckpointedWalk(search_api.search_entities, body=request,
+    >>>                         checkpoint='flows.state')
+    >>> with open('flows.jsonl', 'a+') as out:
+    >>>     walk.sink = out
+    >>>     for page in walk:
+    >>>         for result in page.results:
+    >>>             out.write(json.dumps(result.to_dict()) + '\\n')
+
+    The checkpoint is kept once the walk is complete, so running it again
+    yields nothing; call `reset()` to start over.
+
+    :param api_method: bound API method returning a paged response.
+    :param args: positional arguments for `api_method`.
+    :param checkpoint: path of the state file.
+    :param sink: file receiving the output, optional.
+    :param prefetch: number of pages to fetch ahead, 0 disables prefetching.
+    :param kwargs: keyword arguments for `api_method`.
+    """
+
+    def __init__(self, api_method, *args, **kwargs):
+        self.checkpoint = CheckpointFile(kwargs.pop('checkpoint'))
+        self.sink = kwargs.pop('sink', None)
+        self.api_method = api_method
+        self.pages = PageIterator(api_method, *args, **kwargs)
+        self.request = self._fingerprint()
+        self.state = None
+
+    def _fingerprint(self):
+        """
+        Returns the serialized request, without the cursor.
+        """
+        api_client = self.api_method.__self__.api_client
+        kwargs = dict((k, v) for k, v in self.pages.kwargs.items() if k != 'cursor')
+        request = api_client.sanitize_for_serialization({
+            'method': self.api_method.__name__,
+            'args': self.pages.args,
+            'kwargs': kwargs,
+        })
+        # drop the cursor of request bodies
+        for value in request['args'] + [request['kwargs'].get('body')]:
+            if isinstance(value, dict):
+                value.pop('cursor', None)
+        return json.loads(json.dumps(request, sort_keys=True))
+
+    def _resume(self):
+        """
+        Loads the checkpoint and positions the walk and the sink after the
+        last saved page.
+        """
+        state = self.checkpoint.load()
+        if state is None:
+            self.state = {
+                'version': STATE_VERSION,
+                'request': self.request,
+                'cursor': self.pages.cursor,
+                'pages': 0,
+                'results': 0,
+                'done': False,
+                'sink_position': self.sink.tell() if self.sink is not None else None,
+            }
+            return
+        if state.get('request') != self.request:
+            raise ValueError("Checkpoint {0} belongs to another request, "
+                             "call reset() to start over".format(self.checkpoint.path))
+        self.state = state
+        self.pages.cursor = state['cursor']
+        self.pages.pages = state['pages']
+        if self.sink is not None and state.get('sink_position') is not None:
+            self.sink.seek(state['sink_position'])
+            self.sink.truncate()
+
+    def commit(self, page):
+        """
+        Saves the checkpoint after a processed page.
+        """
+        state = self.state
+        cursor = _page_field(page, 'cursor')
+        results = _page_field(page, 'results') or []
+        state['cursor'] = cursor
+        state['pages'] += 1
+        state['results'] += len(results)
+        state['done'] = not cursor or not results
+        state['updated'] = time.time()
+        if self.sink is not None:
+            self.sink.flush()
+            os.fsync(self.sink.fileno())
+            state['sink_position'] = self.sink.tell()
+        self.checkpoint.save(state)
+
+    def __iter__(self):
+        self._resume()
+        if self.state['done']:
+            return
+        pages = iter(self.pages)
+        try:
+            for page in pages:
+                yield page
+                self.commit(page)
+        finally:
+            self.pages.close()
+
+    @property
+    def done(self):
+        """
+        Returns True if the saved walk went through every page.
+        """
+        state = self.checkpoint.load()
+        return bool(state and state.get('request') == self.request and state['done'])
+
+    def reset(self):
+        """
+        Forgets the saved progress, the next iteration starts over.
+        """
+        self.checkpoint.clear()
+        self.state = None
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Compact, slots based variants of the generated models.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from six import iteritems
+
+_compact_models = {}
+_lock = threading.Lock()
+
+
+def _restore(klass, values):
+    """
+    Rebuilds a compact model when unpickling.
+    """
+    compact = compact_model(klass)
+    obj = compact.__new__(compact)
+    for attr, value in iteritems(values):
+        setattr(obj, attr, value)
+    return obj
+
+
+class CompactModel(object):
+    """
+    Mixin of the compact model classes.
+
+    Compact models subclass the generated model, so `isinstance` checks,
+    `swagger_types`, `attribute_map`, `to_dict()` and `repr()` behave as
+    usual, but the attributes are stored in `__slots__` and are set
+    without running the property setters. This makes them faster to
+    build, at the cost of the client-side validation of `allowed_values`
+    and required attributes, which only matters for objects built by hand.
+
+    The memory saving is small: the generated base class has no
+    `__slots__`, so instances still carry the `__dict__` and `__weakref__`
+    pointers, and on Python 3.11 the dict of a generated model already
+    shares its keys and stores values inline. Measured with
+    `benchmarks/bench_deserialize.py` on Python 3.11, 10000 entities:
+
+    - Flow: 65.5 MB -> 52.7 MB (-19%), 23% faster;
+    - VirtualMachine, mostly small nested references: 143.3 MB ->
+      143.0 MB (-0.2%), 18% faster.
+
+    A compact model equals the generated model with the same attribute
+    values, in both directions: being a subclass, its `__eq__` is the one
+    Python calls first when the two are compared.
+    """
+
+    __slots__ = ()
+
+    # set in the generated __init__, which compact models do not run
+    discriminator = None
+
+    def __eq__(self, other):
+        """
+        Returns true if both objects are equal
+        """
+        # models of the same class, compact or not, as the generated
+        # __eq__ requires of two generated models
+        if getattr(other, 'model_class', type(other)) is not self.model_class:
+            return False
+        return all(getattr(self, attr) == getattr(other, attr) for attr in self.swagger_types)
+
+    def __ne__(self, other):
+        """
+        Returns true if both objects are not equal
+        """
+        return not self == other
+
+    def __reduce__(self):
+        return _restore, (self.model_class, dict((attr, getattr(self, attr)) for attr in self.swagger_types))
+
+
+def compact_model(klass):
+    """
+    Gets the compact variant of a generated model class.
+
+    Classes are created on first use and cached, every attribute defaults
+    to None.
+
+    :param klass: generated model class.
+    :return: subclass of `klass` storing its attributes in `__slots__`.
+    """
+    try:
+        return _compact_models[klass]
+    except KeyError:
+        pass
+
+    with _lock:
+        if klass not in _compact_models:
+            namespace = {
+                '__slots__': tuple(klass.swagger_types),
+                '__module__': klass.__module__,
+                '__doc__': klass.__doc__,
+                'model_class': klass,
+            }
+            compact = type(klass.__name__, (CompactModel, klass), namespace)
+            _compact_models[klass] = compact
+        return _compact_models[klass]
+
+
+def new_compact(klass, **kwargs):
+    """
+    Builds a compact model.
+
+    :param klass: generated model class.
+    :param kwargs: attribute values, missing attributes are None.
+    """
+    compact = compact_model(klass)
+    obj = compact.__new__(compact)
+    for attr in klass.swagger_types:
+        setattr(obj, attr, kwargs.pop(attr, None))
+    if kwargs:
+        raise TypeError("%s got unexpected attributes: %s" % (klass.__name__, ', '.join(sorted(kwargs))))
+    return obj
+
+
+def is_compact(obj):
+    """
+    Returns true if `obj` is a compact model.
+    """
+    return isinstance(obj, CompactModel)
+
+
+def to_full_model(obj):
+    """
+    Converts a compact model, and the compact models it refers to, into
+    the regular generated models.
+    """
+    if isinstance(obj, list):
+        return [to_full_model(item) for item in obj]
+    if isinstance(obj, dict):
+        return dict((key, to_full_model(value)) for key, value in iteritems(obj))
+    if not is_compact(obj):
+        return obj
+    return obj.model_class(**dict((attr, to_full_model(getattr(obj, attr)))
+                                  for attr in obj.swagger_types))
@@ -0,0 +1,118 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Conditional GET requests revalidating previously returned results.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+
+from .cache import LRUCache, MISSING
+from .configuration import Configuration
+
+
+class _Entry(object):
+    """
+    Validators and result of the last response of a resource.
+    """
+
+    __slots__ = ('etag', 'last_modified', 'digest', 'data')
+
+    def __init__(self, etag, last_modified, digest, data):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.data = data
+
+
+class ConditionalCache(object):
+    """
+    Remembers the validators and the deserialized result of GET responses.
+
+    The next GET of the same resource is sent with `If-None-Match` and
+    `If-Modified-Since` headers; on a 304 answer the previous result is
+    returned as is. When the server sends no validators, a response whose
+    body hashes like the previous one reuses the previous result without
+    parsing it again.
+
+    Results are shared between the calls returning them, callers should
+    copy a result before modifying it.
+
+    >>> api_client.conditional_cache = ConditionalCache(maxsize=100)
+    >>> infrastructure_api.list_vcenters()  # 304 or unchanged body: same object
+
+    :param maxsize: number of resources remembered.
+    """
+
+    def __init__(self, maxsize=1000):
+        self.cache = LRUCache(maxsize=maxsize)
+        # counters
+        self.not_modified = 0
+        self.unchanged = 0
+
+    @classmethod
+    def from_configuration(cls):
+        """
+        Builds the cache configured in `Configuration`, or returns None.
+        """
+        config = Configuration()
+        if not config.conditional_requests:
+            return None
+        return cls()
+
+    @staticmethod
+    def key(url, query_params, response_type, response_mode):
+        """
+        Returns the key of a resource and its deserialization.
+        """
+        query = sorted([k, str(v)] for k, v in query_params or [])
+        return json.dumps([url, query, response_type, response_mode], separators=(',', ':'))
+
+    def validators(self, key):
+        """
+        Returns the conditional request headers for a resource.
+        """
+        entry = self.cache.get(key, None)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def revalidated(self, key):
+        """
+        Returns the result of a resource the server answered 304 for.
+        """
+        entry = self.cache.get(key, None)
+        if entry is None:
+            return MISSING
+        self.not_modified += 1
+        return entry.data
+
+    def result(self, key, response, deserialize):
+        """
+        Returns the result of a response, deserialized by `deserialize`
+        unless its body is the one of the previous response.
+        """
+        digest = hashlib.sha1(response.raw_data or b'').digest()
+        entry = self.cache.get(key, None)
+        if entry is not None and entry.digest == digest:
+            self.unchanged += 1
+            data = entry.data
+        else:
+            data = deserialize()
+        headers = response.getheaders() or {}
+        self.cache.set(key, _Entry(headers.get('ETag'), headers.get('Last-Modified'), digest, data))
+        return data
+
+    def stats(self):
+        """
+        Returns the counters of reused results.
+        """
+        return {'not_modified': self.not_modified, 'unchanged': self.unchanged, 'resources': len(self.cache)}
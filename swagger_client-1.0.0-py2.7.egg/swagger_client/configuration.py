@@ -14,6 +14,7 @@ from __future__ import absolute_import
 
 import urllib3
 
+import os
 import sys
 import logging
 
@@ -21,6 +22,18 @@ from six import iteritems
 from six.moves import http_client as httplib
 
 
+def _cpu_count():
+    """
+    Returns the number of CPUs, without importing multiprocessing on
+    Python 3.
+    """
+    cpu_count = getattr(os, 'cpu_count', None)
+    if cpu_count is None:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    return cpu_count() or 1
+
+
 def singleton(cls, *args, **kw):
     instances = {}
 
@@ -88,6 +101,61 @@ class Configuration(object):
 
         # Proxy URL
         self.proxy = None
+
+        # Connection pool settings
+        # Number of connection pools to keep, one pool is used per host
+        self.connection_pool_num_pools = 4
+        # Number of connections kept open per host. This bounds the number
+        # of requests that can run in parallel without reconnecting.
+        self.connection_pool_maxsize = _cpu_count() * 5
+        # Block and wait for a free connection when all `connection_pool_maxsize`
+        # connections are in use, instead of opening and discarding extra ones
+        self.connection_pool_block = False
+        # Enable TCP keep-alive probes on pooled connections
+        self.tcp_keepalive = True
+        # Seconds of idle time before the first keep-alive probe, interval
+        # between probes and number of failed probes before dropping the connection
+        self.tcp_keepalive_idle = 60
+        self.tcp_keepalive_interval = 15
+        self.tcp_keepalive_count = 4
+        # Raw socket options, overrides the keep-alive settings when set
+        self.socket_options = None
+        # Number of threads running asynchronous requests of an ApiClient,
+        # None uses `connection_pool_maxsize`
+        self.executor_max_workers = None
+        # Connection level retries of the pool manager, an int or `urllib3.Retry`.
+        # None keeps the urllib3 default.
+        self.retries = None
+        # Client side rate limit of each ApiClient in requests per second,
+        # and the number of requests that may be sent at once. None disables it
+        self.rate_limit = None
+        self.rate_limit_burst = None
+        # Adapt the number of requests in flight of each ApiClient to
+        # throttling responses (429, 503) and, if set, to `latency_target` seconds
+        self.adaptive_concurrency = False
+        self.latency_target = None
+        # Attempts per request of idempotent and read-only routes, see
+        # `swagger_client.retry`; 1 (default) disables retries, callers opt
+        # in with e.g. 3. Delays start at `retry_backoff_factor` seconds and
+        # double on each retry
+        self.retry_max_attempts = 1
+        self.retry_backoff_factor = 0.5
+        # Directory of the on-disk caches, e.g. the metric schema index.
+        # None keeps them in memory only
+        self.cache_dir = None
+        # Cache responses of queries pinned to the past in `cache_dir`, see
+        # `swagger_client.response_cache`, up to `response_cache_max_bytes`
+        self.response_cache = False
+        self.response_cache_max_bytes = 256 * 1024 * 1024
+        # Revalidate GET responses with ETag/Last-Modified and reuse the
+        # previous result when unchanged, see `swagger_client.conditional`
+        self.conditional_requests = False
+        # Record timings, sizes and status codes of API calls per operation,
+        # see `swagger_client.instrumentation`
+        self.instrumentation = False
+        # Share valid auth tokens of `swagger_client.auth.TokenManager`
+        # between processes, in a file of `cache_dir` only the user can read
+        self.token_cache = False
         # Safe chars for path_param
         self.safe_chars_for_path_param = ''
 
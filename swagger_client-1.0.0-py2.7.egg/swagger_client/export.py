@@ -0,0 +1,579 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Staged export of search results to CSV, JSON Lines and Parquet files.
+"""
+
+from __future__ import absolute_import, print_function
+
+import argparse
+import csv
+import io
+import json
+import logging
+import sys
+import threading
+import time
+
+from itertools import islice
+
+from six import PY3, iteritems, text_type
+from six.moves import queue
+
+from .api_client import ApiClient
+from .apis.entities_api import EntitiesApi
+from .apis.search_api import SearchApi
+from .auth import TokenManager
+from .configuration import Configuration
+from .hydration import MAX_BATCH_SIZE, to_fetch_id
+from .models.fetch_request import FetchRequest
+from .models.reference import Reference
+from .models.search_request import SearchRequest
+from .models.time_range import TimeRange
+from .models.user_credential import UserCredential
+from .pagination import iter_results
+from .resolver import ReferenceResolver
+from .sharding import ShardedSearch
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+_DONE = object()
+
+# Columns of the flow export of the examples.
+FLOW_FIELDS = ['source_ip.ip_address', 'destination_ip.ip_address', 'port.iana_port_display',
+               'protocol', 'source_vm', 'destination_vm', 'source_security_groups',
+               'destination_security_groups', 'traffic_type', 'flow_tag']
+
+
+def _is_reference(value):
+    """
+    Returns True if value is a serialized `Reference` to another entity.
+    """
+    return isinstance(value, dict) and 'entity_id' in value and \
+        set(value) <= set(['entity_id', 'entity_type', 'time'])
+
+
+def _get_path(entity, path):
+    """
+    Gets a dotted path out of a serialized entity, mapping over lists.
+    """
+    value = entity
+    for name in path.split('.'):
+        if isinstance(value, list):
+            value = [item.get(name) if isinstance(item, dict) else None for item in value]
+        elif isinstance(value, dict):
+            value = value.get(name)
+        else:
+            return None
+    return value
+
+
+def _flatten(value, prefix, row):
+    """
+    Flattens nested dicts into dotted columns, references and lists are
+    kept as they are.
+    """
+    for name, item in iteritems(value):
+        column = prefix + name
+        if isinstance(item, dict) and not _is_reference(item):
+            _flatten(item, column + '.', row)
+        else:
+            row[column] = item
+    return row
+
+
+def _references(value):
+    if _is_reference(value):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            if _is_reference(item):
+                yield item
+
+
+def _replace_references(value, names):
+    if _is_reference(value):
+        return names.get(value['entity_id'])
+    if isinstance(value, list):
+        return [names.get(item['entity_id']) if _is_reference(item) else item for item in value]
+    return value
+
+
+class StageStats(object):
+    """
+    Counters of a pipeline stage.
+
+    :param name: name of the stage.
+    :param workers: number of threads running the stage.
+    """
+
+    def __init__(self, name, workers):
+        self.name = name
+        self.workers = workers
+        self.rows = 0
+        self.busy = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, rows, seconds):
+        with self._lock:
+            self.rows += rows
+            self.busy += seconds
+
+    def report(self, elapsed):
+        """
+        Returns the counters as a dict.
+
+        `rows_per_sec` is the throughput the stage could sustain if it
+        never waited for its neighbours, `utilization` the share of time
+        its workers were busy. The stage with the lowest `rows_per_sec`,
+        and a utilization close to 1, is the bottleneck.
+        """
+        with self._lock:
+            return {'stage': self.name,
+                    'workers': self.workers,
+                    'rows': self.rows,
+                    'busy': round(self.busy, 3),
+                    'rows_per_sec': round(self.rows * self.workers / self.busy, 1) if self.busy else None,
+                    'utilization': round(self.busy / (self.workers * elapsed), 3) if elapsed else None}
+
+
+class Sink(object):
+    """
+    Destination of exported rows, written one batch at a time.
+    """
+
+    def write_batch(self, rows):
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvSink(Sink):
+    """
+    Writes rows to a CSV file, list values are joined with commas.
+
+    :param path: path of the file.
+    :param fields: columns, defaults to the columns of the first batch.
+    :param delimiter: field delimiter.
+    """
+
+    def __init__(self, path, fields=None, delimiter=','):
+        if PY3:
+            self.file = io.open(path, 'w', newline='', encoding='utf-8')
+        else:
+            self.file = open(path, 'wb')
+        self.fields = list(fields) if fields else None
+        self.delimiter = delimiter
+        self.writer = None
+
+    def _format(self, value):
+        if isinstance(value, list):
+            return ','.join(text_type(item) for item in value if item is not None)
+        if isinstance(value, dict):
+            return json.dumps(value, sort_keys=True)
+        if not PY3 and isinstance(value, text_type):
+            return value.encode('utf-8')
+        return value
+
+    def write_batch(self, rows):
+        if not rows:
+            return
+        if self.writer is None:
+            if self.fields is None:
+                self.fields = sorted(rows[0])
+            self.writer = csv.DictWriter(self.file, fieldnames=self.fields, delimiter=self.delimiter,
+                                         extrasaction='ignore')
+            self.writer.writeheader()
+        format = self._format
+        self.writer.writerows(dict((field, format(row.get(field))) for field in self.fields) for row in rows)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonLinesSink(Sink):
+    """
+    Writes rows to a JSON Lines file, one JSON object per line.
+
+    :param path: path of the file.
+    """
+
+    def __init__(self, path):
+        self.file = io.open(path, 'w', encoding='utf-8')
+
+    def write_batch(self, rows):
+        self.file.write(u''.join(text_type(json.dumps(row, sort_keys=True)) + u'\n' for row in rows))
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Writes rows to a Parquet file, in row groups of `row_group_size` rows.
+
+    The schema is inferred from the first row group, columns without any
+    value in it are stored as strings.
+
+    :param path: path of the file.
+    :param fields: columns, defaults to the columns of the first row group.
+    :param row_group_size: number of rows buffered per row group.
+    """
+
+    def __init__(self, path, fields=None, row_group_size=10000):
+        if pyarrow is None:
+            raise ImportError('ParquetSink requires pyarrow.')
+        self.path = path
+        self.fields = list(fields) if fields else None
+        self.row_group_size = row_group_size
+        self.rows = []
+        self.writer = None
+        self.schema = None
+        self._string_columns = ()
+
+    def write_batch(self, rows):
+        self.rows.extend(rows)
+        if len(self.rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        rows, self.rows = self.rows, []
+        if not rows:
+            return
+        if self.schema is None:
+            if self.fields is None:
+                self.fields = sorted(rows[0])
+            rows = [dict((field, row.get(field)) for field in self.fields) for row in rows]
+            table = pyarrow.Table.from_pylist(rows)
+            fields = [pyarrow.field(f.name, pyarrow.string()) if pyarrow.types.is_null(f.type) else f
+                      for f in table.schema]
+            self._string_columns = [f.name for f in table.schema if pyarrow.types.is_null(f.type)]
+            self.schema = pyarrow.schema(fields)
+            table = table.cast(self.schema)
+            self.writer = pyarrow.parquet.ParquetWriter(self.path, self.schema)
+        else:
+            rows = [dict((field, row.get(field)) for field in self.fields) for row in rows]
+            for row in rows:
+                for column in self._string_columns:
+                    if row[column] is not None:
+                        row[column] = text_type(row[column])
+            table = pyarrow.Table.from_pylist(rows, schema=self.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+
+
+SINKS = {'csv': CsvSink, 'jsonl': JsonLinesSink, 'parquet': ParquetSink}
+
+
+def open_sink(format, path, fields=None):
+    """
+    Opens a sink by format name: 'csv', 'jsonl' or 'parquet'.
+    """
+    if format not in SINKS:
+        raise ValueError("Unknown format {0}, expected one of {1}".format(format, sorted(SINKS)))
+    if format == 'jsonl':
+        return JsonLinesSink(path)
+    return SINKS[format](path, fields=fields)
+
+
+class ExportPipeline(object):
+    """
+    Exports the entities matching a search into a sink.
+
+    The export runs in four stages connected by bounded queues:
+
+    * search: walks the search cursor and groups entity ids into batches,
+    * fetch: bulk fetches the entities of a batch, `fetch_workers` threads,
+    * resolve: flattens the entities into rows and resolves the references
+      they hold to names, `resolve_workers` threads,
+    * sink: writes the rows, on the calling thread.
+
+    Entities are handled as plain JSON (the 'dict' response mode), no
+    model is built. Rows are not written in search order.
+
+    >>> pipeline = ExportPipeline(SearchRequest(entity_type='Flow', filter=filter_string), fields=FLOW_FIELDS)
+    >>> with CsvSink('flows.csv', fields=FLOW_FIELDS) as sink:
+    >>>     pipeline.run(sink)
+    >>> pprint(pipeline.stats())
+
+    :param request: SearchRequest of the entities to export.
+    :param search_api: SearchApi used for the search calls.
+    :param entities_api: EntitiesApi used for the bulk fetch calls.
+    :param resolver: ReferenceResolver used for the names of references.
+    :param fields: dotted paths of the exported columns, e.g.
+        'source_ip.ip_address', defaults to every field of the entities.
+    :param resolve: replace references by the names of the entities.
+    :param batch_size: number of entities per bulk fetch.
+    :param fetch_workers: number of concurrent bulk fetches.
+    :param resolve_workers: number of threads building rows.
+    :param queue_size: batches buffered between two stages.
+    :param shards: split the time range of the search into shards walked
+        concurrently, see `ShardedSearch`.
+    """
+
+    def __init__(self, request, search_api=None, entities_api=None, resolver=None, fields=None,
+                 resolve=True, batch_size=100, fetch_workers=4, resolve_workers=2, queue_size=4, shards=1):
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError("batch_size must be between 1 and {0}".format(MAX_BATCH_SIZE))
+        self.request = request
+        self.search_api = search_api or SearchApi()
+        self.entities_api = entities_api or EntitiesApi()
+        self.resolver = resolver or (ReferenceResolver(self.entities_api) if resolve else None)
+        self.fields = list(fields) if fields else None
+        self.resolve = resolve
+        self.batch_size = batch_size
+        self.fetch_workers = fetch_workers
+        self.resolve_workers = resolve_workers
+        self.queue_size = queue_size
+        self.shards = shards
+        self.elapsed = 0.0
+        self._stages = []
+        self._closed = threading.Event()
+        self._error = None
+
+    def search_batches(self):
+        """
+        Yields the entity ids matching the search, in batches.
+        """
+        if self.shards > 1:
+            results = ShardedSearch(self.search_api, shards=self.shards).results(self.request)
+        else:
+            results = iter_results(self.search_api.search_entities, body=self.request, _response_mode='dict')
+        while True:
+            batch = list(islice(results, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def fetch_batch(self, entity_ids):
+        """
+        Bulk fetches a batch of entities.
+
+        :return: list of serialized entities.
+        """
+        response = self.entities_api.entities_fetch_post(
+            body=FetchRequest(entity_ids=[to_fetch_id(e) for e in entity_ids]), _response_mode='dict')
+        return [result.get('entity') for result in (response or {}).get('results') or []
+                if result.get('entity') is not None]
+
+    def build_rows(self, entities):
+        """
+        Turns a batch of serialized entities into rows, with the names of
+        referenced entities resolved in a single lookup.
+        """
+        if self.fields:
+            rows = [dict((field, _get_path(entity, field)) for field in self.fields) for entity in entities]
+        else:
+            rows = [_flatten(entity, '', {}) for entity in entities]
+        if not self.resolve:
+            return rows
+        references = {}
+        for row in rows:
+            for value in row.values():
+                for reference in _references(value):
+                    references[reference['entity_id']] = Reference(entity_id=reference['entity_id'],
+                                                                   entity_type=reference.get('entity_type'))
+        if references:
+            references = list(references.values())
+            names = dict(zip([r.entity_id for r in references], self.resolver.resolve_names(references)))
+            for row in rows:
+                for column, value in iteritems(row):
+                    row[column] = _replace_references(value, names)
+        return rows
+
+    def _get(self, inbox):
+        while not self._closed.is_set():
+            try:
+                return inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _put(self, outbox, item):
+        while not self._closed.is_set():
+            try:
+                outbox.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _fail(self, error):
+        if self._error is None:
+            self._error = error
+        self._closed.set()
+
+    def _search_worker(self, stage, outbox):
+        try:
+            batches = self.search_batches()
+            while not self._closed.is_set():
+                started = time.time()
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                stage.add(len(batch), time.time() - started)
+                self._put(outbox, batch)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._put(outbox, _DONE)
+
+    def _worker(self, stage, fn, inbox, outbox, remaining):
+        try:
+            while not self._closed.is_set():
+                batch = self._get(inbox)
+                if batch is _DONE:
+                    # leave the marker for the other workers of the stage
+                    self._put(inbox, _DONE)
+                    break
+                started = time.time()
+                result = fn(batch)
+                stage.add(len(result), time.time() - started)
+                self._put(outbox, result)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            with remaining['lock']:
+                remaining['workers'] -= 1
+                last = remaining['workers'] == 0
+            if last:
+                self._put(outbox, _DONE)
+
+    def _start(self, name, fn, workers, inbox, outbox):
+        stage = StageStats(name, workers)
+        self._stages.append(stage)
+        remaining = {'lock': threading.Lock(), 'workers': workers}
+        for _ in range(workers):
+            thread = threading.Thread(target=self._worker, args=(stage, fn, inbox, outbox, remaining))
+            thread.daemon = True
+            thread.start()
+
+    def run(self, sink):
+        """
+        Runs the export into `sink` and returns the stage statistics.
+        """
+        self._closed.clear()
+        self._error = None
+        ids, entities, rows = [queue.Queue(maxsize=self.queue_size) for _ in range(3)]
+        search = StageStats('search', 1)
+        self._stages = [search]
+        started = time.time()
+        thread = threading.Thread(target=self._search_worker, args=(search, ids))
+        thread.daemon = True
+        thread.start()
+        self._start('fetch', self.fetch_batch, self.fetch_workers, ids, entities)
+        self._start('resolve', self.build_rows, self.resolve_workers, entities, rows)
+        write = StageStats('sink', 1)
+        self._stages.append(write)
+        try:
+            while True:
+                batch = self._get(rows)
+                if batch is _DONE:
+                    break
+                batch_started = time.time()
+                sink.write_batch(batch)
+                write.add(len(batch), time.time() - batch_started)
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self._closed.set()
+            self.elapsed = time.time() - started
+        if self._error is not None:
+            raise self._error
+        return self.stats()
+
+    def stats(self):
+        """
+        Returns the statistics of every stage of the last run, see
+        `StageStats.report`.
+        """
+        return [stage.report(self.elapsed) for stage in self._stages]
+
+
+def _parse_arguments(argv):
+    parser = argparse.ArgumentParser(prog='vrni-export', description='Export vRealize Network Insight entities')
+    parser.add_argument('--platform_ip', required=True,
+                        help='IP address of vRNI platform. In case of cluster IP address of Platform-1')
+    parser.add_argument('--username', default='admin@local', help='user name for authentication')
+    parser.add_argument('--password', default='admin', help='password for authentication')
+    parser.add_argument('--domain_type', default='LOCAL', help='domain type for authentication')
+    parser.add_argument('--no_verify_ssl', action='store_true', help='skip verification of the certificate')
+    parser.add_argument('--entity_type', default='Flow', help='entity type to export')
+    parser.add_argument('--filter', help='search filter')
+    parser.add_argument('--start_time', type=int, help='start of the time range, epoch seconds')
+    parser.add_argument('--end_time', type=int, help='end of the time range, epoch seconds')
+    parser.add_argument('--fields', help='comma separated dotted paths of the exported columns, '
+                                         'FLOW for the flow columns, every field by default')
+    parser.add_argument('--no_resolve', action='store_true', help='keep entity ids of references')
+    parser.add_argument('--format', choices=sorted(SINKS), default='csv', help='output format')
+    parser.add_argument('--output', required=True, help='output file')
+    parser.add_argument('--batch_size', type=int, default=100, help='entities per bulk fetch')
+    parser.add_argument('--fetch_workers', type=int, default=4, help='concurrent bulk fetches')
+    parser.add_argument('--resolve_workers', type=int, default=2, help='threads building rows')
+    parser.add_argument('--shards', type=int, default=1, help='time range shards searched concurrently, '
+                                                               'requires --start_time')
+    args = parser.parse_args(argv)
+    if args.shards < 1:
+        parser.error('--shards must be at least 1')
+    if args.shards > 1 and args.start_time is None:
+        parser.error('--shards splits the time range, --start_time is required')
+    return args
+
+
+def main(argv=None):
+    """
+    Command line entry point, `vrni-export`.
+    """
+    args = _parse_arguments(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    config = Configuration()
+    config.verify_ssl = not args.no_verify_ssl
+    api_client = ApiClient(host="https://{0}/api/ni".format(args.platform_ip))
+    credential = UserCredential(username=args.username, password=args.password,
+                                domain=dict(domain_type=args.domain_type))
+    token_manager = TokenManager.for_credentials(api_client, credential)
+    token_manager.get_token()
+    api_client.token_manager = token_manager.start()
+    config.api_client = api_client
+
+    fields = None
+    if args.fields:
+        fields = FLOW_FIELDS if args.fields == 'FLOW' else args.fields.split(',')
+    time_range = None
+    if args.start_time is not None or args.end_time is not None:
+        time_range = TimeRange(start_time=args.start_time, end_time=args.end_time or int(time.time()))
+    request = SearchRequest(entity_type=args.entity_type, filter=args.filter, size=args.batch_size,
+                            time_range=time_range)
+    pipeline = ExportPipeline(request, SearchApi(api_client), EntitiesApi(api_client), fields=fields,
+                              resolve=not args.no_resolve, batch_size=args.batch_size,
+                              fetch_workers=args.fetch_workers, resolve_workers=args.resolve_workers,
+                              shards=args.shards)
+    with open_sink(args.format, args.output, fields) as sink:
+        stats = pipeline.run(sink)
+    print("{0:<8} {1:>7} {2:>10} {3:>12} {4:>11}".format('stage', 'workers', 'rows', 'rows/sec', 'utilization'),
+          file=sys.stderr)
+    for stage in stats:
+        print("{stage:<8} {workers:>7} {rows:>10} {rows_per_sec!s:>12} {utilization!s:>11}".format(**stage),
+              file=sys.stderr)
+    print("exported {0} rows in {1:.1f}s".format(stats[-1]['rows'], pipeline.elapsed), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
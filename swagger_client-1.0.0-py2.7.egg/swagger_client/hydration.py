@@ -0,0 +1,144 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Concurrent bulk fetch of entities through `EntitiesApi.entities_fetch_post`.
+"""
+
+from __future__ import absolute_import
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+from .apis.entities_api import EntitiesApi
+from .models.fetch_request import FetchRequest
+from .models.fetch_request_entity_ids import FetchRequestEntityIds
+
+# Bulk fetch accepts at most 1000 ids per request.
+MAX_BATCH_SIZE = 1000
+
+
+def to_fetch_id(entity):
+    """
+    Converts an entity reference into a `FetchRequestEntityIds`.
+
+    :param entity: `EntityIdWithTime`, `EntityId`, `Reference`,
+        `FetchRequestEntityIds` or a dict with the same keys.
+    :return: FetchRequestEntityIds
+    """
+    if isinstance(entity, FetchRequestEntityIds):
+        return entity
+    if isinstance(entity, dict):
+        return FetchRequestEntityIds(entity_id=entity.get('entity_id'),
+                                     entity_type=entity.get('entity_type'),
+                                     time=entity.get('time'))
+    return FetchRequestEntityIds(entity_id=entity.entity_id,
+                                 entity_type=getattr(entity, 'entity_type', None),
+                                 time=getattr(entity, 'time', None))
+
+
+class EntityHydrator(object):
+    """
+    Turns a stream of entity ids into full entities.
+
+    Ids are grouped into `FetchRequest` batches of `batch_size` and up to
+    `max_workers` batches are fetched concurrently over the connection pool
+    of the api client. Input is consumed lazily, so the ids may come straight
+    from `iter_results`.
+
+    >>> hydrator = EntityHydrator(entities_api, batch_size=200)
+    >>> for entity in hydrator.hydrate(iter_results(search_api.search_entities, body=request)):
+    >>>     pprint(entity.entity)
+
+    :param entities_api: EntitiesApi used for the bulk fetch calls.
+    :param batch_size: number of ids per `entities_fetch_post` call.
+    :param max_workers: number of batches in flight, should not exceed the
+        connection pool size of the api client.
+    :param preserve_order: yield results in input order instead of as they
+        arrive.
+    """
+
+    def __init__(self, entities_api=None, batch_size=100, max_workers=4, preserve_order=False):
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError("batch_size must be between 1 and {0}".format(MAX_BATCH_SIZE))
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.entities_api = entities_api or EntitiesApi()
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.preserve_order = preserve_order
+
+    def fetch_batch(self, entity_ids):
+        """
+        Fetches a single batch of entities.
+
+        :param entity_ids: list of `FetchRequestEntityIds`.
+        :return: list of `EntityWithTime`.
+        """
+        response = self.entities_api.entities_fetch_post(body=FetchRequest(entity_ids=entity_ids),
+                                                       _response_mode='model')
+        return response.results or []
+
+    def batches(self, entities):
+        """
+        Groups entity references into lists of `FetchRequestEntityIds`.
+        """
+        entities = iter(entities)
+        while True:
+            batch = [to_fetch_id(e) for e in islice(entities, self.batch_size)]
+            if not batch:
+                return
+            yield batch
+
+    def hydrate(self, entities):
+        """
+        Yields `EntityWithTime` results for a stream of entity references.
+
+        Entities the server no longer knows about are silently skipped, as
+        they are by `entities_fetch_post` itself.
+
+        :param entities: iterable of entity references.
+        :return: generator of EntityWithTime.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        pending = deque()
+        try:
+            for batch in self.batches(entities):
+                pending.append(executor.submit(self.fetch_batch, batch))
+                while len(pending) >= self.max_workers:
+                    for result in self._collect(pending):
+                        yield result
+            while pending:
+                for result in self._collect(pending):
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _collect(self, pending):
+        """
+        Removes finished batches from `pending` and returns their results.
+        """
+        if self.preserve_order:
+            return pending.popleft().result()
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        results = []
+        for future in done:
+            pending.remove(future)
+            results.extend(future.result())
+        return results
+
+
+def hydrate(entities, entities_api=None, **kwargs):
+    """
+    Yields full entities for a stream of entity references.
+
+    :param entities: iterable of `EntityIdWithTime`, `Reference` or similar.
+    :param entities_api: EntitiesApi used for the bulk fetch calls.
+    :param kwargs: options for `EntityHydrator`.
+    :return: generator of EntityWithTime.
+    """
+    return EntityHydrator(entities_api, **kwargs).hydrate(entities)
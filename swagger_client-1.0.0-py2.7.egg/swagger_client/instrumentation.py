@@ -0,0 +1,347 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Per operation timing, payload size and status code instrumentation.
+"""
+
+from __future__ import absolute_import
+
+import logging
+import re
+import socket
+import threading
+
+from bisect import bisect_left
+from timeit import default_timer
+
+from .configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+# Phases of a call, in order: opening connections, waiting for response
+# headers, reading the body, parsing JSON and building models.
+PHASES = ('connect', 'wait', 'transfer', 'decode', 'build')
+# Upper bounds in seconds of the buckets of the duration histogram.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_local = threading.local()
+
+
+def current_record():
+    """
+    Returns the `CallRecord` of the instrumented call running on this
+    thread, or None.
+    """
+    return getattr(_local, 'record', None)
+
+
+class CallRecord(object):
+    """
+    Measurements of one API call, filled in as the call proceeds.
+    """
+
+    __slots__ = ('method', 'resource_path', 'status', 'error', 'attempts', 'request_bytes',
+                 'response_bytes', 'duration', 'phases')
+
+    def __init__(self, method, resource_path):
+        self.method = method
+        self.resource_path = resource_path
+        # status of the last response, None when served from a cache
+        self.status = None
+        # exception class name of a failed call
+        self.error = None
+        # HTTP requests sent, retries included
+        self.attempts = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.duration = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+
+    @property
+    def operation(self):
+        return '%s %s' % (self.method, self.resource_path)
+
+    @property
+    def retries(self):
+        return max(self.attempts - 1, 0)
+
+    @property
+    def status_label(self):
+        if self.status:
+            return str(self.status)
+        return 'error' if self.error else 'cached'
+
+    def add(self, phase, seconds):
+        self.phases[phase] += seconds
+
+
+class OperationStats(object):
+    """
+    Counters of the calls of one operation.
+    """
+
+    def __init__(self, method, resource_path, buckets=DURATION_BUCKETS):
+        self.method = method
+        self.resource_path = resource_path
+        self.buckets = buckets
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.duration = 0.0
+        self.max_duration = 0.0
+        self.statuses = {}
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        # calls per duration bucket, the last one unbounded
+        self.histogram = [0] * (len(buckets) + 1)
+
+    def add(self, record):
+        self.calls += 1
+        if record.error:
+            self.errors += 1
+        self.retries += record.retries
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        self.duration += record.duration
+        self.max_duration = max(self.max_duration, record.duration)
+        status = record.status_label
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        for phase, seconds in record.phases.items():
+            self.phases[phase] += seconds
+        self.histogram[bisect_left(self.buckets, record.duration)] += 1
+
+    def report(self):
+        """
+        Returns the counters as a dict, times in seconds.
+        """
+        return {'operation': '%s %s' % (self.method, self.resource_path),
+                'calls': self.calls,
+                'errors': self.errors,
+                'retries': self.retries,
+                'statuses': dict(self.statuses),
+                'request_bytes': self.request_bytes,
+                'response_bytes': self.response_bytes,
+                'seconds': round(self.duration, 6),
+                'max_seconds': round(self.max_duration, 6),
+                'phases': dict((phase, round(seconds, 6)) for phase, seconds in self.phases.items())}
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Instrumentation(object):
+    """
+    Records the duration, phases, payload sizes, status codes and retries
+    of API calls, per operation (method and path template).
+
+    Every finished call is added to the per operation counters and passed,
+    as a `CallRecord`, to the hooks: callables such as `StatsdExporter`.
+    The counters are read with `stats`, `summary` (a text table) or
+    `prometheus` (the Prometheus text exposition format).
+
+    The wall time of a call is split into `PHASES`; the remainder is spent
+    serializing the request and waiting on the throttle or retry delays.
+    An ApiClient without instrumentation, the default, skips all of it.
+
+    >>> api_client.instrumentation = Instrumentation()
+    >>> search_api.search_entities(body=request)
+    >>> print(api_client.instrumentation.summary())
+
+    :param hooks: callables taking the `CallRecord` of every call.
+    :param buckets: upper bounds in seconds of the duration histogram.
+    """
+
+    def __init__(self, hooks=None, buckets=DURATION_BUCKETS):
+        self.hooks = list(hooks or [])
+        self.buckets = tuple(buckets)
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_configuration(cls):
+        """
+        Builds the instrumentation configured in `Configuration`, or
+        returns None.
+        """
+        config = Configuration()
+        if not config.instrumentation:
+            return None
+        return cls()
+
+    def add_hook(self, hook):
+        """
+        Adds a callable taking the `CallRecord` of every finished call.
+        """
+        self.hooks.append(hook)
+
+    def call(self, method, resource_path, fn, *args, **kwargs):
+        """
+        Calls `fn`, the API call of a route, and records it.
+
+        :param method: HTTP method of the request.
+        :param resource_path: path template of the request.
+        """
+        record = CallRecord(method, resource_path)
+        previous = current_record()
+        _local.record = record
+        start = default_timer()
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            record.error = type(e).__name__
+            record.status = getattr(e, 'status', None) or record.status
+            raise
+        finally:
+            record.duration = default_timer() - start
+            _local.record = previous
+            self.record(record)
+
+    def record(self, record):
+        """
+        Adds a finished call to the counters and passes it to the hooks.
+        """
+        key = (record.method, record.resource_path)
+        with self._lock:
+            stats = self._operations.get(key)
+            if stats is None:
+                stats = self._operations[key] = OperationStats(record.method, record.resource_path, self.buckets)
+            stats.add(record)
+        for hook in self.hooks:
+            try:
+                hook(record)
+            except Exception:
+                logger.warning("Instrumentation hook %r failed", hook, exc_info=True)
+
+    def stats(self):
+        """
+        Returns the counters of every operation, most time consuming first.
+        """
+        with self._lock:
+            reports = [stats.report() for stats in self._operations.values()]
+        return sorted(reports, key=lambda report: -report['seconds'])
+
+    def reset(self):
+        with self._lock:
+            self._operations = {}
+
+    def summary(self):
+        """
+        Returns the counters as a text table, times are means in
+        milliseconds per call.
+        """
+        header = ['operation', 'calls', 'errors', 'retries', 'mean', 'max'] + list(PHASES) + ['KB out', 'KB in']
+        rows = []
+        for report in self.stats():
+            calls = report['calls']
+            rows.append([report['operation'], str(calls), str(report['errors']), str(report['retries']),
+                         '%.2f' % (report['seconds'] * 1000 / calls), '%.2f' % (report['max_seconds'] * 1000)] +
+                        ['%.2f' % (report['phases'][phase] * 1000 / calls) for phase in PHASES] +
+                        ['%.1f' % (report['request_bytes'] / 1024.0), '%.1f' % (report['response_bytes'] / 1024.0)])
+        widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+        lines = []
+        for row in [header] + rows:
+            lines.append('  '.join([row[0].ljust(widths[0])] +
+                                   [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]))
+        return '\n'.join(lines)
+
+    def prometheus(self, prefix='vrni_client'):
+        """
+        Returns the counters in the Prometheus text exposition format.
+        """
+        with self._lock:
+            operations = sorted(self._operations.items())
+            lines = []
+
+            def family(name, kind, help_text):
+                lines.append('# HELP %s_%s %s' % (prefix, name, help_text))
+                lines.append('# TYPE %s_%s %s' % (prefix, name, kind))
+
+            def sample(name, labels, value):
+                lines.append('%s_%s{%s} %s' % (prefix, name, ','.join('%s="%s"' % (k, _label(v)) for k, v in labels),
+                                               repr(float(value)) if isinstance(value, float) else value))
+
+            family('requests_total', 'counter', 'API calls by operation and status.')
+            for (method, path), stats in operations:
+                for status, count in sorted(stats.statuses.items()):
+                    sample('requests_total', [('method', method), ('path', path), ('status', status)], count)
+            family('request_duration_seconds', 'histogram', 'Wall time of API calls.')
+            for (method, path), stats in operations:
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), stats.histogram):
+                    cumulative += count
+                    sample('request_duration_seconds_bucket', [('method', method), ('path', path), ('le', bound)],
+                           cumulative)
+                sample('request_duration_seconds_sum', [('method', method), ('path', path)], stats.duration)
+                sample('request_duration_seconds_count', [('method', method), ('path', path)], stats.calls)
+            family('phase_seconds_total', 'counter', 'Time spent per phase of API calls.')
+            for (method, path), stats in operations:
+                for phase in PHASES:
+                    sample('phase_seconds_total', [('method', method), ('path', path), ('phase', phase)],
+                           stats.phases[phase])
+            for name, attribute, help_text in (('request_bytes_total', 'request_bytes', 'Bytes of request bodies.'),
+                                               ('response_bytes_total', 'response_bytes', 'Bytes of response bodies.'),
+                                               ('retries_total', 'retries', 'Requests sent again after a failure.')):
+                family(name, 'counter', help_text)
+                for (method, path), stats in operations:
+                    sample(name, [('method', method), ('path', path)], getattr(stats, attribute))
+        return '\n'.join(lines) + '\n'
+
+
+class StatsdExporter(object):
+    """
+    Instrumentation hook sending the measurements of every call to a
+    StatsD daemon over UDP, as `<prefix>.<operation>.<metric>`.
+
+    >>> api_client.instrumentation.add_hook(StatsdExporter('statsd.local'))
+
+    :param host: StatsD host.
+    :param port: StatsD UDP port.
+    :param prefix: prefix of the metric names.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8125, prefix='vrni'):
+        self.address = (host, port)
+        self.prefix = prefix
+        self._names = {}
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def name(self, record):
+        """
+        Returns the metric name prefix of an operation,
+        e.g. 'vrni.get_entities_vms_id'.
+        """
+        key = (record.method, record.resource_path)
+        name = self._names.get(key)
+        if name is None:
+            operation = re.sub(r'[^A-Za-z0-9]+', '_', '%s %s' % (record.method.lower(), record.resource_path))
+            name = self._names[key] = '%s.%s' % (self.prefix, operation.strip('_'))
+        return name
+
+    def lines(self, record):
+        """
+        Returns the StatsD lines of a call.
+        """
+        name = self.name(record)
+        lines = ['%s.calls:1|c' % name,
+                 '%s.status.%s:1|c' % (name, record.status_label),
+                 '%s.duration:%.3f|ms' % (name, record.duration * 1000)]
+        lines.extend('%s.%s:%.3f|ms' % (name, phase, record.phases[phase] * 1000) for phase in PHASES)
+        lines.append('%s.request_bytes:%d|c' % (name, record.request_bytes))
+        lines.append('%s.response_bytes:%d|c' % (name, record.response_bytes))
+        if record.retries:
+            lines.append('%s.retries:%d|c' % (name, record.retries))
+        return lines
+
+    def __call__(self, record):
+        try:
+            self._socket.sendto('\n'.join(self.lines(record)).encode('ascii'), self.address)
+        except socket.error:
+            # metrics are best effort, a missing daemon must not fail calls
+            pass
+
+    def close(self):
+        self._socket.close()
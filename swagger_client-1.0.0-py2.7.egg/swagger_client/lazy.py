@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Package attributes imported on first access.
+"""
+
+from __future__ import absolute_import
+
+import sys
+
+from importlib import import_module
+from types import ModuleType
+
+# Interpreters calling a module level `__getattr__` (PEP 562).
+MODULE_GETATTR = sys.version_info >= (3, 7)
+
+
+def _loader(module_name, attributes, submodules, namespace):
+    """
+    Returns the `__getattr__` and `__dir__` functions of a module whose
+    `attributes` map names to the modules defining them, relative to
+    `module_name`, and whose `submodules` are imported as attributes.
+    Imported attributes are stored in `namespace`.
+    """
+
+    def __getattr__(name):
+        if name in submodules:
+            value = import_module('.' + name, module_name)
+        else:
+            try:
+                submodule = attributes[name]
+            except KeyError:
+                raise AttributeError("module '%s' has no attribute '%s'" % (module_name, name))
+            value = getattr(import_module(submodule, module_name), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(attributes) | set(submodules))
+
+    return __getattr__, __dir__
+
+
+class LazyModule(ModuleType):
+    """
+    Stand-in of a module in `sys.modules` on interpreters without module
+    level `__getattr__`, holding a copy of its namespace.
+    """
+
+    def __init__(self, module, attributes, submodules=()):
+        super(LazyModule, self).__init__(module.__name__)
+        self.__dict__.update(module.__dict__)
+        # the functions of the module still refer to its namespace, keep it alive
+        self.__dict__['_lazy_module'] = module
+        self.__dict__['_lazy_getattr'], self.__dict__['_lazy_dir'] = _loader(module.__name__, attributes,
+                                                                             submodules, self.__dict__)
+
+    def __getattr__(self, name):
+        # only called for names missing from the namespace
+        return self._lazy_getattr(name)
+
+    def __dir__(self):
+        return self._lazy_dir()
+
+
+def install(module_name, attributes, submodules=()):
+    """
+    Makes the `attributes` of a module, a dict of names to the relative
+    name of the module defining them, import on first access, as well as
+    its `submodules`, so that `package.submodule.name` works without
+    importing `package.submodule` first.
+
+    Called last in the module body:
+
+    >>> install(__name__, {'VirtualMachine': '.models.virtual_machine'}, ['models'])
+
+    `__all__` lists the lazy attributes and the public names already
+    defined, so that `from module import *` imports everything.
+    """
+    module = sys.modules[module_name]
+    public = [name for name, value in vars(module).items()
+              if not name.startswith('_') and not isinstance(value, ModuleType)]
+    module.__all__ = sorted(set(attributes) | set(public))
+    if MODULE_GETATTR:
+        module.__getattr__, module.__dir__ = _loader(module_name, attributes, frozenset(submodules),
+                                                     vars(module))
+    else:
+        sys.modules[module_name] = LazyModule(module, attributes, frozenset(submodules))
@@ -0,0 +1,254 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Concurrent, columnar fetching of metric time series through `MetricsApi.get_metrics`.
+"""
+
+from __future__ import absolute_import
+
+from array import array
+from itertools import product
+
+from six import PY3
+
+from .apis.metrics_api import MetricsApi
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Number of points requested per get_metrics call, longer ranges are split.
+DEFAULT_MAX_POINTS = 300
+
+_TIMESTAMP_TYPECODE = 'q' if PY3 else 'l'
+_NAN = float('nan')
+
+
+def time_chunks(start, end, interval, max_points=DEFAULT_MAX_POINTS):
+    """
+    Splits a time range into interval aligned chunks of at most
+    `max_points` points.
+
+    :param start: start time in epoch seconds.
+    :param end: end time in epoch seconds.
+    :param interval: metric points interval in seconds.
+    :return: generator of (start, end) tuples covering the range.
+    """
+    if interval <= 0 or max_points <= 0:
+        raise ValueError("interval and max_points must be positive")
+    span = interval * max_points
+    chunk_start = start - start % interval
+    while True:
+        chunk_end = min(chunk_start + span, end)
+        yield chunk_start, chunk_end
+        if chunk_end >= end:
+            return
+        chunk_start = chunk_end
+
+
+class MetricSeries(object):
+    """
+    Points of one metric of one entity, stored as two columns.
+
+    `timestamps` (epoch seconds) and `values` are NumPy arrays when NumPy
+    is installed, `array.array` otherwise. Missing values are NaN.
+    """
+
+    def __init__(self, entity_id, metric, interval=None, unit=None, display_name=None,
+                 timestamps=None, values=None):
+        self.entity_id = entity_id
+        self.metric = metric
+        self.interval = interval
+        self.unit = unit
+        self.display_name = display_name
+        self.timestamps = timestamps
+        self.values = values
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __repr__(self):
+        return "MetricSeries(entity_id=%r, metric=%r, points=%d)" % (self.entity_id, self.metric, len(self))
+
+
+class _SeriesBuilder(object):
+    """
+    Concatenates the chunks of a series, dropping points repeated at
+    chunk boundaries.
+    """
+
+    def __init__(self, entity_id, metric, use_numpy):
+        self.series = MetricSeries(entity_id, metric)
+        self.use_numpy = use_numpy
+        self.last = None
+        if use_numpy:
+            self.chunks = []
+        else:
+            self.timestamps = array(_TIMESTAMP_TYPECODE)
+            self.values = array('d')
+
+    def add(self, response):
+        series = self.series
+        if series.interval is None:
+            series.interval = response.get('interval')
+            series.unit = response.get('unit')
+            series.display_name = response.get('display_name')
+        points = response.get('pointlist') or []
+        if self.use_numpy:
+            if points:
+                chunk = numpy.array(points, dtype=numpy.float64).reshape(-1, 2)
+                if self.last is not None:
+                    chunk = chunk[chunk[:, 0] > self.last]
+                if len(chunk):
+                    self.last = chunk[-1, 0]
+                    self.chunks.append(chunk)
+            return
+        timestamps, values, last = self.timestamps, self.values, self.last
+        for timestamp, value in points:
+            if last is None or timestamp > last:
+                timestamps.append(int(timestamp))
+                values.append(_NAN if value is None else value)
+                last = timestamp
+        self.last = last
+
+    def build(self):
+        series = self.series
+        if self.use_numpy:
+            points = numpy.concatenate(self.chunks) if self.chunks else numpy.empty((0, 2))
+            series.timestamps = points[:, 0].astype(numpy.int64)
+            series.values = points[:, 1].copy()
+        else:
+            series.timestamps = self.timestamps
+            series.values = self.values
+        return series
+
+
+class MetricsFetcher(object):
+    """
+    Fetches metrics of many entities concurrently.
+
+    Each (entity id, metric) pair is split into interval aligned chunks of
+    `max_points` points, the chunks are fetched on the thread pool of the
+    api client and assembled into `MetricSeries`. Responses are parsed as
+    plain JSON (the 'dict' response mode), no model is built per point.
+
+    >>> fetcher = MetricsFetcher(metrics_api)
+    >>> pairs = MetricsFetcher.pairs(vm_ids, ['metric.cpu.usage.rate.average.percent'])
+    >>> for series in fetcher.iter_series(pairs, interval=300, start=start, end=end):
+    >>>     print(series.entity_id, series.values.mean())
+
+    :param metrics_api: MetricsApi used for the get_metrics calls.
+    :param max_points: points per get_metrics call.
+    :param max_in_flight: number of calls queued or running, defaults to
+        twice the thread pool size of the api client.
+    :param use_numpy: store the columns in NumPy arrays, defaults to True
+        when NumPy is installed.
+    """
+
+    def __init__(self, metrics_api=None, max_points=DEFAULT_MAX_POINTS, max_in_flight=None, use_numpy=None):
+        if use_numpy and numpy is None:
+            raise ImportError('use_numpy requires numpy.')
+        self.metrics_api = metrics_api or MetricsApi()
+        self.max_points = max_points
+        self.max_in_flight = max_in_flight
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+
+    @staticmethod
+    def pairs(entity_ids, metrics):
+        """
+        Returns every (entity id, metric) combination.
+        """
+        return product(entity_ids, metrics)
+
+    def fetch_chunk(self, entity_id, metric, interval, start, end):
+        """
+        Fetches a single chunk of a series.
+
+        :return: the MetricResponse as a dict.
+        """
+        return self.metrics_api.get_metrics(entity_id, metric, interval, start, end, _response_mode='dict')
+
+    def _fetch_task(self, task):
+        return task, self.fetch_chunk(*task[1:])
+
+    def _tasks(self, pairs, interval, start, end):
+        for index, (entity_id, metric) in enumerate(pairs):
+            for chunk_start, chunk_end in time_chunks(start, end, interval, self.max_points):
+                yield index, entity_id, metric, interval, chunk_start, chunk_end
+
+    def iter_series(self, pairs, interval, start, end):
+        """
+        Yields the series of each pair, in input order.
+
+        Pairs are consumed lazily and each series is yielded as soon as
+        its last chunk arrived, so memory is bounded by the chunks in
+        flight rather than by the number of series.
+
+        :param pairs: iterable of (entity id, metric) tuples.
+        :param interval: metric points interval in seconds.
+        :param start: start time in epoch seconds.
+        :param end: end time in epoch seconds.
+        :return: generator of MetricSeries.
+        """
+        api_client = self.metrics_api.api_client
+        results = api_client.map_calls(self._fetch_task, self._tasks(pairs, interval, start, end),
+                                       max_in_flight=self.max_in_flight)
+        builder, current = None, None
+        for task, response in results:
+            if task[0] != current:
+                if builder is not None:
+                    yield builder.build()
+                builder, current = _SeriesBuilder(task[1], task[2], self.use_numpy), task[0]
+            builder.add(response or {})
+        if builder is not None:
+            yield builder.build()
+
+    def fetch(self, pairs, interval, start, end):
+        """
+        Fetches the series of every pair.
+
+        :return: dict of (entity id, metric) to MetricSeries.
+        """
+        return dict(((series.entity_id, series.metric), series)
+                    for series in self.iter_series(pairs, interval, start, end))
+
+    def table(self, pairs, interval, start, end):
+        """
+        Fetches every pair into a single table of columns.
+
+        :return: dict with the columns 'entity_id', 'metric', 'timestamp'
+            and 'value', one row per point.
+        """
+        return to_table(self.iter_series(pairs, interval, start, end), self.use_numpy)
+
+
+def to_table(series_list, use_numpy=None):
+    """
+    Concatenates series into a dict of columns, one row per point.
+
+    :param series_list: iterable of MetricSeries.
+    :param use_numpy: build NumPy columns, defaults to True when NumPy is
+        installed.
+    """
+    use_numpy = numpy is not None if use_numpy is None else use_numpy
+    series_list = list(series_list)
+    if use_numpy:
+        lengths = [len(series) for series in series_list]
+        return {
+            'entity_id': numpy.repeat(numpy.array([s.entity_id for s in series_list], dtype=object), lengths),
+            'metric': numpy.repeat(numpy.array([s.metric for s in series_list], dtype=object), lengths),
+            'timestamp': numpy.concatenate([numpy.asarray(s.timestamps, dtype=numpy.int64) for s in series_list]
+                                           or [numpy.empty(0, dtype=numpy.int64)]),
+            'value': numpy.concatenate([numpy.asarray(s.values, dtype=numpy.float64) for s in series_list]
+                                       or [numpy.empty(0)]),
+        }
+    table = {'entity_id': [], 'metric': [], 'timestamp': array(_TIMESTAMP_TYPECODE), 'value': array('d')}
+    for series in series_list:
+        table['entity_id'].extend([series.entity_id] * len(series))
+        table['metric'].extend([series.metric] * len(series))
+        table['timestamp'].extend(series.timestamps)
+        table['value'].extend(series.values)
+    return table
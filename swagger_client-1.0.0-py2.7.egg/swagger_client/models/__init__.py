@@ -13,222 +13,229 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from .aggregation import Aggregation
-from .aggregation_request import AggregationRequest
-from .aggregation_response import AggregationResponse
-from .aggregation_with_value import AggregationWithValue
-from .all_entity_type import AllEntityType
-from .api_error import ApiError
-from .application_flow_summary import ApplicationFlowSummary
-from .application_member import ApplicationMember
-from .application_request import ApplicationRequest
-from .application_vm_members import ApplicationVMMembers
-from .applied_to import AppliedTo
-from .audit_list_response import AuditListResponse
-from .audit_request import AuditRequest
-from .audit_response import AuditResponse
-from .base_data_source import BaseDataSource
-from .base_data_source_request import BaseDataSourceRequest
-from .base_entity import BaseEntity
-from .bulk_fetch_response import BulkFetchResponse
-from .cisco_switch_type import CiscoSwitchType
-from .data_source_entity_id import DataSourceEntityId
-from .data_source_list_response import DataSourceListResponse
-from .data_source_type import DataSourceType
-from .datasource_health import DatasourceHealth
-from .dell_switch_type import DellSwitchType
-from .domain import Domain
-from .ec2_firewall_direction import EC2FirewallDirection
-from .entity_id import EntityId
-from .entity_id_with_time import EntityIdWithTime
-from .entity_metrics_schema import EntityMetricsSchema
-from .entity_type import EntityType
-from .entity_with_time import EntityWithTime
-from .error_detail import ErrorDetail
-from .fetch_request import FetchRequest
-from .fetch_request_entity_ids import FetchRequestEntityIds
-from .firewall_action import FirewallAction
-from .firewall_direction import FirewallDirection
-from .firewall_rule_set import FirewallRuleSet
-from .flow_summary import FlowSummary
-from .flow_tag import FlowTag
-from .flow_traffic_type import FlowTrafficType
-from .group_entry import GroupEntry
-from .group_membership_criteria import GroupMembershipCriteria
-from .ip_address_membership_criteria import IpAddressMembershipCriteria
-from .ip_address_range import IpAddressRange
-from .ip_numeric_range import IpNumericRange
-from .ip_tag import IpTag
-from .ip_tag_id_list import IpTagIdList
-from .ip_v4_address import IpV4Address
-from .k8_s_credentials import K8SCredentials
-from .kubernetes_source_request import KubernetesSourceRequest
-from .manager import Manager
-from .meta_entity_type import MetaEntityType
-from .metric_response import MetricResponse
-from .metric_schema import MetricSchema
-from .micro_sec_group import MicroSecGroup
-from .nsx_controller_data_collection import NSXControllerDataCollection
-from .name_request_param import NameRequestParam
-from .names_request import NamesRequest
-from .names_response import NamesResponse
-from .node import Node
-from .node_id import NodeId
-from .node_list_result import NodeListResult
-from .node_type import NodeType
-from .pks_source_request import PKSSourceRequest
-from .paged_application_list_response import PagedApplicationListResponse
-from .paged_list_response import PagedListResponse
-from .paged_list_response_with_time import PagedListResponseWithTime
-from .paged_user_group_list_response import PagedUserGroupListResponse
-from .paged_user_list_response import PagedUserListResponse
-from .password_credentials import PasswordCredentials
-from .path_firewall_rules import PathFirewallRules
-from .path_firewall_rules_request import PathFirewallRulesRequest
-from .port_range import PortRange
-from .protocol import Protocol
-from .recommended_rule import RecommendedRule
-from .recommended_rules import RecommendedRules
-from .recommended_rules_request import RecommendedRulesRequest
-from .reference import Reference
-from .role import Role
-from .rule_set import RuleSet
-from .snmp2c_config import SNMP2cConfig
-from .snmp3_config import SNMP3Config
-from .snmp_config import SNMPConfig
-from .scope_enum import ScopeEnum
-from .search_membership_criteria import SearchMembershipCriteria
-from .search_request import SearchRequest
-from .service_now_source_request import ServiceNowSourceRequest
-from .simple_list_response import SimpleListResponse
-from .simple_port_range import SimplePortRange
-from .sort_by_clause import SortByClause
-from .subnet_mapping_list import SubnetMappingList
-from .subnet_mapping_request import SubnetMappingRequest
-from .tier_list_response import TierListResponse
-from .tier_request import TierRequest
-from .time_range import TimeRange
-from .token import Token
-from .user_credential import UserCredential
-from .user_group_response import UserGroupResponse
-from .user_group_type import UserGroupType
-from .user_response import UserResponse
-from .user_type import UserType
-from .vendor_id import VendorId
-from .vendor_info import VendorInfo
-from .version_response import VersionResponse
-from .vidm_config_response import VidmConfigResponse
-from .vidm_configuration import VidmConfiguration
-from .vidm_oauth_client_response import VidmOauthClientResponse
-from .vidm_token import VidmToken
-from .vidm_user_group_request import VidmUserGroupRequest
-from .vidm_user_request import VidmUserRequest
-from .vlan import Vlan
-from .application import Application
-from .base_event import BaseEvent
-from .base_firewall import BaseFirewall
-from .base_firewall_rule import BaseFirewallRule
-from .base_ip_set import BaseIPSet
-from .base_l2_network import BaseL2Network
-from .base_manager import BaseManager
-from .base_service import BaseService
-from .base_virtual_machine import BaseVirtualMachine
-from .base_vnic import BaseVnic
-from .cluster import Cluster
-from .container_base_data_source import ContainerBaseDataSource
-from .datastore import Datastore
-from .distributed_virtual_portgroup import DistributedVirtualPortgroup
-from .distributed_virtual_switch import DistributedVirtualSwitch
-from .entity_name import EntityName
-from .flow import Flow
-from .folder import Folder
-from .group import Group
-from .host import Host
-from .infoblox_manager_data_source_request import InfobloxManagerDataSourceRequest
-from .kubernetes_data_source_request import KubernetesDataSourceRequest
-from .nsxt_manager_data_source_request import NSXTManagerDataSourceRequest
-from .nsxv_manager_data_source import NSXVManagerDataSource
-from .nsxv_manager_data_source_request import NSXVManagerDataSourceRequest
-from .pks_data_source import PKSDataSource
-from .pks_data_source_request import PKSDataSourceRequest
-from .policy_manager_data_source import PolicyManagerDataSource
-from .policy_manager_data_source_request import PolicyManagerDataSourceRequest
-from .resource_pool import ResourcePool
-from .security_tag import SecurityTag
-from .service_now_data_source_request import ServiceNowDataSourceRequest
-from .subnet_mapping import SubnetMapping
-from .switch_data_source import SwitchDataSource
-from .switch_data_source_request import SwitchDataSourceRequest
-from .tier import Tier
-from .vc_datacenter import VCDatacenter
-from .v_center_data_source import VCenterDataSource
-from .v_center_data_source_request import VCenterDataSourceRequest
-from .vpc import VPC
-from .vmknic import Vmknic
-from .arista_switch_data_source import AristaSwitchDataSource
-from .arista_switch_data_source_request import AristaSwitchDataSourceRequest
-from .base_firewall_manager import BaseFirewallManager
-from .base_generic_firewall import BaseGenericFirewall
-from .base_generic_firewall_rule import BaseGenericFirewallRule
-from .base_nsx_manager import BaseNSXManager
-from .base_security_group import BaseSecurityGroup
-from .base_service_group import BaseServiceGroup
-from .brocade_switch_data_source import BrocadeSwitchDataSource
-from .brocade_switch_data_source_request import BrocadeSwitchDataSourceRequest
-from .checkpoint_firewall_data_source import CheckpointFirewallDataSource
-from .checkpoint_firewall_data_source_request import CheckpointFirewallDataSourceRequest
-from .cisco_aci_data_source import CiscoACIDataSource
-from .cisco_aci_data_source_request import CiscoACIDataSourceRequest
-from .cisco_switch_data_source import CiscoSwitchDataSource
-from .cisco_switch_data_source_request import CiscoSwitchDataSourceRequest
-from .dell_switch_data_source import DellSwitchDataSource
-from .dell_switch_data_source_request import DellSwitchDataSourceRequest
-from .ec2_firewall import EC2Firewall
-from .ec2_ip_set import EC2IPSet
-from .ec2_instance import EC2Instance
-from .ec2_network_interface import EC2NetworkInterface
-from .ec2_sg_firewall_rule import EC2SGFirewallRule
-from .ec2_service import EC2Service
-from .gd_data_source import GDDataSource
-from .gd_data_source_request import GDDataSourceRequest
-from .hp_one_view_manager_data_source import HPOneViewManagerDataSource
-from .hp_one_view_manager_data_source_request import HPOneViewManagerDataSourceRequest
-from .hpvc_manager_data_source import HPVCManagerDataSource
-from .hpvc_manager_data_source_request import HPVCManagerDataSourceRequest
-from .infoblox_manager_data_source import InfobloxManagerDataSource
-from .juniper_switch_data_source import JuniperSwitchDataSource
-from .juniper_switch_data_source_request import JuniperSwitchDataSourceRequest
-from .kubernetes_data_source import KubernetesDataSource
-from .ns_service import NSService
-from .nsx_distributed_firewall import NSXDistributedFirewall
-from .nsx_firewall_rule import NSXFirewallRule
-from .nsxip_set import NSXIPSet
-from .nsx_redirect_rule import NSXRedirectRule
-from .nsx_service import NSXService
-from .nsxt_firewall import NSXTFirewall
-from .nsxtip_set import NSXTIPSet
-from .nsxt_manager_data_source import NSXTManagerDataSource
-from .pan_firewall_data_source import PanFirewallDataSource
-from .pan_firewall_data_source_request import PanFirewallDataSourceRequest
-from .problem_event import ProblemEvent
-from .service_now_data_source import ServiceNowDataSource
-from .ucs_manager_data_source import UCSManagerDataSource
-from .ucs_manager_data_source_request import UCSManagerDataSourceRequest
-from .v_center_manager import VCenterManager
-from .virtual_machine import VirtualMachine
-from .vlan_l2_network import VlanL2Network
-from .vnic import Vnic
-from .vxlan_layer2_network import VxlanLayer2Network
-from .checkpoint_firewall import CheckpointFirewall
-from .checkpoint_firewall_rule import CheckpointFirewallRule
-from .checkpoint_mds_manager import CheckpointMDSManager
-from .checkpoint_manager import CheckpointManager
-from .ec2_security_group import EC2SecurityGroup
-from .ns_group import NSGroup
-from .ns_service_group import NSServiceGroup
-from .nsx_security_group import NSXSecurityGroup
-from .nsx_service_group import NSXServiceGroup
-from .nsxt_firewall_rule import NSXTFirewallRule
-from .nsxt_manager import NSXTManager
-from .nsxv_manager import NSXVManager
+from .. import lazy
+
+# models are imported on first access
+_MODELS = {
+    'Aggregation': '.aggregation',
+    'AggregationRequest': '.aggregation_request',
+    'AggregationResponse': '.aggregation_response',
+    'AggregationWithValue': '.aggregation_with_value',
+    'AllEntityType': '.all_entity_type',
+    'ApiError': '.api_error',
+    'ApplicationFlowSummary': '.application_flow_summary',
+    'ApplicationMember': '.application_member',
+    'ApplicationRequest': '.application_request',
+    'ApplicationVMMembers': '.application_vm_members',
+    'AppliedTo': '.applied_to',
+    'AuditListResponse': '.audit_list_response',
+    'AuditRequest': '.audit_request',
+    'AuditResponse': '.audit_response',
+    'BaseDataSource': '.base_data_source',
+    'BaseDataSourceRequest': '.base_data_source_request',
+    'BaseEntity': '.base_entity',
+    'BulkFetchResponse': '.bulk_fetch_response',
+    'CiscoSwitchType': '.cisco_switch_type',
+    'DataSourceEntityId': '.data_source_entity_id',
+    'DataSourceListResponse': '.data_source_list_response',
+    'DataSourceType': '.data_source_type',
+    'DatasourceHealth': '.datasource_health',
+    'DellSwitchType': '.dell_switch_type',
+    'Domain': '.domain',
+    'EC2FirewallDirection': '.ec2_firewall_direction',
+    'EntityId': '.entity_id',
+    'EntityIdWithTime': '.entity_id_with_time',
+    'EntityMetricsSchema': '.entity_metrics_schema',
+    'EntityType': '.entity_type',
+    'EntityWithTime': '.entity_with_time',
+    'ErrorDetail': '.error_detail',
+    'FetchRequest': '.fetch_request',
+    'FetchRequestEntityIds': '.fetch_request_entity_ids',
+    'FirewallAction': '.firewall_action',
+    'FirewallDirection': '.firewall_direction',
+    'FirewallRuleSet': '.firewall_rule_set',
+    'FlowSummary': '.flow_summary',
+    'FlowTag': '.flow_tag',
+    'FlowTrafficType': '.flow_traffic_type',
+    'GroupEntry': '.group_entry',
+    'GroupMembershipCriteria': '.group_membership_criteria',
+    'IpAddressMembershipCriteria': '.ip_address_membership_criteria',
+    'IpAddressRange': '.ip_address_range',
+    'IpNumericRange': '.ip_numeric_range',
+    'IpTag': '.ip_tag',
+    'IpTagIdList': '.ip_tag_id_list',
+    'IpV4Address': '.ip_v4_address',
+    'K8SCredentials': '.k8_s_credentials',
+    'KubernetesSourceRequest': '.kubernetes_source_request',
+    'Manager': '.manager',
+    'MetaEntityType': '.meta_entity_type',
+    'MetricResponse': '.metric_response',
+    'MetricSchema': '.metric_schema',
+    'MicroSecGroup': '.micro_sec_group',
+    'NSXControllerDataCollection': '.nsx_controller_data_collection',
+    'NameRequestParam': '.name_request_param',
+    'NamesRequest': '.names_request',
+    'NamesResponse': '.names_response',
+    'Node': '.node',
+    'NodeId': '.node_id',
+    'NodeListResult': '.node_list_result',
+    'NodeType': '.node_type',
+    'PKSSourceRequest': '.pks_source_request',
+    'PagedApplicationListResponse': '.paged_application_list_response',
+    'PagedListResponse': '.paged_list_response',
+    'PagedListResponseWithTime': '.paged_list_response_with_time',
+    'PagedUserGroupListResponse': '.paged_user_group_list_response',
+    'PagedUserListResponse': '.paged_user_list_response',
+    'PasswordCredentials': '.password_credentials',
+    'PathFirewallRules': '.path_firewall_rules',
+    'PathFirewallRulesRequest': '.path_firewall_rules_request',
+    'PortRange': '.port_range',
+    'Protocol': '.protocol',
+    'RecommendedRule': '.recommended_rule',
+    'RecommendedRules': '.recommended_rules',
+    'RecommendedRulesRequest': '.recommended_rules_request',
+    'Reference': '.reference',
+    'Role': '.role',
+    'RuleSet': '.rule_set',
+    'SNMP2cConfig': '.snmp2c_config',
+    'SNMP3Config': '.snmp3_config',
+    'SNMPConfig': '.snmp_config',
+    'ScopeEnum': '.scope_enum',
+    'SearchMembershipCriteria': '.search_membership_criteria',
+    'SearchRequest': '.search_request',
+    'ServiceNowSourceRequest': '.service_now_source_request',
+    'SimpleListResponse': '.simple_list_response',
+    'SimplePortRange': '.simple_port_range',
+    'SortByClause': '.sort_by_clause',
+    'SubnetMappingList': '.subnet_mapping_list',
+    'SubnetMappingRequest': '.subnet_mapping_request',
+    'TierListResponse': '.tier_list_response',
+    'TierRequest': '.tier_request',
+    'TimeRange': '.time_range',
+    'Token': '.token',
+    'UserCredential': '.user_credential',
+    'UserGroupResponse': '.user_group_response',
+    'UserGroupType': '.user_group_type',
+    'UserResponse': '.user_response',
+    'UserType': '.user_type',
+    'VendorId': '.vendor_id',
+    'VendorInfo': '.vendor_info',
+    'VersionResponse': '.version_response',
+    'VidmConfigResponse': '.vidm_config_response',
+    'VidmConfiguration': '.vidm_configuration',
+    'VidmOauthClientResponse': '.vidm_oauth_client_response',
+    'VidmToken': '.vidm_token',
+    'VidmUserGroupRequest': '.vidm_user_group_request',
+    'VidmUserRequest': '.vidm_user_request',
+    'Vlan': '.vlan',
+    'Application': '.application',
+    'BaseEvent': '.base_event',
+    'BaseFirewall': '.base_firewall',
+    'BaseFirewallRule': '.base_firewall_rule',
+    'BaseIPSet': '.base_ip_set',
+    'BaseL2Network': '.base_l2_network',
+    'BaseManager': '.base_manager',
+    'BaseService': '.base_service',
+    'BaseVirtualMachine': '.base_virtual_machine',
+    'BaseVnic': '.base_vnic',
+    'Cluster': '.cluster',
+    'ContainerBaseDataSource': '.container_base_data_source',
+    'Datastore': '.datastore',
+    'DistributedVirtualPortgroup': '.distributed_virtual_portgroup',
+    'DistributedVirtualSwitch': '.distributed_virtual_switch',
+    'EntityName': '.entity_name',
+    'Flow': '.flow',
+    'Folder': '.folder',
+    'Group': '.group',
+    'Host': '.host',
+    'InfobloxManagerDataSourceRequest': '.infoblox_manager_data_source_request',
+    'KubernetesDataSourceRequest': '.kubernetes_data_source_request',
+    'NSXTManagerDataSourceRequest': '.nsxt_manager_data_source_request',
+    'NSXVManagerDataSource': '.nsxv_manager_data_source',
+    'NSXVManagerDataSourceRequest': '.nsxv_manager_data_source_request',
+    'PKSDataSource': '.pks_data_source',
+    'PKSDataSourceRequest': '.pks_data_source_request',
+    'PolicyManagerDataSource': '.policy_manager_data_source',
+    'PolicyManagerDataSourceRequest': '.policy_manager_data_source_request',
+    'ResourcePool': '.resource_pool',
+    'SecurityTag': '.security_tag',
+    'ServiceNowDataSourceRequest': '.service_now_data_source_request',
+    'SubnetMapping': '.subnet_mapping',
+    'SwitchDataSource': '.switch_data_source',
+    'SwitchDataSourceRequest': '.switch_data_source_request',
+    'Tier': '.tier',
+    'VCDatacenter': '.vc_datacenter',
+    'VCenterDataSource': '.v_center_data_source',
+    'VCenterDataSourceRequest': '.v_center_data_source_request',
+    'VPC': '.vpc',
+    'Vmknic': '.vmknic',
+    'AristaSwitchDataSource': '.arista_switch_data_source',
+    'AristaSwitchDataSourceRequest': '.arista_switch_data_source_request',
+    'BaseFirewallManager': '.base_firewall_manager',
+    'BaseGenericFirewall': '.base_generic_firewall',
+    'BaseGenericFirewallRule': '.base_generic_firewall_rule',
+    'BaseNSXManager': '.base_nsx_manager',
+    'BaseSecurityGroup': '.base_security_group',
+    'BaseServiceGroup': '.base_service_group',
+    'BrocadeSwitchDataSource': '.brocade_switch_data_source',
+    'BrocadeSwitchDataSourceRequest': '.brocade_switch_data_source_request',
+    'CheckpointFirewallDataSource': '.checkpoint_firewall_data_source',
+    'CheckpointFirewallDataSourceRequest': '.checkpoint_firewall_data_source_request',
+    'CiscoACIDataSource': '.cisco_aci_data_source',
+    'CiscoACIDataSourceRequest': '.cisco_aci_data_source_request',
+    'CiscoSwitchDataSource': '.cisco_switch_data_source',
+    'CiscoSwitchDataSourceRequest': '.cisco_switch_data_source_request',
+    'DellSwitchDataSource': '.dell_switch_data_source',
+    'DellSwitchDataSourceRequest': '.dell_switch_data_source_request',
+    'EC2Firewall': '.ec2_firewall',
+    'EC2IPSet': '.ec2_ip_set',
+    'EC2Instance': '.ec2_instance',
+    'EC2NetworkInterface': '.ec2_network_interface',
+    'EC2SGFirewallRule': '.ec2_sg_firewall_rule',
+    'EC2Service': '.ec2_service',
+    'GDDataSource': '.gd_data_source',
+    'GDDataSourceRequest': '.gd_data_source_request',
+    'HPOneViewManagerDataSource': '.hp_one_view_manager_data_source',
+    'HPOneViewManagerDataSourceRequest': '.hp_one_view_manager_data_source_request',
+    'HPVCManagerDataSource': '.hpvc_manager_data_source',
+    'HPVCManagerDataSourceRequest': '.hpvc_manager_data_source_request',
+    'InfobloxManagerDataSource': '.infoblox_manager_data_source',
+    'JuniperSwitchDataSource': '.juniper_switch_data_source',
+    'JuniperSwitchDataSourceRequest': '.juniper_switch_data_source_request',
+    'KubernetesDataSource': '.kubernetes_data_source',
+    'NSService': '.ns_service',
+    'NSXDistributedFirewall': '.nsx_distributed_firewall',
+    'NSXFirewallRule': '.nsx_firewall_rule',
+    'NSXIPSet': '.nsxip_set',
+    'NSXRedirectRule': '.nsx_redirect_rule',
+    'NSXService': '.nsx_service',
+    'NSXTFirewall': '.nsxt_firewall',
+    'NSXTIPSet': '.nsxtip_set',
+    'NSXTManagerDataSource': '.nsxt_manager_data_source',
+    'PanFirewallDataSource': '.pan_firewall_data_source',
+    'PanFirewallDataSourceRequest': '.pan_firewall_data_source_request',
+    'ProblemEvent': '.problem_event',
+    'ServiceNowDataSource': '.service_now_data_source',
+    'UCSManagerDataSource': '.ucs_manager_data_source',
+    'UCSManagerDataSourceRequest': '.ucs_manager_data_source_request',
+    'VCenterManager': '.v_center_manager',
+    'VirtualMachine': '.virtual_machine',
+    'VlanL2Network': '.vlan_l2_network',
+    'Vnic': '.vnic',
+    'VxlanLayer2Network': '.vxlan_layer2_network',
+    'CheckpointFirewall': '.checkpoint_firewall',
+    'CheckpointFirewallRule': '.checkpoint_firewall_rule',
+    'CheckpointMDSManager': '.checkpoint_mds_manager',
+    'CheckpointManager': '.checkpoint_manager',
+    'EC2SecurityGroup': '.ec2_security_group',
+    'NSGroup': '.ns_group',
+    'NSServiceGroup': '.ns_service_group',
+    'NSXSecurityGroup': '.nsx_security_group',
+    'NSXServiceGroup': '.nsx_service_group',
+    'NSXTFirewallRule': '.nsxt_firewall_rule',
+    'NSXTManager': '.nsxt_manager',
+    'NSXVManager': '.nsxv_manager',
+}
+
+# the modules too, as `models.virtual_machine`
+lazy.install(__name__, _MODELS, [module[1:] for module in _MODELS.values()])
@@ -0,0 +1,192 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Cursor based pagination helpers for the search, list and audit APIs.
+"""
+
+from __future__ import absolute_import
+
+import copy
+import threading
+
+from six.moves import queue
+
+
+_DONE = object()
+
+
+def _is_cursor_request(value):
+    """
+    Returns True if value is a request model carrying its own cursor,
+    e.g. `SearchRequest` or `AuditRequest`.
+    """
+    return 'cursor' in getattr(value, 'swagger_types', {})
+
+
+def _page_field(page, name):
+    """
+    Gets a field of a page, returned as a model or, with the 'dict'
+    response mode, as a dict.
+    """
+    if isinstance(page, dict):
+        return page.get(name)
+    return getattr(page, name)
+
+
+class PageIterator(object):
+    """
+    Iterates over the pages of a cursor based API method.
+
+    The cursor is carried either in the request body (`SearchRequest`,
+    `AuditRequest`) or as the `cursor` query parameter (`list_*` methods of
+    `EntitiesApi`, `ApplicationsApi`, `SettingsApi`). The body passed in is
+    copied, so the caller's request object is never modified.
+
+    When `prefetch` is greater than zero, pages are fetched on a background
+    thread and up to `prefetch` pages are buffered ahead of the consumer, so
+    the latency of the next request overlaps with processing of the current
+    page.
+
+    >>> pages = PageIterator(search_api.search_entities, body=search_request)
+    >>> for page in pages:
+    >>>     process(page.results)
+
+    :param api_method: bound API method returning a paged response.
+    :param args: positional arguments for `api_method`.
+    :param prefetch: number of pages to fetch ahead, 0 disables prefetching.
+    :param kwargs: keyword arguments for `api_method`.
+    """
+
+    def __init__(self, api_method, *args, **kwargs):
+        self.prefetch = kwargs.pop('prefetch', 1)
+        self.api_method = api_method
+        self.args = list(args)
+        self.kwargs = kwargs
+        self.cursor = None
+        self.pages = 0
+
+        self._body_index = None
+        for index, arg in enumerate(self.args):
+            if _is_cursor_request(arg):
+                self._body_index = index
+                self.args[index] = copy.deepcopy(arg)
+                self.cursor = arg.cursor
+        if _is_cursor_request(self.kwargs.get('body')):
+            self.kwargs['body'] = copy.deepcopy(self.kwargs['body'])
+            self.cursor = self.kwargs['body'].cursor
+        elif self._body_index is None:
+            self.cursor = self.kwargs.get('cursor')
+
+        self._closed = threading.Event()
+        self._queue = None
+        self._worker = None
+
+    def _fetch(self, cursor):
+        """
+        Fetches the page starting at `cursor`.
+        """
+        if self._body_index is not None:
+            self.args[self._body_index].cursor = cursor
+        elif _is_cursor_request(self.kwargs.get('body')):
+            self.kwargs['body'].cursor = cursor
+        elif cursor is not None:
+            self.kwargs['cursor'] = cursor
+        return self.api_method(*self.args, **self.kwargs)
+
+    def _pages(self):
+        """
+        Yields pages in the calling thread until the cursor is exhausted.
+        """
+        cursor = self.cursor
+        while not self._closed.is_set():
+            page = self._fetch(cursor)
+            yield page
+            cursor = _page_field(page, 'cursor')
+            if not cursor or not _page_field(page, 'results'):
+                return
+
+    def _put(self, item):
+        """
+        Hands an item to the consumer unless the iterator has been closed.
+        """
+        while not self._closed.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(self):
+        """
+        Worker loop for prefetching, forwards pages and errors to the queue.
+        """
+        try:
+            for page in self._pages():
+                self._put((page, None))
+        except Exception as e:
+            self._put((None, e))
+        finally:
+            self._put((_DONE, None))
+
+    def __iter__(self):
+        if self.prefetch <= 0:
+            for page in self._pages():
+                self.pages += 1
+                self.cursor = _page_field(page, 'cursor')
+                yield page
+            return
+
+        self._queue = queue.Queue(maxsize=self.prefetch)
+        self._worker = threading.Thread(target=self._produce)
+        self._worker.daemon = True
+        self._worker.start()
+        try:
+            while True:
+                page, error = self._queue.get()
+                if error is not None:
+                    raise error
+                if page is _DONE:
+                    return
+                self.pages += 1
+                self.cursor = _page_field(page, 'cursor')
+                yield page
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stops the background worker, pages already fetched are discarded.
+        """
+        self._closed.set()
+
+
+def iter_pages(api_method, *args, **kwargs):
+    """
+    Yields every page of a cursor based API method.
+
+    >>> for page in iter_pages(entities_api.list_vms, size=100):
+    >>>     pprint(page.results)
+
+    :param api_method: bound API method returning a paged response.
+    :param prefetch: number of pages to fetch ahead, 0 disables prefetching.
+    :return: generator of paged responses.
+    """
+    return iter(PageIterator(api_method, *args, **kwargs))
+
+
+def iter_results(api_method, *args, **kwargs):
+    """
+    Yields the `results` of every page of a cursor based API method.
+
+    >>> for entity_id in iter_results(search_api.search_entities, body=request):
+    >>>     pprint(entity_id)
+
+    :param api_method: bound API method returning a paged response.
+    :param prefetch: number of pages to fetch ahead, 0 disables prefetching.
+    :return: generator of result items.
+    """
+    for page in iter_pages(api_method, *args, **kwargs):
+        for result in _page_field(page, 'results') or []:
+            yield result
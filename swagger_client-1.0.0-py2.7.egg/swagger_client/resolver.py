@@ -0,0 +1,194 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Cached resolution of entity references to names and entities.
+"""
+
+from __future__ import absolute_import
+
+import threading
+
+from .apis.entities_api import EntitiesApi
+from .cache import LRUCache, MISSING
+from .hydration import EntityHydrator, to_fetch_id
+from .models.name_request_param import NameRequestParam
+from .models.names_request import NamesRequest
+
+# Names API accepts at most 1000 entities per request.
+MAX_NAMES_BATCH_SIZE = 1000
+
+
+class _Pending(object):
+    """
+    A lookup in flight, other threads asking for the same key wait on it.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+    def wait(self):
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class ReferenceResolver(object):
+    """
+    Resolves `Reference` objects (entity_id + entity_type) to names or to
+    full entities.
+
+    Results are kept in a bounded LRU cache with a TTL per entity type.
+    Misses are batched through `EntitiesApi.get_names` or
+    `EntitiesApi.entities_fetch_post`, and concurrent lookups of the same
+    id share a single request. Entities no longer known to the platform
+    resolve to None, which is cached as well.
+
+    A resolver is safe to share between threads.
+
+    >>> resolver = ReferenceResolver(entities_api, ttl_by_type={'Flow': 60})
+    >>> resolver.resolve_name(flow.source_vm)
+    >>> resolver.resolve_names(flow.source_security_groups)
+
+    :param entities_api: EntitiesApi used for lookups.
+    :param maxsize: maximum number of cached names and entities.
+    :param ttl: default time to live of cached results in seconds.
+    :param ttl_by_type: dict of entity type to time to live, overriding `ttl`.
+    :param batch_size: number of ids per `get_names` / bulk fetch request.
+    """
+
+    def __init__(self, entities_api=None, maxsize=10000, ttl=3600, ttl_by_type=None, batch_size=500):
+        if not 0 < batch_size <= MAX_NAMES_BATCH_SIZE:
+            raise ValueError("batch_size must be between 1 and {0}".format(MAX_NAMES_BATCH_SIZE))
+        self.entities_api = entities_api or EntitiesApi()
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.ttl_by_type = dict(ttl_by_type or {})
+        self.batch_size = batch_size
+        self.requests = 0
+        self._hydrator = EntityHydrator(self.entities_api, batch_size=batch_size, max_workers=1)
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, entity_type):
+        """
+        Returns the time to live for results of the given entity type.
+        """
+        return self.ttl_by_type.get(entity_type, self.cache.ttl)
+
+    def resolve_name(self, reference):
+        """
+        Returns the name of the referenced entity, or None.
+        """
+        if reference is None:
+            return None
+        return self.resolve_names([reference])[0]
+
+    def resolve_names(self, references):
+        """
+        Returns the names of the referenced entities, in order.
+
+        :param references: iterable of `Reference` or `EntityIdWithTime`.
+        :return: list of names, None for unknown entities.
+        """
+        return self._resolve('name', references, self._fetch_names)
+
+    def resolve_entity(self, reference):
+        """
+        Returns the referenced entity model, or None.
+        """
+        if reference is None:
+            return None
+        return self.resolve_entities([reference])[0]
+
+    def resolve_entities(self, references):
+        """
+        Returns the referenced entity models, in order.
+
+        :param references: iterable of `Reference` or `EntityIdWithTime`.
+        :return: list of entity models, None for unknown entities.
+        """
+        return self._resolve('entity', references, self._fetch_entities)
+
+    def invalidate(self, reference):
+        """
+        Drops everything cached for the referenced entity.
+        """
+        self.cache.pop(('name', reference.entity_id))
+        self.cache.pop(('entity', reference.entity_id))
+
+    def _resolve(self, kind, references, fetch):
+        references = [r for r in references if r is not None]
+        values = {}
+        waiting = {}
+        owned = {}
+        with self._lock:
+            for reference in references:
+                key = (kind, reference.entity_id)
+                if key in values or key in waiting or key in owned:
+                    continue
+                value = self.cache.get(key)
+                if value is not MISSING:
+                    values[key] = value
+                elif key in self._inflight:
+                    waiting[key] = self._inflight[key]
+                else:
+                    owned[key] = reference
+                    self._inflight[key] = _Pending()
+
+        if owned:
+            owned_refs = list(owned.values())
+            for start in range(0, len(owned_refs), self.batch_size):
+                batch = owned_refs[start:start + self.batch_size]
+                try:
+                    fetched = fetch(batch)
+                except Exception as e:
+                    self._complete(kind, owned_refs[start:], {}, error=e)
+                    raise
+                self._complete(kind, batch, fetched)
+                for reference in batch:
+                    values[(kind, reference.entity_id)] = fetched.get(reference.entity_id)
+
+        for key, pending in waiting.items():
+            values[key] = pending.wait()
+
+        return [values.get((kind, r.entity_id)) for r in references]
+
+    def _complete(self, kind, references, fetched, error=None):
+        """
+        Caches fetched values and wakes up threads waiting for them.
+        """
+        with self._lock:
+            for reference in references:
+                key = (kind, reference.entity_id)
+                pending = self._inflight.pop(key, None)
+                if error is None:
+                    value = fetched.get(reference.entity_id)
+                    self.cache.set(key, value, ttl=self.ttl_for(reference.entity_type))
+                if pending is not None:
+                    pending.value = fetched.get(reference.entity_id)
+                    pending.error = error
+                    pending.event.set()
+
+    def _fetch_names(self, references):
+        with self._lock:
+            self.requests += 1
+        body = NamesRequest(entities=[NameRequestParam(entity_id=r.entity_id, time=getattr(r, 'time', None))
+                                      for r in references])
+        response = self.entities_api.get_names(body, _response_mode='model')
+        return dict((e.entity_id, e.name) for e in response.entities or [])
+
+    def _fetch_entities(self, references):
+        with self._lock:
+            self.requests += 1
+        fetched = {}
+        for result in self._hydrator.fetch_batch([to_fetch_id(r) for r in references]):
+            fetched[result.entity_id] = result.entity
+            name = getattr(result.entity, 'name', None)
+            if name is not None:
+                self.cache.set(('name', result.entity_id), name, ttl=self.ttl_for(result.entity_type))
+        return fetched
+
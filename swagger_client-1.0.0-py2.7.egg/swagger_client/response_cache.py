@@ -0,0 +1,217 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Persistent cache of responses to queries pinned to the past.
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from .configuration import Configuration
+from .rest import RESTResponse
+from .retry import READ_ONLY_POSTS
+
+# Name of the cache database in `Configuration.cache_dir`.
+CACHE_FILE = 'responses.sqlite'
+
+
+class CachedResponse(RESTResponse):
+    """
+    Response served from the cache, in place of a `RESTResponse`.
+    """
+
+    def __init__(self, status, headers, raw_data):
+        self.urllib3_response = None
+        self.status = status
+        self.reason = 'OK'
+        self.raw_data = raw_data
+        self._data = None
+        self.headers = headers
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+def _pinned_time(query_params, body):
+    """
+    Returns the latest point in time a query reads data of, or None if
+    the query is relative to now.
+    """
+    params = dict(query_params or [])
+    if 'time' in params:
+        return int(params['time'])
+    if 'end' in params:
+        return int(params['end'])
+    if not isinstance(body, dict):
+        return None
+    time_range = body.get('time_range')
+    if isinstance(time_range, dict):
+        return time_range.get('end_time')
+    for name in ('entity_ids', 'entities'):
+        items = body.get(name)
+        if isinstance(items, list) and items:
+            times = [item.get('time') if isinstance(item, dict) else None for item in items]
+            return None if None in times else max(times)
+    return body.get('time')
+
+
+class ResponseCache(object):
+    """
+    Size bounded, persistent cache of API responses, in a SQLite file.
+
+    Only read-only queries pinned to the past are cached: GETs with a
+    `time` query parameter or an `end` older than `settle` seconds, and
+    read-only POSTs (search, aggregation, bulk fetch) whose `time_range`
+    or entity times are. Queries relative to now bypass the cache. Entries
+    are keyed by auth identity, method, URL, sorted query parameters and
+    body, so users with different access sharing the file never see each
+    other's responses, and hold
+    the zlib compressed response body. When the file grows beyond
+    `max_bytes`, the least recently used entries are evicted.
+
+    >>> api_client.response_cache = ResponseCache('/var/cache/vrni/responses.sqlite')
+    >>> entities_api.get_vm(vm_id, time=last_week)  # cached from now on
+
+    :param path: path of the SQLite database.
+    :param max_bytes: bound of the total size of the cached bodies.
+    :param settle: seconds after which data of a point in time is final.
+    :param clock: function returning the current time in seconds.
+    """
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024, settle=3600, clock=time.time):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.settle = settle
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS responses ('
+                         'key TEXT PRIMARY KEY, status INTEGER, headers TEXT, body BLOB, '
+                         'size INTEGER, accessed REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    @classmethod
+    def from_configuration(cls):
+        """
+        Opens the cache configured in `Configuration`, or returns None.
+        """
+        config = Configuration()
+        if not config.response_cache or not config.cache_dir:
+            return None
+        return cls(os.path.join(config.cache_dir, CACHE_FILE), max_bytes=config.response_cache_max_bytes)
+
+    def is_cacheable(self, method, resource_path, query_params=None, body=None):
+        """
+        Returns True if the response of a query can no longer change.
+
+        :param resource_path: path template, e.g. '/entities/vms/{id}'.
+        :param query_params: list of (name, value) tuples.
+        :param body: serialized request body.
+        """
+        if not (method == 'GET' or (method == 'POST' and resource_path in READ_ONLY_POSTS)):
+            return False
+        pinned = _pinned_time(query_params, body)
+        return pinned is not None and pinned + self.settle <= self.clock()
+
+    @staticmethod
+    def key(method, url, query_params=None, body=None, identity=None):
+        """
+        Returns the cache key of a query.
+
+        :param identity: who the query is sent as, users of a shared cache
+            file only see the responses to their own queries.
+        """
+        query = sorted([k, str(v)] for k, v in query_params or [])
+        normalized = json.dumps([identity, method, url, query, body], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the cached response for a key, or None.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT status, headers, body FROM responses WHERE key = ?',
+                                   (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (self.clock(), key))
+            self.hits += 1
+        status, headers, body = row
+        return CachedResponse(status, json.loads(headers), zlib.decompress(bytes(body)))
+
+    def set(self, key, response):
+        """
+        Caches a response, evicting least recently used entries if needed.
+        """
+        body = zlib.compress(response.raw_data or b'')
+        headers = dict(response.getheaders() or {})
+        with self._lock:
+            previous = self._db.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                             (key, response.status, json.dumps(headers), sqlite3.Binary(body),
+                              len(body), self.clock()))
+            self._size += len(body) - (previous[0] if previous else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """
+        Removes least recently used entries until the cache is 10% below
+        its bound.
+        """
+        target = self.max_bytes * 0.9
+        for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY accessed').fetchall():
+            if self._size <= target:
+                break
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._size -= size
+
+    def lookup(self, method, resource_path, url, query_params=None, body=None, identity=None):
+        """
+        Returns (key, cached response) for a query; the key is None when
+        the query bypasses the cache and the response None on a miss.
+        """
+        if not self.is_cacheable(method, resource_path, query_params, body):
+            self.bypassed += 1
+            return None, None
+        key = self.key(method, url, query_params, body, identity)
+        return key, self.get(key)
+
+    def clear(self):
+        """
+        Removes every cached response.
+        """
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._size = 0
+
+    def close(self):
+        self._db.close()
+
+    def stats(self):
+        """
+        Returns the hit, miss and bypass counters and the cached size.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'bypassed': self.bypassed, 'bytes': self._size}
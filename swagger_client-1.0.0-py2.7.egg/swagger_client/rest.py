@@ -19,12 +19,16 @@ import ssl
 import certifi
 import logging
 import re
+import socket
+
+from timeit import default_timer
 
 # python 2 and python 3 compatibility library
-from six import PY3
+from six import PY3, text_type
 from six.moves.urllib.parse import urlencode
 
 from .configuration import Configuration
+from .instrumentation import current_record
 
 try:
     import urllib3
@@ -41,7 +45,26 @@ class RESTResponse(io.IOBase):
         self.urllib3_response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = resp.data
+        self.raw_data = resp.data
+        self._data = None
+
+    @property
+    def data(self):
+        """
+        Gets the response body, decoded to a string on python 3.
+        """
+        if self._data is None:
+            # In the python 3, the response.data is bytes.
+            # we need to decode it to string.
+            if PY3 and isinstance(self.raw_data, bytes):
+                self._data = self.raw_data.decode('utf8')
+            else:
+                self._data = self.raw_data
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
 
     def getheaders(self):
         """
@@ -56,60 +79,160 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.getheader(name, default)
 
 
+def socket_options(config):
+    """
+    Socket options for pooled connections, built from the configuration.
+
+    :param config: Configuration.
+    :return: list of (level, option, value) tuples.
+    """
+    if config.socket_options is not None:
+        return list(config.socket_options)
+    options = list(urllib3.connection.HTTPConnection.default_socket_options)
+    if config.tcp_keepalive:
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Not every platform exposes the keep-alive tuning knobs
+        for name, value in (('TCP_KEEPIDLE', config.tcp_keepalive_idle),
+                            ('TCP_KEEPINTVL', config.tcp_keepalive_interval),
+                            ('TCP_KEEPCNT', config.tcp_keepalive_count)):
+            if value is not None and hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class _TimedConnect(object):
+    """
+    Adds the time spent opening connections to the instrumented call
+    running on the thread, see `swagger_client.instrumentation`.
+    """
+
+    def connect(self):
+        record = current_record()
+        if record is None:
+            return super(_TimedConnect, self).connect()
+        start = default_timer()
+        try:
+            return super(_TimedConnect, self).connect()
+        finally:
+            record.add('connect', default_timer() - start)
+
+
+class _HTTPConnection(_TimedConnect, urllib3.connection.HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_TimedConnect, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _HTTPConnectionPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+def _encode_body(body):
+    """
+    Returns a serialized request body as the UTF-8 bytes sent on the wire.
+    """
+    if isinstance(body, text_type):
+        return body.encode('utf-8')
+    return body
+
+
 class RESTClientObject(object):
 
-    def __init__(self, pools_size=4, maxsize=4):
+    def __init__(self, pools_size=None, maxsize=None, block=None):
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680
         # maxsize is the number of requests to host that are allowed in parallel
         # ca_certs vs cert_file vs key_file
         # http://stackoverflow.com/a/23957365/2985775
+        config = Configuration()
+
+        # pool sizing, defaults come from the configuration
+        if pools_size is None:
+            pools_size = config.connection_pool_num_pools
+        if maxsize is None:
+            maxsize = config.connection_pool_maxsize
+        if block is None:
+            block = config.connection_pool_block
+        self.pools_size = pools_size
+        self.maxsize = maxsize
 
         # cert_reqs
-        if Configuration().verify_ssl:
+        if config.verify_ssl:
             cert_reqs = ssl.CERT_REQUIRED
         else:
             cert_reqs = ssl.CERT_NONE
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         # ca_certs
-        if Configuration().ssl_ca_cert:
-            ca_certs = Configuration().ssl_ca_cert
+        if config.ssl_ca_cert:
+            ca_certs = config.ssl_ca_cert
         else:
             # if not set certificate file, use Mozilla's root certificates.
             ca_certs = certifi.where()
 
         # cert_file
-        cert_file = Configuration().cert_file
+        cert_file = config.cert_file
 
         # key file
-        key_file = Configuration().key_file
+        key_file = config.key_file
 
         # proxy
-        proxy = Configuration().proxy
+        proxy = config.proxy
+
+        pool_kwargs = dict(
+            num_pools=pools_size,
+            maxsize=maxsize,
+            block=block,
+            cert_reqs=cert_reqs,
+            ca_certs=ca_certs,
+            cert_file=cert_file,
+            key_file=key_file,
+            socket_options=socket_options(config)
+        )
+        # connection level retries are configured once for every pool
+        if config.retries is not None:
+            pool_kwargs['retries'] = config.retries
 
         # https pool manager
         if proxy:
-            self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=cert_file,
-                key_file=key_file,
-                proxy_url=proxy
-            )
+            self.pool_manager = urllib3.ProxyManager(proxy_url=proxy, **pool_kwargs)
         else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=cert_file,
-                key_file=key_file
-            )
+            self.pool_manager = urllib3.PoolManager(**pool_kwargs)
+        self.pool_manager.pool_classes_by_scheme = {'http': _HTTPConnectionPool, 'https': _HTTPSConnectionPool}
+
+    def pool_stats(self):
+        """
+        Returns connection reuse statistics of every pool.
+
+        `connections` is the number of connections opened, `requests` the
+        number of requests sent, `reused` the number of requests served by an
+        already open connection and `available` the number of free slots
+        in the pool.
 
+        :return: dict of "scheme://host:port" -> stats dict.
+        """
+        stats = {}
+        pools = self.pool_manager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            name = "{0}://{1}:{2}".format(pool.scheme, pool.host, pool.port)
+            stats[name] = {
+                'connections': pool.num_connections,
+                'requests': pool.num_requests,
+                'reused': max(pool.num_requests - pool.num_connections, 0),
+                'available': pool.pool.qsize() if pool.pool is not None else 0,
+                'maxsize': self.maxsize,
+            }
+        return stats
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True, _request_timeout=None):
@@ -130,6 +253,11 @@ class RESTClientObject(object):
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH', 'OPTIONS']
 
+        # an instrumented call reads the body itself, to time it apart from
+        # the wait for the response headers
+        record = current_record()
+        preload_content = _preload_content and record is None
+
         if post_params and body:
             raise ValueError(
                 "body parameter cannot be used with post_params parameter."
@@ -138,6 +266,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
+        request_body = None
         timeout = None
         if _request_timeout:
             if isinstance(_request_timeout, (int, ) if PY3 else (int, long)):
@@ -148,25 +277,27 @@ class RESTClientObject(object):
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
+        if record is not None:
+            start = default_timer()
+            connected = record.phases['connect']
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
                 if query_params:
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE):
-                    request_body = None
                     if body:
-                        request_body = json.dumps(body)
+                        request_body = _encode_body(json.dumps(body))
                     r = self.pool_manager.request(method, url,
                                                   body=request_body,
-                                                  preload_content=_preload_content,
+                                                  preload_content=preload_content,
                                                   timeout=timeout,
                                                   headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
                     r = self.pool_manager.request(method, url,
                                                   fields=post_params,
                                                   encode_multipart=False,
-                                                  preload_content=_preload_content,
+                                                  preload_content=preload_content,
                                                   timeout=timeout,
                                                   headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
@@ -176,17 +307,17 @@ class RESTClientObject(object):
                     r = self.pool_manager.request(method, url,
                                                   fields=post_params,
                                                   encode_multipart=True,
-                                                  preload_content=_preload_content,
+                                                  preload_content=preload_content,
                                                   timeout=timeout,
                                                   headers=headers)
                 # Pass a `string` parameter directly in the body to support
                 # other content types than Json when `body` argument is provided
                 # in serialized form
                 elif isinstance(body, str):
-                    request_body = body
+                    request_body = _encode_body(body)
                     r = self.pool_manager.request(method, url,
                                                   body=request_body,
-                                                  preload_content=_preload_content,
+                                                  preload_content=preload_content,
                                                   timeout=timeout,
                                                   headers=headers)
                 else:
@@ -198,23 +329,38 @@ class RESTClientObject(object):
             else:
                 r = self.pool_manager.request(method, url,
                                               fields=query_params,
-                                              preload_content=_preload_content,
+                                              preload_content=preload_content,
                                               timeout=timeout,
                                               headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
+        finally:
+            if record is not None:
+                record.attempts += 1
+                record.request_bytes += len(request_body or b'')
+                record.add('wait', default_timer() - start - (record.phases['connect'] - connected))
+
+        if record is not None:
+            record.status = r.status
+            # requests retried by the connection pool itself, e.g. on Retry-After
+            history = getattr(getattr(r, 'retries', None), 'history', None)
+            if history:
+                record.attempts += len(history)
 
         if _preload_content:
-            r = RESTResponse(r)
-
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if PY3:
-                r.data = r.data.decode('utf8')
+            if record is None:
+                r = RESTResponse(r)
+            else:
+                start = default_timer()
+                r = RESTResponse(r)
+                r.urllib3_response.release_conn()
+                record.add('transfer', default_timer() - start)
+                record.response_bytes += len(r.raw_data or b'')
 
             # log response body
-            logger.debug("response body: %s", r.data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", r.data)
 
         if not 200 <= r.status <= 299:
             raise ApiException(http_resp=r)
@@ -287,6 +433,7 @@ class RESTClientObject(object):
 class ApiException(Exception):
 
     def __init__(self, status=None, reason=None, http_resp=None):
+        self.http_resp = http_resp
         if http_resp:
             self.status = http_resp.status
             self.reason = http_resp.reason
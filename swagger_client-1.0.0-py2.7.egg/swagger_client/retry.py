@@ -0,0 +1,210 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Retries of transient failures with exponential backoff.
+"""
+
+from __future__ import absolute_import
+
+import logging
+import random
+import socket
+import threading
+import time
+
+import urllib3
+
+from .configuration import Configuration
+from .rest import ApiException
+from .throttle import retry_after
+
+logger = logging.getLogger(__name__)
+
+# Methods without side effects, retried on every route.
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+# POST routes that only read data, retried like GETs.
+READ_ONLY_POSTS = frozenset([
+    '/search',
+    '/search/aggregation',
+    '/entities/fetch',
+    '/entities/names',
+    '/logs/audit',
+    '/micro-seg/recommended-rules',
+    '/micro-seg/recommended-rules/nsx',
+    '/path/firewall-rules',
+])
+
+# Responses worth retrying: throttling and gateway errors.
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+
+
+class RetryPolicy(object):
+    """
+    Retries failed requests of read-only routes.
+
+    A request is retried when the connection fails or times out, or when
+    the server answers with one of `status_codes`. Delays grow
+    exponentially with full jitter, a `Retry-After` header is honored.
+    Data source, settings and other mutating calls are never retried.
+
+    Retries are limited by a budget shared by all requests of the client:
+    it holds up to `budget_size` retries and every request adds
+    `budget_ratio` to it, so during an outage retries add at most that
+    ratio to the load on the platform.
+
+    Clients retry nothing by default; set `Configuration.retry_max_attempts`
+    above 1 before creating them, or assign a policy:
+
+    >>> api_client.retry_policy = RetryPolicy(max_attempts=5, backoff_factor=1.0)
+
+    :param max_attempts: attempts per request, including the first one.
+    :param backoff_factor: delay before the first retry, in seconds,
+        doubled on each further retry.
+    :param max_backoff: upper bound of a computed delay, in seconds.
+    :param max_retry_after: longest `Retry-After` honored, in seconds,
+        longer ones are not retried.
+    :param status_codes: response status codes to retry.
+    :param methods: HTTP methods retried on every route.
+    :param routes: (method, resource path) pairs retried as well, e.g.
+        ('POST', '/search').
+    :param budget_ratio: retries allowed per request.
+    :param budget_size: retries that can be saved up in the budget.
+    :param sleep: function sleeping for a number of seconds.
+    :param random: function returning a float in [0, 1).
+    """
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30, max_retry_after=120,
+                 status_codes=RETRY_STATUS_CODES, methods=IDEMPOTENT_METHODS, routes=None,
+                 budget_ratio=0.2, budget_size=10, sleep=time.sleep, random=random.random):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(methods)
+        if routes is None:
+            routes = [('POST', path) for path in READ_ONLY_POSTS]
+        self.routes = frozenset(routes)
+        self.budget_ratio = budget_ratio
+        self.budget_size = budget_size
+        self.sleep = sleep
+        self.random = random
+        self._budget = float(budget_size)
+        self._lock = threading.Lock()
+        # counters
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.budget_exhausted = 0
+
+    @classmethod
+    def from_configuration(cls):
+        """
+        Builds the retry policy configured in `Configuration`, or returns None.
+        """
+        config = Configuration()
+        if config.retry_max_attempts <= 1:
+            return None
+        return cls(max_attempts=config.retry_max_attempts, backoff_factor=config.retry_backoff_factor)
+
+    def is_retryable(self, method, resource_path):
+        """
+        Returns True if requests of a route may be retried.
+
+        :param resource_path: path template, e.g. '/entities/vms/{id}'.
+        """
+        return method in self.methods or (method, resource_path) in self.routes
+
+    def backoff(self, retry):
+        """
+        Returns the delay before a retry, the first one being retry 1.
+        """
+        return self.random() * min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1))
+
+    def _delay(self, error):
+        """
+        Returns the delay before retrying after an error, or None if the
+        error should not be retried.
+        """
+        if isinstance(error, ApiException):
+            if error.status not in self.status_codes:
+                return None
+            delay = retry_after(error.headers)
+            if delay is None:
+                return 0.0
+            return delay if delay <= self.max_retry_after else None
+        if isinstance(error, (urllib3.exceptions.HTTPError, socket.error)):
+            return None if isinstance(error, urllib3.exceptions.SSLError) else 0.0
+        return None
+
+    def _withdraw(self):
+        with self._lock:
+            if self._budget < 1:
+                self.budget_exhausted += 1
+                return False
+            self._budget -= 1
+            self.retries += 1
+            return True
+
+    def begin(self, method, resource_path):
+        """
+        Counts a request and adds to the budget.
+
+        :return: True if the request may be retried.
+        """
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.budget_size, self._budget + self.budget_ratio)
+        return self.is_retryable(method, resource_path)
+
+    def retry_delay(self, method, resource_path, error, attempt):
+        """
+        Returns the seconds to wait before retrying a request of a
+        retryable route after `error` failed attempt number `attempt`, or
+        None if the error should be raised.
+        """
+        retry_delay = self._delay(error)
+        if retry_delay is None or attempt >= self.max_attempts or not self._withdraw():
+            if retry_delay is not None:
+                with self._lock:
+                    self.failures += 1
+            return None
+        delay = max(retry_delay, self.backoff(attempt))
+        logger.info("Retrying %s %s in %.2fs after %s (attempt %d of %d)",
+                    method, resource_path, delay, type(error).__name__, attempt + 1, self.max_attempts)
+        return delay
+
+    def call(self, method, resource_path, fn, *args, **kwargs):
+        """
+        Calls `fn`, retrying it according to the policy.
+
+        :param method: HTTP method of the request.
+        :param resource_path: path template of the request.
+        """
+        if not self.begin(method, resource_path):
+            return fn(*args, **kwargs)
+        attempt = 1
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                delay = self.retry_delay(method, resource_path, e, attempt)
+                if delay is None:
+                    raise
+                self.sleep(delay)
+                attempt += 1
+
+    def stats(self):
+        """
+        Returns the request, retry and failure counters.
+        """
+        with self._lock:
+            return {'requests': self.requests,
+                    'retries': self.retries,
+                    'failures': self.failures,
+                    'budget_exhausted': self.budget_exhausted}
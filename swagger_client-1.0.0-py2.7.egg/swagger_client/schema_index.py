@@ -0,0 +1,202 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Metric schema index built from `SchemaApi.get_metrics_schema`.
+"""
+
+from __future__ import absolute_import
+
+import difflib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from .apis.info_api import InfoApi
+from .apis.schema_api import SchemaApi
+from .configuration import Configuration
+
+
+class MetricSchemaIndex(object):
+    """
+    Metrics available per entity type, fetched once and cached.
+
+    Schemas are kept in memory and, when a cache directory is configured,
+    in a JSON file per platform and version (`InfoApi.get_version`), so
+    they are fetched again only after an upgrade.
+
+    >>> index = MetricSchemaIndex(schema_api, info_api)
+    >>> interval = index.select_interval('VirtualMachine', 'metric.cpu.usage.rate.average.percent',
+    >>>                                  start, end, max_points=300)
+
+    :param schema_api: SchemaApi used to fetch the schemas.
+    :param info_api: InfoApi used to fetch the platform version.
+    :param cache_dir: directory of the on-disk cache, defaults to
+        `Configuration.cache_dir`; None disables it.
+    """
+
+    def __init__(self, schema_api=None, info_api=None, cache_dir=None):
+        self.schema_api = schema_api or SchemaApi()
+        self.info_api = info_api or InfoApi(self.schema_api.api_client)
+        self.cache_dir = cache_dir if cache_dir is not None else Configuration().cache_dir
+        self._version = None
+        # entity type to the schema dicts, as returned by the server
+        self._schemas = None
+        self._metrics = {}
+        # entity types being fetched, other threads wait for the event
+        self._fetching = {}
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        """
+        Gets the platform API version the cache is keyed by.
+        """
+        if self._version is None:
+            self._version = self.info_api.get_version().api_version
+        return self._version
+
+    @property
+    def cache_file(self):
+        """
+        Gets the path of the on-disk cache, or None.
+        """
+        if not self.cache_dir:
+            return None
+        platform = hashlib.sha256(self.schema_api.api_client.host.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, 'metrics-schema-%s-%s.json' % (platform, self.version))
+
+    def metrics(self, entity_type):
+        """
+        Returns the metrics available for an entity type.
+
+        :param entity_type: entity type, e.g. 'VirtualMachine'.
+        :return: dict of metric name to `MetricSchema`.
+        """
+        try:
+            return self._metrics[entity_type]
+        except KeyError:
+            pass
+        # no lock is held across API calls, the version is fetched here
+        cache_file = self.cache_file
+        while True:
+            with self._lock:
+                if entity_type in self._metrics:
+                    return self._metrics[entity_type]
+                fetching = self._fetching.get(entity_type)
+                if fetching is None:
+                    fetching = self._fetching[entity_type] = threading.Event()
+                    break
+            fetching.wait()
+        try:
+            with self._lock:
+                if self._schemas is None:
+                    self._schemas = self._load(cache_file)
+                items = self._schemas.get(entity_type)
+            if items is None:
+                response = self.schema_api.get_metrics_schema(entity_type, _response_mode='dict')
+                items = response.get('results') or []
+                with self._lock:
+                    if self._schemas is None:
+                        # invalidated meanwhile
+                        self._schemas = {}
+                    self._schemas[entity_type] = items
+                    self._save(cache_file)
+            deserialize = self.schema_api.api_client.deserializer('MetricSchema')
+            metrics = dict((item['metric'], deserialize(item)) for item in items)
+            with self._lock:
+                self._metrics[entity_type] = metrics
+            return metrics
+        finally:
+            with self._lock:
+                del self._fetching[entity_type]
+            fetching.set()
+
+    def schema(self, entity_type, metric):
+        """
+        Returns the `MetricSchema` of a metric.
+
+        :raises ValueError: if the entity type has no such metric.
+        """
+        metrics = self.metrics(entity_type)
+        try:
+            return metrics[metric]
+        except KeyError:
+            close = difflib.get_close_matches(metric, list(metrics), n=3)
+            raise ValueError(
+                "Unknown metric `{0}` for entity type `{1}`{2}"
+                .format(metric, entity_type, ", did you mean {0}?".format(', '.join(close)) if close else '')
+            )
+
+    def validate(self, entity_type, metric, interval=None):
+        """
+        Checks a metric request before sending it.
+
+        :raises ValueError: if the metric does not exist for the entity
+            type or does not support the interval.
+        """
+        schema = self.schema(entity_type, metric)
+        if interval is not None and schema.intervals and interval not in schema.intervals:
+            raise ValueError(
+                "Invalid interval ({0}) for metric `{1}`, must be one of {2}"
+                .format(interval, metric, sorted(schema.intervals))
+            )
+        return schema
+
+    def select_interval(self, entity_type, metric, start, end, max_points):
+        """
+        Picks the interval of a metric for a time range and point budget.
+
+        This is the finest interval that keeps the number of points within
+        `max_points`, not the coarsest one: the budget bounds the response
+        size and within it the most detailed series is the most useful.
+        When no interval is within budget the coarsest one is returned.
+
+        :param start: start time in epoch seconds.
+        :param end: end time in epoch seconds.
+        :param max_points: maximum number of points wanted.
+        :return: interval in seconds.
+        """
+        intervals = sorted(self.schema(entity_type, metric).intervals or [])
+        if not intervals:
+            raise ValueError("No interval known for metric `{0}`".format(metric))
+        for interval in intervals:
+            if (end - start) // interval + 1 <= max_points:
+                return interval
+        return intervals[-1]
+
+    def invalidate(self):
+        """
+        Drops the cached schemas, in memory and on disk.
+        """
+        cache_file = self.cache_file
+        with self._lock:
+            self._version = None
+            self._schemas = None
+            self._metrics = {}
+            if cache_file and os.path.exists(cache_file):
+                os.remove(cache_file)
+
+    def _load(self, cache_file):
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file) as f:
+                    return json.load(f)
+            except ValueError:
+                # corrupt cache, fetch again
+                pass
+        return {}
+
+    def _save(self, cache_file):
+        if not cache_file:
+            return
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        # write to a temporary file first so readers never see a partial file
+        fd, path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self._schemas, f)
+        getattr(os, 'replace', os.rename)(path, cache_file)
@@ -0,0 +1,212 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Parallel search over disjoint shards of a `SearchRequest`.
+"""
+
+from __future__ import absolute_import
+
+import copy
+import heapq
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from six.moves import queue
+
+from .apis.search_api import SearchApi
+from .models.time_range import TimeRange
+from .pagination import PageIterator, _page_field
+
+_DONE = object()
+
+
+def split_time_range(time_range, shards):
+    """
+    Splits a time range into consecutive, equally long ranges.
+
+    Each range starts where the previous one ends, entities at a boundary
+    may be returned by both shards.
+
+    :param time_range: TimeRange with start_time and end_time set.
+    :param shards: number of ranges.
+    :return: list of TimeRange, fewer than `shards` for very short ranges.
+    """
+    if time_range is None or time_range.start_time is None or time_range.end_time is None:
+        raise ValueError("A time_range with start_time and end_time is required to shard by time")
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    start, end = time_range.start_time, time_range.end_time
+    shards = max(1, min(shards, end - start))
+    bounds = [start + (end - start) * i // shards for i in range(shards)] + [end]
+    return [TimeRange(start_time=bounds[i], end_time=bounds[i + 1]) for i in range(shards)]
+
+
+class ShardedSearch(object):
+    """
+    Walks several cursors of one search concurrently.
+
+    The request is split into disjoint shards, by default equal parts of
+    its `time_range`, or one shard per filter of `filters`, and the cursor
+    of every shard is walked on its own thread. Results are merged and, by
+    default, de-duplicated by `entity_id`.
+
+    With `ordered`, results are yielded by ascending `time`. Time range
+    shards are emitted in time order and the results of each shard are
+    sorted, while later shards keep fetching in the background. Filter
+    shards overlap in time, their sorted results are merged once every
+    shard is complete. This buffers whole shards in memory.
+
+    >>> search = ShardedSearch(search_api, shards=8)
+    >>> for result in search.results(SearchRequest(entity_type='Flow', time_range=last_30_days)):
+    >>>     pprint(result.entity_id)
+
+    :param search_api: SearchApi used for the search calls.
+    :param shards: number of time range shards.
+    :param filters: filter expressions partitioning the results, e.g.
+        ["protocol = 'TCP'", "protocol != 'TCP'"]; each is combined with
+        the filter of the request and shards it instead of the time range.
+    :param dedupe: skip results whose entity_id was already yielded.
+    :param ordered: yield results by ascending time.
+    :param buffer_pages: pages fetched ahead of the consumer, in total.
+    """
+
+    def __init__(self, search_api=None, shards=4, filters=None, dedupe=True, ordered=False, buffer_pages=None):
+        self.search_api = search_api or SearchApi()
+        self.shards = shards
+        self.filters = list(filters) if filters else None
+        self.dedupe = dedupe
+        self.ordered = ordered
+        self.buffer_pages = buffer_pages or 2 * shards
+        # counters of the last search
+        self.pages = 0
+        self.duplicates = 0
+
+    def shard_requests(self, request):
+        """
+        Returns the requests of the shards, copies of `request`.
+        """
+        shards = []
+        if self.filters:
+            for shard_filter in self.filters:
+                shard = copy.deepcopy(request)
+                shard.cursor = None
+                shard.filter = "({0}) and ({1})".format(request.filter, shard_filter) \
+                    if request.filter else shard_filter
+                shards.append(shard)
+        else:
+            for time_range in split_time_range(request.time_range, self.shards):
+                shard = copy.deepcopy(request)
+                shard.cursor = None
+                shard.time_range = time_range
+                shards.append(shard)
+        return shards
+
+    def _walk(self, index, request, pages, closed):
+        """
+        Worker loop of a shard, forwards its pages and errors to `pages`.
+        """
+        def put(item):
+            while not closed.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+        try:
+            for page in PageIterator(self.search_api.search_entities, body=request, prefetch=0):
+                if closed.is_set():
+                    return
+                put((index, page, None))
+        except Exception as e:
+            put((index, None, e))
+        finally:
+            put((index, _DONE, None))
+
+    def iter_pages(self, request):
+        """
+        Yields (shard index, page) as the pages of the shards arrive, and
+        (shard index, None) when a shard is complete.
+        """
+        requests = self.shard_requests(request)
+        pages = queue.Queue(maxsize=self.buffer_pages)
+        closed = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(requests))
+        try:
+            for index, shard in enumerate(requests):
+                executor.submit(self._walk, index, shard, pages, closed)
+            remaining = len(requests)
+            while remaining:
+                index, page, error = pages.get()
+                if error is not None:
+                    raise error
+                if page is _DONE:
+                    remaining -= 1
+                    yield index, None
+                else:
+                    self.pages += 1
+                    yield index, page
+        finally:
+            closed.set()
+            executor.shutdown(wait=False)
+
+    def results(self, request):
+        """
+        Yields the results of every shard.
+
+        :param request: SearchRequest, its cursor is ignored.
+        :return: generator of `EntityIdWithTime`.
+        """
+        self.pages = 0
+        self.duplicates = 0
+        seen = set()
+
+        def unique(results):
+            for result in results:
+                if self.dedupe:
+                    entity_id = _page_field(result, 'entity_id')
+                    if entity_id in seen:
+                        self.duplicates += 1
+                        continue
+                    seen.add(entity_id)
+                yield result
+
+        if not self.ordered:
+            for index, page in self.iter_pages(request):
+                if page is not None:
+                    for result in unique(_page_field(page, 'results') or []):
+                        yield result
+            return
+
+        def by_time(index, shard_results):
+            # (time, shard, position) keys, results are never compared
+            return [(_page_field(result, 'time') or 0, index, position, result)
+                    for position, result in enumerate(shard_results)]
+
+        buffers = {}
+        if self.filters:
+            # filter shards interleave in time, merge them once all are known
+            for index, page in self.iter_pages(request):
+                if page is not None:
+                    buffers.setdefault(index, []).extend(_page_field(page, 'results') or [])
+            merged = heapq.merge(*[sorted(by_time(index, shard_results))
+                                   for index, shard_results in buffers.items()])
+            for result in unique(item[-1] for item in merged):
+                yield result
+            return
+
+        # time range shards are in ascending time order, emit them one after the other
+        complete = set()
+        next_shard = 0
+        for index, page in self.iter_pages(request):
+            if page is not None:
+                buffers.setdefault(index, []).extend(_page_field(page, 'results') or [])
+                continue
+            complete.add(index)
+            while next_shard in complete:
+                shard_results = buffers.pop(next_shard, [])
+                shard_results.sort(key=lambda r: _page_field(r, 'time') or 0)
+                for result in unique(shard_results):
+                    yield result
+                next_shard += 1
@@ -0,0 +1,222 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Incremental parsing of large JSON responses.
+"""
+
+from __future__ import absolute_import
+
+import codecs
+import json
+
+from six import text_type
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ':,]}'
+
+
+class _Buffer(object):
+    """
+    Text buffer over a stream of byte chunks.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = u''
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self):
+        """
+        Appends the next chunk, returns False at the end of the stream.
+        """
+        if self.exhausted:
+            return False
+        # drop what has been consumed so the buffer stays small
+        if self.pos:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        for chunk in self.chunks:
+            if not chunk:
+                continue
+            self.text += chunk if isinstance(chunk, text_type) else self.decoder.decode(chunk)
+            return True
+        self.text += self.decoder.decode(b'', final=True)
+        self.exhausted = True
+        return False
+
+    def peek(self):
+        """
+        Skips whitespace and returns the next character, or '' at the end.
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars):
+        """
+        Consumes the next character, which must be one of `chars`.
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError("Expected one of %r at offset %d, got %r" % (chars, self.pos, char))
+        self.pos += 1
+        return char
+
+    def value(self, decoder):
+        """
+        Decodes the next JSON value, reading chunks until it is complete.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.text, self.pos)
+            except ValueError:
+                if not self.fill():
+                    raise
+                continue
+            # a number may continue in the next chunk, so a value counts as
+            # complete only once the delimiter following it has been read
+            if (end == len(self.text) or self.text[end] not in _DELIMITERS) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks, key='results', fields=None, decoder=None):
+    """
+    Yields the items of the array `key` of a JSON object, parsing the
+    chunks incrementally.
+
+    Only the item being decoded is held in memory, not the whole document.
+    The other top level members are decoded as a whole and stored into
+    `fields`; those following the array are available once the generator
+    is exhausted.
+
+    >>> for item in iter_json_array(response.stream(), 'results'):
+    >>>     pprint(item)
+
+    :param chunks: iterable of bytes or text.
+    :param key: name of the array member.
+    :param fields: dict receiving the other members of the object.
+    :param decoder: json.JSONDecoder used for the values.
+    """
+    buf = _Buffer(chunks)
+    decoder = decoder or json.JSONDecoder()
+    fields = {} if fields is None else fields
+
+    buf.expect('{')
+    if buf.peek() == '}':
+        return
+    while True:
+        name = buf.value(decoder)
+        buf.expect(':')
+        if name == key and buf.peek() == '[':
+            buf.pos += 1
+            if buf.peek() == ']':
+                buf.pos += 1
+            else:
+                while True:
+                    yield buf.value(decoder)
+                    if buf.expect(',]') == ']':
+                        break
+        else:
+            fields[name] = buf.value(decoder)
+        if buf.expect(',}') == '}':
+            return
+
+
+class ResultStream(object):
+    """
+    Iterates over the items of a large response without loading it.
+
+    The response must have been requested with `_preload_content=False`.
+    Items are parsed from the socket as they arrive and optionally
+    deserialized one at a time, so memory use does not depend on the size
+    of the response. The connection is released once the stream is
+    exhausted or closed.
+
+    >>> stream = stream_results(entities_api.entities_fetch_post, body=request,
+    >>>                         item_type='EntityWithTime')
+    >>> for entity in stream:
+    >>>     pprint(entity)
+
+    :param response: urllib3.HTTPResponse.
+    :param key: name of the array to stream, 'results' for bulk fetch and
+        search, 'pointlist' for metrics.
+    :param deserialize: function applied to each item, e.g. a deserializer
+        of ApiClient. Items are returned as parsed JSON when None.
+    :param chunk_size: number of bytes read from the socket at a time.
+    """
+
+    def __init__(self, response, key='results', deserialize=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.response = response
+        self.key = key
+        self.deserialize = deserialize
+        self.chunk_size = chunk_size
+        # other members of the response, e.g. `cursor` or `total_count`
+        self.fields = {}
+        self.count = 0
+        self.exhausted = False
+
+    def __iter__(self):
+        try:
+            chunks = self.response.stream(self.chunk_size)
+            for item in iter_json_array(chunks, self.key, self.fields):
+                self.count += 1
+                if self.deserialize is not None and item is not None:
+                    item = self.deserialize(item)
+                yield item
+            # read up to the end of the body so the connection can be reused
+            for _ in chunks:
+                pass
+            self.exhausted = True
+        finally:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Releases the connection. It is closed rather than reused when the
+        response has not been read to the end.
+        """
+        if not self.exhausted:
+            self.response.close()
+        self.response.release_conn()
+
+
+def stream_results(api_method, *args, **kwargs):
+    """
+    Calls an API method and streams the items of an array of its response.
+
+    :param api_method: bound method of a generated API class.
+    :param key: name of the array, default 'results'.
+    :param item_type: swagger type of the items, e.g. 'EntityWithTime';
+        items are returned as parsed JSON when omitted.
+    :param chunk_size: number of bytes read from the socket at a time.
+    :return: ResultStream.
+    """
+    key = kwargs.pop('key', 'results')
+    item_type = kwargs.pop('item_type', None)
+    chunk_size = kwargs.pop('chunk_size', DEFAULT_CHUNK_SIZE)
+    kwargs['_preload_content'] = False
+    kwargs['_return_http_data_only'] = True
+    deserialize = None
+    if item_type is not None:
+        deserialize = api_method.__self__.api_client.deserializer(item_type)
+    response = api_method(*args, **kwargs)
+    return ResultStream(response, key, deserialize, chunk_size)
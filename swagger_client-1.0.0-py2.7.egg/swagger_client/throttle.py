@@ -0,0 +1,233 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Client side rate limiting and adaptive concurrency control.
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+from email.utils import mktime_tz, parsedate_tz
+
+from .configuration import Configuration
+from .rest import ApiException
+
+# Status codes the platform answers with when it is overloaded.
+THROTTLE_STATUS_CODES = frozenset([429, 503])
+
+
+def retry_after(headers, now=None):
+    """
+    Returns the delay in seconds requested by a `Retry-After` header, or None.
+
+    :param headers: response headers.
+    :param now: current time in epoch seconds, for HTTP-date values.
+    """
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    date = parsedate_tz(value)
+    if date is None:
+        return None
+    return max(0.0, mktime_tz(date) - (time.time() if now is None else now))
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket, limits the average rate of requests.
+
+    :param rate: tokens added per second.
+    :param burst: bucket size, the number of requests that may be sent at
+        once after an idle period. Defaults to `rate`, at least 1.
+    :param clock: function returning the current time in seconds.
+    :param sleep: function sleeping for a number of seconds.
+    """
+
+    def __init__(self, rate, burst=None, clock=time.time, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Takes a token and returns the seconds to wait before using it.
+        """
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # tokens may go negative, later callers queue behind earlier ones
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Takes a token, waiting until one is available.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            self.sleep(delay)
+
+
+class AdaptiveConcurrency(object):
+    """
+    Additive increase, multiplicative decrease limit of requests in flight.
+
+    The limit grows by about one for every `limit` successful requests and
+    is multiplied by `backoff` when a request is throttled (429/503) or
+    slower than `latency_target`. Requests started before the last
+    decrease do not decrease it again, so a burst of failures from one
+    window only counts once. A `Retry-After` delay pauses every request.
+
+    :param max_limit: upper bound of the limit, defaults to
+        `Configuration.connection_pool_maxsize`.
+    :param min_limit: lower bound of the limit.
+    :param initial: starting limit, defaults to half of `max_limit`.
+    :param latency_target: seconds, slower requests decrease the limit.
+        None only reacts to throttling status codes.
+    :param backoff: factor applied to the limit on decrease.
+    :param clock: function returning the current time in seconds.
+    """
+
+    def __init__(self, max_limit=None, min_limit=1, initial=None, latency_target=None, backoff=0.5,
+                 clock=time.time):
+        if max_limit is None:
+            max_limit = Configuration().connection_pool_maxsize
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(initial if initial is not None else max(min_limit, max_limit // 2))
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.clock = clock
+        self.in_flight = 0
+        self.throttled = 0
+        self.resume_at = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """
+        Waits for a free slot, returns the start time to pass to `release`.
+        """
+        with self._cond:
+            while True:
+                wait = self.resume_at - self.clock()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    break
+                self._cond.wait(wait if wait > 0 else None)
+            self.in_flight += 1
+            return self.clock()
+
+    def release(self, started, throttled=False, delay=None, adapt=True):
+        """
+        Frees a slot and adapts the limit.
+
+        :param started: value returned by `acquire`.
+        :param throttled: True if the server throttled the request.
+        :param delay: seconds requested by a `Retry-After` header.
+        :param adapt: False leaves the limit unchanged, e.g. when the
+            request failed without a response.
+        """
+        with self._cond:
+            now = self.clock()
+            self.in_flight -= 1
+            self._cond.notify_all()
+            if not adapt:
+                return
+            slow = self.latency_target is not None and now - started > self.latency_target
+            if throttled or slow:
+                if throttled:
+                    self.throttled += 1
+                if started >= self._last_decrease:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease = now
+                if delay:
+                    self.resume_at = max(self.resume_at, now + delay)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+
+class Throttle(object):
+    """
+    Rate limit and adaptive concurrency limit of an ApiClient.
+
+    Every request of the client, whichever API class sends it, first takes
+    a token from the bucket and then a slot from the concurrency limit.
+
+    >>> api_client.throttle = Throttle(rate=50, latency_target=2.0)
+
+    :param rate: requests per second, None for no rate limit.
+    :param burst: requests that may be sent at once, defaults to `rate`.
+    :param max_concurrency: upper bound of requests in flight, defaults
+        to `Configuration.connection_pool_maxsize`.
+    :param latency_target: seconds, slower requests reduce the concurrency.
+    :param adaptive: False disables the concurrency limit.
+    """
+
+    def __init__(self, rate=None, burst=None, max_concurrency=None, latency_target=None, adaptive=True):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.concurrency = None
+        if adaptive:
+            self.concurrency = AdaptiveConcurrency(max_limit=max_concurrency, latency_target=latency_target)
+
+    @classmethod
+    def from_configuration(cls):
+        """
+        Builds the throttle configured in `Configuration`, or returns None.
+        """
+        config = Configuration()
+        if not config.rate_limit and not config.adaptive_concurrency:
+            return None
+        return cls(rate=config.rate_limit, burst=config.rate_limit_burst,
+                   latency_target=config.latency_target, adaptive=config.adaptive_concurrency)
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Calls `fn` within the rate and concurrency limits.
+        """
+        if self.bucket is not None:
+            self.bucket.acquire()
+        if self.concurrency is None:
+            return fn(*args, **kwargs)
+        started = self.concurrency.acquire()
+        try:
+            result = fn(*args, **kwargs)
+        except ApiException as e:
+            throttled = e.status in THROTTLE_STATUS_CODES
+            self.concurrency.release(started, throttled, retry_after(e.headers) if throttled else None)
+            raise
+        except Exception:
+            self.concurrency.release(started, adapt=False)
+            raise
+        self.concurrency.release(started)
+        return result
+
+    def stats(self):
+        """
+        Returns the current limit, requests in flight and throttled count.
+        """
+        if self.concurrency is None:
+            return {}
+        return {'limit': int(self.concurrency.limit),
+                'in_flight': self.concurrency.in_flight,
+                'throttled': self.concurrency.throttled}
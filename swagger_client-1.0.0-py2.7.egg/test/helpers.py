@@ -0,0 +1,105 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    Fake transports and a local HTTP server shared by the unit tests.
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import threading
+
+from six.moves import BaseHTTPServer, http_client, socketserver
+
+
+class Response(object):
+    """
+    Stands in for the urllib3 response wrapped by RESTResponse.
+    """
+
+    def __init__(self, status=200, data='{}', headers=None):
+        self.status = status
+        self.reason = http_client.responses.get(status, 'Error')
+        self.data = data
+        self.raw_data = data.encode('utf8')
+        self.headers = headers or {}
+
+    def getheaders(self):
+        return self.headers
+
+
+class StubRESTClient(object):
+    """
+    Stands in for RESTClientObject, subclasses answer `request`.
+    """
+
+    def request(self, method, url, **kwargs):
+        raise NotImplementedError
+
+    def GET(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def HEAD(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def OPTIONS(self, url, **kwargs):
+        return self.request('OPTIONS', url, **kwargs)
+
+    def DELETE(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def POST(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def PUT(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def PATCH(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Keep-alive request handler that does not log.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self, status, body, content_type='application/json'):
+        """
+        Sends a response, `body` is bytes or a payload encoded as JSON.
+        """
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('utf8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    Serves `handler` on a free local port from a daemon thread until
+    `stop` is called.
+    """
+    daemon_threads = True
+
+    def __init__(self, handler):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), handler)
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d' % self.server_address[1]
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+import swagger_client
+from swagger_client import AggregationPlanner, time_buckets
+from swagger_client.aggregation import DAY
+
+BYTES = 'flow.totalBytes.delta.summation.bytes'
+
+
+class FakeSearchApi(object):
+    """
+    Answers SUM with the bucket start and MAX with 1.
+    """
+
+    def __init__(self, host='https://vrni'):
+        self.api_client = swagger_client.ApiClient(host=host)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def aggregate_search_results(self, body=None, **kwargs):
+        with self.lock:
+            self.requests.append((body.filter, body.time_range.start_time,
+                                  [(a.field, a.aggregation_type) for a in body.aggregations]))
+        values = {'SUM': float(body.time_range.start_time), 'MAX': 1.0}
+        return {'aggregations': [{'field': a.field, 'aggregation_type': a.aggregation_type,
+                                  'value': values[a.aggregation_type]} for a in body.aggregations],
+                'total_count': 1}
+
+
+class TestTimeBuckets(unittest.TestCase):
+    """ time_buckets unit tests """
+
+    def testDays(self):
+        self.assertEqual(time_buckets(DAY + 100, 3 * DAY + 5),
+                         [(DAY, 2 * DAY), (2 * DAY, 3 * DAY), (3 * DAY, 3 * DAY + 5)])
+
+
+class TestAggregationPlanner(unittest.TestCase):
+    """ AggregationPlanner unit tests """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.search_api = FakeSearchApi()
+        self.now = [10 * DAY + 100]
+        self.buckets = time_buckets(7 * DAY, 10 * DAY + 100)
+        self.filters = ["destination_l2_network.name = 'vlan-%d'" % i for i in range(3)]
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def planner(self, cache_dir=None):
+        return AggregationPlanner(self.search_api, cache_dir=cache_dir or self.dir, settle=60,
+                                  clock=lambda: self.now[0])
+
+    def testPlanMergesAggregationsAndDuplicates(self):
+        queries = self.planner().plan('Flow', self.filters + self.filters[:1], self.buckets,
+                                      [(BYTES, 'SUM'), swagger_client.Aggregation(BYTES, 'MAX'), (BYTES, 'SUM')])
+        self.assertEqual(len(queries), 3 * 4)
+        self.assertEqual(queries[0].aggregations, ((BYTES, 'SUM'), (BYTES, 'MAX')))
+
+    def testRun(self):
+        planner = self.planner()
+        table = planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM'), (BYTES, 'MAX')])
+        self.assertEqual(len(table['value']), 3 * 4 * 2)
+        self.assertEqual(table['filter'][:4], [self.filters[0]] * 4)
+        self.assertEqual(table['start_time'][:4], [7 * DAY, 7 * DAY, 8 * DAY, 8 * DAY])
+        self.assertEqual(table['aggregation_type'][:2], ['SUM', 'MAX'])
+        self.assertEqual(table['value'][:4], [7.0 * DAY, 1.0, 8.0 * DAY, 1.0])
+        self.assertEqual(planner.requests, 12)
+
+    def testClosedBucketsAreCached(self):
+        aggregations = [(BYTES, 'SUM')]
+        first = self.planner().run('Flow', self.filters, self.buckets, aggregations)
+        self.assertTrue(os.path.exists(os.path.join(self.dir, 'aggregations.json')))
+        del self.search_api.requests[:]
+
+        # a day later, in a new process
+        self.now[0] += DAY
+        planner = self.planner()
+        buckets = time_buckets(7 * DAY, self.now[0])
+        table = planner.run('Flow', self.filters, buckets, aggregations)
+        # the open bucket of the first run and the new bucket
+        self.assertEqual(sorted(set(r[1] for r in self.search_api.requests)), [10 * DAY, 11 * DAY])
+        self.assertEqual(planner.cache_hits, 9)
+        self.assertEqual(table['value'][:3], first['value'][:3])
+
+    def testCacheSharedByPlatforms(self):
+        self.planner().run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        other = FakeSearchApi(host='https://other-vrni')
+        planner = AggregationPlanner(other, cache_dir=self.dir, settle=60, clock=lambda: self.now[0])
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        self.assertEqual((planner.requests, planner.cache_hits), (12, 0))
+        # both platforms' results are kept
+        planner = self.planner()
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        self.assertEqual(planner.cache_hits, 9)
+
+    def testCacheSharedByUsers(self):
+        self.search_api.api_client.set_default_header('Authorization', 'NetworkInsight token-a')
+        self.planner().run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        other = FakeSearchApi()
+        other.api_client.set_default_header('Authorization', 'NetworkInsight token-b')
+        planner = AggregationPlanner(other, cache_dir=self.dir, settle=60, clock=lambda: self.now[0])
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        self.assertEqual((planner.requests, planner.cache_hits), (12, 0))
+        planner = self.planner()
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        self.assertEqual(planner.cache_hits, 9)
+
+    def testMemoryCache(self):
+        planner = AggregationPlanner(self.search_api, cache_dir='', settle=60, clock=lambda: self.now[0])
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        self.assertEqual(planner.requests, 3)
+        self.assertIsNone(planner.cache_file)
+
+    def testInvalidate(self):
+        planner = self.planner()
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        planner.invalidate()
+        planner.run('Flow', self.filters, self.buckets, [(BYTES, 'SUM')])
+        self.assertEqual(planner.requests, 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
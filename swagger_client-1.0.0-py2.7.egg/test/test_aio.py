@@ -0,0 +1,164 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import threading
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+
+from . import helpers
+
+try:
+    import asyncio
+    from unittest import mock
+    from swagger_client.aio import AsyncApiClient, AsyncEntitiesApi, AsyncSearchApi
+except (ImportError, SyntaxError):
+    AsyncApiClient = None
+
+
+class Handler(helpers.Handler):
+    # requests of the 'flaky' vm answered 503 before it is served
+    failures = 0
+
+    def do_GET(self):
+        vm_id = self.path.rsplit('/', 1)[1]
+        if vm_id == 'missing':
+            self.respond(404, {'code': 404, 'message': 'not found'})
+        elif vm_id == 'secure' and self.headers.get('Authorization') != 'NetworkInsight token-2':
+            self.respond(401, {'code': 401, 'message': 'unauthorized'})
+        elif vm_id == 'flaky' and Handler.failures:
+            Handler.failures -= 1
+            self.respond(503, {'code': 503, 'message': 'unavailable'})
+        else:
+            self.respond(200, {'entity_id': vm_id, 'entity_type': 'VirtualMachine', 'name': 'vm-' + vm_id})
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.respond(200, {'results': [{'entity_id': '1', 'entity_type': request['entity_type']}],
+                           'total_count': 1})
+
+
+@unittest.skipIf(AsyncApiClient is None, "asyncio client requires Python 3.5+ and aiohttp")
+class TestAsyncApiClient(unittest.TestCase):
+    """ AsyncApiClient unit tests """
+
+    def setUp(self):
+        self.server = helpers.Server(Handler)
+        self.host = self.server.url + '/api/ni'
+
+    def tearDown(self):
+        self.server.stop()
+
+    def run_async(self, coroutine_function, setup=None):
+        async def run():
+            async with AsyncApiClient(host=self.host, max_concurrency=4) as api_client:
+                if setup is not None:
+                    setup(api_client)
+                return await coroutine_function(api_client)
+        return asyncio.new_event_loop().run_until_complete(run())
+
+    def testGatherGetCalls(self):
+        async def fetch(api_client):
+            entities_api = AsyncEntitiesApi(api_client)
+            return await asyncio.gather(*[entities_api.get_vm(str(i)) for i in range(20)])
+        vms = self.run_async(fetch)
+        self.assertEqual([vm.name for vm in vms], ['vm-%d' % i for i in range(20)])
+        self.assertIsInstance(vms[0], swagger_client.VirtualMachine)
+
+    def testPostWithBody(self):
+        async def search(api_client):
+            request = swagger_client.SearchRequest(entity_type='VirtualMachine')
+            return await AsyncSearchApi(api_client).search_entities(body=request)
+        response = self.run_async(search)
+        self.assertEqual(response.results[0].entity_type, 'VirtualMachine')
+
+    def testErrorStatus(self):
+        async def fetch(api_client):
+            return await AsyncEntitiesApi(api_client).get_vm('missing')
+        with self.assertRaises(ApiException) as context:
+            self.run_async(fetch)
+        self.assertEqual(context.exception.status, 404)
+
+    def testTokenRenewedAfter401(self):
+        tokens = []
+        loop_threads = []
+
+        def authenticate():
+            loop_threads.append(threading.current_thread())
+            tokens.append('token-%d' % (len(tokens) + 1))
+            return {'token': tokens[-1], 'expiry': None}
+
+        def setup(api_client):
+            api_client.token_manager = swagger_client.TokenManager(authenticate)
+
+        async def fetch(api_client):
+            return await AsyncEntitiesApi(api_client).get_vm('secure')
+        self.assertEqual(self.run_async(fetch, setup).name, 'vm-secure')
+        self.assertEqual(tokens, ['token-1', 'token-2'])
+        # authentication never runs on the event loop thread
+        self.assertNotIn(threading.current_thread(), loop_threads)
+
+    def testRetryPolicyAndInstrumentation(self):
+        Handler.failures = 2
+        records = []
+
+        def setup(api_client):
+            api_client.retry_policy = swagger_client.RetryPolicy(max_attempts=3, backoff_factor=0.01)
+            api_client.instrumentation = swagger_client.Instrumentation(hooks=[records.append])
+
+        async def fetch(api_client):
+            return await AsyncEntitiesApi(api_client).get_vm('flaky')
+        self.assertEqual(self.run_async(fetch, setup).name, 'vm-flaky')
+        record, = records
+        self.assertEqual((record.operation, record.status_label, record.attempts),
+                         ('GET /entities/vms/{id}', '200', 3))
+
+    def testConditionalCache(self):
+        def setup(api_client):
+            api_client.conditional_cache = swagger_client.conditional.ConditionalCache()
+
+        async def fetch(api_client):
+            entities_api = AsyncEntitiesApi(api_client)
+            return [await entities_api.get_vm('1') for _ in range(2)]
+        first, second = self.run_async(fetch, setup)
+        # the unchanged body reuses the previous result
+        self.assertIs(first, second)
+
+    def testNoSynchronousTransport(self):
+        with mock.patch('swagger_client.api_client.RESTClientObject') as rest_client_object:
+            api_client = AsyncApiClient(host=self.host)
+        self.assertFalse(rest_client_object.called)
+        self.assertIsInstance(api_client.rest_client, swagger_client.aio.AsyncRESTClientObject)
+
+    def testTokenManagerLogsInWithSynchronousClient(self):
+        credential = swagger_client.UserCredential(username='admin@local', password='admin',
+                                                   domain={'domain_type': 'LOCAL'})
+        with self.assertRaises(TypeError):
+            swagger_client.TokenManager.for_credentials(AsyncApiClient(host=self.host), credential)
+        token_manager = swagger_client.TokenManager.for_credentials(swagger_client.ApiClient(host=self.host),
+                                                                    credential, cache=None)
+        self.assertIsNone(token_manager.token)
+
+    def testRequiresAsyncClient(self):
+        with self.assertRaises(TypeError):
+            AsyncEntitiesApi(swagger_client.ApiClient())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+from concurrent.futures import Future
+
+import swagger_client
+from swagger_client.rest import ApiException
+
+
+class FakeResponse(object):
+
+    def __init__(self, status, data, headers=None):
+        self.status = status
+        self.reason = 'OK' if status < 400 else 'Error'
+        self.data = data
+        self.raw_data = data.encode('utf8')
+        self.headers = headers or {}
+
+    def getheaders(self):
+        return self.headers
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+class FakeRESTClient(object):
+    """
+    Answers every GET on /entities/vms/{id} with a VM named after the id.
+    """
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def GET(self, url, headers=None, query_params=None, _preload_content=True, _request_timeout=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        vm_id = url.rsplit('/', 1)[1]
+        if vm_id == 'missing':
+            raise ApiException(status=404, reason='Not Found')
+        return FakeResponse(200, json.dumps({'entity_id': vm_id, 'entity_type': 'VirtualMachine',
+                                             'name': 'vm-' + vm_id}))
+
+
+class TestApiClient(unittest.TestCase):
+    """ ApiClient unit tests """
+
+    def setUp(self):
+        self.config = swagger_client.Configuration()
+        self.max_workers = self.config.executor_max_workers
+        self.config.executor_max_workers = 3
+        self.rest_client = FakeRESTClient(delay=0.01)
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.api_client.rest_client = self.rest_client
+        self.entities_api = swagger_client.EntitiesApi(self.api_client)
+
+    def tearDown(self):
+        self.api_client.shutdown()
+        self.config.executor_max_workers = self.max_workers
+
+    def testSubmit(self):
+        future = self.api_client.submit(self.entities_api.get_vm, '1')
+        self.assertEqual(future.result().name, 'vm-1')
+
+    def testCallbackRunsOnExecutor(self):
+        results = []
+        future = self.entities_api.get_vm('2', callback=results.append)
+        self.assertIsInstance(future, Future)
+        future.result()
+        self.assertEqual(results[0].name, 'vm-2')
+
+    def testMapCallsIsBounded(self):
+        ids = [str(i) for i in range(20)]
+        vms = list(self.api_client.map_calls(self.entities_api.get_vm, ids))
+        self.assertEqual([vm.name for vm in vms], ['vm-' + i for i in ids])
+        self.assertLessEqual(self.rest_client.max_in_flight, 3)
+
+    def testMapCallsUnordered(self):
+        ids = [str(i) for i in range(10)]
+        vms = self.api_client.map_calls(self.entities_api.get_vm, ids, ordered=False, max_in_flight=4)
+        self.assertEqual(sorted(vm.name for vm in vms), sorted('vm-' + i for i in ids))
+
+    def testMapCallsRaises(self):
+        with self.assertRaises(ApiException):
+            list(self.api_client.map_calls(self.entities_api.get_vm, ['1', 'missing', '2']))
+
+    def testAsCompleted(self):
+        futures = [self.api_client.submit(self.entities_api.get_vm, str(i)) for i in range(5)]
+        names = [f.result().name for f in self.api_client.as_completed(futures)]
+        self.assertEqual(sorted(names), ['vm-%d' % i for i in range(5)])
+
+    def testResponseModes(self):
+        self.assertEqual(self.entities_api.get_vm('3', _response_mode='dict'),
+                         {'entity_id': '3', 'entity_type': 'VirtualMachine', 'name': 'vm-3'})
+        self.assertEqual(json.loads(self.entities_api.get_vm('3', _response_mode='raw_bytes').decode('utf8')),
+                         {'entity_id': '3', 'entity_type': 'VirtualMachine', 'name': 'vm-3'})
+        self.api_client.response_mode = 'dict'
+        self.assertIsInstance(self.entities_api.get_vm('4'), dict)
+        self.assertIsInstance(self.entities_api.get_vm('4', _response_mode='model'), swagger_client.VirtualMachine)
+        with self.assertRaises(ValueError):
+            self.entities_api.get_vm('4', _response_mode='xml')
+
+    def testShutdownRecreatesExecutor(self):
+        executor = self.api_client.executor
+        self.api_client.shutdown()
+        self.assertIsNot(self.api_client.executor, executor)
+
+
+class TestDeserialization(unittest.TestCase):
+    """ ApiClient deserialization unit tests """
+
+    def setUp(self):
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+
+    def deserialize(self, data, response_type):
+        return self.api_client.deserialize(FakeResponse(200, json.dumps(data)), response_type)
+
+    def testPolymorphicEntities(self):
+        data = {'results': [
+            {'entity_id': '1', 'entity_type': 'VirtualMachine', 'time': 10,
+             'entity': {'entity_type': 'VirtualMachine', 'name': 'vm', 'vnics': [{'entity_id': 'n1'}]}},
+            {'entity_id': '2', 'entity_type': 'Flow', 'time': 10,
+             'entity': {'entity_type': 'Flow', 'name': 'flow', 'within_host': True, 'source_vm_tags': None}},
+        ]}
+        response = self.deserialize(data, 'BulkFetchResponse')
+        vm, flow = [r.entity for r in response.results]
+        self.assertIsInstance(vm, swagger_client.VirtualMachine)
+        self.assertEqual(vm.vnics[0].entity_id, 'n1')
+        self.assertIsInstance(flow, swagger_client.Flow)
+        self.assertIs(flow.within_host, True)
+        self.assertIsNone(flow.source_vm_tags)
+
+    def testContainersAndPrimitives(self):
+        self.assertEqual(self.deserialize([[1, 2.5], None], 'list[list[float]]'), [[1.0, 2.5], None])
+        self.assertEqual(self.deserialize({'a': 1}, 'dict(str, int)'), {'a': 1})
+        self.assertEqual(self.deserialize({'a': [1]}, 'object'), {'a': [1]})
+        self.assertEqual(self.deserialize('VirtualMachine', 'EntityType'), 'VirtualMachine')
+
+    def testDeserializersAreCached(self):
+        deserializer = self.api_client.deserializer('list[EntityIdWithTime]')
+        self.assertIs(self.api_client.deserializer('list[EntityIdWithTime]'), deserializer)
+        self.assertIn(swagger_client.EntityIdWithTime, self.api_client._deserializers)
+
+    def testUnknownModel(self):
+        with self.assertRaises(AttributeError):
+            self.api_client.deserializer('NoSuchModel')
+        self.assertEqual(self.api_client._compiling, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
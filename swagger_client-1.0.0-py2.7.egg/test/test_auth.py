@@ -0,0 +1,204 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.auth import TokenCache, TokenManager
+from swagger_client.rest import ApiException
+
+from .helpers import Response, StubRESTClient
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Authenticator(object):
+    """
+    Issues numbered tokens valid for `ttl` seconds.
+    """
+
+    def __init__(self, clock, ttl=1800):
+        self.clock = clock
+        self.ttl = ttl
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return swagger_client.Token(token='token-%d' % self.calls, expiry=int((self.clock() + self.ttl) * 1000))
+
+
+class TokenRESTClient(StubRESTClient):
+    """
+    Answers 401 unless the request carries one of the `valid` tokens.
+    """
+
+    def __init__(self, header='Authorization', prefix='NetworkInsight '):
+        self.header = header
+        self.prefix = prefix
+        self.valid = set()
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        value = (headers or {}).get(self.header)
+        self.requests.append(value)
+        if value is None or value[len(self.prefix):] not in self.valid:
+            raise ApiException(http_resp=Response(401, '{"code": 401}'))
+        return Response(200, json.dumps({'api_version': '1.1.0'}))
+
+
+class TestTokenManager(unittest.TestCase):
+    """ TokenManager unit tests """
+
+    def setUp(self):
+        self.clock = Clock()
+        self.authenticate = Authenticator(self.clock)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def manager(self, **kwargs):
+        kwargs.setdefault('clock', self.clock)
+        return TokenManager(self.authenticate, **kwargs)
+
+    def testRenewsBeforeExpiry(self):
+        manager = self.manager(refresh_margin=300)
+        self.assertEqual(manager.auth_headers(), {'Authorization': 'NetworkInsight token-1'})
+        self.clock.now += 1499
+        self.assertEqual(manager.get_token(), 'token-1')
+        self.clock.now += 2
+        self.assertEqual(manager.get_token(), 'token-2')
+
+    def testShortLivedTokenRenewedAtHalfLife(self):
+        self.authenticate.ttl = 60
+        manager = self.manager(refresh_margin=300)
+        manager.get_token()
+        self.clock.now += 29
+        self.assertEqual(manager.get_token(), 'token-1')
+        self.clock.now += 2
+        self.assertEqual(manager.get_token(), 'token-2')
+
+    def testSaasHeader(self):
+        manager = self.manager(header='csp-auth-token')
+        self.assertEqual(manager.auth_headers(), {'csp-auth-token': 'token-1'})
+        config = swagger_client.Configuration()
+        config.deployment_type = 'on_saas'
+        try:
+            self.assertEqual(self.manager().header, 'csp-auth-token')
+        finally:
+            config.deployment_type = 'on_prem'
+
+    def testRefreshOfRejectedTokenOnly(self):
+        manager = self.manager()
+        manager.get_token()
+        self.assertEqual(manager.refresh(rejected='NetworkInsight token-1'), 'token-2')
+        # a thread still holding the first token reuses the new one
+        self.assertEqual(manager.refresh(rejected='NetworkInsight token-1'), 'token-2')
+        self.assertEqual(self.authenticate.calls, 2)
+
+    def testRetriesOnceAfter401(self):
+        api_client = swagger_client.ApiClient(host='https://vrni')
+        rest = api_client.rest_client = TokenRESTClient()
+        api_client.token_manager = self.manager()
+        info_api = swagger_client.InfoApi(api_client)
+        rest.valid.add('token-1')
+        self.assertEqual(info_api.get_version().api_version, '1.1.0')
+        # the server revokes the token
+        rest.valid = set(['token-2'])
+        self.assertEqual(info_api.get_version().api_version, '1.1.0')
+        self.assertEqual(rest.requests, ['NetworkInsight token-1', 'NetworkInsight token-1',
+                                         'NetworkInsight token-2'])
+        # a token rejected again is not retried twice
+        rest.valid = set()
+        with self.assertRaises(ApiException) as raised:
+            info_api.get_version()
+        self.assertEqual(raised.exception.status, 401)
+        self.assertEqual(len(rest.requests), 5)
+
+    def testConcurrentRefreshesAuthenticateOnce(self):
+        api_client = swagger_client.ApiClient(host='https://vrni')
+        rest = api_client.rest_client = TokenRESTClient()
+        api_client.token_manager = self.manager()
+        api_client.token_manager.get_token()
+        rest.valid = set(['token-2'])
+        info_api = swagger_client.InfoApi(api_client)
+        threads = [threading.Thread(target=info_api.get_version) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.authenticate.calls, 2)
+
+    def testBackgroundRefresh(self):
+        self.authenticate = Authenticator(time.time, ttl=0.4)
+        manager = TokenManager(self.authenticate)
+        with manager:
+            deadline = time.time() + 5
+            while self.authenticate.calls < 3 and time.time() < deadline:
+                time.sleep(0.05)
+        self.assertFalse(manager.running)
+        self.assertGreaterEqual(self.authenticate.calls, 3)
+
+    def testCacheSharedBetweenProcesses(self):
+        path = os.path.join(self.directory, 'tokens', 'tokens.json')
+        first = self.manager(cache=TokenCache(path), cache_key='admin')
+        self.assertEqual(first.get_token(), 'token-1')
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+        second = self.manager(cache=TokenCache(path), cache_key='admin')
+        self.assertEqual(second.get_token(), 'token-1')
+        self.assertEqual(second.cache_hits, 1)
+        other = self.manager(cache=TokenCache(path), cache_key='other')
+        self.assertEqual(other.get_token(), 'token-2')
+        # a rejected token is not taken from the cache again
+        self.assertEqual(second.refresh(rejected='NetworkInsight token-1'), 'token-3')
+        self.assertEqual(self.manager(cache=TokenCache(path), cache_key='admin').get_token(), 'token-3')
+        self.assertEqual(self.authenticate.calls, 3)
+
+    @unittest.skipUnless(os.name == 'posix', 'file permissions')
+    def testCacheReadableByOthersIsIgnored(self):
+        path = os.path.join(self.directory, 'tokens.json')
+        self.manager(cache=TokenCache(path), cache_key='admin').get_token()
+        os.chmod(path, 0o644)
+        self.assertEqual(self.manager(cache=TokenCache(path), cache_key='admin').get_token(), 'token-2')
+
+    def testForCredentialsCacheKey(self):
+        api_client = swagger_client.ApiClient(host='https://vrni')
+        credential = swagger_client.UserCredential(username='admin@local', password='secret',
+                                                   domain=dict(domain_type='LOCAL'))
+        manager = TokenManager.for_credentials(api_client, credential)
+        self.assertIsNone(manager.cache)
+        self.assertNotIn('secret', manager.cache_key)
+        other = swagger_client.UserCredential(username='other@local', password='secret',
+                                              domain=dict(domain_type='LOCAL'))
+        self.assertNotEqual(TokenManager.for_credentials(api_client, other).cache_key, manager.cache_key)
+
+
+if __name__ == '__main__':
+    unittest.main()
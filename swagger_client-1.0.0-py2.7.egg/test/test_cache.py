@@ -0,0 +1,54 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.cache import LRUCache, MISSING
+
+
+class TestLRUCache(unittest.TestCase):
+    """ LRUCache unit tests """
+
+    def setUp(self):
+        self.now = [0]
+        self.cache = LRUCache(maxsize=2, ttl=10, clock=lambda: self.now[0])
+
+    def testEviction(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.cache.get('a')
+        self.cache.set('c', 3)
+        self.assertEqual(self.cache.get('a'), 1)
+        self.assertIs(self.cache.get('b'), MISSING)
+        self.assertEqual(len(self.cache), 2)
+
+    def testTtl(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2, ttl=None)
+        self.now[0] = 11
+        self.assertIs(self.cache.get('a'), MISSING)
+        self.assertEqual(self.cache.get('b'), 2)
+
+    def testCachesNone(self):
+        self.cache.set('a', None)
+        self.assertIsNone(self.cache.get('a'))
+        self.assertIn('a', self.cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import swagger_client
+from swagger_client import CheckpointedWalk
+
+
+class Crash(Exception):
+    pass
+
+
+class FakeSearchApi(object):
+    """
+    Serves 4 pages of 2 results.
+    """
+
+    def __init__(self):
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.cursors = []
+
+    def search_entities(self, body=None):
+        self.cursors.append(body.cursor)
+        page = int(body.cursor or 0)
+        results = ['r%d' % (page * 2), 'r%d' % (page * 2 + 1)]
+        cursor = str(page + 1) if page < 3 else None
+        return swagger_client.PagedListResponseWithTime(results=results, cursor=cursor, total_count=8)
+
+    def list_vms(self, size=None, cursor=None):
+        return self.search_entities(body=swagger_client.SearchRequest(cursor=cursor))
+
+
+class TestCheckpointedWalk(unittest.TestCase):
+    """ CheckpointedWalk unit tests """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.state = os.path.join(self.dir, 'walk.state')
+        self.output = os.path.join(self.dir, 'out.txt')
+        self.search_api = FakeSearchApi()
+        self.request = swagger_client.SearchRequest(entity_type='Flow', filter="name = 'x'", size=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def walk(self, sink=None, **kwargs):
+        return CheckpointedWalk(self.search_api.search_entities, body=self.request, checkpoint=self.state,
+                                sink=sink, prefetch=0, **kwargs)
+
+    def export(self, crash_after=None):
+        with io.open(self.output, 'a+', encoding='utf8') as out:
+            written = 0
+            for page in self.walk(sink=out):
+                for result in page.results:
+                    out.write(result + u'\n')
+                    written += 1
+                    if written == crash_after:
+                        raise Crash()
+
+    def read_output(self):
+        with io.open(self.output, encoding='utf8') as f:
+            return f.read().split()
+
+    def testResumeIsExactlyOnce(self):
+        # crash in the middle of the third page
+        self.assertRaises(Crash, self.export, crash_after=5)
+        state = json.load(open(self.state))
+        self.assertEqual((state['pages'], state['results'], state['cursor'], state['done']), (2, 4, '2', False))
+        self.assertEqual(len(self.read_output()), 5)
+
+        self.search_api.cursors = []
+        self.export()
+        # the third page is fetched again and its partial output replaced
+        self.assertEqual(self.search_api.cursors, ['2', '3'])
+        self.assertEqual(self.read_output(), ['r%d' % i for i in range(8)])
+        self.assertTrue(self.walk().done)
+
+        # a complete walk yields nothing until reset
+        self.assertEqual(list(self.walk()), [])
+        walk = self.walk()
+        walk.reset()
+        self.assertEqual(len(list(walk)), 4)
+        # the caller's request is untouched
+        self.assertIsNone(self.request.cursor)
+
+    def testOtherRequestIsRejected(self):
+        list(self.walk())
+        self.request.filter = "name = 'y'"
+        with self.assertRaises(ValueError):
+            list(self.walk())
+
+    def testQueryCursor(self):
+        walk = CheckpointedWalk(self.search_api.list_vms, size=2, checkpoint=self.state)
+        pages = iter(walk)
+        next(pages)
+        next(pages)
+        pages.close()
+        self.assertEqual(json.load(open(self.state))['cursor'], '1')
+        self.search_api.cursors = []
+        results = [r for page in CheckpointedWalk(self.search_api.list_vms, size=2, checkpoint=self.state,
+                                                  prefetch=0)
+                   for r in page.results]
+        self.assertEqual(results, ['r2', 'r3', 'r4', 'r5', 'r6', 'r7'])
+        self.assertEqual(self.search_api.cursors, ['1', '2', '3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import pickle
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.compact import compact_model, is_compact, new_compact, to_full_model
+
+from .helpers import Response
+
+
+VM = {
+    'entity_id': 'vm-1',
+    'entity_type': 'VirtualMachine',
+    'name': 'vm',
+    'cpu_count': 2,
+    'vnics': [{'entity_id': 'vnic-1', 'entity_type': 'Vnic'}],
+    'cluster': {'entity_id': 'cluster-1', 'entity_type': 'Cluster'},
+}
+
+
+class TestCompact(unittest.TestCase):
+    """ Compact model unit tests """
+
+    def setUp(self):
+        self.api_client = swagger_client.ApiClient(host='https://vrni', compact_models=True)
+
+    def testCompactModel(self):
+        compact = compact_model(swagger_client.Reference)
+        self.assertIs(compact_model(swagger_client.Reference), compact)
+        self.assertTrue(issubclass(compact, swagger_client.Reference))
+        self.assertEqual(compact.__name__, 'Reference')
+
+        reference = new_compact(swagger_client.Reference, entity_id='1')
+        self.assertTrue(is_compact(reference))
+        self.assertEqual(reference.entity_id, '1')
+        self.assertIsNone(reference.entity_type)
+        self.assertEqual(reference, new_compact(swagger_client.Reference, entity_id='1'))
+        self.assertNotEqual(reference, new_compact(swagger_client.Reference, entity_id='2'))
+        self.assertRaises(TypeError, new_compact, swagger_client.Reference, unknown='1')
+
+    def testDeserialize(self):
+        vm = self.api_client.deserialize(Response(200, json.dumps(VM)), 'BaseVirtualMachine')
+        self.assertTrue(is_compact(vm))
+        self.assertIsInstance(vm, swagger_client.VirtualMachine)
+        self.assertTrue(is_compact(vm.vnics[0]))
+        self.assertEqual(vm.cluster.entity_id, 'cluster-1')
+        self.assertIsNone(vm.memory)
+
+        full = swagger_client.ApiClient(host='https://vrni').deserialize(Response(200, json.dumps(VM)), 'BaseVirtualMachine')
+        self.assertFalse(is_compact(full))
+        self.assertEqual(vm.to_dict(), full.to_dict())
+        self.assertEqual(repr(vm), repr(full))
+        self.assertEqual(self.api_client.sanitize_for_serialization(vm),
+                         self.api_client.sanitize_for_serialization(full))
+
+        converted = to_full_model(vm)
+        self.assertFalse(is_compact(converted))
+        self.assertFalse(is_compact(converted.vnics[0]))
+        self.assertEqual(converted, full)
+
+    def testEqualityWithGeneratedModels(self):
+        compact = self.api_client.deserialize(Response(200, json.dumps(VM)), 'VirtualMachine')
+        full = swagger_client.ApiClient(host='https://vrni').deserialize(Response(200, json.dumps(VM)), 'VirtualMachine')
+        self.assertTrue(compact == full)
+        self.assertTrue(full == compact)
+        self.assertFalse(compact != full)
+        self.assertFalse(full != compact)
+        full.name = 'other'
+        self.assertTrue(compact != full)
+        self.assertTrue(full != compact)
+        # a model of a parent class is not equal, as between generated models
+        base = swagger_client.BaseVirtualMachine(entity_id=compact.entity_id)
+        reference = new_compact(swagger_client.BaseVirtualMachine, entity_id=compact.entity_id)
+        self.assertEqual(reference, base)
+        self.assertNotEqual(compact, reference)
+        self.assertNotEqual(reference, compact)
+
+    def testPickle(self):
+        vm = self.api_client.deserialize(Response(200, json.dumps(VM)), 'VirtualMachine')
+        copy = pickle.loads(pickle.dumps(vm, pickle.HIGHEST_PROTOCOL))
+        self.assertTrue(is_compact(copy))
+        self.assertEqual(copy, vm)
+
+    def testToggle(self):
+        self.assertTrue(is_compact(self.api_client.deserialize(Response(200, json.dumps(VM)), 'VirtualMachine')))
+        self.api_client.compact_models = False
+        self.assertFalse(is_compact(self.api_client.deserialize(Response(200, json.dumps(VM)), 'VirtualMachine')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.conditional import ConditionalCache
+from swagger_client.rest import ApiException
+
+from .helpers import Response, StubRESTClient
+
+
+class InventoryRESTClient(StubRESTClient):
+    """
+    Serves a data source list, with or without validators.
+    """
+
+    def __init__(self, validators=True):
+        self.validators = validators
+        self.version = 1
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        etag = '"v%d"' % self.version
+        if self.validators and (headers or {}).get('If-None-Match') == etag:
+            raise ApiException(http_resp=Response(304, '', headers={'ETag': etag}))
+        body = json.dumps({'results': [{'entity_id': 'vc-%d' % self.version, 'entity_type': 'VCenterDataSource'}]})
+        return Response(200, body, {'ETag': etag, 'Last-Modified': 'Mon, 01 Jan 2018 00:00:00 GMT'}
+                        if self.validators else {})
+
+
+class TestConditionalCache(unittest.TestCase):
+    """ ConditionalCache unit tests """
+
+    def setUp(self):
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.api_client.conditional_cache = ConditionalCache()
+        self.data_sources_api = swagger_client.DataSourcesApi(self.api_client)
+
+    def client(self, validators=True):
+        self.rest = self.api_client.rest_client = InventoryRESTClient(validators)
+
+    def testNotModified(self):
+        self.client()
+        first = self.data_sources_api.list_vcenters()
+        data, status, headers = self.data_sources_api.list_vcenters_with_http_info()
+        self.assertIs(data, first)
+        self.assertEqual(status, 304)
+        self.assertEqual(self.rest.requests[1]['If-None-Match'], '"v1"')
+        self.assertEqual(self.rest.requests[1]['If-Modified-Since'], 'Mon, 01 Jan 2018 00:00:00 GMT')
+        self.assertNotIn('If-None-Match', self.rest.requests[0])
+        self.assertEqual(self.api_client.conditional_cache.stats()['not_modified'], 1)
+
+    def testModified(self):
+        self.client()
+        first = self.data_sources_api.list_vcenters()
+        self.rest.version = 2
+        second = self.data_sources_api.list_vcenters()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.results[0].entity_id, 'vc-2')
+
+    def testUnchangedBodyWithoutValidators(self):
+        self.client(validators=False)
+        first = self.data_sources_api.list_vcenters()
+        second = self.data_sources_api.list_vcenters()
+        self.assertIs(second, first)
+        self.assertNotIn('If-None-Match', self.rest.requests[1])
+        self.assertEqual(self.api_client.conditional_cache.stats()['unchanged'], 1)
+        self.rest.version = 2
+        self.assertEqual(self.data_sources_api.list_vcenters().results[0].entity_id, 'vc-2')
+
+    def testResponseModesAreKeptApart(self):
+        self.client()
+        model = self.data_sources_api.list_vcenters()
+        data = self.data_sources_api.list_vcenters(_response_mode='dict')
+        self.assertIsInstance(model, swagger_client.DataSourceListResponse)
+        self.assertEqual(data['results'][0]['entity_id'], 'vc-1')
+
+    def testDisabledByDefault(self):
+        self.assertIsNone(swagger_client.ApiClient(host='https://vrni').conditional_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
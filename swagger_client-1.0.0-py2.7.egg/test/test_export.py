@@ -0,0 +1,196 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import csv
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import swagger_client
+from swagger_client import CsvSink, ExportPipeline, JsonLinesSink, ParquetSink
+from swagger_client.export import FLOW_FIELDS, _parse_arguments, open_sink
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def flow(index):
+    return {'entity_id': 'f%d' % index, 'entity_type': 'Flow', 'name': 'flow-%d' % index,
+            'source_ip': {'ip_address': '10.0.0.%d' % index, 'netmask': '255.255.255.0'},
+            'destination_ip': {'ip_address': '10.0.1.%d' % index},
+            'port': {'iana_port_display': '443 [https]', 'start': 443},
+            'protocol': 'TCP',
+            'source_vm': {'entity_id': 'vm%d' % (index % 3), 'entity_type': 'VirtualMachine'},
+            'source_security_groups': [{'entity_id': 'sg1', 'entity_type': 'NSXSecurityGroup'},
+                                       {'entity_id': 'sg2', 'entity_type': 'NSXSecurityGroup'}]}
+
+
+class FakeSearchApi(object):
+    """
+    Serves the ids of 25 flows, 10 per page.
+    """
+
+    def search_entities(self, body=None, **kwargs):
+        offset = int(body.cursor or 0)
+        results = [{'entity_id': 'f%d' % i, 'entity_type': 'Flow', 'time': 100}
+                   for i in range(offset, min(offset + 10, 25))]
+        cursor = str(offset + 10) if offset + 10 < 25 else None
+        return {'results': results, 'cursor': cursor, 'total_count': 25}
+
+
+class FakeEntitiesApi(object):
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.fetch_calls = []
+        self.name_calls = []
+
+    def entities_fetch_post(self, body=None, **kwargs):
+        if self.fail:
+            raise swagger_client.rest.ApiException(status=500, reason='boom')
+        self.fetch_calls.append([e.entity_id for e in body.entity_ids])
+        return {'results': [{'entity_id': e.entity_id, 'entity_type': 'Flow',
+                             'entity': flow(int(e.entity_id[1:]))} for e in body.entity_ids]}
+
+    def get_names(self, body, **kwargs):
+        self.name_calls.append([e.entity_id for e in body.entities])
+        return swagger_client.NamesResponse(entities=[
+            swagger_client.EntityName(entity_id=e.entity_id, name='name-' + e.entity_id)
+            for e in body.entities])
+
+
+class ListSink(swagger_client.export.Sink):
+
+    def __init__(self):
+        self.rows = []
+
+    def write_batch(self, rows):
+        self.rows.extend(rows)
+
+
+class TestExportPipeline(unittest.TestCase):
+    """ ExportPipeline unit tests """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.request = swagger_client.SearchRequest(entity_type='Flow', size=10)
+        self.entities_api = FakeEntitiesApi()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def pipeline(self, **kwargs):
+        return ExportPipeline(self.request, FakeSearchApi(), self.entities_api, batch_size=4, **kwargs)
+
+    def testFields(self):
+        sink = ListSink()
+        self.pipeline(fields=FLOW_FIELDS[:5] + ['source_security_groups']).run(sink)
+        rows = sorted(sink.rows, key=lambda r: int(r['source_ip.ip_address'].split('.')[-1]))
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[4], {'source_ip.ip_address': '10.0.0.4', 'destination_ip.ip_address': '10.0.1.4',
+                                   'port.iana_port_display': '443 [https]', 'protocol': 'TCP',
+                                   'source_vm': 'name-vm1', 'source_security_groups': ['name-sg1', 'name-sg2']})
+        self.assertEqual(sorted(len(c) for c in self.entities_api.fetch_calls), [1] + [4] * 6)
+
+    def testAllFieldsWithoutResolve(self):
+        sink = ListSink()
+        self.pipeline(resolve=False).run(sink)
+        row = [r for r in sink.rows if r['entity_id'] == 'f2'][0]
+        self.assertEqual(row['source_ip.netmask'], '255.255.255.0')
+        self.assertEqual(row['source_vm'], {'entity_id': 'vm2', 'entity_type': 'VirtualMachine'})
+        self.assertEqual(self.entities_api.name_calls, [])
+
+    def testStats(self):
+        pipeline = self.pipeline(fields=['name'])
+        stats = pipeline.run(ListSink())
+        self.assertEqual([s['stage'] for s in stats], ['search', 'fetch', 'resolve', 'sink'])
+        self.assertEqual([s['rows'] for s in stats], [25] * 4)
+        self.assertEqual(stats[1]['workers'], 4)
+
+    def testErrorIsRaised(self):
+        self.entities_api.fail = True
+        self.assertRaises(swagger_client.rest.ApiException, self.pipeline().run, ListSink())
+
+    def testCsv(self):
+        path = os.path.join(self.dir, 'flows.csv')
+        with CsvSink(path, fields=['name', 'source_vm', 'source_security_groups']) as sink:
+            self.pipeline(fields=['name', 'source_vm', 'source_security_groups']).run(sink)
+        with io.open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 25)
+        row = [r for r in rows if r['name'] == 'flow-3'][0]
+        self.assertEqual(row['source_vm'], 'name-vm0')
+        self.assertEqual(row['source_security_groups'], 'name-sg1,name-sg2')
+
+    def testJsonl(self):
+        path = os.path.join(self.dir, 'flows.jsonl')
+        with open_sink('jsonl', path) as sink:
+            self.pipeline(fields=['name', 'port.start']).run(sink)
+        with io.open(path) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(sorted(r['name'] for r in rows), sorted('flow-%d' % i for i in range(25)))
+        self.assertEqual(rows[0]['port.start'], 443)
+
+    @unittest.skipIf(pyarrow is None, 'requires pyarrow')
+    def testParquet(self):
+        path = os.path.join(self.dir, 'flows.parquet')
+        fields = ['name', 'port.start', 'tag', 'source_security_groups']
+        with ParquetSink(path, fields=fields, row_group_size=10) as sink:
+            sink.write_batch([{'name': 'a', 'port.start': 1, 'tag': None}])
+            self.pipeline(fields=fields).run(sink)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 26)
+        self.assertIn(pyarrow.parquet.ParquetFile(path).metadata.num_row_groups, (2, 3))
+        rows = table.to_pylist()
+        self.assertEqual(rows[0], {'name': 'a', 'port.start': 1, 'tag': None, 'source_security_groups': None})
+        self.assertEqual(rows[1]['source_security_groups'], ['name-sg1', 'name-sg2'])
+        self.assertEqual(sorted(r['name'] for r in rows[1:]), sorted('flow-%d' % i for i in range(25)))
+        self.assertEqual(str(table.schema.field('tag').type), 'string')
+
+    def testUnknownFormat(self):
+        self.assertRaises(ValueError, open_sink, 'xml', os.path.join(self.dir, 'flows.xml'))
+
+
+class TestParseArguments(unittest.TestCase):
+    """ export command line unit tests """
+
+    ARGV = ['--platform_ip', 'vrni.example.com', '--output', 'flows.csv']
+
+    def setUp(self):
+        self.stderr = sys.stderr
+        sys.stderr = io.StringIO() if sys.version_info[0] > 2 else io.BytesIO()
+
+    def tearDown(self):
+        sys.stderr = self.stderr
+
+    def testShardsRequireStartTime(self):
+        self.assertRaises(SystemExit, _parse_arguments, self.ARGV + ['--shards', '4'])
+        self.assertRaises(SystemExit, _parse_arguments, self.ARGV + ['--shards', '4', '--end_time', '1528000000'])
+        self.assertIn('--start_time is required', sys.stderr.getvalue())
+        args = _parse_arguments(self.ARGV + ['--shards', '4', '--start_time', '1527000000'])
+        self.assertEqual(args.shards, 4)
+
+    def testShardsMustBePositive(self):
+        self.assertRaises(SystemExit, _parse_arguments, self.ARGV + ['--shards', '0'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+from swagger_client.hydration import EntityHydrator, hydrate, to_fetch_id
+
+
+class FakeEntitiesApi(object):
+
+    def __init__(self, missing=()):
+        self.missing = set(missing)
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def entities_fetch_post(self, body=None, **kwargs):
+        with self.lock:
+            self.batches.append([e.entity_id for e in body.entity_ids])
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # later batches finish first
+        time.sleep(0.05 / len(self.batches))
+        with self.lock:
+            self.in_flight -= 1
+        results = [swagger_client.EntityWithTime(entity_id=e.entity_id, entity_type=e.entity_type, time=e.time)
+                   for e in body.entity_ids if e.entity_id not in self.missing]
+        return swagger_client.BulkFetchResponse(results=results)
+
+
+def ids(count):
+    for i in range(count):
+        yield swagger_client.EntityIdWithTime(entity_id=str(i), entity_type='VirtualMachine', time=10)
+
+
+class TestHydration(unittest.TestCase):
+    """ EntityHydrator unit tests """
+
+    def testBatchingAndOrder(self):
+        api = FakeEntitiesApi()
+        hydrator = EntityHydrator(api, batch_size=3, max_workers=2, preserve_order=True)
+        results = list(hydrator.hydrate(ids(10)))
+        self.assertEqual([r.entity_id for r in results], [str(i) for i in range(10)])
+        self.assertEqual([len(b) for b in api.batches], [3, 3, 3, 1])
+        self.assertLessEqual(api.max_in_flight, 2)
+
+    def testUnordered(self):
+        api = FakeEntitiesApi(missing=['4'])
+        results = list(hydrate(ids(10), api, batch_size=2, max_workers=4))
+        self.assertEqual(sorted(int(r.entity_id) for r in results), [0, 1, 2, 3, 5, 6, 7, 8, 9])
+
+    def testToFetchId(self):
+        reference = swagger_client.Reference(entity_id='1', entity_type='Host')
+        fetch_id = to_fetch_id(reference)
+        self.assertEqual((fetch_id.entity_id, fetch_id.entity_type, fetch_id.time), ('1', 'Host', None))
+        fetch_id = to_fetch_id({'entity_id': '2', 'entity_type': 'Flow', 'time': 5})
+        self.assertEqual((fetch_id.entity_id, fetch_id.time), ('2', 5))
+
+    def testInvalidBatchSize(self):
+        with self.assertRaises(ValueError):
+            EntityHydrator(FakeEntitiesApi(), batch_size=1001)
+
+
+if __name__ == '__main__':
+    unittest.main()
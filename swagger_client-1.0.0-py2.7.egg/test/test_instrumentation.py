@@ -0,0 +1,148 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import socket
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.instrumentation import PHASES, Instrumentation, StatsdExporter, current_record
+from swagger_client.rest import ApiException
+
+from . import helpers
+
+VM = json.dumps({'entity_id': 'vm-1', 'entity_type': 'VirtualMachine', 'name': 'vm-1',
+                 'ip_addresses': [{'ip_address': '10.0.0.%d' % i} for i in range(50)]}).encode('utf8')
+
+
+class Handler(helpers.Handler):
+    wbufsize = -1
+
+    def do_GET(self):
+        if self.path.startswith('/api/ni/entities/vms/'):
+            self.respond(200, VM)
+        else:
+            self.respond(404, {'code': 404, 'message': 'Not found'})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.respond(200, {})
+
+
+class TestInstrumentation(unittest.TestCase):
+    """ Instrumentation unit tests """
+
+    def setUp(self):
+        self.server = helpers.Server(Handler)
+        self.api_client = swagger_client.ApiClient(host=self.server.url + '/api/ni')
+        self.records = []
+        self.api_client.instrumentation = Instrumentation(hooks=[self.records.append])
+        self.entities_api = swagger_client.EntitiesApi(self.api_client)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def testDisabledByDefault(self):
+        self.assertIsNone(swagger_client.ApiClient().instrumentation)
+
+    def testRecordsPhasesAndSizes(self):
+        vm = self.entities_api.get_vm('vm-1')
+        self.assertEqual(vm.name, 'vm-1')
+        self.entities_api.get_vm('vm-2')
+        first, second = self.records
+        self.assertEqual(first.operation, 'GET /entities/vms/{id}')
+        self.assertEqual(first.status_label, '200')
+        self.assertEqual(first.attempts, 1)
+        self.assertEqual(first.response_bytes, len(VM))
+        self.assertGreater(first.phases['connect'], 0)
+        # the pooled connection is reused
+        self.assertEqual(second.phases['connect'], 0)
+        for phase in ('wait', 'transfer', 'decode', 'build'):
+            self.assertGreater(first.phases[phase], 0)
+        self.assertLessEqual(sum(first.phases.values()), first.duration)
+        self.assertIsNone(current_record())
+
+        stats, = self.api_client.instrumentation.stats()
+        self.assertEqual(stats['calls'], 2)
+        self.assertEqual(stats['statuses'], {'200': 2})
+        self.assertEqual(stats['response_bytes'], 2 * len(VM))
+        self.assertEqual(sorted(stats['phases']), sorted(PHASES))
+
+    def testDictModeHasNoBuildPhase(self):
+        self.entities_api.get_vm('vm-1', _response_mode='dict')
+        record, = self.records
+        self.assertGreater(record.phases['decode'], 0)
+        self.assertEqual(record.phases['build'], 0)
+
+    def testRequestBytesAreEncodedSize(self):
+        body = u'name = \u00e9t\u00e9'
+        self.api_client.call_api('/search', 'POST', header_params={'Content-Type': 'text/plain'},
+                                 body=body if sys.version_info[0] >= 3 else body.encode('utf-8'))
+        record, = self.records
+        self.assertEqual(record.request_bytes, len(body.encode('utf-8')))
+
+    def testErrors(self):
+        with self.assertRaises(ApiException):
+            self.entities_api.get_host('host-1')
+        record, = self.records
+        self.assertEqual((record.status_label, record.error), ('404', 'ApiException'))
+        stats, = self.api_client.instrumentation.stats()
+        self.assertEqual(stats['errors'], 1)
+
+    def testFailingHookDoesNotFailCalls(self):
+        def hook(record):
+            raise RuntimeError('hook')
+        self.api_client.instrumentation.add_hook(hook)
+        self.assertEqual(self.entities_api.get_vm('vm-1').name, 'vm-1')
+        self.assertEqual(len(self.records), 1)
+
+    def testAsynchronousCalls(self):
+        future = self.entities_api.get_vm('vm-1', callback=lambda vm: None)
+        future.result()
+        self.api_client.shutdown()
+        self.assertEqual([r.status_label for r in self.records], ['200'])
+        self.assertGreater(self.records[0].phases['wait'], 0)
+
+    def testSummaryAndPrometheus(self):
+        self.entities_api.get_vm('vm-1')
+        summary = self.api_client.instrumentation.summary()
+        self.assertIn('GET /entities/vms/{id}', summary.splitlines()[1])
+        text = self.api_client.instrumentation.prometheus()
+        self.assertIn('vrni_client_requests_total{method="GET",path="/entities/vms/{id}",status="200"} 1\n', text)
+        self.assertIn('vrni_client_request_duration_seconds_bucket{method="GET",path="/entities/vms/{id}",le="+Inf"} 1\n',
+                      text)
+        self.assertIn('vrni_client_response_bytes_total{method="GET",path="/entities/vms/{id}"} %d\n' % len(VM), text)
+        self.api_client.instrumentation.reset()
+        self.assertEqual(self.api_client.instrumentation.stats(), [])
+
+    def testStatsdExporter(self):
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(('127.0.0.1', 0))
+        receiver.settimeout(5)
+        exporter = StatsdExporter(port=receiver.getsockname()[1], prefix='test')
+        self.api_client.instrumentation.add_hook(exporter)
+        self.entities_api.get_vm('vm-1')
+        lines = receiver.recv(65536).decode('ascii').splitlines()
+        exporter.close()
+        receiver.close()
+        self.assertIn('test.get_entities_vms_id.calls:1|c', lines)
+        self.assertIn('test.get_entities_vms_id.status.200:1|c', lines)
+        self.assertIn('test.get_entities_vms_id.response_bytes:%d|c' % len(VM), lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
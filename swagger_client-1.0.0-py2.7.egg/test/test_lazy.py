@@ -0,0 +1,91 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import subprocess
+import sys
+import types
+import unittest
+
+import swagger_client
+from swagger_client import apis, models
+from swagger_client.lazy import LazyModule
+from swagger_client.models.virtual_machine import VirtualMachine
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+
+class TestLazy(unittest.TestCase):
+    """ lazy package attributes unit tests """
+
+    def testPackageAttributes(self):
+        self.assertIs(swagger_client.VirtualMachine, VirtualMachine)
+        self.assertIs(models.VirtualMachine, VirtualMachine)
+        self.assertIs(getattr(models, 'VirtualMachine'), VirtualMachine)
+        self.assertIs(swagger_client.EntitiesApi, apis.EntitiesApi)
+        self.assertIs(swagger_client.iter_results, swagger_client.pagination.iter_results)
+        self.assertIs(swagger_client.configuration, swagger_client.Configuration())
+
+    def testMissingAttribute(self):
+        self.assertFalse(hasattr(models, 'NoSuchModel'))
+        with self.assertRaises(AttributeError):
+            swagger_client.NoSuchApi
+
+    def testDirAndAll(self):
+        self.assertIn('DataSourcesApi', dir(swagger_client))
+        self.assertIn('Flow', dir(models))
+        self.assertIn('Configuration', swagger_client.__all__)
+        self.assertIn('configuration', swagger_client.__all__)
+        self.assertNotIn('lazy', swagger_client.__all__)
+        namespace = {}
+        exec('from swagger_client.apis import *', namespace)
+        self.assertIs(namespace['SearchApi'], apis.SearchApi)
+
+    def testImportLoadsNoApi(self):
+        code = ('import sys, swagger_client\n'
+                'swagger_client.InfoApi\n'
+                'print(sorted(m for m in sys.modules if m.startswith("swagger_client.")))')
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT).decode('utf8')
+        self.assertIn('swagger_client.apis.info_api', output)
+        self.assertNotIn('swagger_client.apis.data_sources_api', output)
+        self.assertNotIn('swagger_client.models.flow', output)
+
+    def testSubmodules(self):
+        code = ('import swagger_client\n'
+                'print(swagger_client.models.VirtualMachine.__name__)\n'
+                'print(swagger_client.rest.ApiException.__name__)\n'
+                'print(swagger_client.apis.entities_api.EntitiesApi.__name__)\n'
+                'print(swagger_client.api_client.ApiClient is swagger_client.ApiClient)\n'
+                'print(type(swagger_client.configuration).__name__)')
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT).decode('utf8')
+        self.assertEqual(output.split(), ['VirtualMachine', 'ApiException', 'EntitiesApi', 'True', 'Configuration'])
+        self.assertIn('rest', dir(swagger_client))
+        self.assertNotIn('rest', swagger_client.__all__)
+
+    def testLazyModuleFallback(self):
+        module = types.ModuleType('swagger_client')
+        module.eager = 1
+        lazy_module = LazyModule(module, {'VirtualMachine': '.models.virtual_machine'}, ['rest'])
+        self.assertEqual(lazy_module.eager, 1)
+        self.assertIs(lazy_module.VirtualMachine, VirtualMachine)
+        self.assertIn('VirtualMachine', lazy_module.__dict__)
+        self.assertIn('VirtualMachine', dir(lazy_module))
+        self.assertIs(lazy_module.rest, sys.modules['swagger_client.rest'])
+        with self.assertRaises(AttributeError):
+            lazy_module.Missing
+
+
+if __name__ == '__main__':
+    unittest.main()
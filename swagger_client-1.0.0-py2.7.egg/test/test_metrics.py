@@ -0,0 +1,94 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import math
+import os
+import sys
+import threading
+import unittest
+
+import swagger_client
+from swagger_client.metrics import MetricsFetcher, numpy, time_chunks, to_table
+
+
+class FakeMetricsApi(object):
+    """
+    Serves a point every `interval` seconds, start and end inclusive.
+    """
+
+    def __init__(self):
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_metrics(self, entity_id, metric, interval, start, end, **kwargs):
+        with self.lock:
+            self.calls.append((entity_id, metric, start, end, kwargs.get('_response_mode')))
+        first = start + (-start) % interval
+        points = [[t, None if t % 3600 == 0 else float(t % 1000)] for t in range(first, end + 1, interval)]
+        return {'metric': metric, 'interval': interval, 'unit': '%', 'display_name': metric.upper(),
+                'pointlist': points, 'start': start, 'end': end}
+
+
+class TestMetricsFetcher(unittest.TestCase):
+    """ MetricsFetcher unit tests """
+
+    def setUp(self):
+        self.metrics_api = FakeMetricsApi()
+
+    def tearDown(self):
+        self.metrics_api.api_client.shutdown()
+
+    def testTimeChunks(self):
+        self.assertEqual(list(time_chunks(1010, 4000, 300, 4)), [(900, 2100), (2100, 3300), (3300, 4000)])
+        self.assertEqual(list(time_chunks(600, 600, 300)), [(600, 600)])
+        self.assertRaises(ValueError, list, time_chunks(0, 10, 0))
+
+    def check(self, use_numpy):
+        fetcher = MetricsFetcher(self.metrics_api, max_points=10, max_in_flight=3, use_numpy=use_numpy)
+        pairs = list(MetricsFetcher.pairs(['vm-1', 'vm-2', 'vm-3'], ['cpu', 'mem']))
+        series = list(fetcher.iter_series(pairs, 300, 0, 30000))
+
+        self.assertEqual([(s.entity_id, s.metric) for s in series], pairs)
+        self.assertEqual(len(self.metrics_api.calls), 6 * 10)
+        self.assertTrue(all(call[4] == 'dict' for call in self.metrics_api.calls))
+        first = series[0]
+        self.assertEqual((first.interval, first.unit, first.display_name), (300, '%', 'CPU'))
+        self.assertEqual(list(first.timestamps), list(range(0, 30001, 300)))
+        self.assertTrue(math.isnan(first.values[0]))
+        self.assertEqual(first.values[1], 300.0)
+
+        table = to_table(series, use_numpy)
+        self.assertEqual(len(table['value']), 6 * 101)
+        self.assertEqual(list(table['entity_id'][100:102]), ['vm-1', 'vm-1'])
+        self.assertEqual(list(table['metric'][100:102]), ['cpu', 'mem'])
+        self.assertEqual(list(table['timestamp'][100:102]), [30000, 0])
+
+    def testArrays(self):
+        self.check(use_numpy=False)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def testNumpy(self):
+        self.check(use_numpy=True)
+
+    def testFetch(self):
+        fetcher = MetricsFetcher(self.metrics_api, use_numpy=False)
+        result = fetcher.fetch([('vm-1', 'cpu')], 300, 0, 600)
+        self.assertEqual(list(result[('vm-1', 'cpu')].timestamps), [0, 300, 600])
+        self.assertEqual(len(fetcher.fetch([], 300, 0, 600)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
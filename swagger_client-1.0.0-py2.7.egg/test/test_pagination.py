@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+from swagger_client.pagination import PageIterator, iter_pages, iter_results
+
+
+PAGES = {
+    None: (['a', 'b'], 'c1'),
+    'c1': (['c', 'd'], 'c2'),
+    'c2': (['e'], None),
+}
+
+
+def search_entities(body=None):
+    results, cursor = PAGES[body.cursor]
+    return swagger_client.PagedListResponseWithTime(results=results, cursor=cursor)
+
+
+def list_vms(size=None, cursor=None):
+    results, cursor = PAGES[cursor]
+    return swagger_client.PagedListResponseWithTime(results=results, cursor=cursor)
+
+
+def get_audit_logs(body):
+    return search_entities(body=body)
+
+
+def failing_list(cursor=None):
+    if cursor:
+        raise ApiException(status=500, reason='boom')
+    return swagger_client.PagedListResponseWithTime(results=['a'], cursor='c1')
+
+
+class TestPagination(unittest.TestCase):
+    """ Pagination unit tests """
+
+    def testBodyCursor(self):
+        request = swagger_client.SearchRequest(size=2)
+        results = list(iter_results(search_entities, body=request))
+        self.assertEqual(results, ['a', 'b', 'c', 'd', 'e'])
+        # caller's request is left untouched
+        self.assertIsNone(request.cursor)
+
+    def testPositionalBodyCursor(self):
+        request = swagger_client.AuditRequest(size=2)
+        results = list(iter_results(get_audit_logs, request, prefetch=0))
+        self.assertEqual(results, ['a', 'b', 'c', 'd', 'e'])
+
+    def testQueryCursor(self):
+        for prefetch in (0, 1, 3):
+            pages = list(iter_pages(list_vms, size=2, prefetch=prefetch))
+            self.assertEqual([p.results for p in pages], [['a', 'b'], ['c', 'd'], ['e']])
+
+    def testResumeFromCursor(self):
+        self.assertEqual(list(iter_results(list_vms, cursor='c1')), ['c', 'd', 'e'])
+
+    def testProgress(self):
+        iterator = PageIterator(list_vms)
+        first = next(iter(iterator))
+        self.assertEqual(first.results, ['a', 'b'])
+        self.assertEqual(iterator.pages, 1)
+        self.assertEqual(iterator.cursor, 'c1')
+        iterator.close()
+
+    def testErrorPropagates(self):
+        for prefetch in (0, 2):
+            with self.assertRaises(ApiException):
+                list(iter_results(failing_list, prefetch=prefetch))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+from swagger_client.resolver import ReferenceResolver
+
+
+class FakeEntitiesApi(object):
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.name_calls = []
+        self.fetch_calls = []
+
+    def get_names(self, body, **kwargs):
+        self.name_calls.append([e.entity_id for e in body.entities])
+        time.sleep(self.delay)
+        return swagger_client.NamesResponse(entities=[
+            swagger_client.EntityName(entity_id=e.entity_id, name='name-' + e.entity_id)
+            for e in body.entities if e.entity_id != 'deleted'])
+
+    def entities_fetch_post(self, body=None, **kwargs):
+        self.fetch_calls.append([e.entity_id for e in body.entity_ids])
+        return swagger_client.BulkFetchResponse(results=[
+            swagger_client.EntityWithTime(entity_id=e.entity_id, entity_type='VirtualMachine',
+                                          entity=swagger_client.VirtualMachine(name='vm-' + e.entity_id))
+            for e in body.entity_ids])
+
+
+def ref(entity_id, entity_type='VirtualMachine'):
+    return swagger_client.Reference(entity_id=entity_id, entity_type=entity_type)
+
+
+class TestReferenceResolver(unittest.TestCase):
+    """ ReferenceResolver unit tests """
+
+    def testBatchesMissesAndCaches(self):
+        api = FakeEntitiesApi()
+        resolver = ReferenceResolver(api)
+        names = resolver.resolve_names([ref('1'), ref('2'), ref('1'), ref('deleted')])
+        self.assertEqual(names, ['name-1', 'name-2', 'name-1', None])
+        self.assertEqual(api.name_calls, [['1', '2', 'deleted']])
+        self.assertEqual(resolver.resolve_name(ref('2')), 'name-2')
+        self.assertIsNone(resolver.resolve_name(ref('deleted')))
+        self.assertIsNone(resolver.resolve_name(None))
+        self.assertEqual(len(api.name_calls), 1)
+
+    def testBatchSize(self):
+        api = FakeEntitiesApi()
+        resolver = ReferenceResolver(api, batch_size=2)
+        resolver.resolve_names([ref(str(i)) for i in range(5)])
+        self.assertEqual([len(c) for c in api.name_calls], [2, 2, 1])
+
+    def testTtlByType(self):
+        api = FakeEntitiesApi()
+        resolver = ReferenceResolver(api, ttl_by_type={'Flow': 0})
+        resolver.resolve_name(ref('f', 'Flow'))
+        resolver.resolve_name(ref('f', 'Flow'))
+        self.assertEqual(len(api.name_calls), 2)
+
+    def testEntitiesPopulateNames(self):
+        api = FakeEntitiesApi()
+        resolver = ReferenceResolver(api)
+        self.assertEqual(resolver.resolve_entity(ref('1')).name, 'vm-1')
+        self.assertEqual(resolver.resolve_name(ref('1')), 'vm-1')
+        self.assertEqual(api.name_calls, [])
+
+    def testConcurrentLookupsAreCoalesced(self):
+        api = FakeEntitiesApi(delay=0.05)
+        resolver = ReferenceResolver(api)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(resolver.resolve_name(ref('1'))))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['name-1'] * 8)
+        self.assertEqual(len(api.name_calls), 1)
+
+    def testRequestsCountedAcrossThreads(self):
+        api = FakeEntitiesApi(delay=0.01)
+        resolver = ReferenceResolver(api)
+        threads = [threading.Thread(target=resolver.resolve_name, args=(ref(str(i)),)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(resolver.requests, len(api.name_calls))
+
+    def testErrorsAreNotCached(self):
+        resolver = ReferenceResolver(FakeEntitiesApi())
+
+        def fail(body, **kwargs):
+            raise ApiException(status=500, reason='boom')
+        resolver.entities_api.get_names = fail
+        with self.assertRaises(ApiException):
+            resolver.resolve_name(ref('1'))
+        resolver.entities_api = FakeEntitiesApi()
+        self.assertEqual(resolver.resolve_name(ref('1')), 'name-1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import swagger_client
+from swagger_client.response_cache import ResponseCache
+
+from .helpers import Response, StubRESTClient
+
+NOW = 1000000
+
+
+class RecordingRESTClient(StubRESTClient):
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, url, query_params=None, body=None, **kwargs):
+        self.requests.append((method, url, query_params, body))
+        data = json.dumps({'entity_id': 'vm-%d' % len(self.requests), 'entity_type': 'VirtualMachine',
+                           'name': 'x' * 200, 'results': [], 'cursor': None})
+        return Response(200, data, {'Content-Type': 'application/json'})
+
+
+class TestResponseCache(unittest.TestCase):
+    """ ResponseCache unit tests """
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'responses.sqlite')
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.api_client.retry_policy = None
+        self.api_client.response_cache = self.cache()
+        self.rest = self.api_client.rest_client = RecordingRESTClient()
+        self.entities_api = swagger_client.EntitiesApi(self.api_client)
+        self.search_api = swagger_client.SearchApi(self.api_client)
+
+    def tearDown(self):
+        self.api_client.response_cache.close()
+        shutil.rmtree(self.dir)
+
+    def cache(self, **kwargs):
+        return ResponseCache(self.path, settle=60, clock=lambda: NOW, **kwargs)
+
+    def testPinnedGetIsCached(self):
+        first = self.entities_api.get_vm('1', time=NOW - 3600)
+        second = self.entities_api.get_vm('1', time=NOW - 3600)
+        self.assertEqual(len(self.rest.requests), 1)
+        self.assertEqual(first, second)
+        self.assertIsInstance(second, swagger_client.VirtualMachine)
+        self.assertEqual(self.api_client.response_cache.stats()['hits'], 1)
+
+    def testCacheIsPersistent(self):
+        self.entities_api.get_vm('1', time=NOW - 3600)
+        self.api_client.response_cache.close()
+        self.api_client.response_cache = self.cache()
+        vm = self.entities_api.get_vm('1', time=NOW - 3600, _response_mode='dict')
+        self.assertEqual(vm['entity_id'], 'vm-1')
+        self.assertEqual(len(self.rest.requests), 1)
+
+    def testUsersDoNotShareResponses(self):
+        config = swagger_client.Configuration()
+        self.addCleanup(config.api_key.pop, 'Authorization', None)
+        config.api_key['Authorization'] = 'NetworkInsight admin-token'
+        self.entities_api.get_vm('1', time=NOW - 3600)
+        config.api_key['Authorization'] = 'NetworkInsight auditor-token'
+        self.entities_api.get_vm('1', time=NOW - 3600)
+        self.assertEqual(len(self.rest.requests), 2)
+        # a managed token is keyed by its identity, renewals keep hitting
+        self.api_client.token_manager = swagger_client.TokenManager(
+            lambda: {'token': 'renewed-%d' % len(self.rest.requests), 'expiry': None}, cache_key='admin')
+        self.entities_api.get_vm('1', time=NOW - 3600)
+        self.api_client.token_manager.refresh()
+        self.entities_api.get_vm('1', time=NOW - 3600)
+        self.assertEqual(len(self.rest.requests), 3)
+
+    def testNowRelativeQueriesBypass(self):
+        self.entities_api.get_vm('1')
+        self.entities_api.get_vm('1')
+        self.entities_api.get_vm('1', time=NOW - 10)
+        self.entities_api.get_vm('1', time=NOW - 10)
+        self.assertEqual(len(self.rest.requests), 4)
+        self.assertEqual(self.api_client.response_cache.stats()['bypassed'], 4)
+
+    def testClosedSearchIsCached(self):
+        closed = swagger_client.SearchRequest(entity_type='Flow', filter="name = 'a'",
+                                              time_range=swagger_client.TimeRange(NOW - 7200, NOW - 3600))
+        self.search_api.search_entities(body=closed)
+        self.search_api.search_entities(body=closed)
+        self.assertEqual(len(self.rest.requests), 1)
+        closed.filter = "name = 'b'"
+        self.search_api.search_entities(body=closed)
+        self.assertEqual(len(self.rest.requests), 2)
+        closed.time_range.end_time = NOW
+        self.search_api.search_entities(body=closed)
+        self.search_api.search_entities(body=closed)
+        self.assertEqual(len(self.rest.requests), 4)
+
+    def testMutatingCallsBypass(self):
+        self.assertFalse(self.api_client.response_cache.is_cacheable(
+            'DELETE', '/data-sources/vcenters/{id}', [('time', NOW - 3600)]))
+        self.assertFalse(self.api_client.response_cache.is_cacheable(
+            'POST', '/data-sources/vcenters', body={'time': NOW - 3600}))
+        self.assertTrue(self.api_client.response_cache.is_cacheable(
+            'POST', '/entities/fetch', body={'entity_ids': [{'entity_id': '1', 'time': NOW - 3600}]}))
+        self.assertFalse(self.api_client.response_cache.is_cacheable(
+            'POST', '/entities/fetch', body={'entity_ids': [{'entity_id': '1', 'time': NOW - 3600},
+                                                            {'entity_id': '2'}]}))
+
+    def testEviction(self):
+        cache = self.api_client.response_cache
+        cache.max_bytes = 3 * len(cache.key('GET', 'x'))
+        for i in range(20):
+            self.entities_api.get_vm(str(i), time=NOW - 3600)
+        self.assertLessEqual(cache.stats()['bytes'], cache.max_bytes)
+        self.entities_api.get_vm('19', time=NOW - 3600)
+        self.assertEqual(len(self.rest.requests), 20)
+        self.entities_api.get_vm('0', time=NOW - 3600)
+        self.assertEqual(len(self.rest.requests), 21)
+
+    def testFromConfiguration(self):
+        config = swagger_client.Configuration()
+        self.assertIsNone(ResponseCache.from_configuration())
+        config.cache_dir, config.response_cache = self.dir, True
+        try:
+            cache = ResponseCache.from_configuration()
+            self.assertEqual(cache.path, os.path.join(self.dir, 'responses.sqlite'))
+            cache.close()
+        finally:
+            config.cache_dir, config.response_cache = None, False
+
+
+if __name__ == '__main__':
+    unittest.main()
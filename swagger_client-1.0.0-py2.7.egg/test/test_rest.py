@@ -0,0 +1,71 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import socket
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException, RESTClientObject, socket_options
+
+from . import helpers
+
+
+class Handler(helpers.Handler):
+
+    def do_GET(self):
+        self.respond(200, {'ok': True})
+
+
+class TestRESTClientObject(unittest.TestCase):
+    """ RESTClientObject unit tests """
+
+    def setUp(self):
+        self.server = helpers.Server(Handler)
+        self.url = self.server.url + '/'
+
+    def tearDown(self):
+        self.server.stop()
+
+    def testPoolSizingFromConfiguration(self):
+        config = swagger_client.Configuration()
+        maxsize = config.connection_pool_maxsize
+        config.connection_pool_maxsize = 32
+        try:
+            client = RESTClientObject()
+        finally:
+            config.connection_pool_maxsize = maxsize
+        self.assertEqual(client.maxsize, 32)
+        self.assertEqual(client.pool_manager.connection_pool_kw['maxsize'], 32)
+        self.assertEqual(RESTClientObject(maxsize=8).maxsize, 8)
+
+    def testConnectionReuseStats(self):
+        client = RESTClientObject()
+        for _ in range(5):
+            self.assertEqual(client.GET(self.url).status, 200)
+        stats = list(client.pool_stats().values())[0]
+        self.assertEqual(stats['connections'], 1)
+        self.assertEqual(stats['requests'], 5)
+        self.assertEqual(stats['reused'], 4)
+        self.assertEqual(stats['available'], client.maxsize)
+
+    def testKeepAliveSocketOptions(self):
+        options = socket_options(swagger_client.Configuration())
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), options)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import unittest
+
+import urllib3
+
+import swagger_client
+from swagger_client.rest import ApiException
+from swagger_client.retry import RetryPolicy
+
+from .helpers import Response, StubRESTClient
+
+
+class FlakyRESTClient(StubRESTClient):
+    """
+    Fails the first requests with the given errors, then succeeds.
+    """
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        if self.errors:
+            raise self.errors.pop(0)
+        return Response(200, json.dumps({'results': [], 'entity_id': '1', 'entity_type': 'VirtualMachine'}))
+
+
+def throttled(retry_after=None):
+    return ApiException(http_resp=Response(503, headers={'Retry-After': retry_after} if retry_after else {}))
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """ RetryPolicy unit tests """
+
+    def setUp(self):
+        self.sleeps = []
+        self.policy = RetryPolicy(max_attempts=4, backoff_factor=1.0, sleep=self.sleeps.append, random=lambda: 1.0)
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.api_client.retry_policy = self.policy
+
+    def client(self, *errors):
+        self.api_client.rest_client = FlakyRESTClient(*errors)
+        return self.api_client.rest_client
+
+    def testRetriesGetWithBackoff(self):
+        rest_client = self.client(urllib3.exceptions.ProtocolError('reset'), throttled(), throttled('7'))
+        vm = swagger_client.EntitiesApi(self.api_client).get_vm('1')
+        self.assertEqual(vm.entity_id, '1')
+        self.assertEqual(len(rest_client.requests), 4)
+        # exponential backoff, at least the Retry-After delay
+        self.assertEqual(self.sleeps, [1.0, 2.0, 7.0])
+        self.assertEqual(self.policy.stats(), {'requests': 1, 'retries': 3, 'failures': 0, 'budget_exhausted': 0})
+
+    def testGivesUp(self):
+        rest_client = self.client(*[throttled() for _ in range(5)])
+        with self.assertRaises(ApiException):
+            swagger_client.EntitiesApi(self.api_client).get_vm('1')
+        self.assertEqual(len(rest_client.requests), 4)
+        self.assertEqual(self.policy.stats()['failures'], 1)
+
+    def testReadOnlyPostsAreRetried(self):
+        rest_client = self.client(throttled())
+        swagger_client.SearchApi(self.api_client).search_entities(body=swagger_client.SearchRequest())
+        self.assertEqual(len(rest_client.requests), 2)
+
+    def testMutatingCallsAreNotRetried(self):
+        rest_client = self.client(throttled())
+        with self.assertRaises(ApiException):
+            swagger_client.SettingsApi(self.api_client).create_subnet_mapping(swagger_client.SubnetMappingRequest())
+        self.assertEqual(len(rest_client.requests), 1)
+        self.assertFalse(self.policy.is_retryable('PUT', '/data-sources/vcenters/{id}'))
+        self.assertTrue(self.policy.is_retryable('POST', '/entities/fetch'))
+
+    def testClientErrorsAreNotRetried(self):
+        rest_client = self.client(ApiException(http_resp=Response(404)))
+        with self.assertRaises(ApiException):
+            swagger_client.EntitiesApi(self.api_client).get_vm('1')
+        self.assertEqual(len(rest_client.requests), 1)
+
+    def testLongRetryAfterIsNotRetried(self):
+        rest_client = self.client(throttled('3600'))
+        with self.assertRaises(ApiException):
+            swagger_client.EntitiesApi(self.api_client).get_vm('1')
+        self.assertEqual(len(rest_client.requests), 1)
+
+    def testBudget(self):
+        self.policy.budget_size = 2
+        self.policy._budget = 2
+        self.policy.budget_ratio = 0
+        rest_client = self.client(*[throttled() for _ in range(10)])
+        with self.assertRaises(ApiException):
+            swagger_client.EntitiesApi(self.api_client).get_vm('1')
+        self.assertEqual(len(rest_client.requests), 3)
+        self.assertEqual(self.policy.stats()['budget_exhausted'], 1)
+
+    def testFromConfiguration(self):
+        config = swagger_client.Configuration()
+        # retries are opt-in
+        self.assertEqual(config.retry_max_attempts, 1)
+        self.assertIsNone(swagger_client.ApiClient().retry_policy)
+        config.retry_max_attempts = 3
+        try:
+            self.assertEqual(swagger_client.ApiClient().retry_policy.max_attempts, 3)
+        finally:
+            config.retry_max_attempts = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
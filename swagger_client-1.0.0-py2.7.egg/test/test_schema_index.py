@@ -0,0 +1,136 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client import MetricSchemaIndex
+
+
+CPU = 'metric.cpu.usage.rate.average.percent'
+
+
+class FakeSchemaApi(object):
+
+    def __init__(self, host='https://vrni'):
+        self.api_client = swagger_client.ApiClient(host=host)
+        self.calls = []
+        self.delay = 0
+
+    def get_metrics_schema(self, entity_type, **kwargs):
+        self.calls.append(entity_type)
+        time.sleep(self.delay)
+        return {'results': [
+            {'metric': CPU, 'display_name': 'CPU Usage', 'intervals': [3600, 300, 86400, 1800], 'unit': '%'},
+            {'metric': 'metric.memory.usage.rate.average.percent', 'intervals': [300], 'unit': '%'},
+        ]}
+
+
+class FakeInfoApi(object):
+
+    def __init__(self, version='1.1.0'):
+        self.version = version
+
+    def get_version(self):
+        return swagger_client.VersionResponse(api_version=self.version)
+
+
+class TestMetricSchemaIndex(unittest.TestCase):
+    """ MetricSchemaIndex unit tests """
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.schema_api = FakeSchemaApi()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def index(self, version='1.1.0'):
+        return MetricSchemaIndex(self.schema_api, FakeInfoApi(version), cache_dir=os.path.join(self.cache_dir, 'c'))
+
+    def testMetricsAreCached(self):
+        index = self.index()
+        metrics = index.metrics('VirtualMachine')
+        self.assertIsInstance(metrics[CPU], swagger_client.MetricSchema)
+        self.assertEqual(metrics[CPU].unit, '%')
+        index.metrics('VirtualMachine')
+        self.assertEqual(self.schema_api.calls, ['VirtualMachine'])
+
+        # persisted per version
+        self.index().metrics('VirtualMachine')
+        self.assertEqual(self.schema_api.calls, ['VirtualMachine'])
+        self.index('1.2.0').metrics('VirtualMachine')
+        self.assertEqual(self.schema_api.calls, ['VirtualMachine', 'VirtualMachine'])
+
+        index.invalidate()
+        index.metrics('VirtualMachine')
+        self.assertEqual(len(self.schema_api.calls), 3)
+
+    def testValidate(self):
+        index = self.index()
+        self.assertEqual(index.validate('VirtualMachine', CPU, 300).metric, CPU)
+        with self.assertRaises(ValueError) as e:
+            index.validate('VirtualMachine', CPU, 60)
+        self.assertIn('[300, 1800, 3600, 86400]', str(e.exception))
+        with self.assertRaises(ValueError) as e:
+            index.validate('VirtualMachine', 'metric.cpu.usage.rate.average')
+        self.assertIn('did you mean ' + CPU, str(e.exception))
+
+    def testSelectInterval(self):
+        index = self.index()
+        day = 86400
+        self.assertEqual(index.select_interval('VirtualMachine', CPU, 0, day, 300), 300)
+        self.assertEqual(index.select_interval('VirtualMachine', CPU, 0, 7 * day, 300), 3600)
+        self.assertEqual(index.select_interval('VirtualMachine', CPU, 0, 365 * day, 300), 86400)
+        self.assertEqual(index.select_interval('VirtualMachine', CPU, 0, 3650 * day, 300), 86400)
+
+    def testCachePerPlatform(self):
+        self.index().metrics('VirtualMachine')
+        other = FakeSchemaApi(host='https://other-vrni')
+        index = MetricSchemaIndex(other, FakeInfoApi(), cache_dir=os.path.join(self.cache_dir, 'c'))
+        index.metrics('VirtualMachine')
+        self.assertEqual(other.calls, ['VirtualMachine'])
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir, 'c'))), 2)
+
+    def testConcurrentFetches(self):
+        self.schema_api.delay = 0.2
+        index = self.index()
+        threads = [threading.Thread(target=index.metrics, args=(entity_type,))
+                   for entity_type in ['VirtualMachine'] * 4 + ['Host']]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # one fetch per entity type, the two types fetched in parallel
+        self.assertEqual(sorted(self.schema_api.calls), ['Host', 'VirtualMachine'])
+        self.assertLess(time.time() - start, 0.39)
+        self.assertIn(CPU, index.metrics('Host'))
+
+    def testMemoryOnly(self):
+        index = MetricSchemaIndex(self.schema_api, FakeInfoApi(), cache_dir='')
+        self.assertIsNone(index.cache_file)
+        index.metrics('Host')
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
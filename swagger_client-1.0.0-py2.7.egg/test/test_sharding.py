@@ -0,0 +1,156 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client import ShardedSearch, split_time_range
+from swagger_client.models.entity_id_with_time import EntityIdWithTime
+from swagger_client.models.search_request import SearchRequest
+from swagger_client.models.time_range import TimeRange
+
+
+class FakeSearchApi(object):
+    """
+    Serves one result per 10 seconds of the requested time range, in
+    descending time, 3 results per page. Results at time 1000 also match
+    the range ending there.
+    """
+
+    def __init__(self, delay=0):
+        self.api_client = swagger_client.ApiClient(host='https://vrni')
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def search_entities(self, body=None):
+        with self.lock:
+            self.requests.append((body.filter, body.time_range.start_time, body.time_range.end_time, body.cursor))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            start, end = body.time_range.start_time, body.time_range.end_time
+            times = [t for t in range(0, 2000, 10) if start <= t <= end and (t != end or t == 1000)]
+            times.reverse()
+            offset = int(body.cursor or 0)
+            results = [EntityIdWithTime(entity_id='e%d' % t, entity_type='Flow', time=t)
+                       for t in times[offset:offset + 3]]
+            cursor = str(offset + 3) if offset + 3 < len(times) else None
+            return swagger_client.PagedListResponseWithTime(results=results, cursor=cursor,
+                                                            total_count=len(times))
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestSplitTimeRange(unittest.TestCase):
+    """ split_time_range unit tests """
+
+    def testSplit(self):
+        ranges = split_time_range(TimeRange(start_time=0, end_time=100), 3)
+        self.assertEqual([(r.start_time, r.end_time) for r in ranges], [(0, 33), (33, 66), (66, 100)])
+
+    def testShortRange(self):
+        ranges = split_time_range(TimeRange(start_time=10, end_time=12), 8)
+        self.assertEqual([(r.start_time, r.end_time) for r in ranges], [(10, 11), (11, 12)])
+
+    def testMissingRange(self):
+        self.assertRaises(ValueError, split_time_range, None, 4)
+        self.assertRaises(ValueError, split_time_range, TimeRange(start_time=0, end_time=10), 0)
+
+
+class TestShardedSearch(unittest.TestCase):
+    """ ShardedSearch unit tests """
+
+    def setUp(self):
+        self.request = SearchRequest(entity_type='Flow', filter="name = 'x'", size=3,
+                                     time_range=TimeRange(start_time=0, end_time=2000))
+
+    def testResultsAreCompleteAndUnique(self):
+        search_api = FakeSearchApi()
+        search = ShardedSearch(search_api, shards=4)
+        ids = [r.entity_id for r in search.results(self.request)]
+        self.assertEqual(sorted(ids), sorted('e%d' % t for t in range(0, 2000, 10)))
+        # the boundary result at 1000 is returned by two shards
+        self.assertEqual(search.duplicates, 1)
+        self.assertEqual(len(set(r[1:3] for r in search_api.requests)), 4)
+        self.assertIsNone(self.request.cursor)
+
+    def testWithoutDedupe(self):
+        search = ShardedSearch(FakeSearchApi(), shards=4, dedupe=False)
+        ids = [r.entity_id for r in search.results(self.request)]
+        self.assertEqual(len(ids), 201)
+
+    def testOrdered(self):
+        search = ShardedSearch(FakeSearchApi(), shards=5, ordered=True)
+        times = [r.time for r in search.results(self.request)]
+        self.assertEqual(times, list(range(0, 2000, 10)))
+
+    def testShardsRunConcurrently(self):
+        search_api = FakeSearchApi(delay=0.05)
+        list(ShardedSearch(search_api, shards=4).results(self.request))
+        self.assertEqual(search_api.max_active, 4)
+
+    def testFilterShards(self):
+        search_api = FakeSearchApi()
+        search = ShardedSearch(search_api, filters=["protocol = 'TCP'", "protocol != 'TCP'"])
+        requests = search.shard_requests(self.request)
+        self.assertEqual([r.filter for r in requests],
+                         ["(name = 'x') and (protocol = 'TCP')", "(name = 'x') and (protocol != 'TCP')"])
+        self.assertEqual([r.time_range for r in requests], [self.request.time_range] * 2)
+
+    def testOrderedFilterShards(self):
+        search_api = FakeSearchApi()
+        search_entities = search_api.search_entities
+
+        def interleaved(body=None):
+            # each filter matches every other 10 seconds
+            page = search_entities(body=body)
+            parity = 0 if 'TCP' in body.filter else 10
+            page.results = [r for r in page.results if r.time % 20 == parity]
+            return page
+        search_api.search_entities = interleaved
+        search = ShardedSearch(search_api, filters=["protocol = 'TCP'", "protocol = 'UDP'"], ordered=True)
+        times = [r.time for r in search.results(self.request)]
+        self.assertEqual(times, list(range(0, 2000, 10)))
+
+    def testErrorIsRaised(self):
+        search_api = FakeSearchApi()
+
+        def search_entities(body=None):
+            if body.time_range.start_time:
+                raise swagger_client.rest.ApiException(status=500, reason='boom')
+            return FakeSearchApi.search_entities(search_api, body=body)
+        search_api.search_entities = search_entities
+        search = ShardedSearch(search_api, shards=2)
+        self.assertRaises(swagger_client.rest.ApiException, list, search.results(self.request))
+
+    def testDictPages(self):
+        search_api = FakeSearchApi()
+        search_entities = search_api.search_entities
+        search_api.search_entities = lambda body=None: search_entities(body=body).to_dict()
+        ids = [r['entity_id'] for r in ShardedSearch(search_api, shards=3).results(self.request)]
+        self.assertEqual(len(ids), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+from swagger_client.streaming import iter_json_array
+
+from . import helpers
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+BULK = {
+    'results': [{'entity_id': 'id-%d' % i, 'entity_type': 'Flow', 'time': 1528000000 + i,
+                 'entity': {'entity_type': 'Flow', 'name': u'flöw-%d' % i, 'within_host': i % 2 == 0}}
+                for i in range(50)],
+    'total_count': 50,
+}
+
+
+class Handler(helpers.Handler):
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        status, body = 200, json.dumps(BULK).encode('utf8')
+        if self.path.startswith('/missing'):
+            status, body = 404, b'{"message": "not found"}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for chunk in chunked(body, 100):
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+        self.wfile.write(b'0\r\n\r\n')
+
+
+class TestIterJsonArray(unittest.TestCase):
+    """ iter_json_array unit tests """
+
+    def testChunkBoundaries(self):
+        data = json.dumps({'cursor': 'abc', 'results': [1, 23.5, -456, u'été', None, [7, 8], {'a': {}}],
+                           'total_count': 12345}).encode('utf8')
+        for size in (1, 2, 3, 7, len(data)):
+            fields = {}
+            items = list(iter_json_array(chunked(data, size), 'results', fields))
+            self.assertEqual(items, [1, 23.5, -456, u'été', None, [7, 8], {'a': {}}])
+            self.assertEqual(fields, {'cursor': 'abc', 'total_count': 12345})
+
+    def testPointList(self):
+        data = b' { "metric" : "cpu" ,\n "pointlist" : [ [1, 0.5] , [2, 1.5] ] } '
+        self.assertEqual(list(iter_json_array(chunked(data, 4), 'pointlist')), [[1, 0.5], [2, 1.5]])
+
+    def testEmptyOrMissingArray(self):
+        self.assertEqual(list(iter_json_array([b'{"results": []}'])), [])
+        self.assertEqual(list(iter_json_array([b'{}'])), [])
+        fields = {}
+        self.assertEqual(list(iter_json_array([b'{"results": null}'], fields=fields)), [])
+        self.assertEqual(fields, {'results': None})
+
+    def testTruncated(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"results": [1, 2']))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'[1, 2]']))
+
+
+class TestStreamResults(unittest.TestCase):
+    """ stream_results unit tests """
+
+    def setUp(self):
+        self.server = helpers.Server(Handler)
+        self.api_client = swagger_client.ApiClient(host=self.server.url)
+        self.entities_api = swagger_client.EntitiesApi(self.api_client)
+        self.body = swagger_client.FetchRequest(entity_ids=[])
+
+    def tearDown(self):
+        self.server.stop()
+
+    def testStreamModels(self):
+        stream = swagger_client.stream_results(self.entities_api.entities_fetch_post, body=self.body,
+                                               item_type='EntityWithTime', chunk_size=64)
+        entities = list(stream)
+        self.assertEqual(len(entities), 50)
+        self.assertIsInstance(entities[3].entity, swagger_client.Flow)
+        self.assertEqual(entities[3].entity.name, u'flöw-3')
+        self.assertEqual(stream.fields, {'total_count': 50})
+        # the connection was read to the end and is reused
+        self.assertEqual(list(swagger_client.stream_results(self.entities_api.entities_fetch_post,
+                                                            body=self.body))[0]['entity_id'], 'id-0')
+        stats = list(self.api_client.rest_client.pool_stats().values())[0]
+        self.assertEqual(stats['connections'], 1)
+
+    def testCloseEarly(self):
+        with swagger_client.stream_results(self.entities_api.entities_fetch_post, body=self.body) as stream:
+            for item in stream:
+                break
+        self.assertEqual(item['entity_id'], 'id-0')
+        self.assertEqual(len(list(swagger_client.stream_results(self.entities_api.entities_fetch_post,
+                                                                body=self.body))), 50)
+
+    def testError(self):
+        self.api_client.host += '/missing'
+        with self.assertRaises(ApiException) as e:
+            swagger_client.stream_results(self.entities_api.entities_fetch_post, body=self.body)
+        self.assertEqual(e.exception.status, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# coding: utf-8
+
+"""
+    vRealize Network Insight API Reference
+
+    vRealize Network Insight API Reference
+
+    OpenAPI spec version: 1.1.0
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+"""
+
+
+from __future__ import absolute_import
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+import swagger_client
+from swagger_client.rest import ApiException
+from swagger_client.throttle import AdaptiveConcurrency, Throttle, TokenBucket, retry_after
+
+from .helpers import Response, StubRESTClient
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ThrottlingRESTClient(StubRESTClient):
+    """
+    Throttles every request while more than `capacity` are in flight.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            overloaded = self.in_flight > self.capacity
+            if overloaded:
+                self.throttled += 1
+        try:
+            time.sleep(0.005)
+            if overloaded:
+                raise ApiException(http_resp=Response(429, headers={'Retry-After': '0.01'}))
+            return Response(200, json.dumps({'entity_id': url.rsplit('/', 1)[1], 'entity_type': 'VirtualMachine'}))
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestThrottle(unittest.TestCase):
+    """ Throttle unit tests """
+
+    def testTokenBucket(self):
+        clock = Clock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+        for _ in range(12):
+            bucket.acquire()
+        # the burst is free, the other 10 tokens take a second
+        self.assertAlmostEqual(clock.now, 1001.0)
+        self.assertRaises(ValueError, TokenBucket, 0)
+
+    def testRetryAfter(self):
+        self.assertEqual(retry_after({'Retry-After': '5'}), 5.0)
+        self.assertIsNone(retry_after({}))
+        self.assertIsNone(retry_after(None))
+        self.assertEqual(retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, now=1445412470), 10)
+        self.assertIsNone(retry_after({'Retry-After': 'soon'}))
+
+    def testAdditiveIncreaseMultiplicativeDecrease(self):
+        clock = Clock()
+        limiter = AdaptiveConcurrency(max_limit=16, initial=4, latency_target=1.0, clock=clock)
+        for _ in range(4):
+            limiter.release(limiter.acquire())
+        self.assertEqual(int(limiter.limit), 4)
+        self.assertGreater(limiter.limit, 4.9)
+
+        # two failures of the same window decrease the limit once
+        started = [limiter.acquire(), limiter.acquire()]
+        clock.now += 0.5
+        limiter.release(started[0], throttled=True, delay=2)
+        limiter.release(started[1], throttled=True)
+        self.assertEqual(int(limiter.limit), 2)
+        self.assertEqual(limiter.throttled, 2)
+        self.assertEqual(limiter.resume_at, clock.now + 2)
+
+        # slow responses decrease it as well, down to min_limit
+        for _ in range(2):
+            clock.now += 2
+            started = limiter.acquire()
+            clock.now += 1.5
+            limiter.release(started)
+        self.assertEqual(limiter.limit, 1)
+
+        started = limiter.acquire()
+        limiter.release(started, adapt=False)
+        self.assertEqual((limiter.limit, limiter.in_flight), (1, 0))
+
+    def testConcurrencyAdaptsToThrottling(self):
+        rest_client = ThrottlingRESTClient(capacity=4)
+        api_client = swagger_client.ApiClient(host='https://vrni')
+        api_client.rest_client = rest_client
+        api_client.throttle = Throttle(max_concurrency=16)
+        api_client.retry_policy = None
+        entities_api = swagger_client.EntitiesApi(api_client)
+        errors = []
+
+        def worker(ids):
+            for i in ids:
+                try:
+                    entities_api.get_vm(str(i))
+                except ApiException as e:
+                    errors.append(e.status)
+
+        threads = [threading.Thread(target=worker, args=(range(20),)) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = api_client.throttle.stats()
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertGreater(stats['throttled'], 0)
+        self.assertEqual(set(errors), set([429]))
+        # without the throttle nearly every request fails
+        self.assertLess(len(errors), 16 * 20 / 2)
+        self.assertLessEqual(rest_client.max_in_flight, 16)
+
+    def testFromConfiguration(self):
+        config = swagger_client.Configuration()
+        self.assertIsNone(swagger_client.ApiClient().throttle)
+        config.rate_limit = 5
+        try:
+            throttle = swagger_client.ApiClient().throttle
+        finally:
+            config.rate_limit = None
+        self.assertEqual(throttle.bucket.rate, 5)
+        self.assertIsNone(throttle.concurrency)
+
+
+if __name__ == '__main__':
+    unittest.main()